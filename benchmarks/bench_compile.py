@@ -0,0 +1,31 @@
+import shutil
+import tempfile
+
+from cupy.cuda import compiler
+
+from benchmarks import common
+
+
+_source = '''
+extern "C" __global__ void bench_compile(float* x) {
+  x[threadIdx.x] = threadIdx.x;
+}
+'''
+
+
+class CompileWithCache(object):
+
+    def setup(self):
+        common.setup_stub()
+        # An explicit arch avoids a device query in the stub-kernel mode.
+        self.arch = 'compute_30' if common.stub_mode else None
+        self.cache_dir = tempfile.mkdtemp()
+        compiler.compile_with_cache(
+            _source, arch=self.arch, cache_dir=self.cache_dir)
+
+    def teardown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def time_cache_hit(self):
+        compiler.compile_with_cache(
+            _source, arch=self.arch, cache_dir=self.cache_dir)
@@ -0,0 +1,126 @@
+import cupy
+
+from benchmarks import common
+
+
+class GetItemView(object):
+
+    """Indexing that only creates views (runs in the stub-kernel mode)."""
+
+    def setup(self):
+        self.a = common.empty((4, 5, 6))
+
+    def time_int(self):
+        self.a[1]
+
+    def time_slice(self):
+        self.a[1:3]
+
+    def time_slice_step(self):
+        self.a[::2, 1:, :3]
+
+    def time_ellipsis(self):
+        self.a[..., 1]
+
+    def time_newaxis(self):
+        self.a[:, None]
+
+
+class GetItemCopy(object):
+
+    """Indexing that launches kernels."""
+
+    def setup(self):
+        common.setup_stub()
+        self.a = cupy.ones((4, 5, 6), 'f')
+        self.index = cupy.arange(3)
+
+    def teardown(self):
+        common.synchronize()
+
+    def time_int_array(self):
+        self.a[self.index]
+
+
+class GetItemTransfer(object):
+
+    """Indexing that transfers the indices or the result size.
+
+    They need a GPU since the transfers cannot be stubbed.
+
+    """
+
+    def setup(self):
+        common.require_gpu()
+        self.a = cupy.ones((4, 5, 6), 'f')
+        self.mask = self.a > 0
+
+    def teardown(self):
+        common.synchronize()
+
+    def time_list(self):
+        self.a[[0, 2, 3]]
+
+    def time_mask(self):
+        self.a[self.mask]
+
+
+class ShapeManipulation(object):
+
+    def setup(self):
+        self.a = common.empty((4, 5, 6))
+
+    def time_reshape(self):
+        self.a.reshape(20, 6)
+
+    def time_reshape_infer(self):
+        self.a.reshape(-1, 6)
+
+    def time_ravel(self):
+        self.a.ravel()
+
+    def time_transpose(self):
+        self.a.transpose()
+
+    def time_transpose_axes(self):
+        self.a.transpose(1, 0, 2)
+
+    def time_T(self):
+        self.a.T
+
+    def time_view(self):
+        self.a.view()
+
+
+class Flip(object):
+
+    """Flips that only create views.
+
+    They run in the stub-kernel mode. The setup checks that none of them
+    launches a kernel in this mode.
+
+    """
+
+    def setup(self):
+        self.a = common.empty((4, 5, 6))
+        if common.stub_mode:
+            count = common.launch_count()
+            for name in dir(self):
+                if name.startswith('time_'):
+                    getattr(self, name)()
+            assert common.launch_count() == count, 'a kernel is launched'
+
+    def time_getitem_reverse(self):
+        self.a[::-1]
+
+    def time_flip(self):
+        cupy.flip(self.a, 1)
+
+    def time_fliplr(self):
+        cupy.fliplr(self.a)
+
+    def time_flipud(self):
+        cupy.flipud(self.a)
+
+    def time_rot90(self):
+        cupy.rot90(self.a)
@@ -0,0 +1,58 @@
+import cupy
+
+from benchmarks import common
+
+
+class ElementwiseKernel(object):
+
+    def setup(self):
+        common.setup_stub()
+        self.kernel = cupy.ElementwiseKernel(
+            'T x, T y', 'T z', 'z = x * y + x', 'bench_elementwise')
+        self.raw_kernel = cupy.ElementwiseKernel(
+            'raw T x', 'T y', 'y = x[i]', 'bench_elementwise_raw')
+        self.a = cupy.ones((4, 4), 'f')
+        self.out = cupy.empty((4, 4), 'f')
+        # Compile the kernels outside of the measurement.
+        self.kernel(self.a, self.a)
+        self.raw_kernel(self.a, self.out)
+
+    def teardown(self):
+        common.synchronize()
+
+    def time_call(self):
+        self.kernel(self.a, self.a)
+
+    def time_call_out(self):
+        self.kernel(self.a, self.a, self.out)
+
+    def time_call_scalar(self):
+        self.kernel(self.a, 2.0)
+
+    def time_call_raw(self):
+        self.raw_kernel(self.a, self.out)
+
+
+class Reduction(object):
+
+    params = [None, 0, 1]
+    param_names = ['axis']
+
+    def setup(self, axis):
+        common.setup_stub()
+        self.kernel = cupy.ReductionKernel(
+            'T x', 'T y', 'x * x', 'a + b', 'y = a', '0', 'bench_reduction')
+        self.a = cupy.ones((4, 4), 'f')
+        self.kernel(self.a, axis=axis)
+
+    def teardown(self, axis):
+        common.synchronize()
+
+    def time_sum(self, axis):
+        self.a.sum(axis=axis)
+
+    def time_max(self, axis):
+        self.a.max(axis=axis)
+
+    def time_reduction_kernel(self, axis):
+        self.kernel(self.a, axis=axis)
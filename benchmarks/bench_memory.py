@@ -0,0 +1,25 @@
+from cupy.cuda import memory
+
+from benchmarks import common
+
+
+class MemoryPool(object):
+
+    params = [1, 1024, 1 << 20]
+    param_names = ['size']
+
+    def setup(self, size):
+        common.setup_stub()
+        if common.stub_mode:
+            self.pool = memory.SingleDeviceMemoryPool(common.stub_malloc)
+        else:
+            self.pool = memory.SingleDeviceMemoryPool()
+        # Keep a free block in the pool so that malloc hits the cache.
+        self.pool.malloc(size)
+
+    def teardown(self, size):
+        self.pool.free_all_blocks()
+
+    def time_malloc_free(self, size):
+        # The pointer is freed to the pool as soon as it is released.
+        self.pool.malloc(size)
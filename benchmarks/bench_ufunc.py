@@ -0,0 +1,50 @@
+import cupy
+
+from benchmarks import common
+
+
+class Ufunc(object):
+
+    params = [(), (4, 4), (2, 3, 4)]
+    param_names = ['shape']
+
+    def setup(self, shape):
+        common.setup_stub()
+        self.a = cupy.ones(shape, 'f')
+        self.b = cupy.ones(shape, 'f')
+        self.out = cupy.empty(shape, 'f')
+
+    def teardown(self, shape):
+        common.synchronize()
+
+    def time_add(self, shape):
+        cupy.add(self.a, self.b)
+
+    def time_add_out(self, shape):
+        cupy.add(self.a, self.b, out=self.out)
+
+    def time_add_python_scalar(self, shape):
+        cupy.add(self.a, 1.0)
+
+    def time_add_operator(self, shape):
+        self.a + self.b
+
+    def time_sqrt(self, shape):
+        cupy.sqrt(self.a)
+
+
+class UfuncBroadcast(object):
+
+    def setup(self):
+        common.setup_stub()
+        self.a = cupy.ones((4, 4), 'f')
+        self.b = cupy.ones((4,), 'f')
+
+    def teardown(self):
+        common.synchronize()
+
+    def time_add_broadcast(self):
+        cupy.add(self.a, self.b)
+
+    def time_add_mixed_dtype(self):
+        cupy.add(self.a, self.b.astype('d'))
@@ -0,0 +1,170 @@
+"""Helpers shared by the host-overhead benchmarks.
+
+The benchmarks measure the Python-side cost of a single call, so every array
+used here is small enough for the kernel execution to be negligible.
+
+When ``CUPY_BENCHMARK_STUB=1`` is set, the suite runs in the *stub-kernel
+mode*, which does not need a GPU. In this mode the device memory allocator is
+replaced with a fake one that only hands out addresses, the copies to and
+from the fake memory do nothing, modules loaded by
+:func:`cupy.cuda.compile_with_cache` are replaced with stubs whose kernels
+are not launched, and the current device is reported without querying the
+runtime. The kernels are still generated and compiled by NVRTC, so the whole
+host-side dispatch is measured. Benchmarks that read results back to the
+host are skipped in this mode.
+
+"""
+import itertools
+import os
+
+import cupy
+from cupy.cuda import compiler
+from cupy.cuda import device
+from cupy.cuda import function
+from cupy.cuda import memory
+
+
+stub_mode = os.environ.get('CUPY_BENCHMARK_STUB') == '1'
+
+
+class _StubMemory(memory.Memory):
+
+    """Fake device memory that owns only an address range."""
+
+    _next_ptr = itertools.count(1)
+
+    def __init__(self, size):
+        memory.Memory.__init__(self, 0)
+        self.size = size
+        # Keep the addresses unique and aligned as cudaMalloc does.
+        self.ptr = next(self._next_ptr) << 20 if size > 0 else 0
+
+    def __del__(self):
+        # The address range must not be freed by the runtime.
+        self.ptr = 0
+
+
+class _StubMemoryPointer(memory.MemoryPointer):
+
+    """Pointer to fake device memory, which ignores copies and memsets."""
+
+    def copy_from_device(self, src, size):
+        pass
+
+    def copy_from_device_async(self, src, size, stream):
+        pass
+
+    def copy_from_host(self, mem, size):
+        pass
+
+    def copy_from_host_async(self, mem, size, stream):
+        pass
+
+    def copy_from(self, mem, size):
+        pass
+
+    def copy_from_async(self, mem, size, stream):
+        pass
+
+    def copy_to_host(self, mem, size):
+        pass
+
+    def copy_to_host_async(self, mem, size, stream):
+        pass
+
+    def memset(self, value, size):
+        pass
+
+    def memset_async(self, value, size, stream):
+        pass
+
+
+def stub_malloc(size):
+    """Allocator compatible with :func:`cupy.cuda.set_allocator`."""
+    return _StubMemoryPointer(_StubMemory(size), 0)
+
+
+class _StubFunction(function.Function):
+
+    """Kernel that is not launched but counted."""
+
+    launch_count = 0
+
+    def __init__(self, module, name):
+        self.module = module
+        self.name = name
+
+    def __call__(self, grid, block, args, shared_mem=0, stream=None):
+        _StubFunction.launch_count += 1
+
+    def linear_launch(self, size, args, shared_mem=0, block_max_size=128,
+                      stream=None):
+        _StubFunction.launch_count += 1
+
+
+class _StubModule(function.Module):
+
+    def load(self, cubin):
+        pass
+
+    def load_file(self, filename):
+        pass
+
+    def get_function(self, name):
+        return _StubFunction(self, name)
+
+
+class _StubLinkState(object):
+
+    def add_ptr_data(self, data, name):
+        pass
+
+    def complete(self):
+        return b''
+
+
+class _StubFunctionModule(object):
+
+    Module = _StubModule
+    LinkState = _StubLinkState
+
+
+def _stub_get_arch():
+    return 'compute_30'
+
+
+def setup_stub():
+    """Enters the stub-kernel mode if it is requested."""
+    if stub_mode:
+        memory.set_allocator(stub_malloc)
+        compiler.function = _StubFunctionModule
+        compiler._get_arch = _stub_get_arch
+        device._set_stub_device_id(0)
+
+
+def launch_count():
+    """Returns the number of kernels launched in the stub-kernel mode."""
+    return _StubFunction.launch_count
+
+
+def require_gpu():
+    """Skips the benchmark in the stub-kernel mode.
+
+    It is needed only by the benchmarks that read results back to the host.
+
+    asv treats :class:`NotImplementedError` raised in ``setup`` as a skip.
+
+    """
+    if stub_mode:
+        raise NotImplementedError('requires a GPU')
+
+
+def empty(shape, dtype='f'):
+    """Creates an array that can be used in both modes."""
+    setup_stub()
+    return cupy.ndarray(shape, dtype)
+
+
+def synchronize():
+    if not stub_mode:
+        cupy.cuda.Device().synchronize()
@@ -33,6 +33,7 @@ __version__ = pkg_resources.get_distribution('cupy').version
 from cupy import binary  # NOQA
 from cupy.core import fusion  # NOQA
 from cupy import creation  # NOQA
+from cupy import fft  # NOQA
 from cupy import indexing  # NOQA
 from cupy import io  # NOQA
 from cupy import linalg  # NOQA
@@ -281,6 +282,7 @@ from numpy import base_repr  # NOQA
 # -----------------------------------------------------------------------------
 # Linear algebra
 # -----------------------------------------------------------------------------
+from cupy.linalg.einsum import einsum  # NOQA
 from cupy.linalg.product import dot  # NOQA
 from cupy.linalg.product import inner  # NOQA
 from cupy.linalg.product import kron  # NOQA
@@ -379,6 +381,11 @@ from cupy.core.fusion import remainder as mod  # NOQA
 from cupy.core.fusion import subtract  # NOQA
 from cupy.core.fusion import true_divide  # NOQA
 
+from cupy.core.fusion import conj  # NOQA
+from cupy.core.fusion import conjugate  # NOQA
+from cupy.math.misc import imag  # NOQA
+from cupy.math.misc import real  # NOQA
+
 from cupy.core.fusion import abs  # NOQA
 from cupy.core.fusion import absolute  # NOQA
 from cupy.core.fusion import clip  # NOQA
@@ -402,15 +409,19 @@ pad = padding.pad.pad
 from cupy.sorting.count import count_nonzero  # NOQA
 from cupy.sorting.search import flatnonzero  # NOQA
 from cupy.sorting.search import nonzero  # NOQA
+from cupy.sorting.search import searchsorted  # NOQA
 
 from cupy.core.fusion import where  # NOQA
 from cupy.sorting.search import argmax  # NOQA
 from cupy.sorting.search import argmin  # NOQA
 
+from cupy.sorting.sort import argpartition  # NOQA
 from cupy.sorting.sort import argsort  # NOQA
 from cupy.sorting.sort import lexsort  # NOQA
 from cupy.sorting.sort import msort  # NOQA
+from cupy.sorting.sort import partition  # NOQA
 from cupy.sorting.sort import sort  # NOQA
+from cupy.sorting.sort import topk  # NOQA
 
 # -----------------------------------------------------------------------------
 # Statistics
@@ -421,12 +432,20 @@ from cupy.core.fusion import amin  # NOQA
 from cupy.core.fusion import amin as min  # NOQA
 from cupy.statistics.order import nanmax  # NOQA
 from cupy.statistics.order import nanmin  # NOQA
+from cupy.statistics.order import nanpercentile  # NOQA
+from cupy.statistics.order import nanquantile  # NOQA
+from cupy.statistics.order import percentile  # NOQA
+from cupy.statistics.order import quantile  # NOQA
 
 from cupy.statistics.meanvar import mean  # NOQA
+from cupy.statistics.meanvar import median  # NOQA
+from cupy.statistics.meanvar import nanmedian  # NOQA
 from cupy.statistics.meanvar import std  # NOQA
 from cupy.statistics.meanvar import var  # NOQA
 
 from cupy.statistics.histogram import bincount  # NOQA
+from cupy.statistics.histogram import digitize  # NOQA
+from cupy.statistics.histogram import histogram  # NOQA
 
 # -----------------------------------------------------------------------------
 # CuPy specific functions
@@ -0,0 +1,9 @@
+from cupy.benchmarks import harness  # NOQA
+from cupy.benchmarks import routines  # NOQA
+
+from cupy.benchmarks.harness import benchmark  # NOQA
+from cupy.benchmarks.harness import Benchmark  # NOQA
+from cupy.benchmarks.harness import get_benchmarks  # NOQA
+from cupy.benchmarks.harness import print_results  # NOQA
+from cupy.benchmarks.harness import run  # NOQA
+from cupy.benchmarks.harness import write_json  # NOQA
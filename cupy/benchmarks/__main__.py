@@ -0,0 +1,43 @@
+from __future__ import print_function
+
+import argparse
+import sys
+
+from cupy import benchmarks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m cupy.benchmarks',
+        description='Measures throughput of CuPy routines against NumPy.')
+    parser.add_argument('pattern', nargs='?', default=None,
+                        help='glob pattern of benchmark names to run, '
+                        'e.g. "sorting.*"')
+    parser.add_argument('--repeat', type=int, default=10,
+                        help='number of calls measured for each case')
+    parser.add_argument('--no-numpy', action='store_true',
+                        help='do not measure the NumPy baseline')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='validate the harness without GPU')
+    parser.add_argument('--output', '-o', default=None,
+                        help='path to write the results in JSON')
+    parser.add_argument('--list', action='store_true',
+                        help='list the benchmarks and exit')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for b in benchmarks.get_benchmarks(args.pattern):
+            print(b.name)
+        return 0
+
+    results = benchmarks.run(
+        args.pattern, repeat=args.repeat, use_numpy=not args.no_numpy,
+        dry_run=args.dry_run)
+    benchmarks.print_results(results)
+    if args.output is not None:
+        benchmarks.write_json(results, args.output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,216 @@
+from __future__ import print_function
+
+import fnmatch
+import json
+import platform
+import timeit
+
+import numpy
+try:
+    import scipy.sparse
+    scipy_available = True
+except ImportError:
+    scipy_available = False
+
+import cupy
+from cupy import cuda
+
+
+_benchmarks = []
+
+_dry_run_size = 64
+
+
+class Benchmark(object):
+
+    """Throughput benchmark of a routine.
+
+    Args:
+        name (str): Name of the benchmark, e.g. ``'elementwise.add'``.
+        setup (function): Function that prepares the operands and returns a
+            function without arguments that runs the routine once. It takes
+            the array module (``numpy`` or ``cupy``) as ``xp``, the sparse
+            module (``scipy.sparse`` or ``cupy.sparse``) as ``sp`` if
+            ``sparse`` is ``True``, and the parameters as keyword arguments.
+        params (list of dicts): Parameters to run the benchmark with. Each
+            dict must contain ``size``.
+        nbytes (function): Function that takes the parameters as keyword
+            arguments and returns the number of bytes read and written by
+            the routine. It is used to report the effective bandwidth.
+        flops (function): Function that takes the parameters as keyword
+            arguments and returns the number of floating point operations.
+        sparse (bool): If ``True``, the sparse module is passed to ``setup``.
+
+    """
+
+    def __init__(self, name, setup, params, nbytes=None, flops=None,
+                 sparse=False):
+        self.name = name
+        self.setup = setup
+        self.params = params
+        self.nbytes = nbytes
+        self.flops = flops
+        self.sparse = sparse
+
+    def __repr__(self):
+        return '<Benchmark %s>' % self.name
+
+    def dry_run_params(self):
+        """Returns the parameters shrunk for the dry-run mode."""
+        params = []
+        for p in self.params:
+            p = dict(p, size=min(p['size'], _dry_run_size))
+            if p not in params:
+                params.append(p)
+        return params
+
+
+def benchmark(name, params, nbytes=None, flops=None, sparse=False):
+    """Decorator to register a setup function as a benchmark.
+
+    .. seealso:: :class:`cupy.benchmarks.Benchmark`
+
+    """
+    def decorator(setup):
+        _benchmarks.append(
+            Benchmark(name, setup, params, nbytes, flops, sparse))
+        return setup
+    return decorator
+
+
+def get_benchmarks(pattern=None):
+    """Returns the registered benchmarks whose names match ``pattern``."""
+    if pattern is None:
+        return list(_benchmarks)
+    return [b for b in _benchmarks if fnmatch.fnmatch(b.name, pattern)]
+
+
+def _time_cupy(func, repeat):
+    start = cuda.Event()
+    stop = cuda.Event()
+    start.record()
+    for _ in range(repeat):
+        func()
+    stop.record()
+    stop.synchronize()
+    return cuda.get_elapsed_time(start, stop) / 1000. / repeat
+
+
+def _time_numpy(func, repeat):
+    start = timeit.default_timer()
+    for _ in range(repeat):
+        func()
+    return (timeit.default_timer() - start) / repeat
+
+
+def _run_one(bench, xp, params, repeat):
+    kwargs = dict(params)
+    if bench.sparse:
+        kwargs['sp'] = cupy.sparse if xp is cupy else scipy.sparse
+    func = bench.setup(xp, **kwargs)
+    # The first call is excluded to skip kernel compilation.
+    func()
+    if xp is cupy:
+        cuda.Device().synchronize()
+        time = _time_cupy(func, repeat)
+    else:
+        time = _time_numpy(func, repeat)
+
+    result = {
+        'name': bench.name,
+        'backend': xp.__name__,
+        'params': dict(params),
+        'time': time,
+        'bandwidth': None,
+        'flops': None,
+    }
+    if time > 0:
+        if bench.nbytes is not None:
+            result['bandwidth'] = bench.nbytes(**params) / time
+        if bench.flops is not None:
+            result['flops'] = bench.flops(**params) / time
+    return result
+
+
+def run(pattern=None, repeat=10, use_numpy=True, dry_run=False):
+    """Runs the registered benchmarks.
+
+    Args:
+        pattern (str): Glob pattern of benchmark names to run. All benchmarks
+            are run by default.
+        repeat (int): Number of calls measured for each parameter set.
+        use_numpy (bool): If ``True``, NumPy (and SciPy for sparse routines)
+            is also measured as the baseline.
+        dry_run (bool): If ``True``, the harness is validated without a GPU.
+            Every benchmark is run once with tiny operands using NumPy only.
+
+    Returns:
+        list of dicts: Results of each run.
+
+    """
+    if dry_run:
+        modules = [numpy]
+        repeat = 1
+    else:
+        if not cupy.is_available():
+            raise RuntimeError(
+                'No CUDA device is available. '
+                'Use the dry-run mode to validate the harness without GPU.')
+        modules = [cupy, numpy] if use_numpy else [cupy]
+
+    results = []
+    for bench in get_benchmarks(pattern):
+        params = bench.dry_run_params() if dry_run else bench.params
+        for xp in modules:
+            if bench.sparse and xp is numpy and not scipy_available:
+                continue
+            for p in params:
+                results.append(_run_one(bench, xp, p, repeat))
+    return results
+
+
+def _environment():
+    env = {
+        'cupy': cupy.__version__,
+        'numpy': numpy.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'device': None,
+    }
+    try:
+        if cupy.is_available():
+            env['device'] = cuda.Device().compute_capability
+    except Exception:
+        pass
+    return env
+
+
+def write_json(results, path):
+    """Writes the results to a JSON file for regression tracking."""
+    with open(path, 'w') as f:
+        json.dump({'environment': _environment(), 'results': results}, f,
+                  indent=2, sort_keys=True)
+
+
+def _format_rate(value, unit):
+    if value is None:
+        return '-'
+    return '%.3f G%s' % (value / 1e9, unit)
+
+
+def print_results(results, file=None):
+    """Prints the results as a table."""
+    fmt = '%-24s %-6s %-36s %12s %14s %14s'
+    lines = [fmt % ('name', 'xp', 'params', 'time [us]', 'bandwidth',
+                    'flops')]
+    for r in results:
+        params = ', '.join(
+            '%s=%s' % (k, v) for k, v in sorted(r['params'].items()))
+        lines.append(fmt % (
+            r['name'], r['backend'], params, '%.2f' % (r['time'] * 1e6),
+            _format_rate(r['bandwidth'], 'B/s'),
+            _format_rate(r['flops'], 'FLOP/s')))
+    if file is None:
+        print('\n'.join(lines))
+    else:
+        file.write('\n'.join(lines) + '\n')
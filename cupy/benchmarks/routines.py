@@ -0,0 +1,217 @@
+import numpy
+
+from cupy.benchmarks.harness import benchmark
+from cupy import testing
+
+
+_sizes = [1 << 12, 1 << 16, 1 << 20, 1 << 24]
+_matrix_sizes = [128, 512, 1024, 2048]
+_float_dtypes = ['float32', 'float64']
+
+
+def _itemsize(dtype):
+    return numpy.dtype(dtype).itemsize
+
+
+# -----------------------------------------------------------------------------
+# Elementwise
+# -----------------------------------------------------------------------------
+
+@benchmark('elementwise.add',
+           testing.product({'size': _sizes, 'dtype': _float_dtypes}),
+           nbytes=lambda size, dtype: 3 * size * _itemsize(dtype))
+def add(xp, size, dtype):
+    a = testing.shaped_random((size,), xp, dtype)
+    b = testing.shaped_random((size,), xp, dtype)
+    out = xp.empty_like(a)
+    return lambda: xp.add(a, b, out=out)
+
+
+@benchmark('elementwise.exp',
+           testing.product({'size': _sizes, 'dtype': _float_dtypes}),
+           nbytes=lambda size, dtype: 2 * size * _itemsize(dtype))
+def exp(xp, size, dtype):
+    a = testing.shaped_random((size,), xp, dtype, scale=1)
+    out = xp.empty_like(a)
+    return lambda: xp.exp(a, out=out)
+
+
+# -----------------------------------------------------------------------------
+# Reduction
+# -----------------------------------------------------------------------------
+
+@benchmark('reduction.sum',
+           testing.product({'size': _sizes, 'dtype': _float_dtypes}),
+           nbytes=lambda size, dtype: size * _itemsize(dtype))
+def sum_all(xp, size, dtype):
+    a = testing.shaped_random((size,), xp, dtype)
+    return lambda: a.sum()
+
+
+@benchmark('reduction.sum_axis',
+           testing.product({'size': _sizes, 'dtype': _float_dtypes}),
+           nbytes=lambda size, dtype: size * _itemsize(dtype))
+def sum_axis(xp, size, dtype):
+    a = testing.shaped_random((size // 64, 64), xp, dtype)
+    return lambda: a.sum(axis=1)
+
+
+@benchmark('reduction.max',
+           testing.product({'size': _sizes, 'dtype': _float_dtypes}),
+           nbytes=lambda size, dtype: size * _itemsize(dtype))
+def max_all(xp, size, dtype):
+    a = testing.shaped_random((size,), xp, dtype)
+    return lambda: a.max()
+
+
+# -----------------------------------------------------------------------------
+# Sorting
+# -----------------------------------------------------------------------------
+
+@benchmark('sorting.sort',
+           testing.product({'size': _sizes,
+                            'dtype': _float_dtypes + ['int32']}),
+           nbytes=lambda size, dtype: 2 * size * _itemsize(dtype))
+def sort(xp, size, dtype):
+    a = testing.shaped_random((size,), xp, dtype, scale=size)
+    return lambda: xp.sort(a)
+
+
+@benchmark('sorting.argsort',
+           testing.product({'size': _sizes, 'dtype': _float_dtypes}),
+           nbytes=lambda size, dtype: size * (_itemsize(dtype) + 8))
+def argsort(xp, size, dtype):
+    a = testing.shaped_random((size,), xp, dtype, scale=size)
+    return lambda: xp.argsort(a)
+
+
+# -----------------------------------------------------------------------------
+# Linear algebra
+# -----------------------------------------------------------------------------
+
+@benchmark('linalg.matmul',
+           testing.product({'size': _matrix_sizes, 'dtype': _float_dtypes}),
+           flops=lambda size, dtype: 2 * size ** 3)
+def matmul(xp, size, dtype):
+    a = testing.shaped_random((size, size), xp, dtype)
+    b = testing.shaped_random((size, size), xp, dtype)
+    return lambda: xp.matmul(a, b)
+
+
+@benchmark('linalg.tensordot',
+           testing.product({'size': _matrix_sizes, 'dtype': _float_dtypes}),
+           flops=lambda size, dtype: 2 * size * size * 16 * 16)
+def tensordot(xp, size, dtype):
+    a = testing.shaped_random((size, 16, 16), xp, dtype)
+    b = testing.shaped_random((16, 16, size), xp, dtype)
+    return lambda: xp.tensordot(a, b, axes=2)
+
+
+# -----------------------------------------------------------------------------
+# Scan
+# -----------------------------------------------------------------------------
+
+@benchmark('scan.cumsum',
+           testing.product({'size': _sizes, 'dtype': _float_dtypes}),
+           nbytes=lambda size, dtype: 2 * size * _itemsize(dtype))
+def cumsum(xp, size, dtype):
+    a = testing.shaped_random((size,), xp, dtype)
+    return lambda: xp.cumsum(a)
+
+
+@benchmark('scan.cumsum_axis',
+           testing.product({'size': _sizes, 'dtype': _float_dtypes}),
+           nbytes=lambda size, dtype: 2 * size * _itemsize(dtype))
+def cumsum_axis(xp, size, dtype):
+    a = testing.shaped_random((size // 64, 64), xp, dtype)
+    return lambda: xp.cumsum(a, axis=0)
+
+
+# -----------------------------------------------------------------------------
+# Indexing
+# -----------------------------------------------------------------------------
+
+def _random_indices(xp, size):
+    indices = numpy.random.RandomState(0).randint(0, size, size)
+    return xp.array(indices.astype(numpy.int64))
+
+
+@benchmark('indexing.take',
+           testing.product({'size': _sizes, 'dtype': _float_dtypes}),
+           nbytes=lambda size, dtype: size * (2 * _itemsize(dtype) + 8))
+def take(xp, size, dtype):
+    a = testing.shaped_random((size,), xp, dtype)
+    indices = _random_indices(xp, size)
+    return lambda: xp.take(a, indices)
+
+
+@benchmark('indexing.scatter',
+           testing.product({'size': _sizes, 'dtype': _float_dtypes}),
+           nbytes=lambda size, dtype: size * (2 * _itemsize(dtype) + 8))
+def scatter(xp, size, dtype):
+    a = xp.zeros((size,), dtype)
+    v = testing.shaped_random((size,), xp, dtype)
+    indices = _random_indices(xp, size)
+
+    def f():
+        a[indices] = v
+    return f
+
+
+# -----------------------------------------------------------------------------
+# Sparse
+# -----------------------------------------------------------------------------
+
+_nnz_per_row = 16
+
+
+def _random_csr(xp, sp, size, dtype):
+    rs = numpy.random.RandomState(0)
+    k = min(_nnz_per_row, size)
+    indptr = numpy.arange(0, size * k + 1, k, dtype=numpy.int32)
+    indices = numpy.sort(
+        rs.randint(0, size, (size, k)).astype(numpy.int32), axis=1)
+    # Remove duplicated column indices by shifting them within each row.
+    indices = (indices + numpy.arange(k, dtype=numpy.int32)) % size
+    indices.sort(axis=1)
+    data = rs.uniform(-1, 1, size * k).astype(dtype)
+    return sp.csr_matrix(
+        (xp.array(data), xp.array(indices.ravel()), xp.array(indptr)),
+        shape=(size, size))
+
+
+@benchmark('sparse.spmv',
+           testing.product({'size': _sizes, 'dtype': _float_dtypes}),
+           flops=lambda size, dtype: 2 * size * min(_nnz_per_row, size),
+           sparse=True)
+def spmv(xp, sp, size, dtype):
+    a = _random_csr(xp, sp, size, dtype)
+    x = testing.shaped_random((size,), xp, dtype)
+    return lambda: a.dot(x)
+
+
+@benchmark('sparse.spgemm',
+           testing.product({'size': _sizes[:3], 'dtype': _float_dtypes}),
+           flops=lambda size, dtype: 2 * size * min(_nnz_per_row, size) ** 2,
+           sparse=True)
+def spgemm(xp, sp, size, dtype):
+    a = _random_csr(xp, sp, size, dtype)
+    return lambda: a.dot(a)
+
+
+# -----------------------------------------------------------------------------
+# Random
+# -----------------------------------------------------------------------------
+
+@benchmark('random.uniform', testing.product({'size': _sizes}),
+           nbytes=lambda size: 8 * size)
+def uniform(xp, size):
+    rs = xp.random.RandomState(0)
+    return lambda: rs.uniform(size=size)
+
+
+@benchmark('random.normal', testing.product({'size': _sizes}),
+           nbytes=lambda size: 8 * size)
+def normal(xp, size):
+    rs = xp.random.RandomState(0)
+    return lambda: rs.normal(size=size)
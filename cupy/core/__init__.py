@@ -16,6 +16,7 @@ from cupy.core.core import broadcast  # NOQA
 from cupy.core.core import broadcast_to  # NOQA
 from cupy.core.core import concatenate  # NOQA
 from cupy.core.core import concatenate_method  # NOQA
+from cupy.core.core import conj  # NOQA
 from cupy.core.core import create_comparison  # NOQA
 from cupy.core.core import create_reduction_func  # NOQA
 from cupy.core.core import create_ufunc  # NOQA
@@ -30,6 +31,7 @@ from cupy.core.core import floor_divide  # NOQA
 from cupy.core.core import greater  # NOQA
 from cupy.core.core import greater_equal  # NOQA
 from cupy.core.core import invert  # NOQA
+from cupy.core.core import KernelCode  # NOQA
 from cupy.core.core import left_shift  # NOQA
 from cupy.core.core import less  # NOQA
 from cupy.core.core import less_equal  # NOQA
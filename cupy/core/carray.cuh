@@ -131,6 +131,181 @@ __device__ int isinf(float16 x) {return x.isinf();}
 __device__ int isfinite(float16 x) {return x.isfinite();}
 __device__ int signbit(float16 x) {return x.signbit();}
 
+// complex
+template <typename T>
+class __align__(sizeof(T) * 2) complex
+{
+private:
+  T real_;
+  T imag_;
+public:
+  typedef T value_type;
+
+  __device__ complex() {}
+  __device__ complex(T re, T im = T()) : real_(re), imag_(im) {}
+  // float16 needs its own constructor since its conversion to T is also
+  // user-defined, and implicit conversions cannot chain two of them.
+  __device__ complex(const float16& re)
+      : real_(static_cast<float>(re)), imag_() {}
+
+  template <typename U>
+  __device__ complex(const complex<U>& z)
+      : real_(static_cast<T>(z.real())), imag_(static_cast<T>(z.imag())) {}
+
+  __device__ T real() const {return real_;}
+  __device__ T imag() const {return imag_;}
+
+  __device__ complex& operator+=(const complex& rhs) {
+    real_ += rhs.real_;
+    imag_ += rhs.imag_;
+    return *this;
+  }
+
+  __device__ complex& operator-=(const complex& rhs) {
+    real_ -= rhs.real_;
+    imag_ -= rhs.imag_;
+    return *this;
+  }
+
+  __device__ complex& operator*=(const complex& rhs) {
+    *this = *this * rhs;
+    return *this;
+  }
+
+  __device__ complex& operator/=(const complex& rhs) {
+    *this = *this / rhs;
+    return *this;
+  }
+
+  friend __device__ complex operator+(const complex& x, const complex& y) {
+    return complex(x.real_ + y.real_, x.imag_ + y.imag_);
+  }
+
+  friend __device__ complex operator-(const complex& x, const complex& y) {
+    return complex(x.real_ - y.real_, x.imag_ - y.imag_);
+  }
+
+  friend __device__ complex operator*(const complex& x, const complex& y) {
+    return complex(x.real_ * y.real_ - x.imag_ * y.imag_,
+                   x.real_ * y.imag_ + x.imag_ * y.real_);
+  }
+
+  friend __device__ complex operator/(const complex& x, const complex& y) {
+    // Smith's algorithm avoids the overflow of |y|^2.
+    if (fabs(y.real_) >= fabs(y.imag_)) {
+      T r = y.imag_ / y.real_;
+      T d = y.real_ + y.imag_ * r;
+      return complex((x.real_ + x.imag_ * r) / d,
+                     (x.imag_ - x.real_ * r) / d);
+    } else {
+      T r = y.real_ / y.imag_;
+      T d = y.real_ * r + y.imag_;
+      return complex((x.real_ * r + x.imag_) / d,
+                     (x.imag_ * r - x.real_) / d);
+    }
+  }
+
+  friend __device__ complex operator-(const complex& x) {
+    return complex(-x.real_, -x.imag_);
+  }
+
+  friend __device__ bool operator==(const complex& x, const complex& y) {
+    return x.real_ == y.real_ && x.imag_ == y.imag_;
+  }
+
+  friend __device__ bool operator!=(const complex& x, const complex& y) {
+    return x.real_ != y.real_ || x.imag_ != y.imag_;
+  }
+
+  // Complex values are ordered lexicographically as in NumPy.
+  friend __device__ bool operator<(const complex& x, const complex& y) {
+    return x.real_ < y.real_ || (x.real_ == y.real_ && x.imag_ < y.imag_);
+  }
+
+  friend __device__ bool operator<=(const complex& x, const complex& y) {
+    return x.real_ < y.real_ || (x.real_ == y.real_ && x.imag_ <= y.imag_);
+  }
+
+  friend __device__ bool operator>(const complex& x, const complex& y) {
+    return y < x;
+  }
+
+  friend __device__ bool operator>=(const complex& x, const complex& y) {
+    return y <= x;
+  }
+};
+
+template <typename T>
+__device__ T real(const complex<T>& z) {return z.real();}
+template <typename T>
+__device__ T imag(const complex<T>& z) {return z.imag();}
+template <typename T>
+__device__ complex<T> conj(const complex<T>& z) {
+  return complex<T>(z.real(), -z.imag());
+}
+template <typename T>
+__device__ T abs(const complex<T>& z) {return hypot(z.real(), z.imag());}
+template <typename T>
+__device__ T arg(const complex<T>& z) {return atan2(z.imag(), z.real());}
+template <typename T>
+__device__ complex<T> exp(const complex<T>& z) {
+  T r = exp(z.real());
+  return complex<T>(r * cos(z.imag()), r * sin(z.imag()));
+}
+template <typename T>
+__device__ complex<T> log(const complex<T>& z) {
+  return complex<T>(log(abs(z)), arg(z));
+}
+template <typename T>
+__device__ complex<T> sqrt(const complex<T>& z) {
+  if (z.real() == 0 && z.imag() == 0) {
+    return complex<T>(0, z.imag());
+  }
+  T t = sqrt((fabs(z.real()) + abs(z)) / 2);
+  if (z.real() >= 0) {
+    return complex<T>(t, z.imag() / (2 * t));
+  } else {
+    return complex<T>(fabs(z.imag()) / (2 * t), copysign(t, z.imag()));
+  }
+}
+template <typename T>
+__device__ complex<T> sin(const complex<T>& z) {
+  return complex<T>(sin(z.real()) * cosh(z.imag()),
+                    cos(z.real()) * sinh(z.imag()));
+}
+template <typename T>
+__device__ complex<T> cos(const complex<T>& z) {
+  return complex<T>(cos(z.real()) * cosh(z.imag()),
+                    -sin(z.real()) * sinh(z.imag()));
+}
+template <typename T>
+__device__ bool isnan(const complex<T>& z) {
+  return isnan(z.real()) || isnan(z.imag());
+}
+template <typename T>
+__device__ bool isinf(const complex<T>& z) {
+  return isinf(z.real()) || isinf(z.imag());
+}
+template <typename T>
+__device__ bool isfinite(const complex<T>& z) {
+  return isfinite(z.real()) && isfinite(z.imag());
+}
+
+// Assigns a value with the conversion of NumPy, which drops the imaginary
+// part of a complex value assigned to a real variable.
+template <typename T, typename U>
+__device__ void _cupy_assign(T& out, const U& in) {out = in;}
+template <typename T, typename U>
+__device__ void _cupy_assign(T& out, const complex<U>& in) {out = in.real();}
+template <typename T, typename U>
+__device__ void _cupy_assign(complex<T>& out, const complex<U>& in) {
+  out = complex<T>(in);
+}
+template <typename U>
+__device__ void _cupy_assign(bool& out, const complex<U>& in) {
+  out = in.real() != 0 || in.imag() != 0;
+}
+
 // CArray
 #define CUPY_FOR(i, n) \
     for (ptrdiff_t i = blockIdx.x * blockDim.x + threadIdx.x; \
@@ -76,3 +76,55 @@ cpdef function.Module compile_with_cache(
         str source, tuple options=(), arch=None, cachd_dir=None):
     source = _get_header_source() + source
     return cuda.compile_with_cache(source, options, arch, cachd_dir)
+
+
+class KernelCode(object):
+
+    """Generated code of a kernel.
+
+    Objects of this class are returned by the ``get_code`` methods of
+    :class:`~cupy.ufunc`, :class:`~cupy.ElementwiseKernel`,
+    :class:`~cupy.ReductionKernel` and fused functions. Generating the code
+    neither compiles it nor requires any device.
+
+    Attributes:
+        name (str): Name of the kernel function.
+        source (str): CUDA-C/C++ source of the kernel module. The header
+            ``cupy/core/carray.cuh`` is prepended to it on compilation.
+        options (tuple of str): Compiler options.
+
+    """
+
+    def __init__(self, name, source, options=()):
+        self.name = name
+        self.source = source
+        self.options = tuple(options)
+
+    def __repr__(self):
+        return "<KernelCode '%s'>" % self.name
+
+    def get_cache_key(self, arch=None):
+        """Returns the key of the kernel in the kernel cache.
+
+        Computing the key runs the NVRTC preprocessor, but not the compiler.
+
+        Args:
+            arch (str): Target architecture such as ``'compute_35'``. The
+                architecture of the current device is used by default.
+
+        Returns:
+            str: The key, which is also the prefix of the cache file name.
+
+        """
+        return cuda.compiler.get_cache_key(
+            _get_header_source() + self.source, self.options, arch)
+
+    def compile(self):
+        """Compiles the code and returns the kernel function.
+
+        Returns:
+            cupy.cuda.Function: The kernel function.
+
+        """
+        module = compile_with_cache(self.source, self.options)
+        return module.get_function(self.name)
@@ -62,6 +62,7 @@ cdef class ndarray:
     cpdef _set_shape_and_strides(self, vector.vector[Py_ssize_t]& shape,
                                  vector.vector[Py_ssize_t]& strides,
                                  bint update_c_contiguity=*)
+    cdef ndarray _complex_part_view(self, Py_ssize_t offset)
     cdef CPointer get_pointer(self)
 
 
@@ -1,6 +1,7 @@
 # distutils: language = c++
 
 from __future__ import division
+import os
 import sys
 
 import numpy
@@ -8,11 +9,15 @@ import six
 
 import cupy
 from cupy.core import flags
-from cupy.cuda import stream
+from cupy.cuda import stream as stream_module
 try:
     from cupy.cuda import thrust
 except ImportError:
     pass
+try:
+    from cupy.cuda import nvtx
+except ImportError:
+    nvtx = None
 from cupy import util
 
 cimport cpython
@@ -198,6 +203,54 @@ cdef class ndarray:
         else:
             return self._transpose(vector.vector[Py_ssize_t]())
 
+    property real:
+        """Real part of the array.
+
+        For complex arrays, it is a view of the real parts. Otherwise, it is
+        the array itself.
+
+        .. seealso:: :attr:`numpy.ndarray.real`
+
+        """
+
+        def __get__(self):
+            if self.dtype.kind != 'c':
+                return self
+            return self._complex_part_view(0)
+
+        def __set__(self, value):
+            elementwise_copy(value, self.real)
+
+    property imag:
+        """Imaginary part of the array.
+
+        For complex arrays, it is a view of the imaginary parts. Otherwise,
+        it is a new array filled with zeros, and cannot be set.
+
+        .. seealso:: :attr:`numpy.ndarray.imag`
+
+        """
+
+        def __get__(self):
+            cdef ndarray ret
+            if self.dtype.kind != 'c':
+                ret = ndarray(self.shape, dtype=self.dtype)
+                ret.fill(0)
+                return ret
+            return self._complex_part_view(self.itemsize // 2)
+
+        def __set__(self, value):
+            if self.dtype.kind != 'c':
+                raise TypeError('array does not have imaginary part to set')
+            elementwise_copy(value, self.imag)
+
+    cdef ndarray _complex_part_view(self, Py_ssize_t offset):
+        cdef ndarray v
+        v = self.view(self.dtype.char.lower())
+        v._set_shape_and_strides(self._shape, self._strides)
+        v.data = self.data + offset
+        return v
+
     __array_priority__ = 100
 
     # -------------------------------------------------------------------------
@@ -370,7 +423,8 @@ cdef class ndarray:
                 x = self.astype(self.dtype, copy=False, order=order)
             newarray = ndarray(x.shape, dtype=x.dtype)
             newarray._set_shape_and_strides(x._shape, x._strides)
-            newarray.data.copy_from_device(x.data, x.nbytes)
+            newarray.data.copy_from_device_async(
+                x.data, x.nbytes, stream_module.get_current_stream())
             return newarray
 
     cpdef ndarray view(self, dtype=None):
@@ -420,7 +474,8 @@ cdef class ndarray:
             value = value.item()
 
         if value == 0 and self._c_contiguous:
-            self.data.memset_async(0, self.nbytes, stream.Stream(True))
+            self.data.memset_async(0, self.nbytes,
+                                   stream_module.get_current_stream())
         else:
             elementwise_copy(value, self, dtype=self.dtype)
 
@@ -712,9 +767,9 @@ cdef class ndarray:
                 sort along the last axis.
 
         .. note::
-           For its implementation reason, ``ndarray.sort`` currently supports
-           only arrays with their own data, and does not support ``kind`` and
-           ``order`` parameters that ``numpy.ndarray.sort`` does support.
+           For its implementation reason, ``ndarray.sort`` currently does not
+           support ``kind`` and ``order`` parameters that
+           ``numpy.ndarray.sort`` does support.
 
         .. seealso::
             :func:`cupy.sort` for full documentation,
@@ -725,43 +780,48 @@ cdef class ndarray:
         # TODO(takagi): Support kind argument.
 
         cdef Py_ssize_t ndim = self.ndim
-
-        if not cupy.cuda.thrust_enabled:
-            raise RuntimeError('Thrust is needed to use cupy.sort. Please '
-                               'install CUDA Toolkit with Thrust then '
-                               'reinstall CuPy after uninstalling it.')
+        cdef Py_ssize_t n
+        cdef ndarray data
 
         if ndim == 0:
             raise ValueError('Sorting arrays with the rank of zero is not '
                              'supported')  # as numpy.sort() raises
 
-        # TODO(takagi): Support sorting views
-        if not self._c_contiguous:
-            raise NotImplementedError('Sorting non-contiguous array is not '
-                                      'supported.')
+        _check_sort_dtype(self.dtype)
 
         if axis < 0:
             axis += ndim
         if not (0 <= axis < ndim):
             raise ValueError('Axis out of range')
 
-        if axis == ndim - 1:
+        n = self._shape[axis]
+        if self.size == 0 or n == 1:
+            return
+        if n <= _sort_max_batched_size:
+            # Short rows are sorted in place even if they are strided.
+            _batched_sort(self, axis, None)
+            return
+
+        if not cupy.cuda.thrust_enabled:
+            raise RuntimeError('Thrust is needed to use cupy.sort. Please '
+                               'install CUDA Toolkit with Thrust then '
+                               'reinstall CuPy after uninstalling it.')
+
+        if axis == ndim - 1 and self._c_contiguous:
             data = self
         else:
             data = cupy.rollaxis(self, axis, ndim).copy()
 
-        if ndim == 1:
-            thrust.sort(self.dtype, data.data.ptr, 0, self._shape)
+        if data.size == n:
+            thrust.sort(self.dtype, data.data.ptr, 0, data._shape)
         else:
-            keys_array = ndarray(data._shape, dtype=numpy.intp)
+            keys_array = ndarray(
+                data._shape, dtype=thrust.get_segment_key_dtype(data._shape))
             thrust.sort(
                 self.dtype, data.data.ptr, keys_array.data.ptr, data._shape)
 
-        if axis == ndim - 1:
-            pass
-        else:
-            data = cupy.rollaxis(data, -1, axis)
-            elementwise_copy(data, self)
+        if data is not self:
+            elementwise_copy(cupy.rollaxis(data, -1, axis), self)
 
     def argsort(self, axis=-1):
         """Returns the indices that would sort an array with stable sorting
@@ -783,19 +843,19 @@ cdef class ndarray:
         # TODO(takagi): Support kind argument.
 
         cdef Py_ssize_t ndim = self.ndim
-
-        if not cupy.cuda.thrust_enabled:
-            raise RuntimeError('Thrust is needed to use cupy.argsort. Please '
-                               'install CUDA Toolkit with Thrust then '
-                               'reinstall CuPy after uninstalling it.')
+        cdef Py_ssize_t n
+        cdef ndarray data, idx_array
 
         if ndim == 0:
             raise ValueError('Sorting arrays with the rank of zero is not '
                              'supported')  # as numpy.argsort() raises
 
+        _check_sort_dtype(self.dtype)
+
         if axis is None:
             data = self.reshape(self.size)
             axis = -1
+            ndim = 1
         else:
             data = self
 
@@ -804,6 +864,23 @@ cdef class ndarray:
         if not (0 <= axis < ndim):
             raise ValueError('Axis out of range')
 
+        n = data._shape[axis]
+        idx_array = ndarray(data.shape, dtype=numpy.intp)
+        if data.size == 0:
+            return idx_array
+        if n == 1:
+            idx_array.fill(0)
+            return idx_array
+        if n <= _sort_max_batched_size:
+            # The input is read in place even if it is strided.
+            _batched_sort(data, axis, idx_array)
+            return idx_array
+
+        if not cupy.cuda.thrust_enabled:
+            raise RuntimeError('Thrust is needed to use cupy.argsort. Please '
+                               'install CUDA Toolkit with Thrust then '
+                               'reinstall CuPy after uninstalling it.')
+
         if axis == ndim - 1:
             data = data.copy()
         else:
@@ -811,11 +888,12 @@ cdef class ndarray:
 
         idx_array = ndarray(data.shape, dtype=numpy.intp)
 
-        if ndim == 1:
+        if data.size == n:
             thrust.argsort(self.dtype, idx_array.data.ptr, data.data.ptr, 0,
                            data._shape)
         else:
-            keys_array = ndarray(data._shape, dtype=numpy.intp)
+            keys_array = ndarray(
+                data._shape, dtype=thrust.get_segment_key_dtype(data._shape))
             thrust.argsort(self.dtype, idx_array.data.ptr, data.data.ptr,
                            keys_array.data.ptr, data._shape)
 
@@ -824,8 +902,76 @@ cdef class ndarray:
         else:
             return cupy.rollaxis(idx_array, -1, axis)
 
-    # TODO(okuta): Implement partition
-    # TODO(okuta): Implement argpartition
+    def partition(self, kth, axis=-1):
+        """Partially sorts an array, in-place.
+
+        The ``kth`` element is moved to the position where it would be in a
+        sorted array. The elements before it are not greater than it, and the
+        elements after it are not less than it. The order within each part is
+        undefined.
+
+        Args:
+            kth (int or sequence of ints): Element index to partition by. If
+                a sequence is given, all of them are placed in their sorted
+                positions.
+            axis (int): Axis along which to partition. Default is -1, which
+                means partition along the last axis.
+
+        .. note::
+           Rows longer than 1024 elements are partitioned by the radix select
+           in linear time when ``kth`` is a single index. Otherwise, the rows
+           are sorted.
+
+        .. seealso::
+            :func:`cupy.partition` for full documentation,
+            :meth:`numpy.ndarray.partition`
+
+        """
+        cdef list kths = []
+        cdef ndarray out
+        axis = _normalize_partition_args(self, kth, axis, kths)
+        if self.size == 0:
+            return
+        if _partition_by_sort(self, axis, kths):
+            self.sort(axis)
+            return
+        out = ndarray(self.shape, dtype=self.dtype)
+        _radix_select(self, axis, kths[0], out, None)
+        elementwise_copy(out, self)
+
+    def argpartition(self, kth, axis=-1):
+        """Returns the indices that would partially sort an array.
+
+        Args:
+            kth (int or sequence of ints): Element index to partition by. If
+                a sequence is given, all of them are placed in their sorted
+                positions.
+            axis (int or None): Axis along which to partition. Default is -1,
+                which means partition along the last axis. If None is
+                supplied, the array is flattened before partitioning.
+
+        Returns:
+            cupy.ndarray: Array of indices that partition the array.
+
+        .. seealso::
+            :func:`cupy.argpartition` for full documentation,
+            :meth:`numpy.ndarray.argpartition`
+
+        """
+        cdef list kths = []
+        cdef ndarray data, idx_array
+        if axis is None:
+            data = self.reshape(self.size)
+            axis = -1
+        else:
+            data = self
+        axis = _normalize_partition_args(data, kth, axis, kths)
+        if data.size == 0 or _partition_by_sort(data, axis, kths):
+            return data.argsort(axis)
+        idx_array = ndarray(data.shape, dtype=numpy.intp)
+        _radix_select(data, axis, kths[0], None, idx_array)
+        return idx_array
+
     # TODO(okuta): Implement searchsorted
 
     def nonzero(self):
@@ -937,6 +1083,26 @@ cdef class ndarray:
         """
         return _clip(self, a_min, a_max, out=out)
 
+    def conj(self):
+        """Returns the complex conjugate, element-wise.
+
+        .. seealso::
+           :func:`cupy.conj` for full documentation,
+           :meth:`numpy.ndarray.conj`
+
+        """
+        return conj(self)
+
+    def conjugate(self):
+        """Returns the complex conjugate, element-wise.
+
+        .. seealso::
+           :func:`cupy.conjugate` for full documentation,
+           :meth:`numpy.ndarray.conjugate`
+
+        """
+        return conj(self)
+
     # TODO(okuta): Implement round
 
     cpdef ndarray trace(self, offset=0, axis1=0, axis2=1, dtype=None,
@@ -1495,6 +1661,9 @@ cdef class ndarray:
     def __float__(self):
         return float(self.get())
 
+    def __complex__(self):
+        return complex(self.get())
+
     def __oct__(self):
         return oct(self.get())
 
@@ -1535,7 +1704,8 @@ cdef class ndarray:
 
         Args:
             stream (cupy.cuda.Stream): CUDA stream object. If it is given, the
-                copy runs asynchronously. Otherwise, the copy is synchronous.
+                copy runs asynchronously. Otherwise, the copy is issued to the
+                current stream and synchronized.
 
         Returns:
             numpy.ndarray: Copy of the array on host memory.
@@ -1549,7 +1719,9 @@ cdef class ndarray:
         a_cpu = numpy.empty(self._shape, dtype=self.dtype)
         ptr = a_cpu.ctypes.get_as_parameter()
         if stream is None:
-            a_gpu.data.copy_to_host(ptr, a_gpu.nbytes)
+            current = stream_module.get_current_stream()
+            a_gpu.data.copy_to_host_async(ptr, a_gpu.nbytes, current)
+            current.synchronize()
         else:
             a_gpu.data.copy_to_host_async(ptr, a_gpu.nbytes, stream)
         return a_cpu
@@ -1560,7 +1732,8 @@ cdef class ndarray:
         Args:
             arr (numpy.ndarray): The source array on the host memory.
             stream (cupy.cuda.Stream): CUDA stream object. If it is given, the
-                copy runs asynchronously. Otherwise, the copy is synchronous.
+                copy runs asynchronously. Otherwise, the copy is issued to the
+                current stream and synchronized.
 
         """
         if not isinstance(arr, numpy.ndarray):
@@ -1576,7 +1749,9 @@ cdef class ndarray:
         arr = numpy.ascontiguousarray(arr)
         ptr = arr.ctypes.get_as_parameter()
         if stream is None:
-            self.data.copy_from_host(ptr, self.nbytes)
+            current = stream_module.get_current_stream()
+            self.data.copy_from_host_async(ptr, self.nbytes, current)
+            current.synchronize()
         else:
             self.data.copy_from_host_async(ptr, self.nbytes, stream)
 
@@ -1690,9 +1865,58 @@ cpdef vector.vector[Py_ssize_t] _get_strides_for_nocopy_reshape(
     return newstrides
 
 
+# -----------------------------------------------------------------------------
+# Automatic NVTX ranges
+# -----------------------------------------------------------------------------
+
+cpdef bint _get_auto_range_default():
+    # Automatic ranges are enabled at import by the environment variable.
+    return nvtx is not None and os.environ.get('CUPY_NVTX_AUTO_RANGE') == '1'
+
+
+cdef bint _auto_range = _get_auto_range_default()
+
+
+cpdef set_auto_range(bint enabled):
+    """Enables or disables automatic NVTX ranges.
+
+    While enabled, every kernel launched by :class:`~cupy.ufunc`,
+    :class:`~cupy.ElementwiseKernel` and :class:`~cupy.ReductionKernel` and
+    every library routine called by CuPy is enclosed in an NVTX range named
+    after the kernel or the routine. The dtype and the shape of the operation
+    are appended to the name. The ranges nest under user-defined ranges such
+    as :func:`cupy.prof.time_range`.
+
+    It can also be enabled by setting ``CUPY_NVTX_AUTO_RANGE=1``.
+
+    Args:
+        enabled (bool): If ``True``, automatic ranges are enabled.
+
+    """
+    global _auto_range
+    if enabled and nvtx is None:
+        raise RuntimeError('nvtx is not installed')
+    _auto_range = enabled
+
+
+cpdef bint is_auto_range_enabled():
+    """Returns ``True`` if automatic NVTX ranges are enabled."""
+    return _auto_range
+
+
+cdef inline _auto_range_push(str name, dtype, tuple shape):
+    nvtx.RangePush('%s (%s, %s)' % (name, numpy.dtype(dtype).name, shape))
+
+
+cdef inline _auto_range_pop():
+    nvtx.RangePop()
+
+
 include "carray.pxi"
 include "elementwise.pxi"
 include "reduction.pxi"
+include "scan.pxi"
+include "sort.pxi"
 
 
 # =============================================================================
@@ -1701,10 +1925,14 @@ include "reduction.pxi"
 
 cdef _id = 'out0 = in0'
 
+# The values of float16 and complex types need to be converted explicitly
+cdef _assign = '_cupy_assign(out0, in0)'
+
 _elementwise_copy = create_ufunc(
     'cupy_copy',
     ('?->?', 'b->b', 'B->B', 'h->h', 'H->H', 'i->i', 'I->I', 'l->l', 'L->L',
-     'q->q', 'Q->Q', 'e->e', 'f->f', 'd->d'),
+     'q->q', 'Q->Q', ('e->e', _assign), 'f->f', 'd->d', ('F->F', _assign),
+     ('D->D', _assign)),
     _id)
 
 
@@ -1716,7 +1944,9 @@ def elementwise_copy(*args, **kwargs):
 _elementwise_copy_where = create_ufunc(
     'cupy_copy_where',
     ('??->?', 'b?->b', 'B?->B', 'h?->h', 'H?->H', 'i?->i', 'I?->I', 'l?->l',
-     'L?->L', 'q?->q', 'Q?->Q', 'e?->e', 'f?->f', 'd?->d'),
+     'L?->L', 'q?->q', 'Q?->Q', ('e?->e', 'if (in1) ' + _assign), 'f?->f',
+     'd?->d', ('F?->F', 'if (in1) ' + _assign),
+     ('D?->D', 'if (in1) ' + _assign)),
     'if (in1) out0 = in0')
 
 
@@ -1936,7 +2166,7 @@ cpdef ndarray array(obj, dtype=None, bint copy=True, Py_ssize_t ndmin=0):
         a_cpu = numpy.array(obj, dtype=dtype, copy=False, order='C',
                             ndmin=ndmin)
         a_dtype = a_cpu.dtype
-        if a_dtype.char not in '?bhilqBHILQefd':
+        if a_dtype.char not in '?bhilqBHILQefdFD':
             raise ValueError('Unsupported dtype %s' % a_dtype)
         a = ndarray(a_cpu.shape, dtype=a_dtype)
         if a_cpu.ndim == 0:
@@ -1946,9 +2176,9 @@ cpdef ndarray array(obj, dtype=None, bint copy=True, Py_ssize_t ndmin=0):
         src_cpu = numpy.frombuffer(mem, a_cpu.dtype,
                                    a_cpu.size).reshape(a_cpu.shape)
         src_cpu[...] = a_cpu
-        stream = cuda.Stream.null
-        a.set(src_cpu, stream)
-        pinned_memory._add_to_watch_list(stream.record(), mem)
+        current = stream_module.get_current_stream()
+        a.set(src_cpu, current)
+        pinned_memory._add_to_watch_list(current.record(), mem)
     return a
 
 
@@ -2187,12 +2417,69 @@ cpdef ndarray broadcast_to(ndarray array, shape):
     return view
 
 
+# NumPy raises AxisError for an axis out of bounds. It is a subclass of both
+# ValueError and IndexError, and older NumPy raises ValueError instead.
+try:
+    _AxisError = numpy.AxisError
+except AttributeError:
+    _AxisError = getattr(
+        getattr(numpy, 'exceptions', None), 'AxisError', ValueError)
+
+
+cdef _repeat_flat_kernel = ElementwiseKernel(
+    'raw T x, int64 rep', 'T y', 'y = x[i / rep]', 'cupy_repeat_flat')
+
+
+cdef _repeat_kernel = ElementwiseKernel(
+    'raw T x, raw int64 src, int64 axis, int64 rep', 'T y',
+    '''
+    const char* ptr = reinterpret_cast<const char*>(&x[0]);
+    for (int j = 0; j < _ind.ndim; ++j) {
+      ptrdiff_t offset = _ind.get()[j];
+      if (j == axis) {
+        offset = rep > 0 ? offset / rep : src[offset];
+      }
+      ptr += x.strides()[j] * offset;
+    }
+    y = *reinterpret_cast<const T*>(ptr);
+    ''',
+    'cupy_repeat',
+    reduce_dims=False
+)
+
+
+# Maps each index along the repeated axis to the index of its source by a
+# binary search on the cumulative sum of the repeats.
+cdef _repeat_index_kernel = ElementwiseKernel(
+    'raw int64 cum, int64 n', 'int64 src',
+    '''
+    ptrdiff_t left = 0, right = n - 1;
+    while (left < right) {
+      ptrdiff_t m = left + (right - left) / 2;
+      if (cum[m] > i) {
+        right = m;
+      } else {
+        left = m + 1;
+      }
+    }
+    src = left;
+    ''',
+    'cupy_repeat_index'
+)
+
+
 cpdef ndarray _repeat(ndarray a, repeats, axis=None):
     """Repeat arrays along an axis.
 
+    The result is gathered by a single kernel. If ``repeats`` is a sequence
+    or an array, the index of the source along the axis is looked up in a
+    map made from the cumulative sum of the repeats. The cumulative sum of
+    an array is computed on the device, and only its total is transferred
+    to the host to decide the shape.
+
     Args:
         a (cupy.ndarray): Array to transform.
-        repeats (int, list or tuple): The number of repeats.
+        repeats (int, list, tuple or cupy.ndarray): The number of repeats.
         axis (int): The axis to repeat.
 
     Returns:
@@ -2201,53 +2488,80 @@ cpdef ndarray _repeat(ndarray a, repeats, axis=None):
     .. seealso:: :func:`numpy.repeat`
 
     """
-    cdef ndarray ret
-    if isinstance(repeats, int):
-        if repeats < 0:
+    cdef ndarray ret, cum, src
+    cdef Py_ssize_t n, total, rep = 0
+    cdef bint is_scalar = False
+    if isinstance(repeats, six.integer_types + (numpy.integer,)):
+        is_scalar = True
+        rep = repeats
+        if rep < 0:
             raise ValueError(
                 "'repeats' should not be negative: {}".format(repeats))
         if axis is None:
-            a = a.reshape((-1, 1))
-            ret = ndarray((a.size, repeats), dtype=a.dtype)
+            ret = ndarray((a.size * rep,), dtype=a.dtype)
             if ret.size:
-                ret[...] = a
-            return ret.ravel()
-
-        repeats = [repeats] * a._shape[axis % a._shape.size()]
+                _repeat_flat_kernel(a, rep, ret)
+            return ret
+    elif isinstance(repeats, ndarray):
+        if repeats.ndim != 1:
+            raise ValueError("'repeats' should be 1-dimensional")
     elif cpython.PySequence_Check(repeats):
-        for rep in repeats:
-            if rep < 0:
+        for r in repeats:
+            if r < 0:
                 raise ValueError(
                     "all elements of 'repeats' should not be negative: {}"
                     .format(repeats))
-        if axis is None:
-            raise ValueError(
-                "'axis' should be specified if 'repeats' is sequence")
-        if a.shape[axis] != len(repeats):
-            raise ValueError(
-                "'repeats' and 'axis' of 'a' should be same length: {} != {}"
-                .format(a.shape[axis], len(repeats)))
     else:
         raise ValueError(
             "'repeats' should be int or sequence: {}".format(repeats))
 
+    if axis is None:
+        raise ValueError(
+            "'axis' should be specified if 'repeats' is sequence")
+    if a._shape.size() == 0:
+        # A 0-dimensional array is repeated as a 1-dimensional one.
+        a = a.reshape((1,))
+    if not -a.ndim <= axis < a.ndim:
+        raise _AxisError(
+            'axis {} is out of bounds for array of dimension {}'.format(
+                axis, a.ndim))
     if axis < 0:
         axis += a.ndim
+    n = a._shape[axis]
+    if not is_scalar and n != len(repeats):
+        raise ValueError(
+            "'repeats' and 'axis' of 'a' should be same length: {} != {}"
+            .format(n, len(repeats)))
+
+    if is_scalar:
+        total = n * rep
+    elif n == 0:
+        total = 0
+    elif isinstance(repeats, ndarray):
+        cum = scan(repeats.astype(numpy.int64))
+        # The total and the minimum are transferred at once.
+        total, minimum = concatenate_method(
+            (cum[-1:], repeats.min(keepdims=True).astype(numpy.int64)),
+            0).get()
+        if minimum < 0:
+            raise ValueError(
+                "all elements of 'repeats' should not be negative")
+    else:
+        cum_host = numpy.cumsum(repeats, dtype=numpy.int64)
+        total = cum_host[-1]
+        cum = array(cum_host)
 
     ret_shape = list(a.shape)
-    ret_shape[axis] = sum(repeats)
+    ret_shape[axis] = total
     ret = ndarray(ret_shape, dtype=a.dtype)
-    a_index = [slice(None)] * len(ret_shape)
-    ret_index = list(a_index)
-    offset = 0
-    for i in range(a._shape[axis]):
-        if repeats[i] == 0:
-            continue
-        a_index[axis] = slice(i, i + 1)
-        ret_index[axis] = slice(offset, offset + repeats[i])
-        # convert to tuple because cupy has a indexing bug
-        ret[tuple(ret_index)] = a[tuple(a_index)]
-        offset += repeats[i]
+    if ret.size == 0:
+        return ret
+    if is_scalar:
+        src = ndarray((0,), dtype=numpy.int64)
+    else:
+        src = _repeat_index_kernel(
+            cum, n, ndarray((total,), dtype=numpy.int64))
+    _repeat_kernel(a, src, axis, rep, ret)
     return ret
 
 
@@ -2909,8 +3223,8 @@ cpdef _scatter_op(ndarray a, slices, value, op):
                 if y.data.ptr == x.data.ptr:
                     return  # Skip since x and y are the same array
                 elif y._c_contiguous and x.dtype == y.dtype:
-                    y.data.copy_from_device_async(x.data, x.nbytes,
-                                                  cuda.Stream.null)
+                    y.data.copy_from_device_async(
+                        x.data, x.nbytes, stream_module.get_current_stream())
                     return
             elementwise_copy(x, y)
         else:
@@ -3145,21 +3459,19 @@ cdef ndarray _mat_ptrs(ndarray a):
         return _get_all_addresses(a.data.ptr, a.shape[:-2], a.strides[:-2])
 
 
-cpdef ndarray matmul(ndarray a, ndarray b):
+cdef _cuda_runtime_version = None
+
+
+cpdef ndarray matmul(ndarray a, ndarray b, ndarray out=None):
     """ Returns the matrix product of two arrays and is the implementation of
     the `@` operator introduced in Python 3.5 following PEP465.
 
     The main difference against cupy.dot are the handling of arrays with more
     than 2 dimensions. For more information see :func:`numpy.matmul`.
 
-    .. note::
-        Differences to numpy or missing features:
-
-        Currently the output must be real (float16, float32, uint8, ...),
-        complex64 and complex128 follow later. This means, that
-        numpy.result_type(a.dtype, b.dtype) have to be real.
-
-        The out array as input is currently not supported.
+    Batches of matrices are multiplied by a single strided batched GEMM call
+    when the batch dimensions of each operand have a uniform stride. Batch
+    dimensions are broadcast by zero strides without copying the operands.
 
     Args:
         a (cupy.ndarray): The left argument.
@@ -3169,178 +3481,314 @@ cpdef ndarray matmul(ndarray a, ndarray b):
     .. seealso:: :func:`numpy.matmul`
 
     """
-    # ToDo: Argument out=None is missing
-    # ToDo: remove python object .shape
-    # ToDo: remove python object .strides
-    # ToDo: remove python object out_shape
-    # ToDo: remove python object .reshape
-    cdef Py_ssize_t i, n, m, ka, kb
-    cdef Py_ssize_t batchCount
-    cdef ndarray out, ap, bp, outp
+    cdef Py_ssize_t i, n, m, ka, kb, ndim, itemsize
+    cdef Py_ssize_t batch_count, stride_a, stride_b
+    cdef int trans_a, trans_b, ld_a, ld_b
+    cdef list batch_shape, a_shape, a_strides, b_shape, b_strides
+    cdef tuple out_shape
+    cdef ndarray c, ret
+
+    if a.ndim == 0 or b.ndim == 0:
+        raise ValueError('Scalar operands are not allowed, use \'*\' instead')
 
     ret_dtype = numpy.result_type(a.dtype, b.dtype)
     dtype = numpy.find_common_type((ret_dtype, 'f'), ())
+    if dtype.char not in 'fdFD':
+        raise TypeError(dtype)
 
     a = a.astype(dtype, copy=False)
     b = b.astype(dtype, copy=False)
-
-    if a.ndim == 1:
-        a = a.reshape(1, len(a))
-        a_part_outshape = ()
-    else:
-        a_part_outshape = (a.shape[-2],)
-    if b.ndim == 1:
-        b = b.reshape(len(b), 1)
-        b_part_outshape = ()
-        ldout = 1
+    a_is_vec = a.ndim == 1
+    b_is_vec = b.ndim == 1
+    if a_is_vec:
+        a = a.reshape(1, a.size)
+    if b_is_vec:
+        b = b.reshape(b.size, 1)
+
+    ka = a._shape[a.ndim - 1]
+    kb = b._shape[b.ndim - 2]
+    if ka != kb:
+        raise ValueError(
+            'shapes %s and %s not aligned: %d (dim %d) != %d (dim %d)' %
+            (a.shape, b.shape, ka, a.ndim - 1, kb, b.ndim - 2))
+    n = a._shape[a.ndim - 2]
+    m = b._shape[b.ndim - 1]
+
+    # Broadcasts the batch dimensions.
+    ndim = max(a.ndim, b.ndim)
+    a_shape = [1] * (ndim - a.ndim) + list(a.shape)
+    a_strides = [0] * (ndim - a.ndim) + list(a.strides)
+    b_shape = [1] * (ndim - b.ndim) + list(b.shape)
+    b_strides = [0] * (ndim - b.ndim) + list(b.strides)
+    batch_shape = []
+    for i in range(ndim - 2):
+        if a_shape[i] == b_shape[i] or b_shape[i] == 1:
+            batch_shape.append(a_shape[i])
+        elif a_shape[i] == 1:
+            batch_shape.append(b_shape[i])
+        else:
+            raise ValueError(
+                'operands could not be broadcast together with shapes %s %s'
+                % (a.shape, b.shape))
+
+    out_shape = tuple(batch_shape)
+    if not a_is_vec:
+        out_shape += (n,)
+    if not b_is_vec:
+        out_shape += (m,)
+    if out is not None and out.shape != out_shape:
+        raise ValueError('Output array has a wrong shape')
+
+    if (out is not None and out.dtype == dtype and out._c_contiguous and
+            not _may_share_bounds(out, a) and not _may_share_bounds(out, b)):
+        c = out
     else:
-        b_part_outshape = b.shape[-1:]
-        ldout = b.shape[-1]
-
-    # expand dims
-    if a.ndim < b.ndim:
-        view = a.view()
-        view._set_shape_and_strides(
-            (1,) * (b.ndim - a.ndim) + a.shape,
-            (0,) * (b.ndim - a.ndim) + a.strides)
-        a = view
-    elif a.ndim > b.ndim:
-        view = b.view()
-        view._set_shape_and_strides(
-            (1,) * (a.ndim - b.ndim) + b.shape,
-            (0,) * (a.ndim - b.ndim) + b.strides)
-        b = view
-
-    broatcast_pre_shape = numpy.maximum(a.shape[:-2], b.shape[:-2])
-
-    out_shape = (*broatcast_pre_shape, *a_part_outshape, *b_part_outshape)
-
-    a = ascontiguousarray(a, dtype=dtype)
-    b = ascontiguousarray(b, dtype=dtype)
-
-    # broadcast
-    a_strides = list(a.strides)
-    a_shape = list(a.shape)
-    b_strides = list(b.strides)
-    b_shape = list(b.shape)
-    for i in range(len(a_strides) - 2):
-        if a_shape[i] == 1 and broatcast_pre_shape[i] > 1:
+        c = ndarray(out_shape, dtype=dtype)
+    if c.size == 0:
+        return _matmul_result(c, out, ret_dtype)
+    if ka == 0:
+        c.fill(0)
+        return _matmul_result(c, out, ret_dtype)
+
+    # Each matrix is passed to cuBLAS as it is if it is laid out in the row-
+    # or column-major order; otherwise the operand is copied.
+    itemsize = a.itemsize
+    layout_a = _gemm_layout(a_shape[ndim - 2], a_shape[ndim - 1],
+                            a_strides[ndim - 2], a_strides[ndim - 1],
+                            itemsize)
+    if layout_a is None:
+        a = ascontiguousarray(a)
+        a_strides = [0] * (ndim - a.ndim) + list(a.strides)
+        layout_a = (0, a_shape[ndim - 1])
+    layout_b = _gemm_layout(b_shape[ndim - 2], b_shape[ndim - 1],
+                            b_strides[ndim - 2], b_strides[ndim - 1],
+                            itemsize)
+    if layout_b is None:
+        b = ascontiguousarray(b)
+        b_strides = [0] * (ndim - b.ndim) + list(b.strides)
+        layout_b = (0, b_shape[ndim - 1])
+    trans_a, ld_a = layout_a
+    trans_b, ld_b = layout_b
+
+    for i in range(ndim - 2):
+        if a_shape[i] != batch_shape[i]:
+            a_shape[i] = batch_shape[i]
             a_strides[i] = 0
-            a_shape[i] = broatcast_pre_shape[i]
-    for i in range(len(b_strides) - 2):
-        if b_shape[i] == 1 and broatcast_pre_shape[i] > 1:
+        if b_shape[i] != batch_shape[i]:
+            b_shape[i] = batch_shape[i]
             b_strides[i] = 0
-            b_shape[i] = broatcast_pre_shape[i]
-
-    view = a.view()
-    view._set_shape_and_strides(a_shape, a_strides)
-    a = view
-    view = b.view()
-    view._set_shape_and_strides(b_shape, b_strides)
-    b = view
+    batch_count = internal.prod(batch_shape)
+    stride_a = _uniform_batch_stride(batch_shape, a_strides, itemsize)
+    stride_b = _uniform_batch_stride(batch_shape, b_strides, itemsize)
 
-    out = ndarray(out_shape, dtype=dtype)
-    out.data.memset(0, out.nbytes)
-
-    out_view = out.view()
-    out_view_shape = out.shape
-    out_view_strides = out.strides
-    if a_part_outshape == ():
-        out_view_shape += (1,)
-        out_view_strides += (0,)
-    if b_part_outshape == ():
-        out_view_shape += (1,)
-        out_view_strides += (0,)
-
-    out_view._set_shape_and_strides(out_view_shape, out_view_strides)
-
-    # (A B)^T = B^T A^T
-    a, b = b, a
+    global _cuda_runtime_version
+    if _cuda_runtime_version is None:
+        _cuda_runtime_version = runtime.runtimeGetVersion()
 
-    lda = a.shape[-1]
-    ldb = b.shape[-1]
+    # Computes C^T = B^T A^T in the column-major order, which is C in the
+    # row-major order.
+    if _auto_range:
+        _auto_range_push('cublas.gemmBatched', dtype, out_shape)
+    try:
+        if (batch_count == 1 or (stride_a >= 0 and stride_b >= 0 and
+                                 _cuda_runtime_version >= 8000)):
+            _gemm_strided_batched(
+                dtype, trans_b, trans_a, m, n, ka, b.data.ptr, ld_b,
+                stride_b, a.data.ptr, ld_a, stride_a, c.data.ptr, m, n * m,
+                batch_count)
+        else:
+            # Irregular batch layouts need arrays of pointers to matrices.
+            a_view = a.view()
+            a_view._set_shape_and_strides(a_shape, a_strides)
+            b_view = b.view()
+            b_view._set_shape_and_strides(b_shape, b_strides)
+            c_view = c.reshape(batch_shape + [n, m])
+            _gemm_batched(
+                dtype, trans_b, trans_a, m, n, ka, _mat_ptrs(b_view), ld_b,
+                _mat_ptrs(a_view), ld_a, _mat_ptrs(c_view), m, batch_count)
+    finally:
+        if _auto_range:
+            _auto_range_pop()
+
+    return _matmul_result(c, out, ret_dtype)
+
+
+cdef inline bint _may_share_bounds(ndarray a, ndarray b):
+    # Returns True if the memory ranges spanned by the arrays overlap.
+    cdef Py_ssize_t a_lo, a_hi, b_lo, b_hi
+    if a.data.mem is not b.data.mem:
+        return False
+    a_lo, a_hi = _get_bounds(a)
+    b_lo, b_hi = _get_bounds(b)
+    return a_lo < b_hi and b_lo < a_hi
+
+
+cdef tuple _get_bounds(ndarray a):
+    cdef Py_ssize_t lo = a.data.ptr, hi = a.data.ptr, i
+    for i in range(a.ndim):
+        if a._shape[i] == 0:
+            return lo, lo
+        if a._strides[i] > 0:
+            hi += a._strides[i] * (a._shape[i] - 1)
+        else:
+            lo += a._strides[i] * (a._shape[i] - 1)
+    return lo, hi + a.itemsize
+
+
+cdef tuple _gemm_layout(Py_ssize_t rows, Py_ssize_t cols,
+                        Py_ssize_t row_stride, Py_ssize_t col_stride,
+                        Py_ssize_t itemsize):
+    # Returns the transpose flag and the leading dimension with which cuBLAS
+    # reads the transpose of a row-major matrix in the column-major order,
+    # or None if the matrix must be copied.
+    if row_stride % itemsize or col_stride % itemsize:
+        return None
+    row_stride //= itemsize
+    col_stride //= itemsize
+    if cols == 1 or col_stride == 1:
+        ld = row_stride if rows > 1 else cols
+        if ld >= max(cols, 1):
+            return 0, ld
+    if rows == 1 or row_stride == 1:
+        ld = col_stride if cols > 1 else rows
+        if ld >= max(rows, 1):
+            return 1, ld
+    return None
+
+
+cdef Py_ssize_t _uniform_batch_stride(
+        list shape, list strides, Py_ssize_t itemsize):
+    # Returns the stride in elements between consecutive matrices of a batch
+    # in the C order, or -1 if the matrices are not evenly spaced.
+    cdef Py_ssize_t i, stride = -1, expected = 0
+    for i in range(len(shape) - 1, -1, -1):
+        if shape[i] == 1:
+            continue
+        if stride == -1:
+            if strides[i] < 0 or strides[i] % itemsize:
+                return -1
+            stride = strides[i] // itemsize
+        elif strides[i] != expected:
+            return -1
+        expected = strides[i] * shape[i]
+    return 0 if stride == -1 else stride
 
-    *la, ka, n = a.shape
-    *lb, m, kb = b.shape
 
-    assert ka == kb
-    for la_, lb_ in zip(la, lb):
-        assert la_ == lb_ or la_ == 1 or lb_ == 1
+cdef ndarray _matmul_result(ndarray c, ndarray out, ret_dtype):
+    if out is None:
+        if c.dtype == ret_dtype:
+            return c
+        out = ndarray(c.shape, ret_dtype)
+    elif c is out:
+        return out
+    elementwise_copy(c, out)
+    return out
 
-    batchCount = 1  # batchCount = numpy.prod(la)
-    for i in la:
-        batchCount *= i
 
-    ap = _mat_ptrs(a)
-    bp = _mat_ptrs(b)
-    outp = _mat_ptrs(out_view)
+cdef _gemm_strided_batched(
+        dtype, int transa, int transb, Py_ssize_t m, Py_ssize_t n,
+        Py_ssize_t k, size_t a, int lda, Py_ssize_t stride_a, size_t b,
+        int ldb, Py_ssize_t stride_b, size_t c, int ldc,
+        Py_ssize_t stride_c, Py_ssize_t batch_count):
+    handle = cuda.Device().cublas_handle
+    if batch_count == 1:
+        if dtype == numpy.float32:
+            gemm = cuda.cublas.sgemm
+        elif dtype == numpy.float64:
+            gemm = cuda.cublas.dgemm
+        elif dtype == numpy.complex64:
+            gemm = cuda.cublas.cgemm
+        else:
+            gemm = cuda.cublas.zgemm
+        gemm(handle, transa, transb, m, n, k, 1, a, lda, b, ldb, 0, c, ldc)
+        return
 
     if dtype == numpy.float32:
-        cuda.cublas.sgemmBatched(
-            cuda.Device().cublas_handle,
-            0,  # transa
-            0,  # transb
-            n, m, ka, 1.0,
-            ap.data.ptr, lda,
-            bp.data.ptr, ldb,
-            0.0, outp.data.ptr, ldout, batchCount)
+        gemm = cuda.cublas.sgemmStridedBatched
     elif dtype == numpy.float64:
-        cuda.cublas.dgemmBatched(
-            cuda.Device().cublas_handle,
-            0,  # transa
-            0,  # transb
-            n, m, ka, 1.0,
-            ap.data.ptr, lda,
-            bp.data.ptr, ldb,
-            0.0, outp.data.ptr, ldout, batchCount)
-    # elif dtype == numpy.complex64:
-    #     cuda.cublas.cgemmBatched(
-    #         cuda.Device().cublas_handle,
-    #         0,  # transa
-    #         0,  # transb
-    #         n, m, ka, 1,
-    #         ap.data.ptr, lda,
-    #         bp.data.ptr, ldb,
-    #         0, outp.data.ptr, ldout, batchCount)
-    # elif dtype == numpy.complex128:
-    #     cuda.cublas.zgemmBatched(
-    #         cuda.Device().cublas_handle,
-    #         0,  # transa
-    #         0,  # transb
-    #         n, m, ka, 1,
-    #         ap.data.ptr, lda,
-    #         bp.data.ptr, ldb,
-    #         0, outp.data.ptr, ldout, batchCount)
+        gemm = cuda.cublas.dgemmStridedBatched
+    elif dtype == numpy.complex64:
+        gemm = cuda.cublas.cgemmStridedBatched
     else:
-        raise TypeError(dtype, a.dtype, b.dtype)
-
-    if dtype == ret_dtype:
-        return out
-    else:
-        ret = ndarray(out_shape, ret_dtype)
-        elementwise_copy(out, ret)
-        return ret
+        gemm = cuda.cublas.zgemmStridedBatched
+    gemm(handle, transa, transb, m, n, k, 1, a, lda, stride_a, b, ldb,
+         stride_b, 0, c, ldc, stride_c, batch_count)
 
 
-cdef _cuda_runtime_version = None
+cdef _gemm_batched(dtype, int transa, int transb, Py_ssize_t m,
+                   Py_ssize_t n, Py_ssize_t k, ndarray ap, int lda,
+                   ndarray bp, int ldb, ndarray cp, int ldc,
+                   Py_ssize_t batch_count):
+    if dtype == numpy.float32:
+        gemm = cuda.cublas.sgemmBatched
+    elif dtype == numpy.float64:
+        gemm = cuda.cublas.dgemmBatched
+    elif dtype == numpy.complex64:
+        gemm = cuda.cublas.cgemmBatched
+    elif dtype == numpy.complex128:
+        gemm = cuda.cublas.zgemmBatched
+    else:
+        raise TypeError(dtype)
+    gemm(cuda.Device().cublas_handle, transa, transb, m, n, k, 1,
+         ap.data.ptr, lda, bp.data.ptr, ldb, 0, cp.data.ptr, ldc,
+         batch_count)
+
+
+cdef _complex_dotu(ndarray a, ndarray b, ndarray out):
+    # Computes the unconjugated dot product of complex vectors by cuBLAS.
+    # The result is written to the zero-dimensional array on the device.
+    cdef Py_ssize_t handle
+    cdef int mode
+    a = ascontiguousarray(a)
+    b = ascontiguousarray(b)
+    handle = device.get_cublas_handle()
+    mode = cublas.getPointerMode(handle)
+    cublas.setPointerMode(handle, cublas.CUBLAS_POINTER_MODE_DEVICE)
+    if _auto_range:
+        _auto_range_push('cublas.dotu', a.dtype, (a.size,))
+    try:
+        if a.dtype.char == 'F':
+            cublas.cdotu(handle, <int>a.size, a.data.ptr, 1, b.data.ptr, 1,
+                         out.data.ptr)
+        else:
+            cublas.zdotu(handle, <int>a.size, a.data.ptr, 1, b.data.ptr, 1,
+                         out.data.ptr)
+    finally:
+        cublas.setPointerMode(handle, mode)
+        if _auto_range:
+            _auto_range_pop()
 
 
 cpdef ndarray tensordot_core(
         ndarray a, ndarray b, ndarray out, Py_ssize_t n, Py_ssize_t m,
-        Py_ssize_t k, vector.vector[Py_ssize_t] ret_shape):
+        Py_ssize_t k, vector.vector[Py_ssize_t] ret_shape, alpha=1, beta=0):
+    """Computes ``alpha * a.T.dot(b) + beta * out`` by GEMM.
+
+    ``a`` and ``b`` are regarded as ``(k, n)`` and ``(k, m)`` matrices. The
+    scaling and the accumulation are done by cuBLAS within GEMM. ``out`` is
+    required if ``beta`` is nonzero.
+
+    """
     cdef vector.vector[Py_ssize_t] shape
     cdef Py_ssize_t inca, incb, transa, transb, lda, ldb
     cdef Py_ssize_t mode, handle
     cdef str dtype, ret_dtype
-    cdef bint use_sgemmEx
+    cdef bint use_sgemmEx, scaled
     ret_dtype = a.dtype.char
     if ret_dtype != b.dtype.char:
         ret_dtype = numpy.find_common_type((ret_dtype, b.dtype), ()).char
 
+    scaled = alpha != 1 or beta != 0
+    if beta != 0 and out is None:
+        raise ValueError('Output array is required if beta is nonzero')
+
     if not a.size or not b.size:
         if out is None:
             out = ndarray(ret_shape, dtype=ret_dtype)
-        out.fill(0)
+        if beta == 0:
+            out.fill(0)
+        else:
+            multiply(out, beta, out)
         return out
 
     global _cuda_runtime_version
@@ -3351,7 +3799,7 @@ cpdef ndarray tensordot_core(
                    a.dtype == 'e' and b.dtype == 'e' and
                    (ret_dtype == 'e' or ret_dtype == 'f'))
 
-    if use_sgemmEx or ret_dtype == 'f' or ret_dtype == 'd':
+    if use_sgemmEx or ret_dtype in 'fdFD':
         dtype = ret_dtype
     else:
         dtype = numpy.find_common_type((ret_dtype, 'f'), ()).char
@@ -3370,9 +3818,20 @@ cpdef ndarray tensordot_core(
         ret = out
         if out.dtype != dtype:
             out = ndarray(ret_shape, dtype)
+            if beta != 0:
+                elementwise_copy(ret, out)
 
     if m == 1 and n == 1:
-        (a.ravel() * b.ravel()).sum(out=out.reshape(()))
+        if scaled:
+            c = out.reshape(())
+            s = multiply((a.ravel() * b.ravel()).sum(), alpha)
+            if beta != 0:
+                s = add(s, multiply(c, beta))
+            elementwise_copy(s, c)
+        elif dtype == 'F' or dtype == 'D':
+            _complex_dotu(a, b, out.reshape(()))
+        else:
+            (a.ravel() * b.ravel()).sum(out=out.reshape(()))
         if out is not ret:
             elementwise_copy(out, ret)
         return ret
@@ -3392,6 +3851,11 @@ cpdef ndarray tensordot_core(
     if c._shape.size() != 2 or c._shape[0] != n or c._shape[1] != m:
         c = c.view()
         c.shape = (n, m)
+    # The result of cuBLAS is undefined if the output overlaps an operand.
+    if _may_share_bounds(c, a):
+        a = a.copy()
+    if _may_share_bounds(c, b):
+        b = b.copy()
 
     # Be careful that cuBLAS uses the FORTRAN-order matrix representation.
     handle = device.get_cublas_handle()
@@ -3400,20 +3864,39 @@ cpdef ndarray tensordot_core(
     # compute C^T = B^T * A here.
     a, transa, lda = _mat_to_cublas_contiguous(a, 0)
     b, transb, ldb = _mat_to_cublas_contiguous(b, 1)
-    if use_sgemmEx:
-        Ctype = runtime.CUDA_R_16F if c.dtype == 'e' else runtime.CUDA_R_32F
-        cublas.sgemmEx(
-            handle, <int>transb, <int> transa, <int>m, <int>n, <int>k, 1,
-            b.data.ptr, runtime.CUDA_R_16F, <int>ldb, a.data.ptr,
-            runtime.CUDA_R_16F, <int>lda, 0, c.data.ptr, Ctype, <int>m)
-    elif dtype == 'f':
-        cublas.sgemm(
-            handle, <int>transb, <int>transa, <int>m, <int> n, <int> k, 1,
-            b.data.ptr, <int>ldb, a.data.ptr, <int>lda, 0, c.data.ptr, <int>m)
-    elif dtype == 'd':
-        cublas.dgemm(
-            handle, <int>transb, <int>transa, <int>m, <int>n, <int>k, 1,
-            b.data.ptr, <int>ldb, a.data.ptr, <int>lda, 0, c.data.ptr, <int>m)
+    if _auto_range:
+        _auto_range_push('cublas.gemm', a.dtype, (n, m, k))
+    try:
+        if use_sgemmEx:
+            Ctype = (runtime.CUDA_R_16F if c.dtype == 'e'
+                     else runtime.CUDA_R_32F)
+            cublas.sgemmEx(
+                handle, <int>transb, <int> transa, <int>m, <int>n, <int>k,
+                alpha, b.data.ptr, runtime.CUDA_R_16F, <int>ldb, a.data.ptr,
+                runtime.CUDA_R_16F, <int>lda, beta, c.data.ptr, Ctype, <int>m)
+        elif dtype == 'f':
+            cublas.sgemm(
+                handle, <int>transb, <int>transa, <int>m, <int>n, <int>k,
+                alpha, b.data.ptr, <int>ldb, a.data.ptr, <int>lda, beta,
+                c.data.ptr, <int>m)
+        elif dtype == 'd':
+            cublas.dgemm(
+                handle, <int>transb, <int>transa, <int>m, <int>n, <int>k,
+                alpha, b.data.ptr, <int>ldb, a.data.ptr, <int>lda, beta,
+                c.data.ptr, <int>m)
+        elif dtype == 'F':
+            cublas.cgemm(
+                handle, <int>transb, <int>transa, <int>m, <int>n, <int>k,
+                alpha, b.data.ptr, <int>ldb, a.data.ptr, <int>lda, beta,
+                c.data.ptr, <int>m)
+        elif dtype == 'D':
+            cublas.zgemm(
+                handle, <int>transb, <int>transa, <int>m, <int>n, <int>k,
+                alpha, b.data.ptr, <int>ldb, a.data.ptr, <int>lda, beta,
+                c.data.ptr, <int>m)
+    finally:
+        if _auto_range:
+            _auto_range_pop()
 
     if out is not ret:
         elementwise_copy(out, ret)
@@ -3431,7 +3914,11 @@ cpdef inline tuple _mat_to_cublas_contiguous(ndarray a, Py_ssize_t trans):
         return a, trans, lda
     if not a._c_contiguous:
         a = a.copy()
-    return a, 1 - trans, a._strides[0] // a.itemsize
+    # A flipped axis of length one may have a negative stride.
+    lda = a._strides[0] // a.itemsize
+    if lda < a._shape[1]:
+        lda = a._shape[1]
+    return a, 1 - trans, lda
 
 
 @cython.profile(False)
@@ -3449,7 +3936,8 @@ cpdef create_comparison(name, op, doc=''):
     return create_ufunc(
         'cupy_' + name,
         ('??->?', 'bb->?', 'BB->?', 'hh->?', 'HH->?', 'ii->?', 'II->?',
-         'll->?', 'LL->?', 'qq->?', 'QQ->?', 'ee->?', 'ff->?', 'dd->?'),
+         'll->?', 'LL->?', 'qq->?', 'QQ->?', 'ee->?', 'ff->?', 'dd->?',
+         'FF->?', 'DD->?'),
         'out0 = in0 %s in1' % op,
         doc=doc)
 
@@ -3533,7 +4021,7 @@ _sum = create_reduction_func(
     ('?->l', 'B->L', 'h->l', 'H->L', 'i->l', 'I->L', 'l->l', 'L->L',
      'q->q', 'Q->Q',
      ('e->e', (None, None, None, 'float')),
-     'f->f', 'd->d'),
+     'f->f', 'd->d', 'F->F', 'D->D'),
     ('in0', 'a + b', 'out0 = a', None), 0)
 
 
@@ -3542,7 +4030,7 @@ _prod = create_reduction_func(
     ['?->l', 'B->L', 'h->l', 'H->L', 'i->l', 'I->L', 'l->l', 'L->L',
      'q->q', 'Q->Q',
      ('e->e', (None, None, None, 'float')),
-     'f->f', 'd->d'],
+     'f->f', 'd->d', 'F->F', 'D->D'],
     ('in0', 'a * b', 'out0 = a', None), 1)
 
 
@@ -3551,7 +4039,8 @@ cdef create_arithmetic(name, op, boolop, doc):
         'cupy_' + name,
         (('??->?', 'out0 = in0 %s in1' % boolop),
          'bb->b', 'BB->B', 'hh->h', 'HH->H', 'ii->i', 'II->I', 'll->l',
-         'LL->L', 'qq->q', 'QQ->Q', 'ee->e', 'ff->f', 'dd->d'),
+         'LL->L', 'qq->q', 'QQ->Q', 'ee->e', 'ff->f', 'dd->d', 'FF->F',
+         'DD->D'),
         'out0 = in0 %s in1' % op,
         doc=doc)
 
@@ -3569,7 +4058,7 @@ negative = create_ufunc(
     'cupy_negative',
     (('?->?', 'out0 = !in0'),
      'b->b', 'B->B', 'h->h', 'H->H', 'i->i', 'I->I', 'l->l', 'L->L',
-     'q->q', 'Q->Q', 'e->e', 'f->f', 'd->d'),
+     'q->q', 'Q->Q', 'e->e', 'f->f', 'd->d', 'F->F', 'D->D'),
     'out0 = -in0',
     doc='''Takes numerical negative elementwise.
 
@@ -3629,7 +4118,7 @@ subtract = create_arithmetic(
 true_divide = create_ufunc(
     'cupy_true_divide',
     ('bb->d', 'BB->d', 'hh->d', 'HH->d', 'ii->d', 'II->d', 'll->d', 'LL->d',
-     'qq->d', 'QQ->d', 'ee->e', 'ff->f', 'dd->d'),
+     'qq->d', 'QQ->d', 'ee->e', 'ff->f', 'dd->d', 'FF->F', 'DD->D'),
     'out0 = (out0_type)in0 / (out0_type)in1',
     doc='''Elementwise true division (i.e. division as floating values).
 
@@ -3677,7 +4166,9 @@ absolute = create_ufunc(
      'q->q', ('Q->Q', 'out0 = in0'),
      ('e->e', 'out0 = fabsf(in0)'),
      ('f->f', 'out0 = fabsf(in0)'),
-     ('d->d', 'out0 = fabs(in0)')),
+     ('d->d', 'out0 = fabs(in0)'),
+     ('F->f', 'out0 = abs(in0)'),
+     ('D->d', 'out0 = abs(in0)')),
     'out0 = in0 > 0 ? in0 : -in0',
     doc='''Elementwise absolute value function.
 
@@ -3686,9 +4177,23 @@ absolute = create_ufunc(
     ''')
 
 
+conj = create_ufunc(
+    'cupy_conj',
+    ('?->?', 'b->b', 'B->B', 'h->h', 'H->H', 'i->i', 'I->I', 'l->l', 'L->L',
+     'q->q', 'Q->Q', 'e->e', 'f->f', 'd->d',
+     ('F->F', 'out0 = conj(in0)'),
+     ('D->D', 'out0 = conj(in0)')),
+    'out0 = in0',
+    doc='''Returns the complex conjugate, element-wise.
+
+    .. seealso:: :data:`numpy.conjugate`
+
+    ''')
+
+
 sqrt = create_ufunc(
     'cupy_sqrt',
-    ('e->e', 'f->f', 'd->d'),
+    ('e->e', 'f->f', 'd->d', 'F->F', 'D->D'),
     'out0 = sqrt(in0)')
 
 
@@ -3748,7 +4253,7 @@ cdef _mean = create_reduction_func(
     ('?->d', 'B->d', 'h->d', 'H->d', 'i->d', 'I->d', 'l->d', 'L->d',
      'q->d', 'Q->d',
      ('e->e', (None, None, None, 'float')),
-     'f->f', 'd->d'),
+     'f->f', 'd->d', 'F->F', 'D->D'),
     ('in0', 'a + b', 'out0 = a / (_in_ind.size() / _out_ind.size())', None))
 
 
@@ -3756,93 +4261,6 @@ cdef _mean = create_reduction_func(
 # scan
 # -----------------------------------------------------------------------------
 
-@util.memoize(for_each_device=True)
-def _inclusive_scan_kernel(dtype, block_size):
-    """return Prefix Sum(Scan) cuda kernel
-
-    e.g
-    if blocksize * 2 >= len(src)
-    src [1, 2, 3, 4]
-    dst [1, 3, 6, 10]
-
-    if blocksize * 2 < len(src)
-    block_size: 2
-    src [1, 2, 3, 4, 5, 6]
-    dst [1, 3, 6, 10, 5, 11]
-
-    Args:
-        dtype: src, dst array type
-        block_size: block_size
-
-    Returns:
-         cupy.cuda.Function: cuda function
-    """
-
-    name = "inclusive_scan_kernel"
-    dtype = _get_typename(dtype)
-    source = string.Template("""
-    extern "C" __global__ void ${name}(const CArray<${dtype}, 1> src,
-        CArray<${dtype}, 1> dst){
-        long long n = src.size();
-        extern __shared__ ${dtype} temp[];
-        unsigned int thid = threadIdx.x;
-        unsigned int block = 2 * blockIdx.x * blockDim.x;
-
-        unsigned int idx0 = thid + block;
-        unsigned int idx1 = thid + blockDim.x + block;
-
-        temp[thid] = (idx0 < n) ? src[idx0] : (${dtype})0;
-        temp[thid + blockDim.x] = (idx1 < n) ? src[idx1] : (${dtype})0;
-        __syncthreads();
-
-        for(int i = 1; i <= ${block_size}; i <<= 1){
-            int index = (threadIdx.x + 1) * i * 2 - 1;
-            if (index < (${block_size} << 1)){
-                temp[index] = temp[index] + temp[index - i];
-            }
-            __syncthreads();
-        }
-
-        for(int i = ${block_size} >> 1; i > 0; i >>= 1){
-            int index = (threadIdx.x + 1) * i * 2 - 1;
-            if(index + i < (${block_size} << 1)){
-                temp[index + i] = temp[index + i] + temp[index];
-            }
-            __syncthreads();
-        }
-
-        if(idx0 < n){
-            dst[idx0] = temp[thid];
-        }
-        if(idx1 < n){
-            dst[idx1] = temp[thid + blockDim.x];
-        }
-    }
-    """).substitute(name=name, dtype=dtype, block_size=block_size)
-    module = compile_with_cache(source)
-    return module.get_function(name)
-
-
-@util.memoize(for_each_device=True)
-def _add_scan_blocked_sum_kernel(dtype):
-    name = "add_scan_blocked_sum_kernel"
-    dtype = _get_typename(dtype)
-    source = string.Template("""
-    extern "C" __global__ void ${name}(CArray<${dtype}, 1> src_dst){
-        long long n = src_dst.size();
-        unsigned int idxBase = (blockDim.x + 1) * (blockIdx.x + 1);
-        unsigned int idxAdded = idxBase + threadIdx.x;
-        unsigned int idxAdd = idxBase - 1;
-
-        if(idxAdded < n){
-            src_dst[idxAdded] += src_dst[idxAdd];
-        }
-    }
-    """).substitute(name=name, dtype=dtype)
-    module = compile_with_cache(source)
-    return module.get_function(name)
-
-
 @util.memoize(for_each_device=True)
 def _nonzero_1d_kernel(src_dtype, index_dtype):
     name = "nonzero_1d_kernel"
@@ -3915,26 +4333,6 @@ def scan(a, out=None):
     """
     if a.ndim != 1:
         raise TypeError("Input array should be 1D array.")
-
-    block_size = 256
-
-    if out is None:
-        out = ndarray(a.shape, dtype=a.dtype)
-    else:
-        if a.size != out.size:
-            raise ValueError("Provided out is the wrong size")
-
-    kern_scan = _inclusive_scan_kernel(a.dtype, block_size)
-    kern_scan(grid=((a.size - 1) // (2 * block_size) + 1,),
-              block=(block_size,),
-              args=(a, out),
-              shared_mem=a.itemsize * block_size * 2)
-
-    if (a.size - 1) // (block_size * 2) > 0:
-        blocked_sum = out[block_size * 2 - 1:None:block_size * 2]
-        scan(blocked_sum, blocked_sum)
-        kern_add = _add_scan_blocked_sum_kernel(out.dtype)
-        kern_add(grid=((a.size - 1) // (2 * block_size),),
-                 block=(2 * block_size - 1,),
-                 args=(out,))
-    return out
+    if out is not None and a.size != out.size:
+        raise ValueError("Provided out is the wrong size")
+    return _scan(a, 0, a.dtype, 'out0 = in0 + in1', out)
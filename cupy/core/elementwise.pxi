@@ -7,9 +7,10 @@ from cupy import util
 
 from cupy.cuda cimport device
 from cupy.cuda cimport function
+from cupy.cuda cimport memory
 
 
-cpdef _get_simple_elementwise_kernel(
+cpdef _get_simple_elementwise_kernel_code(
         params, operation, name, preamble,
         loop_prep='', after_loop='', options=()):
     module_code = string.Template('''
@@ -29,8 +30,15 @@ cpdef _get_simple_elementwise_kernel(
         preamble=preamble,
         loop_prep=loop_prep,
         after_loop=after_loop)
-    module = compile_with_cache(module_code, options)
-    return module.get_function(name)
+    return KernelCode(name, module_code, options)
+
+
+cpdef _get_simple_elementwise_kernel(
+        params, operation, name, preamble,
+        loop_prep='', after_loop='', options=()):
+    return _get_simple_elementwise_kernel_code(
+        params, operation, name, preamble,
+        loop_prep, after_loop, options).compile()
 
 
 cdef dict _typenames_base = {
@@ -46,15 +54,17 @@ cdef dict _typenames_base = {
     numpy.dtype('uint16'): 'unsigned short',
     numpy.dtype('uint8'): 'unsigned char',
     numpy.dtype('bool'): 'bool',
+    numpy.dtype('complex64'): 'complex<float>',
+    numpy.dtype('complex128'): 'complex<double>',
 }
 
-cdef str _all_type_chars = 'dfeqlihbQLIHB?'
+cdef str _all_type_chars = 'dfeqlihbQLIHB?FD'
 
 cdef dict _typenames = {
     numpy.dtype(i).type: _typenames_base[numpy.dtype(i)]
     for i in _all_type_chars}
 
-cdef tuple _python_scalar_type = six.integer_types + (float, bool)
+cdef tuple _python_scalar_type = six.integer_types + (float, bool, complex)
 cdef tuple _numpy_scalar_type = tuple([numpy.dtype(i).type
                                        for i in _all_type_chars])
 
@@ -66,11 +76,13 @@ cdef dict _kind_score = {
     'u': 1,
     'i': 1,
     'f': 2,
+    'c': 3,
 }
 
 
 cdef dict _python_type_to_numpy_type = {
     float: numpy.dtype(float).type,
+    complex: numpy.dtype(complex).type,
     bool: numpy.dtype(bool).type}
 for i in six.integer_types:
     _python_type_to_numpy_type[i] = numpy.int64
@@ -113,6 +125,49 @@ cpdef list _preprocess_args(args):
     return ret
 
 
+cdef memory.MemoryPointer _null_memptr = None
+
+
+cdef ndarray _placeholder(tuple shape, dtype, strides=None):
+    """Returns an array that has no device memory.
+
+    Placeholders stand for actual arrays when the code of a kernel is
+    generated without launching it.
+    """
+    global _null_memptr
+    cdef ndarray a
+    if _null_memptr is None:
+        _null_memptr = memory.MemoryPointer(memory.Memory(0), 0)
+    a = ndarray(shape, dtype, memptr=_null_memptr)
+    if strides is not None:
+        a._set_shape_and_strides(shape, strides)
+    return a
+
+
+cpdef list _preprocess_code_args(args):
+    """Preprocesses arguments for kernel code generation
+
+    - Replaces ndarrays and NumPy arrays with placeholders of the same shape,
+      strides and dtype
+    - Converts Python scalars into NumPy scalars
+    """
+    cdef list ret = []
+    cdef type typ
+
+    for arg in args:
+        typ = type(arg)
+        if typ is ndarray or typ is numpy.ndarray:
+            arg = _placeholder(arg.shape, arg.dtype, arg.strides)
+        elif typ in _python_scalar_type_set:
+            arg = _python_type_to_numpy_type[typ](arg)
+        elif typ in _numpy_scalar_type_set:
+            pass
+        else:
+            raise TypeError('Unsupported type %s' % typ)
+        ret.append(arg)
+    return ret
+
+
 cpdef tuple _get_args_info(list args):
     ret = []
     for a in args:
@@ -389,9 +444,8 @@ cdef list _get_out_args_with_params(
     return out_args
 
 
-@util.memoize(for_each_device=True)
-def _get_elementwise_kernel(args_info, types, params, operation, name,
-                            preamble, kwargs):
+def _get_elementwise_kernel_code(args_info, types, params, operation, name,
+                                 preamble, kwargs):
     kernel_params = _get_kernel_params(params, args_info)
     types_preamble = '\n'.join(
         'typedef %s %s;' % (_get_typename(v), k) for k, v in types)
@@ -407,11 +461,19 @@ def _get_elementwise_kernel(args_info, types, params, operation, name,
             op.append(fmt.format(t=p.ctype, n=p.name))
     op.append(operation)
     operation = '\n'.join(op)
-    return _get_simple_elementwise_kernel(
+    return _get_simple_elementwise_kernel_code(
         kernel_params, operation, name,
         preamble, **dict(kwargs))
 
 
+@util.memoize(for_each_device=True)
+def _get_elementwise_kernel(args_info, types, params, operation, name,
+                            preamble, kwargs):
+    return _get_elementwise_kernel_code(
+        args_info, types, params, operation, name, preamble,
+        kwargs).compile()
+
+
 cdef class ElementwiseKernel:
 
     """User-defined elementwise kernel.
@@ -479,6 +541,43 @@ cdef class ElementwiseKernel:
         if 'i' in names:
             raise ValueError("Can not use 'i' as a parameter name")
 
+    cdef tuple _prepare(self, tuple args, size, bint for_code):
+        n_args = len(args)
+        if n_args != self.nin and n_args != self.nargs:
+            raise TypeError('Wrong number of arguments for %s' % self.name)
+        if for_code:
+            args = _preprocess_code_args(args)
+        else:
+            args = _preprocess_args(args)
+
+        values, shape = _broadcast(args, self.params, size is not None)
+        in_args = values[:self.nin]
+        out_args = values[self.nin:]
+
+        in_ndarray_types = tuple(
+            [a.dtype.type if isinstance(a, ndarray) else None
+             for a in in_args])
+        out_ndarray_types = tuple([a.dtype.type for a in out_args])
+
+        in_types, out_types, types = _decide_params_type(
+            self.in_params, self.out_params,
+            in_ndarray_types, out_ndarray_types)
+
+        is_size_specified = False
+        if size is not None:
+            shape = size,
+            is_size_specified = True
+
+        if for_code and not out_args:
+            out_args = [_placeholder(shape, t) for t in out_types]
+        out_args = _get_out_args_with_params(
+            out_args, out_types, shape, self.out_params, is_size_specified)
+
+        inout_args = [x if isinstance(x, ndarray) else in_types[i](x)
+                      for i, x in enumerate(in_args)]
+        inout_args += out_args
+        return out_args, inout_args, shape, types
+
     def __call__(self, *args, **kwargs):
         """Compiles and invokes the elementwise kernel.
 
@@ -506,31 +605,7 @@ cdef class ElementwiseKernel:
         if kwargs:
             raise TypeError('Wrong arguments %s' % kwargs)
 
-        n_args = len(args)
-        if n_args != self.nin and n_args != self.nargs:
-            raise TypeError('Wrong number of arguments for %s' % self.name)
-        args = _preprocess_args(args)
-
-        values, shape = _broadcast(args, self.params, size is not None)
-        in_args = values[:self.nin]
-        out_args = values[self.nin:]
-
-        in_ndarray_types = tuple(
-            [a.dtype.type if isinstance(a, ndarray) else None
-             for a in in_args])
-        out_ndarray_types = tuple([a.dtype.type for a in out_args])
-
-        in_types, out_types, types = _decide_params_type(
-            self.in_params, self.out_params,
-            in_ndarray_types, out_ndarray_types)
-
-        is_size_specified = False
-        if size is not None:
-            shape = size,
-            is_size_specified = True
-
-        out_args = _get_out_args_with_params(
-            out_args, out_types, shape, self.out_params, is_size_specified)
+        out_args, inout_args, shape, types = self._prepare(args, size, False)
         if self.nout == 1:
             ret = out_args[0]
         else:
@@ -539,27 +614,56 @@ cdef class ElementwiseKernel:
         if 0 in shape:
             return ret
 
-        inout_args = [x if isinstance(x, ndarray) else in_types[i](x)
-                      for i, x in enumerate(in_args)]
-        inout_args += out_args
+        if _auto_range:
+            _auto_range_push(self.name, out_args[0].dtype, shape)
+        try:
+            if self.reduce_dims:
+                inout_args, shape = _reduce_dims(
+                    inout_args, self.params, shape)
+            indexer = Indexer(shape)
+            inout_args.append(indexer)
+
+            args_info = _get_args_info(inout_args)
+            kern = _get_elementwise_kernel(
+                args_info, types, self.params, self.operation,
+                self.name, self.preamble, self.kwargs)
+            kern.linear_launch(indexer.size, inout_args, shared_mem=0,
+                               block_max_size=128, stream=stream)
+        finally:
+            if _auto_range:
+                _auto_range_pop()
+        return ret
 
-        if self.reduce_dims:
-            inout_args, shape = _reduce_dims(
-                inout_args, self.params, shape)
-        indexer = Indexer(shape)
-        inout_args.append(indexer)
+    def get_code(self, *args, **kwargs):
+        """Generates the code of the kernel without compiling it.
+
+        The code is the same as what :meth:`__call__` compiles for the given
+        arguments. Since the arguments are used only to decide the dtypes and
+        the dimensions, NumPy arrays can be passed in place of CuPy arrays,
+        and no device is required.
+
+        Args:
+            args: Arguments of the kernel.
+            size (int): Range size of the indices.
+
+        Returns:
+            cupy.core.KernelCode: The generated code.
+
+        """
+        size = kwargs.pop('size', None)
+        if kwargs:
+            raise TypeError('Wrong arguments %s' % kwargs)
 
-        args_info = _get_args_info(inout_args)
-        kern = _get_elementwise_kernel(
-            args_info, types, self.params, self.operation,
+        out_args, inout_args, shape, types = self._prepare(args, size, True)
+        if self.reduce_dims:
+            inout_args, shape = _reduce_dims(inout_args, self.params, shape)
+        inout_args.append(Indexer(shape))
+        return _get_elementwise_kernel_code(
+            _get_args_info(inout_args), types, self.params, self.operation,
             self.name, self.preamble, self.kwargs)
-        kern.linear_launch(indexer.size, inout_args, shared_mem=0,
-                           block_max_size=128, stream=stream)
-        return ret
 
 
-@util.memoize(for_each_device=True)
-def _get_ufunc_kernel(
+def _get_ufunc_kernel_code(
         in_types, out_types, routine, args_info, params, name, preamble):
     kernel_params = _get_kernel_params(params, args_info)
 
@@ -582,10 +686,18 @@ def _get_ufunc_kernel(
     types.append(preamble)
     preamble = '\n'.join(types)
 
-    return _get_simple_elementwise_kernel(
+    return _get_simple_elementwise_kernel_code(
         kernel_params, operation, name, preamble)
 
 
+@util.memoize(for_each_device=True)
+def _get_ufunc_kernel(
+        in_types, out_types, routine, args_info, params, name, preamble):
+    return _get_ufunc_kernel_code(
+        in_types, out_types, routine, args_info, params, name,
+        preamble).compile()
+
+
 cdef tuple _guess_routine_from_in_types(list ops, tuple in_types):
     cdef Py_ssize_t i, n
     cdef tuple op, op_types
@@ -703,24 +815,7 @@ class ufunc(object):
             types.append('%s->%s' % (in_str, out_str))
         return types
 
-    def __call__(self, *args, **kwargs):
-        """Applies the universal function to arguments elementwise.
-
-        Args:
-            args: Input arguments. Each of them can be a :class:`cupy.ndarray`
-                object or a scalar. The output arguments can be omitted or be
-                specified by the ``out`` argument.
-            out (cupy.ndarray): Output array. It outputs to new arrays
-                default.
-            dtype: Data type specifier.
-
-        Returns:
-            Output array or a tuple of output arrays.
-
-        """
-
-        cdef function.Function kern
-
+    def _prepare(self, args, kwargs, for_code):
         out = kwargs.pop('out', None)
         dtype = kwargs.pop('dtype', None)
         # Note default behavior of casting is 'same_kind' on numpy>=1.10
@@ -734,7 +829,11 @@ class ufunc(object):
         if n_args != self.nin and n_args != self.nargs:
             raise TypeError('Wrong number of arguments for %s' % self.name)
 
-        args = _preprocess_args(args)
+        if for_code:
+            preprocess = _preprocess_code_args
+        else:
+            preprocess = _preprocess_args
+        args = preprocess(args)
         if out is None:
             in_args = args[:self.nin]
             out_args = args[self.nin:]
@@ -746,7 +845,7 @@ class ufunc(object):
                                  "a positional and keyword argument")
 
             in_args = list(args)
-            out_args = _preprocess_args((out,))
+            out_args = preprocess((out,))
             args += out_args
 
         broad = broadcast(*args)
@@ -755,7 +854,37 @@ class ufunc(object):
         in_types, out_types, routine = _guess_routine(
             self.name, self._routine_cache, self._ops, in_args, dtype)
 
+        if for_code and not out_args:
+            out_args = [_placeholder(shape, t) for t in out_types]
         out_args = _get_out_args(out_args, out_types, shape, casting)
+
+        inout_args = []
+        for i, t in enumerate(in_types):
+            x = broad.values[i]
+            inout_args.append(x if isinstance(x, ndarray) else t(x))
+        inout_args.extend(out_args)
+        return in_types, out_types, routine, out_args, inout_args, shape
+
+    def __call__(self, *args, **kwargs):
+        """Applies the universal function to arguments elementwise.
+
+        Args:
+            args: Input arguments. Each of them can be a :class:`cupy.ndarray`
+                object or a scalar. The output arguments can be omitted or be
+                specified by the ``out`` argument.
+            out (cupy.ndarray): Output array. It outputs to new arrays
+                default.
+            dtype: Data type specifier.
+
+        Returns:
+            Output array or a tuple of output arrays.
+
+        """
+
+        cdef function.Function kern
+
+        in_types, out_types, routine, out_args, inout_args, shape = \
+            self._prepare(args, kwargs, False)
         if self.nout == 1:
             ret = out_args[0]
         else:
@@ -764,22 +893,73 @@ class ufunc(object):
         if 0 in shape:
             return ret
 
-        inout_args = []
-        for i, t in enumerate(in_types):
-            x = broad.values[i]
-            inout_args.append(x if isinstance(x, ndarray) else t(x))
-        inout_args.extend(out_args)
-        inout_args, shape = _reduce_dims(inout_args, self._params, shape)
-        indexer = Indexer(shape)
-        inout_args.append(indexer)
-        args_info = _get_args_info(inout_args)
+        if _auto_range:
+            _auto_range_push(self.name, out_types[0], shape)
+        try:
+            inout_args, shape = _reduce_dims(
+                inout_args, self._params, shape)
+            indexer = Indexer(shape)
+            inout_args.append(indexer)
+            args_info = _get_args_info(inout_args)
+
+            kern = _get_ufunc_kernel(
+                in_types, out_types, routine, args_info,
+                self._params, self.name, self._preamble)
+
+            kern.linear_launch(indexer.size, inout_args)
+        finally:
+            if _auto_range:
+                _auto_range_pop()
+        return ret
+
+    def get_code(self, *args, **kwargs):
+        """Generates the code of the kernel without compiling it.
+
+        The code is the same as what :meth:`__call__` compiles for the given
+        arguments. Since the arguments are used only to decide the dtypes and
+        the dimensions, NumPy arrays can be passed in place of CuPy arrays,
+        and no device is required.
+
+        Args:
+            args: Input arguments and optional output arguments.
+            out: Output array.
+            dtype: Data type specifier.
+
+        Returns:
+            cupy.core.KernelCode: The generated code.
 
-        kern = _get_ufunc_kernel(
-            in_types, out_types, routine, args_info,
+        """
+        in_types, out_types, routine, out_args, inout_args, shape = \
+            self._prepare(args, kwargs, True)
+        inout_args, shape = _reduce_dims(inout_args, self._params, shape)
+        inout_args.append(Indexer(shape))
+        return _get_ufunc_kernel_code(
+            in_types, out_types, routine, _get_args_info(inout_args),
             self._params, self.name, self._preamble)
 
-        kern.linear_launch(indexer.size, inout_args)
-        return ret
+    def accumulate(self, array, axis=0, dtype=None, out=None):
+        """Accumulates the result of applying the operator to all elements.
+
+        The result is computed by a parallel scan along the axis, which is
+        supported only for binary universal functions whose operators are
+        associative, e.g. :data:`cupy.add`, :data:`cupy.multiply`,
+        :data:`cupy.maximum`, :data:`cupy.minimum` and logical and bitwise
+        operators.
+
+        Args:
+            array (cupy.ndarray): Array to act on.
+            axis (int): Axis along which the operator is accumulated.
+            dtype: Data type in which the operator is applied. The output
+                type of the operator for ``array`` is used by default.
+            out (cupy.ndarray): Output array of the same shape as ``array``.
+
+        Returns:
+            cupy.ndarray: The accumulated values.
+
+        .. seealso:: :meth:`numpy.ufunc.accumulate`
+
+        """
+        return _accumulate(self, array, axis, dtype, out)
 
 
 cpdef create_ufunc(name, ops, routine=None, preamble='', doc=''):
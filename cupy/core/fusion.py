@@ -250,6 +250,7 @@ _kind_score = {
     'u': 1,
     'i': 1,
     'f': 2,
+    'c': 3,
 }
 
 _dtype_to_ctype = {
@@ -265,9 +266,11 @@ _dtype_to_ctype = {
     numpy.dtype('uint16'): 'unsigned short',
     numpy.dtype('uint8'): 'unsigned char',
     numpy.dtype('bool'): 'bool',
+    numpy.dtype('complex64'): 'complex<float>',
+    numpy.dtype('complex128'): 'complex<double>',
 }
 
-_dtype_list = [numpy.dtype(_) for _ in '?bhilqBHILQefd']
+_dtype_list = [numpy.dtype(_) for _ in '?bhilqBHILQefdFD']
 
 
 def _const_to_str(val):
@@ -578,7 +581,9 @@ class Fusion(object):
     """Function class.
 
     This class can be get by using `fuse` function and
-    works like `ElementwiseKernel` or `ReductionKernel`.
+    works like `ElementwiseKernel` or `ReductionKernel`. The result of a
+    fused function with a single output can be written to an existing array
+    given by the ``out`` keyword argument.
 
     Attributes:
         func (function): The function before fusing.
@@ -606,8 +611,61 @@ class Fusion(object):
         finally:
             _thread_local.in_fusion = False
 
+    def _get_kernel(self, args):
+        types = [_.dtype for _ in args]
+        key = tuple(types)
+        if key not in self._memo:
+            if self.input_num is not None:
+                nin = self.input_num
+            else:
+                nin = len(args)
+            f = _get_fusion(self.func, nin, self.reduce,
+                            self.post_map, self.identity, types)
+            self._memo[key] = f
+        return self._memo[key]
+
+    def get_code(self, *args, **kwargs):
+        """Generates the code of the fused kernel without compiling it.
+
+        The code is the same as what the fused function compiles for the
+        given arguments. Since the arguments are used only to decide the
+        dtypes and the dimensions, NumPy arrays can be passed in place of
+        CuPy arrays, and no device is required.
+
+        Args:
+            args: Arguments of the fused function.
+            axis (int or tuple of ints): Axis or axes along which the
+                reduction is performed.
+
+        Returns:
+            cupy.core.KernelCode: The generated code.
+
+        """
+        axis = kwargs.pop('axis', None)
+        if kwargs:
+            raise TypeError('Wrong arguments %s' % kwargs)
+        if len(args) == 0:
+            raise Exception('number of arguments must be more than 0')
+        if builtins.any(
+                not isinstance(_, (core.ndarray, numpy.ndarray, numpy.generic))
+                for _ in args):
+            raise TypeError('Invalid argument type for \'{}\': ({})'.format(
+                self.name,
+                ', '.join(repr(type(_)) for _ in args)))
+
+        _thread_local.in_fusion = True
+        try:
+            f = self._get_kernel(args)
+        finally:
+            _thread_local.in_fusion = False
+        if self.reduce is None:
+            return f.get_code(*args)
+        else:
+            return f.get_code(*args, axis=axis)
+
     def _call(self, *args, **kwargs):
         axis = kwargs['axis'] if 'axis' in kwargs else None
+        out = kwargs.get('out', None)
         if len(args) == 0:
             raise Exception('number of arguments must be more than 0')
         if builtins.any(
@@ -620,32 +678,28 @@ class Fusion(object):
         def is_cupy_data(a):
             return isinstance(a, (core.ndarray, numpy.generic))
         if builtins.all(is_cupy_data(_) for _ in args):
-            types = [_.dtype for _ in args]
-            key = tuple(types)
-            if key not in self._memo:
-                if self.input_num is not None:
-                    nin = self.input_num
-                else:
-                    nin = len(args)
-                f = _get_fusion(self.func, nin, self.reduce,
-                                self.post_map, self.identity, types)
-                self._memo[key] = f
-            f = self._memo[key]
+            f = self._get_kernel(args)
             if self.reduce is None:
-                return f(*args)
+                if out is None:
+                    return f(*args)
+                return f(*args + (out,))
             else:
-                return f(*args, axis=axis)
+                return f(*args, axis=axis, out=out)
         else:
             if builtins.any(type(_) is core.ndarray for _ in args):
                 types = '.'.join(repr(type(_)) for _ in args)
                 message = "Can't fuse \n %s(%s)" % (self.name, types)
                 warnings.warn(message)
             if self.reduce is None:
-                return self.func(*args)
+                ret = self.func(*args)
             elif axis is None:
-                return self.post_map(self.reduce(self.func(*args)))
+                ret = self.post_map(self.reduce(self.func(*args)))
             else:
-                return self.post_map(self.reduce(self.func(*args), axis=axis))
+                ret = self.post_map(self.reduce(self.func(*args), axis=axis))
+            if out is None:
+                return ret
+            out[...] = ret
+            return out
 
 
 def fuse(*args, **kwargs):
@@ -834,6 +888,8 @@ maximum = _create_ufunc(math.misc.maximum, numpy.maximum)
 minimum = _create_ufunc(math.misc.minimum, numpy.minimum)
 fmax = _create_ufunc(math.misc.fmax, numpy.fmax)
 fmin = _create_ufunc(math.misc.fmin, numpy.fmin)
+conj = _create_ufunc(math.misc.conj, numpy.conj)
+conjugate = _create_ufunc(math.misc.conjugate, numpy.conjugate)
 
 
 class reduction(object):
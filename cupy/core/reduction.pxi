@@ -6,7 +6,7 @@ import numpy
 from cupy import util
 
 
-cpdef _get_simple_reduction_kernel(
+cpdef _get_simple_reduction_kernel_code(
         name, block_size, reduce_type, params, identity,
         pre_map_expr, reduce_expr, post_map_expr,
         type_preamble, input_expr, output_expr, preamble, options):
@@ -24,8 +24,10 @@ cpdef _get_simple_reduction_kernel(
 
     typedef ${reduce_type} _type_reduce;
     extern "C" __global__ void ${name}(${params}) {
-      extern __shared__ _type_reduce _sdata_raw[];
-      _type_reduce *_sdata = _sdata_raw;
+      // Shared variables cannot be of class types with constructors such
+      // as complex, so the buffer is declared untyped.
+      extern __shared__ __align__(16) char _sdata_raw[];
+      _type_reduce *_sdata = reinterpret_cast<_type_reduce*>(_sdata_raw);
       unsigned int _tid = threadIdx.x;
 
       int _J_offset = _tid / _block_stride;
@@ -101,8 +103,17 @@ cpdef _get_simple_reduction_kernel(
         input_expr=input_expr,
         output_expr=output_expr,
         preamble=preamble)
-    module = compile_with_cache(module_code, options)
-    return module.get_function(name)
+    return KernelCode(name, module_code, options)
+
+
+cpdef _get_simple_reduction_kernel(
+        name, block_size, reduce_type, params, identity,
+        pre_map_expr, reduce_expr, post_map_expr,
+        type_preamble, input_expr, output_expr, preamble, options):
+    return _get_simple_reduction_kernel_code(
+        name, block_size, reduce_type, params, identity,
+        pre_map_expr, reduce_expr, post_map_expr,
+        type_preamble, input_expr, output_expr, preamble, options).compile()
 
 
 cpdef tuple _get_axis(object axis, Py_ssize_t ndim):
@@ -161,8 +172,7 @@ cpdef list _get_inout_args(
     return args
 
 
-@util.memoize(for_each_device=True)
-def _get_simple_reduction_function(
+def _get_simple_reduction_function_code(
         routine, params, args_info, in_arg_dtype, out_arg_dtype, out_types,
         name, block_size, identity, input_expr, output_expr, _preamble,
         options):
@@ -174,12 +184,23 @@ def _get_simple_reduction_function(
     type_preamble = 'typedef %s type_in0_raw; typedef %s type_out0_raw;' % t
 
     params = _get_kernel_params(params, args_info)
-    return _get_simple_reduction_kernel(
+    return _get_simple_reduction_kernel_code(
         name, block_size, reduce_type, params, identity,
         routine[0], routine[1], routine[2],
         type_preamble, input_expr, output_expr, _preamble, options)
 
 
+@util.memoize(for_each_device=True)
+def _get_simple_reduction_function(
+        routine, params, args_info, in_arg_dtype, out_arg_dtype, out_types,
+        name, block_size, identity, input_expr, output_expr, _preamble,
+        options):
+    return _get_simple_reduction_function_code(
+        routine, params, args_info, in_arg_dtype, out_arg_dtype, out_types,
+        name, block_size, identity, input_expr, output_expr, _preamble,
+        options).compile()
+
+
 class simple_reduction_function(object):
 
     _block_size = 512
@@ -202,7 +223,12 @@ class simple_reduction_function(object):
         self._output_expr = 'type_out0_raw &out0 = _raw_out0[_out_ind.get()];'
         self._routine_cache = {}
 
-    def __call__(self, a, axis=None, dtype=None, out=None, keepdims=False):
+    def _prepare(self, a, axis, dtype, out, keepdims, for_code):
+        if for_code:
+            if isinstance(a, numpy.ndarray):
+                a = _preprocess_code_args((a,))[0]
+            if out is not None:
+                out = _preprocess_code_args((out,))[0]
         if not isinstance(a, ndarray):
             raise TypeError('Input type must be cupy.ndarray')
         if self.identity is None and 0 in a.shape:
@@ -213,26 +239,33 @@ class simple_reduction_function(object):
 
         in_args = [a]
         if out is None:
-            a = _preprocess_args((a,))[0]
             out_args = []
         else:
-            a, out = _preprocess_args((a, out))
             out_args = [out]
+        if not for_code:
+            _preprocess_args(in_args + out_args)
 
         in_types, out_types, routine = _guess_routine(
             self.name, self._routine_cache, self._ops, in_args, dtype)
 
         axis, raxis = _get_axis(axis, a.ndim)
         out_shape = _get_out_shape(a.shape, axis, raxis, keepdims)
+        if for_code and not out_args:
+            out_args = [_placeholder(out_shape, t) for t in out_types]
         out_args = _get_out_args(out_args, out_types, out_shape, 'unsafe')
+
+        in_args, in_shape = _get_trans_args(
+            in_args, axis + raxis, in_args[0].shape, None)
+        return routine, out_types, in_args, out_args, in_shape, out_shape
+
+    def __call__(self, a, axis=None, dtype=None, out=None, keepdims=False):
+        routine, out_types, in_args, out_args, in_shape, out_shape = \
+            self._prepare(a, axis, dtype, out, keepdims, False)
         if 0 in out_shape:
             if len(out_args) == 1:
                 return out_args[0]
             return tuple(out_args)
 
-        in_args, in_shape = _get_trans_args(
-            in_args, axis + raxis, in_args[0].shape, None)
-
         block_size = self._block_size
         in_indexer = Indexer(in_shape)
         out_indexer = Indexer(out_shape)
@@ -242,31 +275,59 @@ class simple_reduction_function(object):
             int(in_indexer.size // out_indexer.size - 1))
         block_stride = max(1, block_size // clp2_count)
 
-        inout_args = _get_inout_args(
-            in_args, out_args, in_indexer, out_indexer, block_stride,
-            self._params, True)
-        args_info = _get_args_info(inout_args)
-
-        kern = _get_simple_reduction_function(
-            routine, self._params, args_info,
-            in_args[0].dtype.type, out_args[0].dtype.type, out_types,
-            self.name, block_size, self.identity,
-            self._input_expr, self._output_expr, self._preamble, ())
-
-        # TODO(okuta) set actual size
-        shared_mem = 32 * block_size
-
-        kern.linear_launch(
-            (out_indexer.size + block_stride - 1) // block_stride * block_size,
-            inout_args, shared_mem, block_size)
+        if _auto_range:
+            _auto_range_push(self.name, in_args[0].dtype, in_shape)
+        try:
+            inout_args = _get_inout_args(
+                in_args, out_args, in_indexer, out_indexer, block_stride,
+                self._params, True)
+            args_info = _get_args_info(inout_args)
+
+            kern = _get_simple_reduction_function(
+                routine, self._params, args_info,
+                in_args[0].dtype.type, out_args[0].dtype.type, out_types,
+                self.name, block_size, self.identity,
+                self._input_expr, self._output_expr, self._preamble, ())
+
+            # TODO(okuta) set actual size
+            shared_mem = 32 * block_size
+
+            kern.linear_launch(
+                (out_indexer.size + block_stride - 1) // block_stride *
+                block_size,
+                inout_args, shared_mem, block_size)
+        finally:
+            if _auto_range:
+                _auto_range_pop()
 
         if len(out_args) == 1:
             return out_args[0]
         return tuple(out_args)
 
+    def get_code(self, a, axis=None, dtype=None, out=None, keepdims=False):
+        """Generates the code of the kernel without compiling it.
 
-@util.memoize(for_each_device=True)
-def _get_reduction_kernel(
+        The code is the same as what :meth:`__call__` compiles for the given
+        arguments. A NumPy array can be passed in place of a CuPy array, and
+        no device is required.
+
+        Returns:
+            cupy.core.KernelCode: The generated code.
+
+        """
+        routine, out_types, in_args, out_args, in_shape, out_shape = \
+            self._prepare(a, axis, dtype, out, keepdims, True)
+        inout_args = _get_inout_args(
+            in_args, out_args, Indexer(in_shape), Indexer(out_shape), 1,
+            self._params, True)
+        return _get_simple_reduction_function_code(
+            routine, self._params, _get_args_info(inout_args),
+            in_args[0].dtype.type, out_args[0].dtype.type, out_types,
+            self.name, self._block_size, self.identity,
+            self._input_expr, self._output_expr, self._preamble, ())
+
+
+def _get_reduction_kernel_code(
         params, args_info, types,
         name, block_size, reduce_type, identity, map_expr, reduce_expr,
         post_map_expr, preamble, options):
@@ -283,12 +344,23 @@ def _get_reduction_kernel(
         ['{0} &{1} = _raw_{1}[_i];'.format(p.ctype, p.name)
          for p in arrays if not p.is_const])
 
-    return _get_simple_reduction_kernel(
+    return _get_simple_reduction_kernel_code(
         name, block_size, reduce_type, kernel_params, identity,
         map_expr, reduce_expr, post_map_expr,
         type_preamble, input_expr, output_expr, preamble, options)
 
 
+@util.memoize(for_each_device=True)
+def _get_reduction_kernel(
+        params, args_info, types,
+        name, block_size, reduce_type, identity, map_expr, reduce_expr,
+        post_map_expr, preamble, options):
+    return _get_reduction_kernel_code(
+        params, args_info, types,
+        name, block_size, reduce_type, identity, map_expr, reduce_expr,
+        post_map_expr, preamble, options).compile()
+
+
 class ReductionKernel(object):
 
     """User-defined reduction kernel.
@@ -346,30 +418,7 @@ class ReductionKernel(object):
             self.reduce_type = reduce_type
         self.preamble = preamble
 
-    def __call__(self, *args, **kwargs):
-        """Compiles and invokes the reduction kernel.
-
-        The compilation runs only if the kernel is not cached. Note that the
-        kernels with different argument dtypes, ndims, or axis are not
-        compatible. It means that single ReductionKernel object may be compiled
-        into multiple kernel binaries.
-
-        Args:
-            args: Arguments of the kernel.
-
-        Returns:
-            Arrays are returned according to the ``out_params`` argument of the
-            ``__init__`` method.
-
-        """
-
-        out = kwargs.pop('out', None)
-        axis = kwargs.pop('axis', None)
-        keepdims = kwargs.pop('keepdims', False)
-        stream = kwargs.pop('stream', None)
-        if kwargs:
-            raise TypeError('Wrong arguments %s' % kwargs)
-
+    def _prepare(self, args, out, axis, keepdims, for_code):
         n_args = len(args)
         if n_args != self.nin and n_args != self.nargs:
             raise TypeError('Wrong number of arguments for %s' % self.name)
@@ -383,8 +432,12 @@ class ReductionKernel(object):
                                  "a positional and keyword argument")
             out_args = [out]
 
-        in_args = _preprocess_args(args[:self.nin])
-        out_args = _preprocess_args(out_args)
+        if for_code:
+            preprocess = _preprocess_code_args
+        else:
+            preprocess = _preprocess_args
+        in_args = preprocess(args[:self.nin])
+        out_args = preprocess(out_args)
         in_args, broad_shape = _broadcast(in_args, self.in_params, False)
 
         if self.identity is None and 0 in broad_shape:
@@ -403,15 +456,45 @@ class ReductionKernel(object):
 
         axis, raxis = _get_axis(axis, len(broad_shape))
         out_shape = _get_out_shape(broad_shape, axis, raxis, keepdims)
+        if for_code and not out_args:
+            out_args = [_placeholder(out_shape, t) for t in out_types]
         out_args = _get_out_args_with_params(
             out_args, out_types, out_shape, self.out_params, False)
-        if 0 in out_shape:
-            return out_args[0]
 
         in_args = [x if isinstance(x, ndarray) else t(x)
                    for x, t in zip(in_args, in_types)]
         in_args, in_shape = _get_trans_args(
             in_args, axis + raxis, broad_shape, self.in_params)
+        return types, in_args, out_args, in_shape, out_shape
+
+    def __call__(self, *args, **kwargs):
+        """Compiles and invokes the reduction kernel.
+
+        The compilation runs only if the kernel is not cached. Note that the
+        kernels with different argument dtypes, ndims, or axis are not
+        compatible. It means that single ReductionKernel object may be compiled
+        into multiple kernel binaries.
+
+        Args:
+            args: Arguments of the kernel.
+
+        Returns:
+            Arrays are returned according to the ``out_params`` argument of the
+            ``__init__`` method.
+
+        """
+
+        out = kwargs.pop('out', None)
+        axis = kwargs.pop('axis', None)
+        keepdims = kwargs.pop('keepdims', False)
+        stream = kwargs.pop('stream', None)
+        if kwargs:
+            raise TypeError('Wrong arguments %s' % kwargs)
+
+        types, in_args, out_args, in_shape, out_shape = self._prepare(
+            args, out, axis, keepdims, False)
+        if 0 in out_shape:
+            return out_args[0]
 
         block_size = 512
         in_indexer = Indexer(in_shape)
@@ -422,25 +505,68 @@ class ReductionKernel(object):
             int(in_indexer.size // out_indexer.size - 1))
         block_stride = max(1, block_size // clp2_count)
 
+        if _auto_range:
+            _auto_range_push(self.name, out_args[0].dtype, in_shape)
+        try:
+            inout_args = _get_inout_args(
+                in_args, out_args, in_indexer, out_indexer, block_stride,
+                self.params, self.reduce_dims)
+            args_info = _get_args_info(inout_args)
+
+            kern = _get_reduction_kernel(
+                self.params, args_info, types,
+                self.name, block_size, self.reduce_type, self.identity,
+                self.map_expr, self.reduce_expr, self.post_map_expr,
+                self.preamble, self.options)
+
+            # TODO(okuta) set actual size
+            shared_mem = 32 * block_size
+
+            kern.linear_launch(
+                (out_indexer.size + block_stride - 1) // block_stride *
+                block_size,
+                inout_args, shared_mem, block_size, stream)
+        finally:
+            if _auto_range:
+                _auto_range_pop()
+        return out_args[0]
+
+    def get_code(self, *args, **kwargs):
+        """Generates the code of the kernel without compiling it.
+
+        The code is the same as what :meth:`__call__` compiles for the given
+        arguments. Since the arguments are used only to decide the dtypes and
+        the dimensions, NumPy arrays can be passed in place of CuPy arrays,
+        and no device is required.
+
+        Args:
+            args: Arguments of the kernel.
+            out: Output array.
+            axis (int or tuple of ints): Axis or axes along which the
+                reduction is performed.
+            keepdims (bool): If ``True``, the reduced axes are kept.
+
+        Returns:
+            cupy.core.KernelCode: The generated code.
+
+        """
+        out = kwargs.pop('out', None)
+        axis = kwargs.pop('axis', None)
+        keepdims = kwargs.pop('keepdims', False)
+        if kwargs:
+            raise TypeError('Wrong arguments %s' % kwargs)
+
+        types, in_args, out_args, in_shape, out_shape = self._prepare(
+            args, out, axis, keepdims, True)
         inout_args = _get_inout_args(
-            in_args, out_args, in_indexer, out_indexer, block_stride,
+            in_args, out_args, Indexer(in_shape), Indexer(out_shape), 1,
             self.params, self.reduce_dims)
-        args_info = _get_args_info(inout_args)
-
-        kern = _get_reduction_kernel(
-            self.params, args_info, types,
-            self.name, block_size, self.reduce_type, self.identity,
+        return _get_reduction_kernel_code(
+            self.params, _get_args_info(inout_args), types,
+            self.name, 512, self.reduce_type, self.identity,
             self.map_expr, self.reduce_expr, self.post_map_expr,
             self.preamble, self.options)
 
-        # TODO(okuta) set actual size
-        shared_mem = 32 * block_size
-
-        kern.linear_launch(
-            (out_indexer.size + block_stride - 1) // block_stride * block_size,
-            inout_args, shared_mem, block_size, stream)
-        return out_args[0]
-
 
 cpdef create_reduction_func(name, ops, routine=None, identity=None,
                             preamble=''):
@@ -0,0 +1,348 @@
+import string
+
+import numpy
+
+from cupy import util
+
+
+# Names of the ufuncs whose operators are associative, i.e. whose
+# ``accumulate`` can be computed by a parallel scan.
+cdef set _associative_ufuncs = {
+    'cupy_add', 'cupy_multiply', 'cupy_maximum', 'cupy_minimum',
+    'cupy_fmax', 'cupy_fmin', 'cupy_logical_and', 'cupy_logical_or',
+    'cupy_logical_xor', 'cupy_bitwise_and', 'cupy_bitwise_or',
+    'cupy_bitwise_xor'}
+
+# Number of items each thread scans sequentially in a tile.
+cdef Py_ssize_t _scan_items_per_thread = 4
+cdef Py_ssize_t _scan_max_block_size = 256
+
+# Scans are computed one thread per row when there are at least this many
+# rows and the rows are not contiguous, so that the loads are coalesced.
+cdef Py_ssize_t _scan_min_rows_for_sequential = 1024
+
+# Kernel modes
+cdef int _SCAN_REDUCE = 0
+cdef int _SCAN_APPLY = 1
+cdef int _SCAN_SEQUENTIAL = 2
+
+
+cpdef _get_scan_kernel_code(
+        name, in_type, scan_type, out_type, in_ndim, out_ndim, routine,
+        preamble, identity, block_size):
+    """Generates the code of the scan kernel.
+
+    The kernel scans each row of a ``(rows, n)`` array. ``routine`` computes
+    ``out0`` from ``in0`` and ``in1`` of the scan type. An exclusive scan is
+    generated if ``identity`` is given.
+
+    The kernel runs in one of three modes. In ``_SCAN_REDUCE`` mode, each
+    block scans a tile of a row and writes the total to ``_carry``. In
+    ``_SCAN_APPLY`` mode, each block scans a tile again and combines it with
+    the scanned totals of the preceding tiles of the row. In
+    ``_SCAN_SEQUENTIAL`` mode, each thread scans a whole row.
+
+    """
+    if identity is None:
+        exclusive = 0
+        identity = 'type_scan()'
+    else:
+        exclusive = 1
+    module_code = string.Template('''
+    typedef ${in_type} type_in;
+    typedef ${scan_type} type_scan;
+    typedef ${out_type} type_out;
+    typedef type_scan in0_type;
+    typedef type_scan in1_type;
+    typedef type_scan out0_type;
+    ${preamble}
+
+    #define _BLOCK ${block_size}
+    #define _TILE (${block_size} * ${items_per_thread})
+    #define _EXCLUSIVE ${exclusive}
+
+    __device__ type_scan _scan_op(const type_scan in0, const type_scan in1) {
+      type_scan out0;
+      ${routine};
+      return out0;
+    }
+
+    // Computes the inclusive scan of the first _count items of _sdata.
+    __device__ void _scan_tile(
+        type_scan* _sdata, type_scan* _stot, int _count) {
+      int _tid = threadIdx.x;
+      int _begin = _tid * ${items_per_thread};
+      int _end = min(_begin + ${items_per_thread}, _count);
+      int _nthreads =
+          (_count + ${items_per_thread} - 1) / ${items_per_thread};
+      if (_begin < _end) {
+        type_scan _acc = _sdata[_begin];
+        for (int _k = _begin + 1; _k < _end; ++_k) {
+          _acc = _scan_op(_acc, _sdata[_k]);
+          _sdata[_k] = _acc;
+        }
+        _stot[_tid] = _acc;
+      }
+      __syncthreads();
+      for (int _offset = 1; _offset < _nthreads; _offset <<= 1) {
+        bool _update = _tid >= _offset && _tid < _nthreads;
+        type_scan _v;
+        if (_update) {
+          _v = _scan_op(_stot[_tid - _offset], _stot[_tid]);
+        }
+        __syncthreads();
+        if (_update) {
+          _stot[_tid] = _v;
+        }
+        __syncthreads();
+      }
+      if (_tid > 0 && _begin < _end) {
+        type_scan _prefix = _stot[_tid - 1];
+        for (int _k = _begin; _k < _end; ++_k) {
+          _sdata[_k] = _scan_op(_prefix, _sdata[_k]);
+        }
+      }
+      __syncthreads();
+    }
+
+    extern "C" __global__ void ${name}(
+        const CArray<type_in, ${in_ndim}> _x,
+        CArray<type_out, ${out_ndim}> _y,
+        CArray<type_scan, 1> _carry,
+        long long _n, long long _nchunks, long long _nrows, long long _mode) {
+      if (_mode == ${mode_sequential}) {
+        long long _row = (long long)blockIdx.x * _BLOCK + threadIdx.x;
+        if (_row >= _nrows) {
+          return;
+        }
+        long long _base = _row * _n;
+        type_scan _acc = type_scan(_x[_base]);
+    #if _EXCLUSIVE
+        _y[_base] = type_out(type_scan(${identity}));
+        for (long long _j = 1; _j < _n; ++_j) {
+          type_scan _v = type_scan(_x[_base + _j]);
+          _y[_base + _j] = type_out(_acc);
+          _acc = _scan_op(_acc, _v);
+        }
+    #else
+        _y[_base] = type_out(_acc);
+        for (long long _j = 1; _j < _n; ++_j) {
+          _acc = _scan_op(_acc, type_scan(_x[_base + _j]));
+          _y[_base + _j] = type_out(_acc);
+        }
+    #endif
+        return;
+      }
+
+      extern __shared__ unsigned long long _scan_smem[];
+      type_scan* _sdata = reinterpret_cast<type_scan*>(_scan_smem);
+      type_scan* _stot = _sdata + _TILE;
+
+      long long _row = blockIdx.x / _nchunks;
+      long long _chunk = blockIdx.x - _row * _nchunks;
+      long long _first = _row * _n + _chunk * _TILE;
+      int _count = (int)min((long long)_TILE, _n - _chunk * _TILE);
+
+      for (int _k = threadIdx.x; _k < _count; _k += _BLOCK) {
+        _sdata[_k] = type_scan(_x[_first + _k]);
+      }
+      __syncthreads();
+      _scan_tile(_sdata, _stot, _count);
+
+      if (_mode == ${mode_reduce}) {
+        if (threadIdx.x == 0) {
+          _carry[blockIdx.x] = _sdata[_count - 1];
+        }
+        return;
+      }
+
+      bool _has_prefix = _chunk > 0;
+      type_scan _prefix;
+      if (_has_prefix) {
+        _prefix = _carry[blockIdx.x - 1];
+      }
+      for (int _k = threadIdx.x; _k < _count; _k += _BLOCK) {
+    #if _EXCLUSIVE
+        type_scan _v;
+        if (_k > 0) {
+          _v = _has_prefix ? _scan_op(_prefix, _sdata[_k - 1])
+                           : _sdata[_k - 1];
+        } else {
+          _v = _has_prefix ? _prefix : type_scan(${identity});
+        }
+    #else
+        type_scan _v = _has_prefix ? _scan_op(_prefix, _sdata[_k])
+                                   : _sdata[_k];
+    #endif
+        _y[_first + _k] = type_out(_v);
+      }
+    }''').substitute(
+        name=name,
+        in_type=_get_typename(in_type),
+        scan_type=_get_typename(scan_type),
+        out_type=_get_typename(out_type),
+        in_ndim=in_ndim,
+        out_ndim=out_ndim,
+        routine=routine,
+        preamble=preamble,
+        identity=identity,
+        exclusive=exclusive,
+        block_size=block_size,
+        items_per_thread=_scan_items_per_thread,
+        mode_reduce=_SCAN_REDUCE,
+        mode_sequential=_SCAN_SEQUENTIAL)
+    return KernelCode(name, module_code)
+
+
+@util.memoize(for_each_device=True)
+def _get_scan_kernel(
+        name, in_type, scan_type, out_type, in_ndim, out_ndim, routine,
+        preamble, identity, block_size):
+    return _get_scan_kernel_code(
+        name, in_type, scan_type, out_type, in_ndim, out_ndim, routine,
+        preamble, identity, block_size).compile()
+
+
+cdef ndarray _as_rows(ndarray a, Py_ssize_t n):
+    # Returns a (rows, n) view of the array if it can be made without a copy.
+    cdef vector.vector[Py_ssize_t] shape, strides
+    cdef ndarray view
+    shape.push_back(a.size // n)
+    shape.push_back(n)
+    strides = _get_strides_for_nocopy_reshape(a, shape)
+    if strides.size() != 2:
+        return a
+    view = a.view()
+    view._set_shape_and_strides(shape, strides, False)
+    return view
+
+
+cpdef ndarray _scan(
+        ndarray a, Py_ssize_t axis, scan_dtype, str routine, ndarray out=None,
+        str preamble='', identity=None, str name='cupy_scan'):
+    """Scans an array along an axis with an associative operator.
+
+    The scan is computed without moving the axis in memory. Each row along
+    the axis is split into tiles. Rows longer than a tile are processed by
+    the reduce-then-scan strategy: the totals of the tiles are computed
+    first, they are scanned recursively, and then each tile is scanned
+    starting from the total of the preceding tiles.
+
+    Args:
+        a (cupy.ndarray): Input array.
+        axis (int): Axis along which the scan is computed. It must be
+            normalized.
+        scan_dtype: Data type in which the operator is applied.
+        routine (str): Code computing ``out0`` from ``in0`` and ``in1``,
+            in the same form as the routines of :class:`ufunc`.
+        out (cupy.ndarray): Output array of the same shape as ``a``. It can
+            be ``a`` itself.
+        preamble (str): Code inserted before the kernel.
+        identity (str): Identity of the operator. If it is given, the
+            exclusive scan is computed. Otherwise, the inclusive scan is
+            computed.
+        name (str): Name of the kernel.
+
+    Returns:
+        cupy.ndarray: The output array.
+
+    """
+    cdef Py_ssize_t n, nrows, nchunks, block_size, tile, itemsize
+    cdef ndarray x, y, carry, carry_rows
+    cdef list axes
+    cdef function.Function kern
+    scan_dtype = numpy.dtype(scan_dtype)
+    if out is None:
+        out = ndarray(a.shape, dtype=scan_dtype)
+    elif out.shape != a.shape:
+        raise ValueError('Provided out is the wrong size')
+    if a.size == 0:
+        return out
+
+    axes = [i for i in range(a.ndim) if i != axis]
+    axes.append(axis)
+    n = a._shape[axis]
+    nrows = a.size // n
+    x = _as_rows(a._transpose(axes), n)
+    y = _as_rows(out._transpose(axes), n)
+
+    block_size = 32
+    while (block_size < _scan_max_block_size and
+           block_size * _scan_items_per_thread < n):
+        block_size *= 2
+    tile = block_size * _scan_items_per_thread
+    nchunks = (n + tile - 1) // tile
+    itemsize = scan_dtype.itemsize
+
+    if _auto_range:
+        _auto_range_push(name, scan_dtype, a.shape)
+    try:
+        if (n > 1 and nrows >= _scan_min_rows_for_sequential and
+                x._strides[x.ndim - 1] != a.itemsize):
+            block_size = _scan_max_block_size
+            kern = _get_scan_kernel(
+                name, a.dtype.type, scan_dtype.type, out.dtype.type, x.ndim,
+                y.ndim, routine, preamble, identity, block_size)
+            kern(grid=((nrows + block_size - 1) // block_size,),
+                 block=(block_size,),
+                 args=(x, y, ndarray((0,), dtype=scan_dtype), n, nchunks,
+                       nrows, _SCAN_SEQUENTIAL))
+            return out
+
+        kern = _get_scan_kernel(
+            name, a.dtype.type, scan_dtype.type, out.dtype.type, x.ndim,
+            y.ndim, routine, preamble, identity, block_size)
+        shared_mem = (tile + block_size) * itemsize
+        if nchunks > 1:
+            # The kernel indexes the totals of the tiles by the block, so
+            # they are passed as a 1-D array and scanned as rows.
+            carry = ndarray((nrows * nchunks,), dtype=scan_dtype)
+            kern(grid=(nrows * nchunks,), block=(block_size,),
+                 args=(x, y, carry, n, nchunks, nrows, _SCAN_REDUCE),
+                 shared_mem=shared_mem)
+            carry_rows = carry.reshape(nrows, nchunks)
+            _scan(carry_rows, 1, scan_dtype, routine, carry_rows, preamble,
+                  None, name)
+        else:
+            carry = ndarray((0,), dtype=scan_dtype)
+        kern(grid=(nrows * nchunks,), block=(block_size,),
+             args=(x, y, carry, n, nchunks, nrows, _SCAN_APPLY),
+             shared_mem=shared_mem)
+    finally:
+        if _auto_range:
+            _auto_range_pop()
+    return out
+
+
+cdef str _get_accumulate_routine(func, dtype):
+    for in_types, out_types, routine in func._ops:
+        if in_types[0] == in_types[1] == out_types[0] == dtype:
+            return routine
+    raise TypeError('Wrong type of arguments for %s.accumulate' % func.name)
+
+
+cpdef ndarray _accumulate(func, ndarray array, axis, dtype, ndarray out):
+    cdef Py_ssize_t ndim = array.ndim
+    if func.nin != 2 or func.nout != 1:
+        raise ValueError('accumulate only supported for binary functions')
+    if func.name not in _associative_ufuncs:
+        raise NotImplementedError(
+            'accumulate is not supported for %s' % func.name)
+    if ndim == 0:
+        raise TypeError('cannot accumulate on a scalar')
+    if not (-ndim <= axis < ndim):
+        raise ValueError('axis(={}) out of bounds'.format(axis))
+    axis %= ndim
+
+    if dtype is None:
+        # The output type of the loop selected for the input is used, e.g.
+        # the scan of logical_and is computed in bool for any input.
+        _, out_types, _ = _guess_routine(
+            func.name, func._routine_cache, func._ops, [array, array],
+            None)
+        dtype = out_types[0]
+    else:
+        dtype = numpy.dtype(dtype).type
+    routine = _get_accumulate_routine(func, dtype)
+    return _scan(array, axis, dtype, routine, out, func._preamble, None,
+                 func.name + '_accumulate')
@@ -0,0 +1,540 @@
+import string
+
+import numpy
+
+from cupy import util
+
+
+# Rows of at most this length are sorted by one block per row in shared
+# memory. Longer rows are sorted by Thrust.
+cdef Py_ssize_t _sort_max_batched_size = 1024
+cdef Py_ssize_t _sort_max_block_size = 512
+
+# TODO(takagi): Support float16 and bool
+cdef str _sort_supported_dtypes = 'bBhHiIlLqQfd'
+
+
+cpdef _get_sort_kernel_code(name, dtype, x_ndim, idx_ndim, size, argsort):
+    """Generates the code of the batched sort kernel.
+
+    Each block sorts a row of a ``(rows, n)`` array by the bitonic sort in
+    shared memory, where ``n`` is at most ``size``, a power of two. Pairs of
+    a value and its position are sorted, so that the sort is stable. NaNs are
+    placed at the end as NumPy does. If ``argsort`` is true, the positions
+    are written to ``_idx``. Otherwise, the values are written back to
+    ``_x``.
+
+    """
+    module_code = string.Template('''
+    typedef ${type} T;
+    #define _SIZE ${size}
+    #define _ARGSORT ${argsort}
+
+    extern __shared__ unsigned long long _sort_smem[];
+
+    __device__ bool _sort_less(
+        const T* _sv, const int* _si, int _a, int _b, long long _n) {
+      int _ia = _si[_a], _ib = _si[_b];
+      // Padding after the end of the row is the largest.
+      if (_ia >= _n || _ib >= _n) {
+        return _ia < _ib;
+      }
+      T _va = _sv[_a], _vb = _sv[_b];
+      if (_va < _vb || (_vb != _vb && _va == _va)) {
+        return true;
+      }
+      if (_vb < _va || (_va != _va && _vb == _vb)) {
+        return false;
+      }
+      return _ia < _ib;
+    }
+
+    extern "C" __global__ void ${name}(
+        CArray<T, ${x_ndim}> _x, CArray<long long, ${idx_ndim}> _idx,
+        long long _n) {
+      int* _si = (int*)_sort_smem;
+      T* _sv = (T*)(_si + _SIZE);
+      long long _base = (long long)blockIdx.x * _n;
+      for (int _k = threadIdx.x; _k < _SIZE; _k += blockDim.x) {
+        _si[_k] = _k;
+        if (_k < _n) {
+          _sv[_k] = _x[_base + _k];
+        }
+      }
+      __syncthreads();
+      for (int _len = 2; _len <= _SIZE; _len <<= 1) {
+        for (int _stride = _len >> 1; _stride > 0; _stride >>= 1) {
+          for (int _k = threadIdx.x; _k < _SIZE; _k += blockDim.x) {
+            int _p = _k ^ _stride;
+            bool _up = (_k & _len) == 0;
+            if (_p > _k && _up == _sort_less(_sv, _si, _p, _k, _n)) {
+              T _v = _sv[_k];
+              _sv[_k] = _sv[_p];
+              _sv[_p] = _v;
+              int _i = _si[_k];
+              _si[_k] = _si[_p];
+              _si[_p] = _i;
+            }
+          }
+          __syncthreads();
+        }
+      }
+      for (int _k = threadIdx.x; _k < _n; _k += blockDim.x) {
+    #if _ARGSORT
+        _idx[_base + _k] = _si[_k];
+    #else
+        _x[_base + _k] = _sv[_k];
+    #endif
+      }
+    }
+    ''').substitute(
+        name=name,
+        type=_get_typename(dtype),
+        x_ndim=x_ndim,
+        idx_ndim=idx_ndim,
+        size=size,
+        argsort=int(argsort))
+    return KernelCode(name, module_code)
+
+
+@util.memoize(for_each_device=True)
+def _get_sort_kernel(name, dtype, x_ndim, idx_ndim, size, argsort):
+    return _get_sort_kernel_code(
+        name, dtype, x_ndim, idx_ndim, size, argsort).compile()
+
+
+cdef _check_sort_dtype(dtype):
+    if dtype.char not in _sort_supported_dtypes:
+        raise NotImplementedError('Sorting arrays with dtype \'{}\' is not '
+                                  'supported'.format(dtype))
+
+
+cdef _batched_sort(ndarray a, Py_ssize_t axis, ndarray idx):
+    # Sorts each row along the axis by a block without moving the axis in
+    # memory. The array is sorted in place if idx is None. Otherwise, the
+    # positions are written to idx.
+    cdef Py_ssize_t n, nrows, size, block_size
+    cdef ndarray x, y
+    cdef list axes
+    cdef function.Function kern
+    axes = [i for i in range(a.ndim) if i != axis]
+    axes.append(axis)
+    n = a._shape[axis]
+    nrows = a.size // n
+    x = _as_rows(a._transpose(axes), n)
+    if idx is None:
+        y = ndarray((0,), dtype=numpy.int64)
+        name = 'cupy_batched_sort'
+    else:
+        y = _as_rows(idx._transpose(axes), n)
+        name = 'cupy_batched_argsort'
+
+    size = 2
+    while size < n:
+        size *= 2
+    block_size = min(size, _sort_max_block_size)
+    kern = _get_sort_kernel(
+        name, a.dtype.type, x.ndim, y.ndim, size, idx is not None)
+    if _auto_range:
+        _auto_range_push(name, a.dtype, a.shape)
+    try:
+        kern(grid=(nrows,), block=(block_size,), args=(x, y, n),
+             shared_mem=size * (4 + a.itemsize))
+    finally:
+        if _auto_range:
+            _auto_range_pop()
+
+
+# Selection of the k-th smallest items of rows by the radix select. Each
+# pass determines the next 8 bits of the keys of the k-th items.
+cdef Py_ssize_t _select_block_size = 256
+cdef Py_ssize_t _select_items_per_block = 4096
+
+# Number of k-th items of a row selected at once. Each of them needs 256
+# counters in shared memory.
+cdef Py_ssize_t _select_max_kths = 32
+
+# Kernel modes
+cdef int _SELECT_HISTOGRAM = 0
+cdef int _SELECT_DIGIT = 1
+cdef int _SELECT_SCATTER = 2
+cdef int _SELECT_VALUE = 3
+
+# Expressions converting a value v to an unsigned key of the same width
+# whose order is the order of the values, with NaNs placed last.
+cdef dict _select_key_exprs = {
+    'b': '(K)v ^ (K)0x80',
+    'h': '(K)v ^ (K)0x8000',
+    'i': '(K)v ^ (K)0x80000000',
+    'l': '(K)v ^ (K)0x8000000000000000ULL',
+    'q': '(K)v ^ (K)0x8000000000000000ULL',
+    'f': '''v != v ? ~(K)0 : (__float_as_uint(v) & 0x80000000U) ?
+            ~(K)__float_as_uint(v) : (K)__float_as_uint(v) | 0x80000000U''',
+    'd': '''v != v ? ~(K)0 :
+            ((K)__double_as_longlong(v) & 0x8000000000000000ULL) ?
+            ~(K)__double_as_longlong(v) :
+            (K)__double_as_longlong(v) | 0x8000000000000000ULL''',
+}
+
+# Expressions converting a key k back to the value.
+cdef dict _select_value_exprs = {
+    'b': '(T)(K)(k ^ (K)0x80)',
+    'h': '(T)(K)(k ^ (K)0x8000)',
+    'i': '(T)(k ^ (K)0x80000000)',
+    'l': '(T)(k ^ (K)0x8000000000000000ULL)',
+    'q': '(T)(k ^ (K)0x8000000000000000ULL)',
+    'f': '''__uint_as_float(
+            (k & 0x80000000U) ? k & 0x7fffffffU : ~k)''',
+    'd': '''__longlong_as_double(
+            (k & 0x8000000000000000ULL) ? k & 0x7fffffffffffffffULL : ~k)''',
+}
+
+cdef dict _select_key_types = {
+    1: 'unsigned char',
+    2: 'unsigned short',
+    4: 'unsigned int',
+    8: 'unsigned long long',
+}
+
+
+cpdef _get_select_kernel_code(
+        name, dtype, x_ndim, y_ndim, idx_ndim, values, indices):
+    """Generates the code of the radix select kernel.
+
+    The kernel selects the ``_rank``-th smallest items of each row of a
+    ``(rows, n)`` array, ``_nk`` items per row. The keys of the items are
+    determined 8 bits at a time from the most significant bits. In
+    ``_SELECT_HISTOGRAM`` mode, the items whose keys match the bits found so
+    far are counted by their next 8 bits in ``_hist``. In ``_SELECT_DIGIT``
+    mode, each thread finds the next 8 bits of a k-th item from the counts.
+    After all passes, ``_prefix`` holds the keys of the k-th items and
+    ``_rank`` holds their ranks among the equal items.
+
+    In ``_SELECT_VALUE`` mode, the k-th items are written to ``_y`` of shape
+    ``(rows, nk)``. In ``_SELECT_SCATTER`` mode, which requires ``_nk`` to be
+    one, each row is partitioned around the ``_kth`` item: smaller items are
+    written to the front, larger ones to the back and equal ones in between.
+    The items are written to ``_y`` if ``values`` is true and their positions
+    to ``_idx`` if ``indices`` is true.
+
+    """
+    dtype = numpy.dtype(dtype)
+    if dtype.kind == 'u':
+        key_expr = '(K)v'
+        value_expr = '(T)k'
+    else:
+        key_expr = _select_key_exprs[dtype.char]
+        value_expr = _select_value_exprs[dtype.char]
+    module_code = string.Template('''
+    typedef ${type} T;
+    typedef ${key_type} K;
+    #define _BITS (8 * sizeof(K))
+    #define _ITEMS ${items_per_block}
+    #define _VALUES ${values}
+    #define _INDICES ${indices}
+
+    extern __shared__ unsigned int _shist[];
+
+    __device__ K _select_key(T v) {
+      return ${key_expr};
+    }
+
+    __device__ T _select_value(K k) {
+      return ${value_expr};
+    }
+
+    extern "C" __global__ void ${name}(
+        const CArray<T, ${x_ndim}> _x, CArray<T, ${y_ndim}> _y,
+        CArray<long long, ${idx_ndim}> _idx,
+        CArray<unsigned long long, 1> _hist,
+        CArray<unsigned long long, 1> _prefix, CArray<long long, 1> _rank,
+        CArray<unsigned long long, 1> _count,
+        long long _n, long long _nchunks, long long _nrows, long long _nk,
+        long long _kth, long long _shift, long long _mode) {
+      if (_mode == ${mode_digit} || _mode == ${mode_value}) {
+        long long _s = (long long)blockIdx.x * blockDim.x + threadIdx.x;
+        if (_s >= _nrows * _nk) {
+          return;
+        }
+        if (_mode == ${mode_value}) {
+          _y[_s] = _select_value((K)_prefix[_s]);
+          return;
+        }
+        long long _r = _rank[_s];
+        int _d = 0;
+        for (; _d < 255; ++_d) {
+          unsigned long long _c = _hist[_s * 256 + _d];
+          if (_r < _c) {
+            break;
+          }
+          _r -= _c;
+        }
+        // Clears the counts for the next pass.
+        for (int _k = 0; _k < 256; ++_k) {
+          _hist[_s * 256 + _k] = 0;
+        }
+        _rank[_s] = _r;
+        _prefix[_s] |= (unsigned long long)_d << _shift;
+        return;
+      }
+
+      long long _row = blockIdx.x / _nchunks;
+      long long _begin = (blockIdx.x % _nchunks) * _ITEMS;
+      long long _end = min(_begin + _ITEMS, _n);
+      long long _base = _row * _n;
+      if (_mode == ${mode_histogram}) {
+        K _mask = _shift + 8 >= _BITS ? (K)0 : (K)(~0ULL << (_shift + 8));
+        for (int _k = threadIdx.x; _k < 256 * _nk; _k += blockDim.x) {
+          _shist[_k] = 0;
+        }
+        __syncthreads();
+        for (long long _j = _begin + threadIdx.x; _j < _end;
+             _j += blockDim.x) {
+          K _key = _select_key(_x[_base + _j]);
+          for (int _q = 0; _q < _nk; ++_q) {
+            if ((_key & _mask) == ((K)_prefix[_row * _nk + _q] & _mask)) {
+              atomicAdd(&_shist[_q * 256 + ((_key >> _shift) & 0xff)], 1U);
+            }
+          }
+        }
+        __syncthreads();
+        for (int _k = threadIdx.x; _k < 256 * _nk; _k += blockDim.x) {
+          if (_shist[_k] != 0) {
+            atomicAdd(&_hist[_row * _nk * 256 + _k],
+                      (unsigned long long)_shist[_k]);
+          }
+        }
+        return;
+      }
+
+      // _SELECT_SCATTER
+      K _kth_key = (K)_prefix[_row];
+      long long _nless = _kth - _rank[_row];
+      for (long long _j = _begin + threadIdx.x; _j < _end;
+           _j += blockDim.x) {
+        T _v = _x[_base + _j];
+        K _key = _select_key(_v);
+        long long _pos;
+        if (_key < _kth_key) {
+          _pos = atomicAdd(&_count[_row * 3], 1ULL);
+        } else if (_key == _kth_key) {
+          _pos = _nless + atomicAdd(&_count[_row * 3 + 1], 1ULL);
+        } else {
+          _pos = _n - 1 - atomicAdd(&_count[_row * 3 + 2], 1ULL);
+        }
+    #if _VALUES
+        _y[_base + _pos] = _v;
+    #endif
+    #if _INDICES
+        _idx[_base + _pos] = _j;
+    #endif
+      }
+    }
+    ''').substitute(
+        name=name,
+        type=_get_typename(dtype),
+        key_type=_select_key_types[dtype.itemsize],
+        key_expr=key_expr,
+        value_expr=value_expr,
+        x_ndim=x_ndim,
+        y_ndim=y_ndim,
+        idx_ndim=idx_ndim,
+        values=int(values),
+        indices=int(indices),
+        items_per_block=_select_items_per_block,
+        mode_histogram=_SELECT_HISTOGRAM,
+        mode_digit=_SELECT_DIGIT,
+        mode_value=_SELECT_VALUE)
+    return KernelCode(name, module_code)
+
+
+@util.memoize(for_each_device=True)
+def _get_select_kernel(name, dtype, x_ndim, y_ndim, idx_ndim, values,
+                       indices):
+    return _get_select_kernel_code(
+        name, dtype, x_ndim, y_ndim, idx_ndim, values, indices).compile()
+
+
+cdef _run_radix_select(
+        function.Function kern, ndarray x, ndarray y, ndarray idx,
+        ndarray rank, Py_ssize_t kth, int mode):
+    # Finds the keys of the items of x of the given ranks and runs the last
+    # pass of the given mode.
+    cdef Py_ssize_t n, nrows, nk, nchunks, shift, nstates
+    cdef ndarray hist, prefix, count
+    if idx is None:
+        # A null pointer must not be passed as an array argument.
+        idx = ndarray((0,), dtype=numpy.int64)
+    n = x._shape[x.ndim - 1]
+    nrows = rank._shape[0]
+    nk = rank._shape[1]
+    nstates = nrows * nk
+    nchunks = (n + _select_items_per_block - 1) // _select_items_per_block
+    hist = ndarray((nstates * 256,), dtype=numpy.uint64)
+    hist.fill(0)
+    prefix = ndarray((nstates,), dtype=numpy.uint64)
+    prefix.fill(0)
+    if mode == _SELECT_SCATTER:
+        count = ndarray((nrows * 3,), dtype=numpy.uint64)
+        count.fill(0)
+    else:
+        count = ndarray((0,), dtype=numpy.uint64)
+
+    args = [x, y, idx, hist, prefix, rank.ravel(), count, n, nchunks, nrows,
+            nk, kth]
+    grid = (nstates + _select_block_size - 1) // _select_block_size
+    for shift in range(x.itemsize * 8 - 8, -1, -8):
+        kern(grid=(nrows * nchunks,), block=(_select_block_size,),
+             args=args + [shift, _SELECT_HISTOGRAM],
+             shared_mem=nk * 256 * 4)
+        kern(grid=(grid,), block=(_select_block_size,),
+             args=args + [shift, _SELECT_DIGIT])
+    if mode == _SELECT_SCATTER:
+        grid = nrows * nchunks
+    kern(grid=(grid,), block=(_select_block_size,), args=args + [0, mode])
+
+
+cdef _radix_select(ndarray a, Py_ssize_t axis, Py_ssize_t kth, ndarray y,
+                   ndarray idx):
+    # Partitions each row along the axis around its kth item. The items are
+    # written to y and their positions to idx unless they are None.
+    cdef Py_ssize_t n, nrows
+    cdef ndarray x, rank
+    cdef list axes
+    cdef function.Function kern
+    axes = [i for i in range(a.ndim) if i != axis]
+    axes.append(axis)
+    n = a._shape[axis]
+    nrows = a.size // n
+    x = _as_rows(a._transpose(axes), n)
+    if y is None:
+        y = ndarray((0,), dtype=a.dtype)
+    else:
+        y = _as_rows(y._transpose(axes), n)
+    if idx is None:
+        idx = ndarray((0,), dtype=numpy.int64)
+    else:
+        idx = _as_rows(idx._transpose(axes), n)
+    rank = ndarray((nrows, 1), dtype=numpy.int64)
+    rank.fill(kth)
+
+    name = 'cupy_radix_select'
+    kern = _get_select_kernel(
+        name, a.dtype.type, x.ndim, y.ndim, idx.ndim, y.size != 0,
+        idx.size != 0)
+    if _auto_range:
+        _auto_range_push(name, a.dtype, a.shape)
+    try:
+        _run_radix_select(kern, x, y, idx, rank, kth, _SELECT_SCATTER)
+    finally:
+        if _auto_range:
+            _auto_range_pop()
+
+
+cdef _select_gather_kernel = ElementwiseKernel(
+    'raw T x, int64 rank, int64 n, int64 nk', 'T y',
+    'y = x[i / nk * n + rank]',
+    'cupy_select_gather')
+
+
+cpdef ndarray _select(ndarray a, Py_ssize_t axis, ndarray rank,
+                      bint overwrite_input=False):
+    """Selects the items of given ranks along an axis.
+
+    The items of long rows are found by the radix select without sorting or
+    copying the array. The cost grows linearly with the size of the array.
+    Short rows are copied and sorted instead. They are sorted in place
+    without the copy if ``overwrite_input`` is ``True`` and the rows are
+    contiguous.
+
+    Args:
+        a (cupy.ndarray): Input array.
+        axis (int): Axis along which the items are selected. It must be
+            normalized.
+        rank (cupy.ndarray): Array of type ``int64`` and shape
+            ``(rows, nk)``, where ``rows`` is the number of rows along the
+            axis. The ``rank[i, j]``-th smallest item of the ``i``-th row is
+            selected. NaNs are regarded as larger than any number.
+        overwrite_input (bool): If ``True``, the input array may be sorted
+            in place.
+
+    Returns:
+        cupy.ndarray: The selected items of shape
+        ``a.shape[:axis] + a.shape[axis + 1:] + (nk,)``.
+
+    """
+    cdef Py_ssize_t n, nrows, nk, begin
+    cdef ndarray x, y, rank_part, y_part
+    cdef list axes, shape
+    cdef function.Function kern
+    _check_sort_dtype(a.dtype)
+    axes = [i for i in range(a.ndim) if i != axis]
+    shape = [a._shape[i] for i in axes]
+    axes.append(axis)
+    n = a._shape[axis]
+    nrows = a.size // n
+    nk = rank._shape[1]
+    if n <= _sort_max_batched_size:
+        # The histograms of the radix select take 2 KiB per row and rank,
+        # which are much larger than short rows. They are sorted by blocks
+        # instead.
+        x = a._transpose(axes)
+        if not (overwrite_input and x._c_contiguous):
+            x = x.copy()
+        x = x.reshape(nrows, n)
+        _batched_sort(x, 1, None)
+        y = _select_gather_kernel(x, rank, n, nk)
+        return y.reshape(shape + [nk])
+
+    x = _as_rows(a._transpose(axes), n)
+    y = ndarray((nrows, nk), dtype=a.dtype)
+
+    name = 'cupy_select'
+    kern = _get_select_kernel(
+        name, a.dtype.type, x.ndim, 2, 1, True, False)
+    if _auto_range:
+        _auto_range_push(name, a.dtype, a.shape)
+    try:
+        for begin in range(0, nk, _select_max_kths):
+            # The ranks are updated by the kernel.
+            rank_part = rank[:, begin:begin + _select_max_kths].copy()
+            y_part = ndarray(rank_part.shape, dtype=a.dtype)
+            _run_radix_select(
+                kern, x, y_part, ndarray((0,), dtype=numpy.int64), rank_part,
+                0, _SELECT_VALUE)
+            elementwise_copy(y_part, y[:, begin:begin + _select_max_kths])
+    finally:
+        if _auto_range:
+            _auto_range_pop()
+    return y.reshape(shape + [nk])
+
+
+cdef Py_ssize_t _normalize_partition_args(
+        ndarray a, kth, axis, list kths) except -1:
+    # Validates the arguments of partition and argpartition, appends the
+    # normalized kth to kths and returns the normalized axis.
+    cdef Py_ssize_t ndim = a.ndim, n, k
+    if ndim == 0:
+        raise ValueError('Partitioning arrays with the rank of zero is not '
+                         'supported')
+    _check_sort_dtype(a.dtype)
+    if axis < 0:
+        axis += ndim
+    if not (0 <= axis < ndim):
+        raise ValueError('Axis out of range')
+    n = a._shape[axis]
+    if numpy.isscalar(kth):
+        kth = (kth,)
+    for k in kth:
+        if k < 0:
+            k += n
+        if not (0 <= k < n):
+            raise ValueError('kth(=%d) out of bounds (%d)' % (k, n))
+        kths.append(k)
+    return axis
+
+
+cdef bint _partition_by_sort(ndarray a, Py_ssize_t axis, list kths):
+    # Short rows are fully sorted by blocks. Multiple kth are also handled by
+    # sorting.
+    return a._shape[axis] <= _sort_max_batched_size or len(kths) > 1
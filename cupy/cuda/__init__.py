@@ -3,6 +3,7 @@ import contextlib
 from cupy.cuda import compiler  # NOQA
 from cupy.cuda import device  # NOQA
 from cupy.cuda import function  # NOQA
+from cupy.cuda import graph  # NOQA
 from cupy.cuda import memory  # NOQA
 from cupy.cuda import pinned_memory  # NOQA
 from cupy.cuda import profiler  # NOQA
@@ -53,6 +54,7 @@ from cupy.cuda.device import get_device_id  # NOQA
 from cupy.cuda.function import Function  # NOQA
 from cupy.cuda.function import Module  # NOQA
 from cupy.cuda.memory import alloc  # NOQA
+from cupy.cuda.memory import get_allocator  # NOQA
 from cupy.cuda.memory import Memory  # NOQA
 from cupy.cuda.memory import MemoryPointer  # NOQA
 from cupy.cuda.memory import MemoryPool  # NOQA
@@ -63,6 +65,7 @@ from cupy.cuda.pinned_memory import PinnedMemoryPointer  # NOQA
 from cupy.cuda.pinned_memory import PinnedMemoryPool  # NOQA
 from cupy.cuda.pinned_memory import set_pinned_memory_allocator  # NOQA
 from cupy.cuda.stream import Event  # NOQA
+from cupy.cuda.stream import get_current_stream  # NOQA
 from cupy.cuda.stream import get_elapsed_time  # NOQA
 from cupy.cuda.stream import Stream  # NOQA
 
@@ -104,15 +104,7 @@ def get_cache_dir():
 _empty_file_preprocess_cache = {}
 
 
-def compile_with_cache(source, options=(), arch=None, cache_dir=None):
-    global _empty_file_preprocess_cache
-    if cache_dir is None:
-        cache_dir = get_cache_dir()
-    if arch is None:
-        arch = _get_arch()
-
-    options += ('-ftz=true',)
-
+def _get_cache_key(source, options, arch):
     env = (arch, options, _get_nvrtc_version())
     if '#include' in source:
         pp_src = '%s %s' % (env, preprocess(source, options))
@@ -124,7 +116,75 @@ def compile_with_cache(source, options=(), arch=None, cache_dir=None):
 
     if isinstance(pp_src, six.text_type):
         pp_src = pp_src.encode('utf-8')
-    name = '%s_2.cubin' % hashlib.md5(pp_src).hexdigest()
+    return hashlib.md5(pp_src).hexdigest()
+
+
+def get_cache_key(source, options=(), arch=None):
+    """Returns the key of a CUDA source in the kernel cache.
+
+    The key is computed in the same way as :func:`compile_with_cache` does.
+    The source is preprocessed by NVRTC, but is not compiled.
+
+    Args:
+        source (str): CUDA source.
+        options (tuple of str): Compiler options.
+        arch (str): Target architecture such as ``'compute_35'``. The
+            architecture of the current device is used by default.
+
+    Returns:
+        str: The key, which is also the prefix of the cache file name.
+
+    """
+    if arch is None:
+        arch = _get_arch()
+    return _get_cache_key(source, options + ('-ftz=true',), arch)
+
+
+def get_dump_dir():
+    return os.environ.get('CUPY_KERNEL_DUMP_DIR')
+
+
+def _dump_source(dump_dir, key, source, options, arch):
+    ptx_path = os.path.join(dump_dir, '%s.ptx' % key)
+    if os.path.exists(ptx_path):
+        return
+
+    if not os.path.isdir(dump_dir):
+        try:
+            os.makedirs(dump_dir)
+        except OSError:
+            if not os.path.isdir(dump_dir):
+                raise
+
+    ptx = compile_using_nvrtc(source, options, arch)
+    if isinstance(ptx, six.binary_type):
+        ptx = ptx.decode('utf-8')
+    with open(os.path.join(dump_dir, '%s.cu' % key), 'w') as cu_file:
+        cu_file.write('// Options: %s\n' % ' '.join(options))
+        cu_file.write('// Architecture: %s\n' % arch)
+        cu_file.write(source)
+    # The PTX file is written last as it marks the dump as completed.
+    with tempfile.NamedTemporaryFile(
+            mode='w', dir=dump_dir, delete=False) as tf:
+        tf.write(ptx)
+        temp_path = tf.name
+    shutil.move(temp_path, ptx_path)
+
+
+def compile_with_cache(source, options=(), arch=None, cache_dir=None):
+    if cache_dir is None:
+        cache_dir = get_cache_dir()
+    if arch is None:
+        arch = _get_arch()
+
+    options += ('-ftz=true',)
+
+    key = _get_cache_key(source, options, arch)
+    name = '%s_2.cubin' % key
+
+    dump_dir = get_dump_dir()
+    if dump_dir:
+        _dump_source(dump_dir, key, source, options, arch)
 
     if not os.path.isdir(cache_dir):
         try:
@@ -14,6 +14,12 @@ cdef extern from *:
     ctypedef int PointerMode 'cublasPointerMode_t'
     ctypedef int SideMode 'cublasSideMode_t'
 
+    ctypedef struct cuComplex 'cuComplex':
+        float x, y
+
+    ctypedef struct cuDoubleComplex 'cuDoubleComplex':
+        double x, y
+
 
 ###############################################################################
 # Enum
@@ -71,6 +77,14 @@ cpdef sdot(size_t handle, int n, size_t x, int incx, size_t y, int incy,
            size_t result)
 cpdef ddot(size_t handle, int n, size_t x, int incx, size_t y, int incy,
            size_t result)
+cpdef cdotu(size_t handle, int n, size_t x, int incx, size_t y, int incy,
+            size_t result)
+cpdef cdotc(size_t handle, int n, size_t x, int incx, size_t y, int incy,
+            size_t result)
+cpdef zdotu(size_t handle, int n, size_t x, int incx, size_t y, int incy,
+            size_t result)
+cpdef zdotc(size_t handle, int n, size_t x, int incx, size_t y, int incy,
+            size_t result)
 cpdef float snrm2(size_t handle, int n, size_t x, int incx) except *
 cpdef sscal(size_t handle, int n, float alpha, size_t x, int incx)
 
@@ -99,6 +113,12 @@ cpdef sgemm(size_t handle, int transa, int transb,
 cpdef dgemm(size_t handle, int transa, int transb,
             int m, int n, int k, double alpha, size_t A, int lda,
             size_t B, int ldb, double beta, size_t C, int ldc)
+cpdef cgemm(size_t handle, int transa, int transb,
+            int m, int n, int k, float complex alpha, size_t A, int lda,
+            size_t B, int ldb, float complex beta, size_t C, int ldc)
+cpdef zgemm(size_t handle, int transa, int transb,
+            int m, int n, int k, double complex alpha, size_t A, int lda,
+            size_t B, int ldb, double complex beta, size_t C, int ldc)
 cpdef sgemmBatched(size_t handle, int transa, int transb,
                    int m, int n, int k, float alpha, size_t Aarray, int lda,
                    size_t Barray, int ldb, float beta, size_t Carray, int ldc,
@@ -107,6 +127,32 @@ cpdef dgemmBatched(size_t handle, int transa, int transb,
                    int m, int n, int k, double alpha, size_t Aarray, int lda,
                    size_t Barray, int ldb, double beta, size_t Carray, int ldc,
                    int batchCount)
+cpdef cgemmBatched(size_t handle, int transa, int transb,
+                   int m, int n, int k, float complex alpha, size_t Aarray,
+                   int lda, size_t Barray, int ldb, float complex beta,
+                   size_t Carray, int ldc, int batchCount)
+cpdef zgemmBatched(size_t handle, int transa, int transb,
+                   int m, int n, int k, double complex alpha, size_t Aarray,
+                   int lda, size_t Barray, int ldb, double complex beta,
+                   size_t Carray, int ldc, int batchCount)
+cpdef sgemmStridedBatched(
+    size_t handle, int transa, int transb, int m, int n, int k, float alpha,
+    size_t A, int lda, long long strideA, size_t B, int ldb, long long strideB,
+    float beta, size_t C, int ldc, long long strideC, int batchCount)
+cpdef dgemmStridedBatched(
+    size_t handle, int transa, int transb, int m, int n, int k, double alpha,
+    size_t A, int lda, long long strideA, size_t B, int ldb, long long strideB,
+    double beta, size_t C, int ldc, long long strideC, int batchCount)
+cpdef cgemmStridedBatched(
+    size_t handle, int transa, int transb, int m, int n, int k,
+    float complex alpha, size_t A, int lda, long long strideA, size_t B,
+    int ldb, long long strideB, float complex beta, size_t C, int ldc,
+    long long strideC, int batchCount)
+cpdef zgemmStridedBatched(
+    size_t handle, int transa, int transb, int m, int n, int k,
+    double complex alpha, size_t A, int lda, long long strideA, size_t B,
+    int ldb, long long strideB, double complex beta, size_t C, int ldc,
+    long long strideC, int batchCount)
 cpdef strsm(size_t handle, int side, int uplo, int trans, int diag,
             int m, int n, float alpha, size_t Aarray, int lda,
             size_t Barray, int ldb)
@@ -132,7 +178,15 @@ cpdef sgemmEx(size_t handle, int transa, int transb, int m, int n, int k,
               int ldc)
 cpdef sgetrfBatched(size_t handle, int n, size_t Aarray, int lda,
                     size_t PivotArray, size_t infoArray, int batchSize)
+cpdef dgetrfBatched(size_t handle, int n, size_t Aarray, int lda,
+                    size_t PivotArray, size_t infoArray, int batchSize)
 
 cpdef sgetriBatched(size_t handle, int n, size_t Aarray, int lda,
                     size_t PivotArray, size_t Carray, int ldc,
                     size_t infoArray, int batchSize)
+cpdef int sgetrsBatched(size_t handle, int trans, int n, int nrhs,
+                        size_t Aarray, int lda, size_t devIpiv,
+                        size_t Barray, int ldb, int batchSize) except *
+cpdef int dgetrsBatched(size_t handle, int trans, int n, int nrhs,
+                        size_t Aarray, int lda, size_t devIpiv,
+                        size_t Barray, int ldb, int batchSize) except *
@@ -38,6 +38,14 @@ cdef extern from 'cupy_cuda.h' nogil:
                    float* y, int incy, float* result)
     int cublasDdot(Handle handle, int n, double* x, int incx,
                    double* y, int incy, double* result)
+    int cublasCdotu(Handle handle, int n, cuComplex* x, int incx,
+                    cuComplex* y, int incy, cuComplex* result)
+    int cublasCdotc(Handle handle, int n, cuComplex* x, int incx,
+                    cuComplex* y, int incy, cuComplex* result)
+    int cublasZdotu(Handle handle, int n, cuDoubleComplex* x, int incx,
+                    cuDoubleComplex* y, int incy, cuDoubleComplex* result)
+    int cublasZdotc(Handle handle, int n, cuDoubleComplex* x, int incx,
+                    cuDoubleComplex* y, int incy, cuDoubleComplex* result)
     int cublasSnrm2(Handle handle, int n, float* x, int incx,
                     float* result)
     int cublasSscal(Handle handle, int n, float* alpha, float* x,
@@ -68,6 +76,15 @@ cdef extern from 'cupy_cuda.h' nogil:
         Handle handle, Operation transa, Operation transb, int m,
         int n, int k, double* alpha, double* A, int lda, double* B,
         int ldb, double* beta, double* C, int ldc)
+    int cublasCgemm(
+        Handle handle, Operation transa, Operation transb, int m,
+        int n, int k, cuComplex* alpha, cuComplex* A, int lda,
+        cuComplex* B, int ldb, cuComplex* beta, cuComplex* C, int ldc)
+    int cublasZgemm(
+        Handle handle, Operation transa, Operation transb, int m,
+        int n, int k, cuDoubleComplex* alpha, cuDoubleComplex* A, int lda,
+        cuDoubleComplex* B, int ldb, cuDoubleComplex* beta,
+        cuDoubleComplex* C, int ldc)
     int cublasSgemmBatched(
         Handle handle, Operation transa, Operation transb, int m,
         int n, int k, const float* alpha, const float** Aarray,
@@ -78,6 +95,43 @@ cdef extern from 'cupy_cuda.h' nogil:
         int n, int k, const double* alpha, const double** Aarray,
         int lda, const double** Barray, int ldb, const double* beta,
         double** Carray, int ldc, int batchCount)
+    int cublasCgemmBatched(
+        Handle handle, Operation transa, Operation transb, int m,
+        int n, int k, const cuComplex* alpha, const cuComplex** Aarray,
+        int lda, const cuComplex** Barray, int ldb, const cuComplex* beta,
+        cuComplex** Carray, int ldc, int batchCount)
+    int cublasZgemmBatched(
+        Handle handle, Operation transa, Operation transb, int m,
+        int n, int k, const cuDoubleComplex* alpha,
+        const cuDoubleComplex** Aarray, int lda,
+        const cuDoubleComplex** Barray, int ldb,
+        const cuDoubleComplex* beta, cuDoubleComplex** Carray, int ldc,
+        int batchCount)
+    int cublasSgemmStridedBatched(
+        Handle handle, Operation transa, Operation transb, int m,
+        int n, int k, const float* alpha, const float* A, int lda,
+        long long strideA, const float* B, int ldb, long long strideB,
+        const float* beta, float* C, int ldc, long long strideC,
+        int batchCount)
+    int cublasDgemmStridedBatched(
+        Handle handle, Operation transa, Operation transb, int m,
+        int n, int k, const double* alpha, const double* A, int lda,
+        long long strideA, const double* B, int ldb, long long strideB,
+        const double* beta, double* C, int ldc, long long strideC,
+        int batchCount)
+    int cublasCgemmStridedBatched(
+        Handle handle, Operation transa, Operation transb, int m,
+        int n, int k, const cuComplex* alpha, const cuComplex* A, int lda,
+        long long strideA, const cuComplex* B, int ldb, long long strideB,
+        const cuComplex* beta, cuComplex* C, int ldc, long long strideC,
+        int batchCount)
+    int cublasZgemmStridedBatched(
+        Handle handle, Operation transa, Operation transb, int m,
+        int n, int k, const cuDoubleComplex* alpha,
+        const cuDoubleComplex* A, int lda, long long strideA,
+        const cuDoubleComplex* B, int ldb, long long strideB,
+        const cuDoubleComplex* beta, cuDoubleComplex* C, int ldc,
+        long long strideC, int batchCount)
     int cublasStrsm(
         Handle handle, SideMode size, FillMode uplo, Operation trans,
         DiagType diag, int m, int n, const float* alpha, const float* A,
@@ -110,10 +164,21 @@ cdef extern from 'cupy_cuda.h' nogil:
     int cublasSgetrfBatched(
         Handle handle, int n, float **Aarray, int lda,
         int *PivotArray, int *infoArray, int batchSize)
+    int cublasDgetrfBatched(
+        Handle handle, int n, double **Aarray, int lda,
+        int *PivotArray, int *infoArray, int batchSize)
     int cublasSgetriBatched(
         Handle handle, int n, const float **Aarray, int lda,
         int *PivotArray, float *Carray[], int ldc, int *infoArray,
         int batchSize)
+    int cublasSgetrsBatched(
+        Handle handle, Operation trans, int n, int nrhs,
+        const float **Aarray, int lda, const int *devIpiv,
+        float **Barray, int ldb, int *info, int batchSize)
+    int cublasDgetrsBatched(
+        Handle handle, Operation trans, int n, int nrhs,
+        const double **Aarray, int lda, const int *devIpiv,
+        double **Barray, int ldb, int *info, int batchSize)
 
 
 ###############################################################################
@@ -270,6 +335,42 @@ cpdef ddot(size_t handle, int n, size_t x, int incx, size_t y, int incy,
     check_status(status)
 
 
+cpdef cdotu(size_t handle, int n, size_t x, int incx, size_t y, int incy,
+            size_t result):
+    with nogil:
+        status = cublasCdotu(
+            <Handle>handle, n, <cuComplex*>x, incx, <cuComplex*>y, incy,
+            <cuComplex*>result)
+    check_status(status)
+
+
+cpdef cdotc(size_t handle, int n, size_t x, int incx, size_t y, int incy,
+            size_t result):
+    with nogil:
+        status = cublasCdotc(
+            <Handle>handle, n, <cuComplex*>x, incx, <cuComplex*>y, incy,
+            <cuComplex*>result)
+    check_status(status)
+
+
+cpdef zdotu(size_t handle, int n, size_t x, int incx, size_t y, int incy,
+            size_t result):
+    with nogil:
+        status = cublasZdotu(
+            <Handle>handle, n, <cuDoubleComplex*>x, incx,
+            <cuDoubleComplex*>y, incy, <cuDoubleComplex*>result)
+    check_status(status)
+
+
+cpdef zdotc(size_t handle, int n, size_t x, int incx, size_t y, int incy,
+            size_t result):
+    with nogil:
+        status = cublasZdotc(
+            <Handle>handle, n, <cuDoubleComplex*>x, incx,
+            <cuDoubleComplex*>y, incy, <cuDoubleComplex*>result)
+    check_status(status)
+
+
 cpdef float snrm2(size_t handle, int n, size_t x, int incx) except *:
     cdef float result
     with nogil:
@@ -348,6 +449,29 @@ cpdef dgemm(size_t handle, int transa, int transb,
     check_status(status)
 
 
+cpdef cgemm(size_t handle, int transa, int transb,
+            int m, int n, int k, float complex alpha, size_t A, int lda,
+            size_t B, int ldb, float complex beta, size_t C, int ldc):
+    with nogil:
+        status = cublasCgemm(
+            <Handle>handle, <Operation>transa, <Operation>transb, m, n, k,
+            <cuComplex*>&alpha, <cuComplex*>A, lda, <cuComplex*>B, ldb,
+            <cuComplex*>&beta, <cuComplex*>C, ldc)
+    check_status(status)
+
+
+cpdef zgemm(size_t handle, int transa, int transb,
+            int m, int n, int k, double complex alpha, size_t A, int lda,
+            size_t B, int ldb, double complex beta, size_t C, int ldc):
+    with nogil:
+        status = cublasZgemm(
+            <Handle>handle, <Operation>transa, <Operation>transb, m, n, k,
+            <cuDoubleComplex*>&alpha, <cuDoubleComplex*>A, lda,
+            <cuDoubleComplex*>B, ldb, <cuDoubleComplex*>&beta,
+            <cuDoubleComplex*>C, ldc)
+    check_status(status)
+
+
 cpdef sgemmBatched(
         size_t handle, int transa, int transb, int m, int n, int k,
         float alpha, size_t Aarray, int lda, size_t Barray, int ldb,
@@ -372,6 +496,88 @@ cpdef dgemmBatched(
     check_status(status)
 
 
+cpdef cgemmBatched(
+        size_t handle, int transa, int transb, int m, int n, int k,
+        float complex alpha, size_t Aarray, int lda, size_t Barray, int ldb,
+        float complex beta, size_t Carray, int ldc, int batchCount):
+    with nogil:
+        status = cublasCgemmBatched(
+            <Handle>handle, <Operation>transa, <Operation>transb, m, n, k,
+            <const cuComplex*>&alpha, <const cuComplex**>Aarray, lda,
+            <const cuComplex**>Barray, ldb, <const cuComplex*>&beta,
+            <cuComplex**>Carray, ldc, batchCount)
+    check_status(status)
+
+
+cpdef zgemmBatched(
+        size_t handle, int transa, int transb, int m, int n, int k,
+        double complex alpha, size_t Aarray, int lda, size_t Barray, int ldb,
+        double complex beta, size_t Carray, int ldc, int batchCount):
+    with nogil:
+        status = cublasZgemmBatched(
+            <Handle>handle, <Operation>transa, <Operation>transb, m, n, k,
+            <const cuDoubleComplex*>&alpha, <const cuDoubleComplex**>Aarray,
+            lda, <const cuDoubleComplex**>Barray, ldb,
+            <const cuDoubleComplex*>&beta, <cuDoubleComplex**>Carray, ldc,
+            batchCount)
+    check_status(status)
+
+
+cpdef sgemmStridedBatched(
+        size_t handle, int transa, int transb, int m, int n, int k,
+        float alpha, size_t A, int lda, long long strideA, size_t B, int ldb,
+        long long strideB, float beta, size_t C, int ldc, long long strideC,
+        int batchCount):
+    with nogil:
+        status = cublasSgemmStridedBatched(
+            <Handle>handle, <Operation>transa, <Operation>transb, m, n, k,
+            &alpha, <const float*>A, lda, strideA, <const float*>B, ldb,
+            strideB, &beta, <float*>C, ldc, strideC, batchCount)
+    check_status(status)
+
+
+cpdef dgemmStridedBatched(
+        size_t handle, int transa, int transb, int m, int n, int k,
+        double alpha, size_t A, int lda, long long strideA, size_t B,
+        int ldb, long long strideB, double beta, size_t C, int ldc,
+        long long strideC, int batchCount):
+    with nogil:
+        status = cublasDgemmStridedBatched(
+            <Handle>handle, <Operation>transa, <Operation>transb, m, n, k,
+            &alpha, <const double*>A, lda, strideA, <const double*>B, ldb,
+            strideB, &beta, <double*>C, ldc, strideC, batchCount)
+    check_status(status)
+
+
+cpdef cgemmStridedBatched(
+        size_t handle, int transa, int transb, int m, int n, int k,
+        float complex alpha, size_t A, int lda, long long strideA, size_t B,
+        int ldb, long long strideB, float complex beta, size_t C, int ldc,
+        long long strideC, int batchCount):
+    with nogil:
+        status = cublasCgemmStridedBatched(
+            <Handle>handle, <Operation>transa, <Operation>transb, m, n, k,
+            <const cuComplex*>&alpha, <const cuComplex*>A, lda, strideA,
+            <const cuComplex*>B, ldb, strideB, <const cuComplex*>&beta,
+            <cuComplex*>C, ldc, strideC, batchCount)
+    check_status(status)
+
+
+cpdef zgemmStridedBatched(
+        size_t handle, int transa, int transb, int m, int n, int k,
+        double complex alpha, size_t A, int lda, long long strideA, size_t B,
+        int ldb, long long strideB, double complex beta, size_t C, int ldc,
+        long long strideC, int batchCount):
+    with nogil:
+        status = cublasZgemmStridedBatched(
+            <Handle>handle, <Operation>transa, <Operation>transb, m, n, k,
+            <const cuDoubleComplex*>&alpha, <const cuDoubleComplex*>A, lda,
+            strideA, <const cuDoubleComplex*>B, ldb, strideB,
+            <const cuDoubleComplex*>&beta, <cuDoubleComplex*>C, ldc, strideC,
+            batchCount)
+    check_status(status)
+
+
 cpdef strsm(
         size_t handle, int side, int uplo, int trans, int diag,
         int m, int n, float alpha, size_t Aarray, int lda,
@@ -454,6 +660,15 @@ cpdef sgetrfBatched(size_t handle, int n, size_t Aarray, int lda,
     check_status(status)
 
 
+cpdef dgetrfBatched(size_t handle, int n, size_t Aarray, int lda,
+                    size_t PivotArray, size_t infoArray, int batchSize):
+    with nogil:
+        status = cublasDgetrfBatched(
+            <Handle>handle, n, <double**>Aarray, lda, <int*>PivotArray,
+            <int*>infoArray, batchSize)
+    check_status(status)
+
+
 cpdef sgetriBatched(
         size_t handle, int n, size_t Aarray, int lda, size_t PivotArray,
         size_t Carray, int ldc, size_t infoArray, int batchSize):
@@ -462,3 +677,27 @@ cpdef sgetriBatched(
             <Handle>handle, n, <const float**>Aarray, lda, <int*>PivotArray,
             <float**>Carray, ldc, <int*>infoArray, batchSize)
     check_status(status)
+
+
+cpdef int sgetrsBatched(
+        size_t handle, int trans, int n, int nrhs, size_t Aarray, int lda,
+        size_t devIpiv, size_t Barray, int ldb, int batchSize) except *:
+    cdef int info
+    with nogil:
+        status = cublasSgetrsBatched(
+            <Handle>handle, <Operation>trans, n, nrhs, <const float**>Aarray,
+            lda, <const int*>devIpiv, <float**>Barray, ldb, &info, batchSize)
+    check_status(status)
+    return info
+
+
+cpdef int dgetrsBatched(
+        size_t handle, int trans, int n, int nrhs, size_t Aarray, int lda,
+        size_t devIpiv, size_t Barray, int ldb, int batchSize) except *:
+    cdef int info
+    with nogil:
+        status = cublasDgetrsBatched(
+            <Handle>handle, <Operation>trans, n, nrhs, <const double**>Aarray,
+            lda, <const int*>devIpiv, <double**>Barray, ldb, &info, batchSize)
+    check_status(status)
+    return info
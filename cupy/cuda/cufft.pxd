@@ -0,0 +1,20 @@
+cdef extern from *:
+    ctypedef int Handle 'cufftHandle'
+    ctypedef int Result 'cufftResult'
+    ctypedef int Type 'cufftType'
+
+
+cpdef enum:
+    CUFFT_FORWARD = -1
+    CUFFT_INVERSE = 1
+
+    CUFFT_R2C = 0x2a
+    CUFFT_C2R = 0x2c
+    CUFFT_C2C = 0x29
+    CUFFT_D2Z = 0x6a
+    CUFFT_Z2D = 0x6c
+    CUFFT_Z2Z = 0x69
+
+
+cpdef int create() except *
+cpdef void destroy(int plan) except *
@@ -0,0 +1,180 @@
+"""Thin wrapper of cuFFT."""
+cimport cython
+
+from cupy.cuda cimport driver
+
+
+###############################################################################
+# Extern
+###############################################################################
+
+cdef extern from 'cupy_cufft.h' nogil:
+    ctypedef struct Complex 'cufftComplex':
+        pass
+    ctypedef struct DoubleComplex 'cufftDoubleComplex':
+        pass
+
+    # Plan
+    Result cufftCreate(Handle* plan)
+    Result cufftDestroy(Handle plan)
+    Result cufftSetAutoAllocation(Handle plan, int autoAllocate)
+    Result cufftMakePlanMany(
+        Handle plan, int rank, int* n, int* inembed, int istride, int idist,
+        int* onembed, int ostride, int odist, Type type, int batch,
+        size_t* workSize)
+    Result cufftSetWorkArea(Handle plan, void* workArea)
+    Result cufftSetStream(Handle plan, driver.Stream stream)
+
+    # Exec
+    Result cufftExecC2C(Handle plan, Complex* idata, Complex* odata,
+                        int direction)
+    Result cufftExecZ2Z(Handle plan, DoubleComplex* idata,
+                        DoubleComplex* odata, int direction)
+    Result cufftExecR2C(Handle plan, float* idata, Complex* odata)
+    Result cufftExecD2Z(Handle plan, double* idata, DoubleComplex* odata)
+    Result cufftExecC2R(Handle plan, Complex* idata, float* odata)
+    Result cufftExecZ2D(Handle plan, DoubleComplex* idata, double* odata)
+
+
+###############################################################################
+# Error handling
+###############################################################################
+
+cdef dict RESULT = {
+    0: 'CUFFT_SUCCESS',
+    1: 'CUFFT_INVALID_PLAN',
+    2: 'CUFFT_ALLOC_FAILED',
+    3: 'CUFFT_INVALID_TYPE',
+    4: 'CUFFT_INVALID_VALUE',
+    5: 'CUFFT_INTERNAL_ERROR',
+    6: 'CUFFT_EXEC_FAILED',
+    7: 'CUFFT_SETUP_FAILED',
+    8: 'CUFFT_INVALID_SIZE',
+    9: 'CUFFT_UNALIGNED_DATA',
+    10: 'CUFFT_INCOMPLETE_PARAMETER_LIST',
+    11: 'CUFFT_INVALID_DEVICE',
+    12: 'CUFFT_PARSE_ERROR',
+    13: 'CUFFT_NO_WORKSPACE',
+    14: 'CUFFT_NOT_IMPLEMENTED',
+    15: 'CUFFT_LICENSE_ERROR',
+    16: 'CUFFT_NOT_SUPPORTED',
+}
+
+
+class CuFFTError(RuntimeError):
+
+    def __init__(self, int result):
+        self.result = result
+        super(CuFFTError, self).__init__(
+            RESULT.get(result, 'CUFFT_UNKNOWN_ERROR (%d)' % result))
+
+
+@cython.profile(False)
+cpdef inline check_result(int result):
+    if result != 0:
+        raise CuFFTError(result)
+
+
+###############################################################################
+# Plan
+###############################################################################
+
+cpdef int create() except *:
+    cdef Handle plan
+    with nogil:
+        result = cufftCreate(&plan)
+    check_result(result)
+    return plan
+
+
+cpdef void destroy(int plan) except *:
+    with nogil:
+        result = cufftDestroy(<Handle>plan)
+    check_result(result)
+
+
+cpdef setAutoAllocation(int plan, int autoAllocate):
+    with nogil:
+        result = cufftSetAutoAllocation(<Handle>plan, autoAllocate)
+    check_result(result)
+
+
+cpdef size_t makePlanMany(int plan, n, int fft_type, int batch) except *:
+    """Makes a plan of batched transforms of contiguous arrays.
+
+    Each transform reads and writes the data in the C order, and the
+    transforms in a batch are placed next to each other.
+
+    Returns:
+        int: Size of the work area required by the plan in bytes.
+
+    """
+    cdef int rank = len(n)
+    cdef int[3] dims
+    cdef size_t workSize
+    if not 1 <= rank <= 3:
+        raise ValueError('rank must be 1, 2 or 3')
+    for i in range(rank):
+        dims[i] = n[i]
+    with nogil:
+        result = cufftMakePlanMany(
+            <Handle>plan, rank, dims, NULL, 1, 0, NULL, 1, 0,
+            <Type>fft_type, batch, &workSize)
+    check_result(result)
+    return workSize
+
+
+cpdef setWorkArea(int plan, size_t workArea):
+    with nogil:
+        result = cufftSetWorkArea(<Handle>plan, <void*>workArea)
+    check_result(result)
+
+
+cpdef setStream(int plan, size_t stream):
+    with nogil:
+        result = cufftSetStream(<Handle>plan, <driver.Stream>stream)
+    check_result(result)
+
+
+###############################################################################
+# Exec
+###############################################################################
+
+cpdef execC2C(int plan, size_t idata, size_t odata, int direction):
+    with nogil:
+        result = cufftExecC2C(<Handle>plan, <Complex*>idata, <Complex*>odata,
+                              direction)
+    check_result(result)
+
+
+cpdef execZ2Z(int plan, size_t idata, size_t odata, int direction):
+    with nogil:
+        result = cufftExecZ2Z(<Handle>plan, <DoubleComplex*>idata,
+                              <DoubleComplex*>odata, direction)
+    check_result(result)
+
+
+cpdef execR2C(int plan, size_t idata, size_t odata):
+    with nogil:
+        result = cufftExecR2C(<Handle>plan, <float*>idata, <Complex*>odata)
+    check_result(result)
+
+
+cpdef execD2Z(int plan, size_t idata, size_t odata):
+    with nogil:
+        result = cufftExecD2Z(<Handle>plan, <double*>idata,
+                              <DoubleComplex*>odata)
+    check_result(result)
+
+
+cpdef execC2R(int plan, size_t idata, size_t odata):
+    with nogil:
+        result = cufftExecC2R(<Handle>plan, <Complex*>idata, <float*>odata)
+    check_result(result)
+
+
+cpdef execZ2D(int plan, size_t idata, size_t odata):
+    with nogil:
+        result = cufftExecZ2D(<Handle>plan, <DoubleComplex*>idata,
+                              <double*>odata)
+    check_result(result)
@@ -37,6 +37,22 @@ typedef cublasDataType_t cudaDataType;
 enum cudaDataType_t {};
 typedef enum cudaDataType_t cudaDataType;
 #endif // #if CUDA_VERSION >= 7050
+
+cublasStatus_t cublasSgemmStridedBatched(...) {
+    return CUBLAS_STATUS_NOT_SUPPORTED;
+}
+
+cublasStatus_t cublasDgemmStridedBatched(...) {
+    return CUBLAS_STATUS_NOT_SUPPORTED;
+}
+
+cublasStatus_t cublasCgemmStridedBatched(...) {
+    return CUBLAS_STATUS_NOT_SUPPORTED;
+}
+
+cublasStatus_t cublasZgemmStridedBatched(...) {
+    return CUBLAS_STATUS_NOT_SUPPORTED;
+}
 #endif // #if CUDA_VERSION < 8000
 
 #if CUDA_VERSION < 7050
@@ -45,6 +61,47 @@ cublasStatus_t cublasSgemmEx(...) {
 }
 #endif // #if CUDA_VERSION < 7050
 
+#if CUDA_VERSION < 10000
+// CUDA Graph is available since CUDA 10.0.
+typedef void* cudaGraph_t;
+typedef void* cudaGraphExec_t;
+typedef void* cudaGraphNode_t;
+typedef int cudaStreamCaptureMode;
+typedef int cudaStreamCaptureStatus;
+
+cudaError_t cudaStreamBeginCapture(...) {
+    return cudaErrorNotSupported;
+}
+
+cudaError_t cudaStreamEndCapture(...) {
+    return cudaErrorNotSupported;
+}
+
+cudaError_t cudaStreamIsCapturing(...) {
+    return cudaErrorNotSupported;
+}
+
+cudaError_t cudaGraphInstantiate(...) {
+    return cudaErrorNotSupported;
+}
+
+cudaError_t cudaGraphLaunch(...) {
+    return cudaErrorNotSupported;
+}
+
+cudaError_t cudaGraphExecDestroy(...) {
+    return cudaErrorNotSupported;
+}
+
+cudaError_t cudaGraphDestroy(...) {
+    return cudaErrorNotSupported;
+}
+#elif CUDA_VERSION < 10010
+// The capture mode argument is added in CUDA 10.1.
+typedef int cudaStreamCaptureMode;
+#define cudaStreamBeginCapture(stream, mode) cudaStreamBeginCapture(stream)
+#endif // #if CUDA_VERSION < 10000
+
 } // extern "C"
 
 #else // #ifndef CUPY_NO_CUDA
@@ -317,6 +374,42 @@ cudaError_t cudaEventSynchronize(...) {
 }
 
 
+// Graph
+typedef void* cudaGraph_t;
+typedef void* cudaGraphExec_t;
+typedef void* cudaGraphNode_t;
+typedef int cudaStreamCaptureMode;
+typedef int cudaStreamCaptureStatus;
+
+cudaError_t cudaStreamBeginCapture(...) {
+    return cudaSuccess;
+}
+
+cudaError_t cudaStreamEndCapture(...) {
+    return cudaSuccess;
+}
+
+cudaError_t cudaStreamIsCapturing(...) {
+    return cudaSuccess;
+}
+
+cudaError_t cudaGraphInstantiate(...) {
+    return cudaSuccess;
+}
+
+cudaError_t cudaGraphLaunch(...) {
+    return cudaSuccess;
+}
+
+cudaError_t cudaGraphExecDestroy(...) {
+    return cudaSuccess;
+}
+
+cudaError_t cudaGraphDestroy(...) {
+    return cudaSuccess;
+}
+
+
 ///////////////////////////////////////////////////////////////////////////////
 // cublas_v2.h
 ///////////////////////////////////////////////////////////////////////////////
@@ -332,6 +425,9 @@ typedef enum {
     CUBLAS_STATUS_SUCCESS=0,
 } cublasStatus_t;
 
+typedef struct {float x, y;} cuComplex;
+typedef struct {double x, y;} cuDoubleComplex;
+
 
 // Context
 cublasStatus_t cublasCreate(...) {
@@ -392,6 +488,22 @@ cublasStatus_t cublasDdot(...) {
     return CUBLAS_STATUS_SUCCESS;
 }
 
+cublasStatus_t cublasCdotu(...) {
+    return CUBLAS_STATUS_SUCCESS;
+}
+
+cublasStatus_t cublasCdotc(...) {
+    return CUBLAS_STATUS_SUCCESS;
+}
+
+cublasStatus_t cublasZdotu(...) {
+    return CUBLAS_STATUS_SUCCESS;
+}
+
+cublasStatus_t cublasZdotc(...) {
+    return CUBLAS_STATUS_SUCCESS;
+}
+
 cublasStatus_t cublasSnrm2(...) {
     return CUBLAS_STATUS_SUCCESS;
 }
@@ -427,6 +539,14 @@ cublasStatus_t cublasDgemm(...) {
     return CUBLAS_STATUS_SUCCESS;
 }
 
+cublasStatus_t cublasCgemm(...) {
+    return CUBLAS_STATUS_SUCCESS;
+}
+
+cublasStatus_t cublasZgemm(...) {
+    return CUBLAS_STATUS_SUCCESS;
+}
+
 cublasStatus_t cublasSgemmBatched(...) {
     return CUBLAS_STATUS_SUCCESS;
 }
@@ -435,6 +555,30 @@ cublasStatus_t cublasDgemmBatched(...) {
     return CUBLAS_STATUS_SUCCESS;
 }
 
+cublasStatus_t cublasCgemmBatched(...) {
+    return CUBLAS_STATUS_SUCCESS;
+}
+
+cublasStatus_t cublasZgemmBatched(...) {
+    return CUBLAS_STATUS_SUCCESS;
+}
+
+cublasStatus_t cublasSgemmStridedBatched(...) {
+    return CUBLAS_STATUS_SUCCESS;
+}
+
+cublasStatus_t cublasDgemmStridedBatched(...) {
+    return CUBLAS_STATUS_SUCCESS;
+}
+
+cublasStatus_t cublasCgemmStridedBatched(...) {
+    return CUBLAS_STATUS_SUCCESS;
+}
+
+cublasStatus_t cublasZgemmStridedBatched(...) {
+    return CUBLAS_STATUS_SUCCESS;
+}
+
 cublasStatus_t cublasSgemmEx(...) {
     return CUBLAS_STATUS_SUCCESS;
 }
@@ -465,10 +609,22 @@ cublasStatus_t cublasSgetrfBatched(...) {
     return CUBLAS_STATUS_SUCCESS;
 }
 
+cublasStatus_t cublasDgetrfBatched(...) {
+    return CUBLAS_STATUS_SUCCESS;
+}
+
 cublasStatus_t cublasSgetriBatched(...) {
     return CUBLAS_STATUS_SUCCESS;
 }
 
+cublasStatus_t cublasSgetrsBatched(...) {
+    return CUBLAS_STATUS_SUCCESS;
+}
+
+cublasStatus_t cublasDgetrsBatched(...) {
+    return CUBLAS_STATUS_SUCCESS;
+}
+
 
 ///////////////////////////////////////////////////////////////////////////////
 // curand.h
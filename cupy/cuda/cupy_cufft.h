@@ -0,0 +1,78 @@
+// This file is a stub header file of cufft for Read the Docs.
+
+#ifndef INCLUDE_GUARD_CUPY_CUFFT_H
+#define INCLUDE_GUARD_CUPY_CUFFT_H
+
+#ifndef CUPY_NO_CUDA
+#  include <cufft.h>
+
+#else  // CUPY_NO_CUDA
+extern "C" {
+
+typedef enum {
+  CUFFT_SUCCESS=0,
+} cufftResult;
+
+typedef int cufftHandle;
+typedef enum {} cufftType;
+
+typedef float cufftReal;
+typedef double cufftDoubleReal;
+typedef struct {} cufftComplex;
+typedef struct {} cufftDoubleComplex;
+
+// cuFFT Plan Function
+cufftResult cufftCreate(...) {
+  return CUFFT_SUCCESS;
+}
+
+cufftResult cufftDestroy(...) {
+  return CUFFT_SUCCESS;
+}
+
+cufftResult cufftSetAutoAllocation(...) {
+  return CUFFT_SUCCESS;
+}
+
+cufftResult cufftMakePlanMany(...) {
+  return CUFFT_SUCCESS;
+}
+
+cufftResult cufftSetWorkArea(...) {
+  return CUFFT_SUCCESS;
+}
+
+cufftResult cufftSetStream(...) {
+  return CUFFT_SUCCESS;
+}
+
+// cuFFT Exec Function
+cufftResult cufftExecC2C(...) {
+  return CUFFT_SUCCESS;
+}
+
+cufftResult cufftExecZ2Z(...) {
+  return CUFFT_SUCCESS;
+}
+
+cufftResult cufftExecR2C(...) {
+  return CUFFT_SUCCESS;
+}
+
+cufftResult cufftExecD2Z(...) {
+  return CUFFT_SUCCESS;
+}
+
+cufftResult cufftExecC2R(...) {
+  return CUFFT_SUCCESS;
+}
+
+cufftResult cufftExecZ2D(...) {
+  return CUFFT_SUCCESS;
+}
+
+}  // extern "C"
+
+#endif  // CUPY_NO_CUDA
+
+#endif  // INCLUDE_GUARD_CUPY_CUFFT_H
@@ -9,6 +9,52 @@
 
 #include <cusolverDn.h>
 
+extern "C" {
+
+#if CUDA_VERSION < 9000
+// Jacobi eigenvalue solvers are available since CUDA 9.0.
+typedef void* syevjInfo_t;
+
+cusolverStatus_t cusolverDnCreateSyevjInfo(...) {
+    return CUSOLVER_STATUS_NOT_SUPPORTED;
+}
+
+cusolverStatus_t cusolverDnDestroySyevjInfo(...) {
+    return CUSOLVER_STATUS_NOT_SUPPORTED;
+}
+
+cusolverStatus_t cusolverDnSsyevjBatched_bufferSize(...) {
+    return CUSOLVER_STATUS_NOT_SUPPORTED;
+}
+
+cusolverStatus_t cusolverDnDsyevjBatched_bufferSize(...) {
+    return CUSOLVER_STATUS_NOT_SUPPORTED;
+}
+
+cusolverStatus_t cusolverDnSsyevjBatched(...) {
+    return CUSOLVER_STATUS_NOT_SUPPORTED;
+}
+
+cusolverStatus_t cusolverDnDsyevjBatched(...) {
+    return CUSOLVER_STATUS_NOT_SUPPORTED;
+}
+
+#endif // #if CUDA_VERSION < 9000
+
+#if CUDA_VERSION < 9010
+// Batched Cholesky factorization is available since CUDA 9.1.
+cusolverStatus_t cusolverDnSpotrfBatched(...) {
+    return CUSOLVER_STATUS_NOT_SUPPORTED;
+}
+
+cusolverStatus_t cusolverDnDpotrfBatched(...) {
+    return CUSOLVER_STATUS_NOT_SUPPORTED;
+}
+
+#endif // #if CUDA_VERSION < 9010
+
+} // extern "C"
+
 #else // #ifndef CUPY_NO_CUDA
 
 extern "C" {
@@ -21,6 +67,7 @@ typedef enum{} cusolverEigType_t;
 typedef enum{} cusolverEigMode_t;
 
 typedef void* cusolverDnHandle_t;
+typedef void* syevjInfo_t;
 
 cusolverStatus_t cusolverDnCreate(...) {
     return CUSOLVER_STATUS_SUCCESS;
@@ -174,6 +221,38 @@ cusolverStatus_t cusolverDnDsyevd(...) {
     return CUSOLVER_STATUS_SUCCESS;
 }
 
+cusolverStatus_t cusolverDnSpotrfBatched(...) {
+    return CUSOLVER_STATUS_SUCCESS;
+}
+
+cusolverStatus_t cusolverDnDpotrfBatched(...) {
+    return CUSOLVER_STATUS_SUCCESS;
+}
+
+cusolverStatus_t cusolverDnCreateSyevjInfo(...) {
+    return CUSOLVER_STATUS_SUCCESS;
+}
+
+cusolverStatus_t cusolverDnDestroySyevjInfo(...) {
+    return CUSOLVER_STATUS_SUCCESS;
+}
+
+cusolverStatus_t cusolverDnSsyevjBatched_bufferSize(...) {
+    return CUSOLVER_STATUS_SUCCESS;
+}
+
+cusolverStatus_t cusolverDnDsyevjBatched_bufferSize(...) {
+    return CUSOLVER_STATUS_SUCCESS;
+}
+
+cusolverStatus_t cusolverDnSsyevjBatched(...) {
+    return CUSOLVER_STATUS_SUCCESS;
+}
+
+cusolverStatus_t cusolverDnDsyevjBatched(...) {
+    return CUSOLVER_STATUS_SUCCESS;
+}
+
 } // extern "C"
 
 #endif // #ifndef CUPY_NO_CUDA
@@ -51,6 +51,15 @@ cusparseStatus_t cusparseSetPointerMode(...) {
   return CUSPARSE_STATUS_SUCCESS;
 }
 
+// cuSPARSE Stream
+cusparseStatus_t cusparseSetStream(...) {
+  return CUSPARSE_STATUS_SUCCESS;
+}
+
+cusparseStatus_t cusparseGetStream(...) {
+  return CUSPARSE_STATUS_SUCCESS;
+}
+
 
 // cuSPARSE Level1 Function
 cusparseStatus_t cusparseSgthr(...) {
@@ -14,13 +14,31 @@ using namespace thrust;
  * sort
  */
 
+template <typename K, typename T>
+void _segmented_sort(device_ptr<T> dp_data_first, device_ptr<T> dp_data_last,
+                     void *keys_start, ptrdiff_t size, ptrdiff_t n) {
+    device_ptr<K> dp_keys_first, dp_keys_last;
+
+    // Generate key indices.
+    dp_keys_first = device_pointer_cast(static_cast<K*>(keys_start));
+    dp_keys_last  = device_pointer_cast(static_cast<K*>(keys_start) + size);
+    transform(make_counting_iterator<size_t>(0),
+              make_counting_iterator<size_t>(size),
+              make_constant_iterator<size_t>(n),
+              dp_keys_first,
+              divides<size_t>());
+
+    stable_sort(
+        make_zip_iterator(make_tuple(dp_keys_first, dp_data_first)),
+        make_zip_iterator(make_tuple(dp_keys_last, dp_data_last)));
+}
+
 template <typename T>
-void cupy::thrust::_sort(void *data_start, size_t *keys_start, const std::vector<ptrdiff_t>& shape) {
+void cupy::thrust::_sort(void *data_start, void *keys_start, bool keys32, const std::vector<ptrdiff_t>& shape) {
 
     size_t ndim = shape.size();
     ptrdiff_t size;
     device_ptr<T> dp_data_first, dp_data_last;
-    device_ptr<size_t> dp_keys_first, dp_keys_last;
 
     // Compute the total size of the array.
     size = shape[0];
@@ -31,34 +49,27 @@ void cupy::thrust::_sort(void *data_start, size_t *keys_start, const std::vector
     dp_data_first = device_pointer_cast(static_cast<T*>(data_start));
     dp_data_last  = device_pointer_cast(static_cast<T*>(data_start) + size);
 
-    if (ndim == 1) {
+    if (size == shape[ndim-1]) {
         stable_sort(dp_data_first, dp_data_last);
+    } else if (keys32) {
+        _segmented_sort<unsigned int>(
+            dp_data_first, dp_data_last, keys_start, size, shape[ndim-1]);
     } else {
-        // Generate key indices.
-        dp_keys_first = device_pointer_cast(keys_start);
-        dp_keys_last  = device_pointer_cast(keys_start + size);
-        transform(make_counting_iterator<size_t>(0),
-                  make_counting_iterator<size_t>(size),
-                  make_constant_iterator<ptrdiff_t>(shape[ndim-1]),
-                  dp_keys_first,
-                  divides<size_t>());
-
-        stable_sort(
-            make_zip_iterator(make_tuple(dp_keys_first, dp_data_first)),
-            make_zip_iterator(make_tuple(dp_keys_last, dp_data_last)));
+        _segmented_sort<size_t>(
+            dp_data_first, dp_data_last, keys_start, size, shape[ndim-1]);
     }
 }
 
-template void cupy::thrust::_sort<cpy_byte>(void *, size_t *, const std::vector<ptrdiff_t>& shape);
-template void cupy::thrust::_sort<cpy_ubyte>(void *, size_t *, const std::vector<ptrdiff_t>& shape);
-template void cupy::thrust::_sort<cpy_short>(void *, size_t *, const std::vector<ptrdiff_t>& shape);
-template void cupy::thrust::_sort<cpy_ushort>(void *, size_t *, const std::vector<ptrdiff_t>& shape);
-template void cupy::thrust::_sort<cpy_int>(void *, size_t *, const std::vector<ptrdiff_t>& shape);
-template void cupy::thrust::_sort<cpy_uint>(void *, size_t *, const std::vector<ptrdiff_t>& shape);
-template void cupy::thrust::_sort<cpy_long>(void *, size_t *, const std::vector<ptrdiff_t>& shape);
-template void cupy::thrust::_sort<cpy_ulong>(void *, size_t *, const std::vector<ptrdiff_t>& shape);
-template void cupy::thrust::_sort<cpy_float>(void *, size_t *, const std::vector<ptrdiff_t>& shape);
-template void cupy::thrust::_sort<cpy_double>(void *, size_t *, const std::vector<ptrdiff_t>& shape);
+template void cupy::thrust::_sort<cpy_byte>(void *, void *, bool, const std::vector<ptrdiff_t>& shape);
+template void cupy::thrust::_sort<cpy_ubyte>(void *, void *, bool, const std::vector<ptrdiff_t>& shape);
+template void cupy::thrust::_sort<cpy_short>(void *, void *, bool, const std::vector<ptrdiff_t>& shape);
+template void cupy::thrust::_sort<cpy_ushort>(void *, void *, bool, const std::vector<ptrdiff_t>& shape);
+template void cupy::thrust::_sort<cpy_int>(void *, void *, bool, const std::vector<ptrdiff_t>& shape);
+template void cupy::thrust::_sort<cpy_uint>(void *, void *, bool, const std::vector<ptrdiff_t>& shape);
+template void cupy::thrust::_sort<cpy_long>(void *, void *, bool, const std::vector<ptrdiff_t>& shape);
+template void cupy::thrust::_sort<cpy_ulong>(void *, void *, bool, const std::vector<ptrdiff_t>& shape);
+template void cupy::thrust::_sort<cpy_float>(void *, void *, bool, const std::vector<ptrdiff_t>& shape);
+template void cupy::thrust::_sort<cpy_double>(void *, void *, bool, const std::vector<ptrdiff_t>& shape);
 
 
 /*
@@ -104,8 +115,29 @@ template void cupy::thrust::_lexsort<cpy_double>(size_t *, void *, size_t, size_
  * argsort
  */
 
+template <typename K, typename T>
+void _segmented_argsort(device_ptr<T> dp_data_first, device_ptr<T> dp_data_last,
+                        device_ptr<size_t> dp_idx_first, void *keys_start,
+                        ptrdiff_t size, ptrdiff_t n) {
+    device_ptr<K> dp_keys_first, dp_keys_last;
+
+    // Generate key indices.
+    dp_keys_first = device_pointer_cast(static_cast<K*>(keys_start));
+    dp_keys_last  = device_pointer_cast(static_cast<K*>(keys_start) + size);
+    transform(make_counting_iterator<size_t>(0),
+              make_counting_iterator<size_t>(size),
+              make_constant_iterator<size_t>(n),
+              dp_keys_first,
+              divides<size_t>());
+
+    stable_sort_by_key(
+        make_zip_iterator(make_tuple(dp_keys_first, dp_data_first)),
+        make_zip_iterator(make_tuple(dp_keys_last, dp_data_last)),
+        dp_idx_first);
+}
+
 template <typename T>
-void cupy::thrust::_argsort(size_t *idx_start, void *data_start, void *keys_start, const std::vector<ptrdiff_t>& shape) {
+void cupy::thrust::_argsort(size_t *idx_start, void *data_start, void *keys_start, bool keys32, const std::vector<ptrdiff_t>& shape) {
     /* idx_start is the beggining of the output array where the indexes that
        would sort the data will be placed. The original contents of idx_start
        will be destroyed. */
@@ -115,7 +147,6 @@ void cupy::thrust::_argsort(size_t *idx_start, void *data_start, void *keys_star
 
     device_ptr<size_t> dp_idx_first, dp_idx_last;
     device_ptr<T> dp_data_first, dp_data_last;
-    device_ptr<size_t> dp_keys_first, dp_keys_last;
 
     // Compute the total size of the data array.
     size = shape[0];
@@ -136,35 +167,29 @@ void cupy::thrust::_argsort(size_t *idx_start, void *data_start, void *keys_star
               dp_idx_first,
               modulus<size_t>());
 
-    if (ndim == 1) {
+    if (size == shape[ndim-1]) {
         // Sort the index sequence by data.
         stable_sort_by_key(dp_data_first,
                            dp_data_last,
                            dp_idx_first);
+    } else if (keys32) {
+        _segmented_argsort<unsigned int>(
+            dp_data_first, dp_data_last, dp_idx_first, keys_start, size,
+            shape[ndim-1]);
     } else {
-        // Generate key indices.
-        dp_keys_first = device_pointer_cast(static_cast<size_t*>(keys_start));
-        dp_keys_last  = device_pointer_cast(static_cast<size_t*>(keys_start) + size);
-        transform(make_counting_iterator<size_t>(0),
-                  make_counting_iterator<size_t>(size),
-                  make_constant_iterator<ptrdiff_t>(shape[ndim-1]),
-                  dp_keys_first,
-                  divides<size_t>());
-
-        stable_sort_by_key(
-            make_zip_iterator(make_tuple(dp_keys_first, dp_data_first)),
-            make_zip_iterator(make_tuple(dp_keys_last, dp_data_last)),
-            dp_idx_first);
+        _segmented_argsort<size_t>(
+            dp_data_first, dp_data_last, dp_idx_first, keys_start, size,
+            shape[ndim-1]);
     }
 }
 
-template void cupy::thrust::_argsort<cpy_byte>(size_t *, void *, void *, const std::vector<ptrdiff_t>& shape);
-template void cupy::thrust::_argsort<cpy_ubyte>(size_t *, void *, void *, const std::vector<ptrdiff_t>& shape);
-template void cupy::thrust::_argsort<cpy_short>(size_t *, void *, void *, const std::vector<ptrdiff_t>& shape);
-template void cupy::thrust::_argsort<cpy_ushort>(size_t *, void *, void *, const std::vector<ptrdiff_t>& shape);
-template void cupy::thrust::_argsort<cpy_int>(size_t *, void *, void *, const std::vector<ptrdiff_t>& shape);
-template void cupy::thrust::_argsort<cpy_uint>(size_t *, void *, void *, const std::vector<ptrdiff_t>& shape);
-template void cupy::thrust::_argsort<cpy_long>(size_t *, void *, void *, const std::vector<ptrdiff_t>& shape);
-template void cupy::thrust::_argsort<cpy_ulong>(size_t *, void *, void *, const std::vector<ptrdiff_t>& shape);
-template void cupy::thrust::_argsort<cpy_float>(size_t *, void *, void *, const std::vector<ptrdiff_t>& shape);
-template void cupy::thrust::_argsort<cpy_double>(size_t *, void *, void *, const std::vector<ptrdiff_t>& shape);
+template void cupy::thrust::_argsort<cpy_byte>(size_t *, void *, void *, bool, const std::vector<ptrdiff_t>& shape);
+template void cupy::thrust::_argsort<cpy_ubyte>(size_t *, void *, void *, bool, const std::vector<ptrdiff_t>& shape);
+template void cupy::thrust::_argsort<cpy_short>(size_t *, void *, void *, bool, const std::vector<ptrdiff_t>& shape);
+template void cupy::thrust::_argsort<cpy_ushort>(size_t *, void *, void *, bool, const std::vector<ptrdiff_t>& shape);
+template void cupy::thrust::_argsort<cpy_int>(size_t *, void *, void *, bool, const std::vector<ptrdiff_t>& shape);
+template void cupy::thrust::_argsort<cpy_uint>(size_t *, void *, void *, bool, const std::vector<ptrdiff_t>& shape);
+template void cupy::thrust::_argsort<cpy_long>(size_t *, void *, void *, bool, const std::vector<ptrdiff_t>& shape);
+template void cupy::thrust::_argsort<cpy_ulong>(size_t *, void *, void *, bool, const std::vector<ptrdiff_t>& shape);
+template void cupy::thrust::_argsort<cpy_float>(size_t *, void *, void *, bool, const std::vector<ptrdiff_t>& shape);
+template void cupy::thrust::_argsort<cpy_double>(size_t *, void *, void *, bool, const std::vector<ptrdiff_t>& shape);
@@ -7,11 +7,11 @@ namespace cupy {
 
 namespace thrust {
 
-template <typename T> void _sort(void *, size_t *, const std::vector<ptrdiff_t>&);
+template <typename T> void _sort(void *, void *, bool, const std::vector<ptrdiff_t>&);
 
 template <typename T> void _lexsort(size_t *, void *, size_t, size_t);
 
-template <typename T> void _argsort(size_t *, void *, void *, const std::vector<ptrdiff_t>&);
+template <typename T> void _argsort(size_t *, void *, void *, bool, const std::vector<ptrdiff_t>&);
 
 } // namespace thrust
 
@@ -25,11 +25,11 @@ namespace cupy {
 
 namespace thrust {
 
-template <typename T> void _sort(void *, size_t *, const std::vector<ptrdiff_t>&) { return; }
+template <typename T> void _sort(void *, void *, bool, const std::vector<ptrdiff_t>&) { return; }
 
 template <typename T> void _lexsort(size_t *, void *, size_t, size_t) { return; }
 
-template <typename T> void _argsort(size_t *, void *, void *, const std::vector<ptrdiff_t>&) { return; }
+template <typename T> void _argsort(size_t *, void *, void *, bool, const std::vector<ptrdiff_t>&) { return; }
 
 } // namespace thrust
 
@@ -9,6 +9,7 @@ from cupy.cuda.driver cimport Stream
 
 cdef extern from *:
     ctypedef void* Handle 'cusolverDnHandle_t'
+    ctypedef void* SyevjInfo 'syevjInfo_t'
 
     ctypedef int Operation 'cublasOperation_t'
     ctypedef int SideMode 'cublasSideMode_t'
@@ -123,3 +124,27 @@ cpdef sgesvd(size_t handle, char jobu, char jobvt, int m, int n, size_t A,
 cpdef dgesvd(size_t handle, char jobu, char jobvt, int m, int n, size_t A,
              int lda, size_t S, size_t U, int ldu, size_t VT, int ldvt,
              size_t Work, int lwork, size_t rwork, size_t devInfo)
+
+###############################################################################
+# Batched dense LAPACK Functions
+###############################################################################
+
+cpdef spotrfBatched(size_t handle, int uplo, int n, size_t Aarray, int lda,
+                    size_t infoArray, int batchSize)
+cpdef dpotrfBatched(size_t handle, int uplo, int n, size_t Aarray, int lda,
+                    size_t infoArray, int batchSize)
+
+cpdef size_t createSyevjInfo() except *
+cpdef destroySyevjInfo(size_t info)
+cpdef int ssyevjBatched_bufferSize(
+    size_t handle, int jobz, int uplo, int n, size_t A, int lda,
+    size_t W, size_t params, int batchSize) except *
+cpdef int dsyevjBatched_bufferSize(
+    size_t handle, int jobz, int uplo, int n, size_t A, int lda,
+    size_t W, size_t params, int batchSize) except *
+cpdef ssyevjBatched(size_t handle, int jobz, int uplo, int n, size_t A,
+                    int lda, size_t W, size_t work, int lwork, size_t info,
+                    size_t params, int batchSize)
+cpdef dsyevjBatched(size_t handle, int jobz, int uplo, int n, size_t A,
+                    int lda, size_t W, size_t work, int lwork, size_t info,
+                    size_t params, int batchSize)
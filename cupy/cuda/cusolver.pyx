@@ -128,6 +128,33 @@ cdef extern from 'cupy_cusolver.h' nogil:
         Handle handle, EigMode jobz, FillMode uplo, int n, double* A, int lda,
         double* W, double* work, int lwork, int* info)
 
+    # Batched routines
+    int cusolverDnSpotrfBatched(
+        Handle handle, FillMode uplo, int n, float** Aarray, int lda,
+        int* infoArray, int batchSize)
+    int cusolverDnDpotrfBatched(
+        Handle handle, FillMode uplo, int n, double** Aarray, int lda,
+        int* infoArray, int batchSize)
+
+    int cusolverDnCreateSyevjInfo(SyevjInfo* info)
+    int cusolverDnDestroySyevjInfo(SyevjInfo info)
+    int cusolverDnSsyevjBatched_bufferSize(
+        Handle handle, EigMode jobz, FillMode uplo, int n, const float* A,
+        int lda, const float* W, int* lwork, SyevjInfo params,
+        int batchSize)
+    int cusolverDnDsyevjBatched_bufferSize(
+        Handle handle, EigMode jobz, FillMode uplo, int n, const double* A,
+        int lda, const double* W, int* lwork, SyevjInfo params,
+        int batchSize)
+    int cusolverDnSsyevjBatched(
+        Handle handle, EigMode jobz, FillMode uplo, int n, float* A, int lda,
+        float* W, float* work, int lwork, int* info, SyevjInfo params,
+        int batchSize)
+    int cusolverDnDsyevjBatched(
+        Handle handle, EigMode jobz, FillMode uplo, int n, double* A,
+        int lda, double* W, double* work, int lwork, int* info,
+        SyevjInfo params, int batchSize)
+
 
 ###############################################################################
 # Error handling
@@ -501,3 +528,82 @@ cpdef dsyevd(size_t handle, int jobz, int uplo, int n, size_t A, int lda,
             <Handle>handle, <EigMode>jobz, <FillMode>uplo, n, <double*>A, lda,
             <double*>W, <double*>work, lwork, <int*>info)
     check_status(status)
+
+###############################################################################
+# Batched dense LAPACK Functions
+###############################################################################
+
+cpdef spotrfBatched(size_t handle, int uplo, int n, size_t Aarray, int lda,
+                    size_t infoArray, int batchSize):
+    cdef int status
+    with nogil:
+        status = cusolverDnSpotrfBatched(
+            <Handle>handle, <FillMode>uplo, n, <float**>Aarray, lda,
+            <int*>infoArray, batchSize)
+    check_status(status)
+
+cpdef dpotrfBatched(size_t handle, int uplo, int n, size_t Aarray, int lda,
+                    size_t infoArray, int batchSize):
+    cdef int status
+    with nogil:
+        status = cusolverDnDpotrfBatched(
+            <Handle>handle, <FillMode>uplo, n, <double**>Aarray, lda,
+            <int*>infoArray, batchSize)
+    check_status(status)
+
+cpdef size_t createSyevjInfo() except *:
+    cdef SyevjInfo info
+    with nogil:
+        status = cusolverDnCreateSyevjInfo(&info)
+    check_status(status)
+    return <size_t>info
+
+cpdef destroySyevjInfo(size_t info):
+    with nogil:
+        status = cusolverDnDestroySyevjInfo(<SyevjInfo>info)
+    check_status(status)
+
+cpdef int ssyevjBatched_bufferSize(
+        size_t handle, int jobz, int uplo, int n, size_t A, int lda,
+        size_t W, size_t params, int batchSize) except *:
+    cdef int lwork, status
+    with nogil:
+        status = cusolverDnSsyevjBatched_bufferSize(
+            <Handle>handle, <EigMode>jobz, <FillMode>uplo, n, <const float*>A,
+            lda, <const float*>W, &lwork, <SyevjInfo>params, batchSize)
+    check_status(status)
+    return lwork
+
+cpdef int dsyevjBatched_bufferSize(
+        size_t handle, int jobz, int uplo, int n, size_t A, int lda,
+        size_t W, size_t params, int batchSize) except *:
+    cdef int lwork, status
+    with nogil:
+        status = cusolverDnDsyevjBatched_bufferSize(
+            <Handle>handle, <EigMode>jobz, <FillMode>uplo, n,
+            <const double*>A, lda, <const double*>W, &lwork,
+            <SyevjInfo>params, batchSize)
+    check_status(status)
+    return lwork
+
+cpdef ssyevjBatched(size_t handle, int jobz, int uplo, int n, size_t A,
+                    int lda, size_t W, size_t work, int lwork, size_t info,
+                    size_t params, int batchSize):
+    cdef int status
+    with nogil:
+        status = cusolverDnSsyevjBatched(
+            <Handle>handle, <EigMode>jobz, <FillMode>uplo, n, <float*>A, lda,
+            <float*>W, <float*>work, lwork, <int*>info, <SyevjInfo>params,
+            batchSize)
+    check_status(status)
+
+cpdef dsyevjBatched(size_t handle, int jobz, int uplo, int n, size_t A,
+                    int lda, size_t W, size_t work, int lwork, size_t info,
+                    size_t params, int batchSize):
+    cdef int status
+    with nogil:
+        status = cusolverDnDsyevjBatched(
+            <Handle>handle, <EigMode>jobz, <FillMode>uplo, n, <double*>A,
+            lda, <double*>W, <double*>work, lwork, <int*>info,
+            <SyevjInfo>params, batchSize)
+    check_status(status)
@@ -37,3 +37,5 @@ cpdef enum:
 
 cpdef size_t create() except *
 cpdef void destroy(size_t handle)
+cpdef setStream(size_t handle, size_t stream)
+cpdef size_t getStream(size_t handle) except *
@@ -1,5 +1,7 @@
 cimport cython
 
+from cupy.cuda cimport driver
+
 cdef extern from "cupy_cusparse.h":
 
     # cuSPARSE Helper Function
@@ -11,6 +13,10 @@ cdef extern from "cupy_cusparse.h":
     Status cusparseSetMatType(MatDescr descr, MatrixType type)
     Status cusparseSetPointerMode(Handle handle, PointerMode mode)
 
+    # Stream
+    Status cusparseSetStream(Handle handle, driver.Stream streamId)
+    Status cusparseGetStream(Handle handle, driver.Stream* streamId)
+
     # cuSPARSE Level1 Function
     Status cusparseSgthr(
         Handle handle, int nnz, const float *y, float *xVal, const int *xInd,
@@ -242,6 +248,21 @@ cpdef setPointerMode(size_t handle, int mode):
     check_status(status)
 
 
+########################################
+# Stream
+
+cpdef setStream(size_t handle, size_t stream):
+    status = cusparseSetStream(<Handle>handle, <driver.Stream>stream)
+    check_status(status)
+
+
+cpdef size_t getStream(size_t handle) except *:
+    cdef driver.Stream stream
+    status = cusparseGetStream(<Handle>handle, &stream)
+    check_status(status)
+    return <size_t>stream
+
+
 ########################################
 # cuSPARSE Level1 Function
 
@@ -1,12 +1,13 @@
 # distutils: language = c++
 
 import atexit
+import threading
+import weakref
 
-import six
-
-from cupy.cuda cimport cublas
-from cupy.cuda cimport cusparse
+from cupy.cuda import cublas
+from cupy.cuda import cusparse
 from cupy.cuda cimport runtime
+from cupy.cuda import stream as stream_module
 
 try:
     from cupy.cuda import cusolver
@@ -15,34 +16,206 @@ except ImportError:
     cusolver_enabled = False
 
 
+# ID of the device returned without querying the runtime if it is not
+# negative. It is set to run the host-side code without a GPU, e.g. in the
+# stub-kernel mode of the benchmarks.
+cdef int _stub_device_id = -1
+
+
 cpdef int get_device_id() except *:
+    if _stub_device_id >= 0:
+        return _stub_device_id
     return runtime.getDevice()
 
 
-cdef dict _cublas_handles = {}
-cdef dict _cusolver_handles = {}
-cdef dict _cusparse_handles = {}
+def _set_stub_device_id(int device_id):
+    global _stub_device_id
+    _stub_device_id = device_id
+
+
+cdef object _thread_local = threading.local()
+
+# Handle pools of all the threads, which are cleared at exit.
+_handle_pools = weakref.WeakSet()
+
+
+class _HandleEntry(object):
+
+    __slots__ = ('handle', 'workspace', 'workspace_size', 'stream_ref')
+
+    def __init__(self):
+        self.handle = None
+        self.workspace = None
+        self.workspace_size = 0
+        self.stream_ref = None
+
+
+def _release_callback(pool_ref, key):
+    def callback(_):
+        pool = pool_ref()
+        if pool is not None:
+            pool.release(key)
+    return callback
+
+
+class _HandlePool(object):
+
+    """Library handles of a thread keyed on the device and the stream.
+
+    Each handle is bound to its stream by ``setStream`` when it is created,
+    so the routines called with it are enqueued to the stream without
+    switching the stream of a shared handle. A workspace that grows to the
+    largest requested size is kept for each handle. The handle and the
+    workspace for a stream are released when the stream is destroyed, and
+    the others when the thread exits.
+
+    Args:
+        module: Library binding module with ``create``, ``destroy`` and
+            ``setStream`` functions.
+
+    """
+
+    def __init__(self, module):
+        self.module = module
+        self._entries = {}
+        _handle_pools.add(self)
+
+    def __del__(self):
+        self.clear()
+
+    def _get_entry(self, dev_id):
+        stream = stream_module.get_current_stream()
+        key = (dev_id, stream.ptr)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = _HandleEntry()
+            if stream.ptr:
+                entry.stream_ref = weakref.ref(
+                    stream, _release_callback(weakref.ref(self), key))
+            self._entries[key] = entry
+        return entry, key
+
+    def get_handle(self, dev_id):
+        """Returns the handle for the device and the current stream."""
+        entry, key = self._get_entry(dev_id)
+        if entry.handle is None:
+            with Device(dev_id):
+                handle = self.module.create()
+                try:
+                    if key[1]:
+                        self.module.setStream(handle, key[1])
+                except Exception:
+                    self.module.destroy(handle)
+                    raise
+            entry.handle = handle
+        return entry.handle
+
+    def get_workspace(self, dev_id, size):
+        """Returns the workspace for the device and the current stream.
+
+        The workspace is shared by the routines called with the handle
+        for the same device and stream, which are serialized by the stream.
+
+        """
+        from cupy.cuda import graph
+        from cupy.cuda import memory
+
+        if graph.is_capturing():
+            # A graph must own the memory it captures, since the workspace
+            # may be reallocated after the capture.
+            with Device(dev_id):
+                return memory.alloc(size)
+        entry, _ = self._get_entry(dev_id)
+        if entry.workspace is None or entry.workspace_size < size:
+            with Device(dev_id):
+                entry.workspace = memory.alloc(size)
+            entry.workspace_size = size
+        return entry.workspace
+
+    def release(self, key):
+        """Destroys the handle and the workspace for a device and a stream."""
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry.handle is not None:
+            with Device(key[0]):
+                self.module.destroy(entry.handle)
+
+    def clear(self):
+        """Destroys all the handles and the workspaces."""
+        for key in list(self._entries):
+            self.release(key)
+
+
+def _get_handle_pool(name):
+    pools = getattr(_thread_local, 'handle_pools', None)
+    if pools is None:
+        pools = _thread_local.handle_pools = {}
+    pool = pools.get(name)
+    if pool is None:
+        if name == 'cublas':
+            module = cublas
+        elif name == 'cusolver':
+            if not cusolver_enabled:
+                raise RuntimeError(
+                    'Current cupy only supports cusolver in CUDA 8.0')
+            module = cusolver
+        else:  # name == 'cusparse'
+            module = cusparse
+        pool = pools[name] = _HandlePool(module)
+    return pool
 
 
 cpdef get_cublas_handle():
-    dev_id = get_device_id()
-    if dev_id in _cublas_handles:
-        return _cublas_handles[dev_id]
-    return Device().cublas_handle
+    """Returns the cuBLAS handle for the current device and stream.
+
+    A handle is created for each device, stream and thread, and it is bound
+    to the stream.
+
+    """
+    return _get_handle_pool('cublas').get_handle(get_device_id())
 
 
 cpdef get_cusolver_handle():
-    dev_id = get_device_id()
-    if dev_id in _cusolver_handles:
-        return _cusolver_handles[dev_id]
-    return Device().cusolver_handle
+    """Returns the cuSOLVER handle for the current device and stream.
+
+    .. seealso:: :func:`cupy.cuda.device.get_cublas_handle`
+
+    """
+    return _get_handle_pool('cusolver').get_handle(get_device_id())
 
 
 cpdef get_cusparse_handle():
-    dev_id = get_device_id()
-    if dev_id in _cusparse_handles:
-        return _cusparse_handles[dev_id]
-    return Device().cusparse_handle
+    """Returns the cuSPARSE handle for the current device and stream.
+
+    .. seealso:: :func:`cupy.cuda.device.get_cublas_handle`
+
+    """
+    return _get_handle_pool('cusparse').get_handle(get_device_id())
+
+
+cpdef get_cusolver_workspace(Py_ssize_t size):
+    """Returns the workspace of the current cuSOLVER handle.
+
+    The workspace is reused by the cuSOLVER routines called with the handle
+    for the current device and stream, and is reallocated only when a larger
+    size is requested.
+
+    Args:
+        size (int): Size of the workspace in bytes.
+
+    Returns:
+        cupy.cuda.MemoryPointer: Pointer to the workspace.
+
+    """
+    return _get_handle_pool('cusolver').get_workspace(get_device_id(), size)
+
+
+cpdef get_cusparse_workspace(Py_ssize_t size):
+    """Returns the workspace of the current cuSPARSE handle.
+
+    .. seealso:: :func:`cupy.cuda.device.get_cusolver_workspace`
+
+    """
+    return _get_handle_pool('cusparse').get_workspace(get_device_id(), size)
 
 
 cdef class Device:
@@ -73,7 +246,7 @@ cdef class Device:
 
     def __init__(self, device=None):
         if device is None:
-            self.id = runtime.getDevice()
+            self.id = get_device_id()
         else:
             self.id = int(device)
 
@@ -123,51 +296,33 @@ cdef class Device:
 
     @property
     def cublas_handle(self):
-        """The cuBLAS handle for this device.
+        """The cuBLAS handle for this device and the current stream.
 
-        The same handle is used for the same device even if the Device instance
-        itself is different.
+        The same handle is used for the same device and stream in a thread
+        even if the Device instance itself is different.
 
         """
-        if self.id in _cublas_handles:
-            return _cublas_handles[self.id]
-        with self:
-            handle = cublas.create()
-            _cublas_handles[self.id] = handle
-            return handle
+        return _get_handle_pool('cublas').get_handle(self.id)
 
     @property
     def cusolver_handle(self):
-        """The cuSOLVER handle for this device.
+        """The cuSOLVER handle for this device and the current stream.
 
-        The same handle is used for the same device even if the Device instance
-        itself is different.
+        The same handle is used for the same device and stream in a thread
+        even if the Device instance itself is different.
 
         """
-        if not cusolver_enabled:
-            raise RuntimeError(
-                'Current cupy only supports cusolver in CUDA 8.0')
-        if self.id in _cusolver_handles:
-            return _cusolver_handles[self.id]
-        with self:
-            handle = cusolver.create()
-            _cusolver_handles[self.id] = handle
-            return handle
+        return _get_handle_pool('cusolver').get_handle(self.id)
 
     @property
     def cusparse_handle(self):
-        """The cuSPARSE handle for this device.
+        """The cuSPARSE handle for this device and the current stream.
 
-        The same handle is used for the same device even if the Device instance
-        itself is different.
+        The same handle is used for the same device and stream in a thread
+        even if the Device instance itself is different.
 
         """
-        if self.id in _cusparse_handles:
-            return _cusparse_handles[self.id]
-        with self:
-            handle = cusparse.create()
-            _cusparse_handles[self.id] = handle
-            return handle
+        return _get_handle_pool('cusparse').get_handle(self.id)
 
     def __richcmp__(Device self, Device other, int op):
         if op == 0:
@@ -199,19 +354,26 @@ def from_pointer(ptr):
     return Device(attrs.device)
 
 
+def _destroy_handles(module):
+    for pool in list(_handle_pools):
+        if pool.module is module:
+            pool.clear()
+
+
 @atexit.register
 def destroy_cublas_handles():
-    """Destroys the cuBLAS handles for all devices."""
-    global _cublas_handles
-    for handle in _cublas_handles.itervalues():
-        cublas.destroy(handle)
-    _cublas_handles = {}
+    """Destroys the cuBLAS handles for all devices, streams and threads."""
+    _destroy_handles(cublas)
+
+
+@atexit.register
+def destroy_cusolver_handles():
+    """Destroys the cuSOLVER handles for all devices, streams and threads."""
+    if cusolver_enabled:
+        _destroy_handles(cusolver)
 
 
 @atexit.register
 def destroy_cusparse_handles():
-    """Destroys the cuSPARSE handles for all devices."""
-    global _cusparse_handles
-    for handle in six.itervalues(_cusparse_handles):
-        cusparse.destroy(handle)
-    _cusparse_handles = {}
+    """Destroys the cuSPARSE handles for all devices, streams and threads."""
+    _destroy_handles(cusparse)
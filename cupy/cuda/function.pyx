@@ -3,6 +3,8 @@
 import numpy
 import six
 
+from cupy.cuda import stream as stream_module
+
 cimport cpython
 from libcpp cimport vector
 
@@ -58,7 +60,18 @@ cdef class CInt64(CPointer):
         self.ptr = <void*>&self.val
 
 
-cdef set _pointer_numpy_types = {numpy.dtype(i).type for i in '?bhilqBHILQefd'}
+cdef class CInt128(CPointer):
+    cdef:
+        int64_t val[2]
+
+    def __init__(self, v):
+        self.val[0] = v[0]
+        self.val[1] = v[1]
+        self.ptr = <void*>self.val
+
+
+cdef set _pointer_numpy_types = {numpy.dtype(i).type
+                                 for i in '?bhilqBHILQefdFD'}
 
 
 cdef inline CPointer _pointer(x):
@@ -77,6 +90,8 @@ cdef inline CPointer _pointer(x):
             x = numpy.float64(x)
         elif isinstance(x, bool):
             x = numpy.bool_(x)
+        elif isinstance(x, complex):
+            x = numpy.complex128(x)
         else:
             raise TypeError('Unsupported type %s' % type(x))
 
@@ -89,11 +104,15 @@ cdef inline CPointer _pointer(x):
         return CInt32(x.view(numpy.int32))
     if itemsize == 8:
         return CInt64(x.view(numpy.int64))
+    if itemsize == 16:
+        return CInt128(numpy.array(x).view(numpy.int64))
     raise TypeError('Unsupported type %s. (size=%d)', type(x), itemsize)
 
 
 cdef inline size_t _get_stream(strm) except *:
-    return 0 if strm is None else strm.ptr
+    if strm is None:
+        strm = stream_module.get_current_stream()
+    return strm.ptr
 
 
 cdef void _launch(size_t func, Py_ssize_t grid0, int grid1, int grid2,
@@ -0,0 +1,238 @@
+import contextlib
+import functools
+import threading
+
+import numpy
+
+from cupy.cuda import device
+from cupy.cuda import memory
+from cupy.cuda import runtime
+from cupy.cuda import stream as stream_module
+
+
+_thread_local = threading.local()
+
+
+def _prepare_library_handles():
+    """Creates the library handles for the current stream in advance."""
+    device.get_cublas_handle()
+    device.get_cusparse_handle()
+    if device.cusolver_enabled:
+        device.get_cusolver_handle()
+
+
+@contextlib.contextmanager
+def _using_stream(stream):
+    """Makes a stream current and prepares the library handles for it.
+
+    The library handles are bound to the current stream, so the routines
+    called in the block are enqueued to the stream. They are created before
+    the block since a handle cannot be created during a capture.
+
+    """
+    with stream:
+        _prepare_library_handles()
+        yield
+
+
+class Graph(object):
+
+    """CUDA graph captured from a stream.
+
+    A graph is created by :func:`cupy.cuda.graph.capture`. It holds the
+    memory allocated during the capture, so that the addresses captured in
+    the graph stay valid while the graph is alive.
+
+    Attributes:
+        ptr (int): Raw handle of the executable graph.
+        stream (cupy.cuda.Stream): Stream the graph is captured from.
+
+    """
+
+    def __init__(self):
+        self.ptr = 0
+        self.stream = None
+        self._graph = 0
+        self._memory = []
+
+    def __del__(self):
+        if self.ptr:
+            runtime.graphExecDestroy(self.ptr)
+            self.ptr = 0
+        if self._graph:
+            runtime.graphDestroy(self._graph)
+            self._graph = 0
+
+    @property
+    def captured(self):
+        """``True`` if the capture has been completed."""
+        return self.ptr != 0
+
+    def launch(self, stream=None):
+        """Launches the captured work.
+
+        Args:
+            stream (cupy.cuda.Stream): Stream to launch the graph on. The
+                stream the graph is captured from is used by default.
+
+        """
+        if not self.captured:
+            raise RuntimeError('The graph is not captured yet')
+        if stream is None:
+            stream = self.stream
+        runtime.graphLaunch(self.ptr, stream.ptr)
+
+
+def is_capturing():
+    """Returns ``True`` if a graph is being captured in the current thread."""
+    return getattr(_thread_local, 'capturing', False)
+
+
+@contextlib.contextmanager
+def capture(stream):
+    """Captures the work enqueued to a stream into a graph.
+
+    While capturing, the stream is the current stream, kernels, library
+    routines, and copies and memsets between device arrays issued to it are
+    recorded instead of being executed, and memory allocated through the
+    current allocator is kept by the graph. :meth:`cupy.ndarray.get` and
+    :meth:`cupy.ndarray.set` without a stream cannot be captured since they
+    synchronize the stream. The captured work is executed by
+    :meth:`Graph.launch`.
+
+    >>> s = cupy.cuda.Stream()
+    >>> with cupy.cuda.graph.capture(s) as g:
+    ...     y = x * 2 + 1
+    >>> g.launch()  # computes y
+    >>> g.launch()  # computes y again from the current content of x
+
+    Synchronous operations such as :meth:`cupy.ndarray.get` are not allowed
+    in the block.
+
+    Args:
+        stream (cupy.cuda.Stream): Stream to capture. It must not be the null
+            stream.
+
+    Returns:
+        cupy.cuda.graph.Graph: The graph, which becomes available at the end
+        of the block.
+
+    """
+    if stream is None or stream.ptr == 0:
+        raise ValueError('The null stream cannot be captured')
+    if is_capturing():
+        raise RuntimeError('Graph capture cannot be nested')
+
+    graph = Graph()
+    allocator = memory.get_allocator()
+
+    def recording_allocator(size):
+        mem = allocator(size)
+        graph._memory.append(mem)
+        return mem
+
+    memory.set_allocator(recording_allocator)
+    _thread_local.capturing = True
+    try:
+        with _using_stream(stream):
+            runtime.streamBeginCapture(stream.ptr)
+            try:
+                yield graph
+            except Exception:
+                # Ends the capture to leave the stream usable.
+                graph._graph = runtime.streamEndCapture(stream.ptr)
+                raise
+            graph._graph = runtime.streamEndCapture(stream.ptr)
+    finally:
+        _thread_local.capturing = False
+        memory.set_allocator(allocator)
+
+    graph.ptr = runtime.graphInstantiate(graph._graph)
+    graph.stream = stream
+
+
+def _get_signature(args):
+    sig = []
+    for a in args:
+        if isinstance(getattr(a, 'data', None), memory.MemoryPointer):
+            sig.append((a.data.ptr, a.shape, a.strides, a.dtype.str))
+        elif isinstance(a, numpy.ndarray):
+            raise TypeError('NumPy arrays cannot be passed to a graphed '
+                            'function')
+        else:
+            sig.append(a)
+    return tuple(sig)
+
+
+class GraphedFunction(object):
+
+    """Function whose kernel launches are captured and replayed.
+
+    Objects of this class are made by :func:`cupy.cuda.graph.graphed`.
+
+    Attributes:
+        func (function): The function before capturing.
+        graph (cupy.cuda.graph.Graph): The captured graph, or ``None`` before
+            the first call.
+
+    """
+
+    def __init__(self, func, stream=None):
+        self.func = func
+        self.stream = stream
+        self.graph = None
+        self._signature = None
+        self._result = None
+
+    def __call__(self, *args):
+        signature = _get_signature(args)
+        if self.graph is None:
+            if self.stream is None:
+                self.stream = stream_module.Stream(non_blocking=True)
+            # Runs once without capturing so that kernels are compiled and
+            # library handles and memory pool chunks are ready.
+            with _using_stream(self.stream):
+                self.func(*args)
+            self.stream.synchronize()
+            with capture(self.stream) as graph:
+                result = self.func(*args)
+            self.graph = graph
+            self._signature = signature
+            self._result = result
+        elif signature != self._signature:
+            raise ValueError(
+                'The arguments of %s must have the same shapes, strides, '
+                'dtypes and pointers as when it was captured' %
+                self.func.__name__)
+        self.graph.launch()
+        return self._result
+
+
+def graphed(func=None, stream=None):
+    """Decorator to capture a function into a CUDA graph and replay it.
+
+    The first call runs the function once as usual, then captures it into a
+    graph and launches the graph. The following calls only launch the graph,
+    which is much cheaper than launching the kernels one by one.
+
+    The arguments must be CuPy arrays of the same shapes, strides, dtypes and
+    pointers, or the same scalars, as the first call; otherwise
+    :class:`ValueError` is raised. Write new inputs into the same arrays to
+    process them. The function always returns the same objects, whose content
+    is updated by each call.
+
+    Args:
+        func (function): The function to capture.
+        stream (cupy.cuda.Stream): Stream to capture and launch the graph
+            on. A new stream is created by default.
+
+    Returns:
+        cupy.cuda.graph.GraphedFunction: The graphed function.
+
+    """
+    def wrapper(f):
+        return functools.update_wrapper(GraphedFunction(f, stream), f)
+
+    if func is None:
+        return wrapper
+    return wrapper(func)
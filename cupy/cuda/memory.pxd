@@ -43,6 +43,7 @@ cpdef MemoryPointer alloc(Py_ssize_t size)
 
 
 cpdef set_allocator(allocator=*)
+cpdef get_allocator()
 
 
 cdef class PooledMemory(Memory):
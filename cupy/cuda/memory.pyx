@@ -329,6 +329,15 @@ cpdef set_allocator(allocator=_malloc):
     _current_allocator = allocator
 
 
+cpdef get_allocator():
+    """Returns the current allocator.
+
+    .. seealso:: :func:`cupy.cuda.set_allocator`
+
+    """
+    return _current_allocator
+
+
 cdef class PooledMemory(Memory):
 
     """Memory allocation for a memory pool.
@@ -54,6 +54,14 @@ cpdef enum:
     CUDA_R_8U = 8  # 8 bit real as a signed integer
     CUDA_C_8U = 9  # 8 bit complex as a pair of signed integers
 
+    streamCaptureModeGlobal = 0
+    streamCaptureModeThreadLocal = 1
+    streamCaptureModeRelaxed = 2
+
+    streamCaptureStatusNone = 0
+    streamCaptureStatusActive = 1
+    streamCaptureStatusInvalidated = 2
+
     errorMemoryAllocation = 2
 
 
@@ -127,3 +135,16 @@ cpdef float eventElapsedTime(size_t start, size_t end) except *
 cpdef eventQuery(size_t event)
 cpdef eventRecord(size_t event, size_t stream)
 cpdef eventSynchronize(size_t event)
+
+
+###############################################################################
+# Graph
+###############################################################################
+
+cpdef streamBeginCapture(size_t stream, int mode=*)
+cpdef size_t streamEndCapture(size_t stream) except *
+cpdef int streamIsCapturing(size_t stream) except *
+cpdef size_t graphInstantiate(size_t graph) except *
+cpdef graphLaunch(size_t graphExec, size_t stream)
+cpdef graphExecDestroy(size_t graphExec)
+cpdef graphDestroy(size_t graph)
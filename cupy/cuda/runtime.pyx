@@ -39,6 +39,12 @@ cdef extern from *:
         driver.Stream stream, Error status, void* userData)
     ctypedef StreamCallbackDef* StreamCallback 'cudaStreamCallback_t'
 
+    ctypedef void* Graph 'cudaGraph_t'
+    ctypedef void* GraphExec 'cudaGraphExec_t'
+    ctypedef void* GraphNode 'cudaGraphNode_t'
+    ctypedef int StreamCaptureMode 'cudaStreamCaptureMode'
+    ctypedef int StreamCaptureStatus 'cudaStreamCaptureStatus'
+
 
 cdef extern from "cupy_cuda.h" nogil:
     # Types
@@ -109,6 +115,18 @@ cdef extern from "cupy_cuda.h" nogil:
     int cudaEventRecord(driver.Event event, driver.Stream stream)
     int cudaEventSynchronize(driver.Event event)
 
+    # Graph
+    int cudaStreamBeginCapture(driver.Stream stream, StreamCaptureMode mode)
+    int cudaStreamEndCapture(driver.Stream stream, Graph* pGraph)
+    int cudaStreamIsCapturing(driver.Stream stream,
+                              StreamCaptureStatus* pCaptureStatus)
+    int cudaGraphInstantiate(GraphExec* pGraphExec, Graph graph,
+                             GraphNode* pErrorNode, char* pLogBuffer,
+                             size_t bufferSize)
+    int cudaGraphLaunch(GraphExec graphExec, driver.Stream stream)
+    int cudaGraphExecDestroy(GraphExec graphExec)
+    int cudaGraphDestroy(Graph graph)
+
 
 ###############################################################################
 # Error handling
@@ -385,3 +403,50 @@ cpdef eventSynchronize(size_t event):
     with nogil:
         status = cudaEventSynchronize(<driver.Event>event)
     check_status(status)
+
+
+###############################################################################
+# Graph
+###############################################################################
+
+cpdef streamBeginCapture(size_t stream, int mode=streamCaptureModeRelaxed):
+    status = cudaStreamBeginCapture(<driver.Stream>stream,
+                                    <StreamCaptureMode>mode)
+    check_status(status)
+
+
+cpdef size_t streamEndCapture(size_t stream) except *:
+    cdef Graph graph
+    status = cudaStreamEndCapture(<driver.Stream>stream, &graph)
+    check_status(status)
+    return <size_t>graph
+
+
+cpdef int streamIsCapturing(size_t stream) except *:
+    cdef StreamCaptureStatus capture_status
+    status = cudaStreamIsCapturing(<driver.Stream>stream, &capture_status)
+    check_status(status)
+    return <int>capture_status
+
+
+cpdef size_t graphInstantiate(size_t graph) except *:
+    cdef GraphExec graph_exec
+    status = cudaGraphInstantiate(&graph_exec, <Graph>graph, NULL, NULL, 0)
+    check_status(status)
+    return <size_t>graph_exec
+
+
+cpdef graphLaunch(size_t graphExec, size_t stream):
+    with nogil:
+        status = cudaGraphLaunch(<GraphExec>graphExec, <driver.Stream>stream)
+    check_status(status)
+
+
+cpdef graphExecDestroy(size_t graphExec):
+    status = cudaGraphExecDestroy(<GraphExec>graphExec)
+    check_status(status)
+
+
+cpdef graphDestroy(size_t graph):
+    status = cudaGraphDestroy(<Graph>graph)
+    check_status(status)
@@ -1,6 +1,11 @@
+import threading
+
 from cupy.cuda import runtime
 
 
+_thread_local = threading.local()
+
+
 class Event(object):
 
     """CUDA event, a synchronization point of CUDA streams.
@@ -113,6 +118,30 @@ class Stream(object):
         if self.ptr:
             runtime.streamDestroy(self.ptr)
 
+    def __enter__(self):
+        if not hasattr(_thread_local, 'prev_streams'):
+            _thread_local.prev_streams = []
+        _thread_local.prev_streams.append(get_current_stream())
+        self.use()
+        return self
+
+    def __exit__(self, *args):
+        _thread_local.prev_streams.pop().use()
+
+    def use(self):
+        """Makes this stream the current stream of the current thread.
+
+        Kernels launched without an explicit stream are enqueued to the
+        current stream. A stream can also be made current in a ``with``
+        block.
+
+        Returns:
+            cupy.cuda.Stream: This stream.
+
+        """
+        _thread_local.current_stream = self
+        return self
+
     @property
     def done(self):
         """True if all work on this stream has been done."""
@@ -167,3 +196,16 @@ class Stream(object):
 
 
 Stream.null = Stream(null=True)
+
+
+def get_current_stream():
+    """Returns the current stream of the current thread.
+
+    The null stream is returned unless another stream is made current by
+    :meth:`Stream.use` or a ``with`` block.
+
+    Returns:
+        cupy.cuda.Stream: The current stream.
+
+    """
+    return getattr(_thread_local, 'current_stream', Stream.null)
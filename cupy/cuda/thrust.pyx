@@ -14,45 +14,70 @@ from cupy.cuda cimport common
 ###############################################################################
 
 cdef extern from "../cuda/cupy_thrust.h" namespace "cupy::thrust":
-    void _sort[T](void *, size_t *, const vector.vector[ptrdiff_t]&)
+    void _sort[T](void *, void *, bint, const vector.vector[ptrdiff_t]&)
     void _lexsort[T](size_t *, void *, size_t, size_t)
-    void _argsort[T](size_t *, void *, void *, const vector.vector[ptrdiff_t]&)
+    void _argsort[T](size_t *, void *, void *, bint,
+                     const vector.vector[ptrdiff_t]&)
 
 
 ###############################################################################
 # Python interface
 ###############################################################################
 
+cdef size_t _max_32bit_segments = 0xffffffff
+
+
+cdef bint _uses_32bit_keys(vector.vector[ptrdiff_t]& shape):
+    cdef size_t nrows = 1
+    for i in range(<Py_ssize_t>shape.size() - 1):
+        nrows *= shape[i]
+    return nrows <= _max_32bit_segments
+
+
+cpdef get_segment_key_dtype(vector.vector[ptrdiff_t]& shape):
+    """Returns the dtype of the keys array for sorting the rows of an array.
+
+    The keys array passed to :func:`sort` and :func:`argsort` has the same
+    size as the data. The keys are 32-bit if the number of rows fits in 32
+    bits, which halves the memory traffic of the segmented sort.
+
+    """
+    if _uses_32bit_keys(shape):
+        return numpy.uint32
+    return numpy.uint64
+
+
 cpdef sort(dtype, size_t data_start, size_t keys_start,
            vector.vector[ptrdiff_t]& shape):
 
     cdef void *_data_start
-    cdef size_t *_keys_start
+    cdef void *_keys_start
+    cdef bint keys32 = _uses_32bit_keys(shape)
 
     _data_start = <void *>data_start
-    _keys_start = <size_t *>keys_start
+    _keys_start = <void *>keys_start
 
     # TODO(takagi): Support float16 and bool
     if dtype == numpy.int8:
-        _sort[common.cpy_byte](_data_start, _keys_start, shape)
+        _sort[common.cpy_byte](_data_start, _keys_start, keys32, shape)
     elif dtype == numpy.uint8:
-        _sort[common.cpy_ubyte](_data_start, _keys_start, shape)
+        _sort[common.cpy_ubyte](_data_start, _keys_start, keys32, shape)
     elif dtype == numpy.int16:
-        _sort[common.cpy_short](_data_start, _keys_start, shape)
+        _sort[common.cpy_short](_data_start, _keys_start, keys32, shape)
     elif dtype == numpy.uint16:
-        _sort[common.cpy_ushort](_data_start, _keys_start, shape)
+        _sort[common.cpy_ushort](_data_start, _keys_start, keys32, shape)
     elif dtype == numpy.int32:
-        _sort[common.cpy_int](_data_start, _keys_start, shape)
+        _sort[common.cpy_int](_data_start, _keys_start, keys32, shape)
     elif dtype == numpy.uint32:
-        _sort[common.cpy_uint](_data_start, _keys_start, shape)
+        _sort[common.cpy_uint](_data_start, _keys_start, keys32, shape)
     elif dtype == numpy.int64:
-        _sort[common.cpy_long](_data_start, _keys_start, shape)
+        _sort[common.cpy_long](_data_start, _keys_start, keys32, shape)
     elif dtype == numpy.uint64:
-        _sort[common.cpy_ulong](_data_start, _keys_start, shape)
+        _sort[common.cpy_ulong](_data_start, _keys_start, keys32, shape)
     elif dtype == numpy.float32:
-        _sort[common.cpy_float](_data_start, _keys_start, shape)
+        _sort[common.cpy_float](_data_start, _keys_start, keys32, shape)
     elif dtype == numpy.float64:
-        _sort[common.cpy_double](_data_start, _keys_start, shape)
+        _sort[common.cpy_double](_data_start, _keys_start, keys32, shape)
     else:
         raise NotImplementedError('Sorting arrays with dtype \'{}\' is not '
                                   'supported'.format(dtype))
@@ -91,36 +116,46 @@ cpdef lexsort(dtype, size_t idx_start, size_t keys_start, size_t k, size_t n):
 
 cpdef argsort(dtype, size_t idx_start, size_t data_start, size_t keys_start,
               vector.vector[ptrdiff_t]& shape):
-    cdef size_t *_idx_start, *_keys_start
+    cdef size_t *_idx_start
     cdef void *_data_start
+    cdef void *_keys_start
+    cdef bint keys32 = _uses_32bit_keys(shape)
 
     _idx_start = <size_t *>idx_start
     _data_start = <void *>data_start
-    _keys_start = <size_t *>keys_start
+    _keys_start = <void *>keys_start
 
     # TODO(takagi): Support float16 and bool
     if dtype == numpy.int8:
-        _argsort[common.cpy_byte](_idx_start, _data_start, _keys_start, shape)
+        _argsort[common.cpy_byte](
+            _idx_start, _data_start, _keys_start, keys32, shape)
     elif dtype == numpy.uint8:
-        _argsort[common.cpy_ubyte](_idx_start, _data_start, _keys_start, shape)
+        _argsort[common.cpy_ubyte](
+            _idx_start, _data_start, _keys_start, keys32, shape)
     elif dtype == numpy.int16:
-        _argsort[common.cpy_short](_idx_start, _data_start, _keys_start, shape)
+        _argsort[common.cpy_short](
+            _idx_start, _data_start, _keys_start, keys32, shape)
     elif dtype == numpy.uint16:
         _argsort[common.cpy_ushort](
-            _idx_start, _data_start, _keys_start, shape)
+            _idx_start, _data_start, _keys_start, keys32, shape)
     elif dtype == numpy.int32:
-        _argsort[common.cpy_int](_idx_start, _data_start, _keys_start, shape)
+        _argsort[common.cpy_int](
+            _idx_start, _data_start, _keys_start, keys32, shape)
     elif dtype == numpy.uint32:
-        _argsort[common.cpy_uint](_idx_start, _data_start, _keys_start, shape)
+        _argsort[common.cpy_uint](
+            _idx_start, _data_start, _keys_start, keys32, shape)
     elif dtype == numpy.int64:
-        _argsort[common.cpy_long](_idx_start, _data_start, _keys_start, shape)
+        _argsort[common.cpy_long](
+            _idx_start, _data_start, _keys_start, keys32, shape)
     elif dtype == numpy.uint64:
-        _argsort[common.cpy_ulong](_idx_start, _data_start, _keys_start, shape)
+        _argsort[common.cpy_ulong](
+            _idx_start, _data_start, _keys_start, keys32, shape)
     elif dtype == numpy.float32:
-        _argsort[common.cpy_float](_idx_start, _data_start, _keys_start, shape)
+        _argsort[common.cpy_float](
+            _idx_start, _data_start, _keys_start, keys32, shape)
     elif dtype == numpy.float64:
         _argsort[common.cpy_double](
-            _idx_start, _data_start, _keys_start, shape)
+            _idx_start, _data_start, _keys_start, keys32, shape)
     else:
         raise NotImplementedError('Sorting arrays with dtype \'{}\' is not '
                                   'supported'.format(dtype))
@@ -8,6 +8,7 @@ import cupy
 from cupy.core import internal
 from cupy import cuda
 from cupy.cuda import cudnn
+from cupy.prof.auto_range import annotate_routine
 
 
 _cudnn_version = cudnn.getVersion()
@@ -205,6 +206,7 @@ def _as4darray(arr):
         return arr.reshape(arr.shape[0], -1, 1, 1)
 
 
+@annotate_routine('cupy.cudnn.activation_forward')
 def activation_forward(x, mode):
     x = cupy.ascontiguousarray(x)
     y = cupy.empty_like(x)
@@ -225,6 +227,7 @@ def activation_forward(x, mode):
     return y
 
 
+@annotate_routine('cupy.cudnn.activation_backward')
 def activation_backward(x, y, gy, mode):
     x = cupy.ascontiguousarray(x)
     gy = cupy.ascontiguousarray(gy)
@@ -316,6 +319,7 @@ def create_spatial_transformer_descriptor(sampler_type, dtype, nb_dims, dim_A):
     return desc
 
 
+@annotate_routine('cupy.cudnn.add_tensor')
 def add_tensor(handle, alpha, biasDesc, biasData, beta, srcDestDesc,
                srcDestData):
     cudnn.addTensor_v3(handle, alpha, biasDesc,
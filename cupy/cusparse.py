@@ -3,6 +3,7 @@ import numpy
 import cupy
 from cupy.cuda import cusparse
 from cupy.cuda import device
+from cupy.prof.auto_range import annotate_routine
 
 
 class MatDescriptor(object):
@@ -52,6 +53,7 @@ def _call_cusparse(name, dtype, *args):
     return f(*args)
 
 
+@annotate_routine('cupy.cusparse.csrmv')
 def csrmv(a, x, y=None, alpha=1, beta=0, transa=False):
     """Matrix-vector product for a CSR-matrix and a dense vector.
 
@@ -98,6 +100,7 @@ def csrmv(a, x, y=None, alpha=1, beta=0, transa=False):
     return y
 
 
+@annotate_routine('cupy.cusparse.csrmm')
 def csrmm(a, b, c=None, alpha=1, beta=0, transa=False):
     """Matrix-matrix product for a CSR-matrix and a dense matrix.
 
@@ -150,6 +153,7 @@ def csrmm(a, b, c=None, alpha=1, beta=0, transa=False):
     return c
 
 
+@annotate_routine('cupy.cusparse.csrmm2')
 def csrmm2(a, b, c=None, alpha=1.0, beta=0.0, transa=False, transb=False):
     """Matrix-matrix product for a CSR-matrix and a dense matrix.
 
@@ -206,6 +210,7 @@ def csrmm2(a, b, c=None, alpha=1.0, beta=0.0, transa=False, transb=False):
     return c
 
 
+@annotate_routine('cupy.cusparse.csrgeam')
 def csrgeam(a, b, alpha=1, beta=1):
     """Matrix-matrix addition.
 
@@ -258,6 +263,7 @@ def csrgeam(a, b, alpha=1, beta=1):
     return cupy.sparse.csr_matrix((c_data, c_indices, c_indptr), shape=a.shape)
 
 
+@annotate_routine('cupy.cusparse.csrgemm')
 def csrgemm(a, b, transa=False, transb=False):
     """Matrix-matrix product for CSR-matrix.
 
@@ -316,6 +322,7 @@ def csrgemm(a, b, transa=False, transb=False):
     return cupy.sparse.csr_matrix((c_data, c_indices, c_indptr), shape=(m, n))
 
 
+@annotate_routine('cupy.cusparse.csr2dense')
 def csr2dense(x, out=None):
     """Converts CSR-matrix to a dense matrix.
 
@@ -345,6 +352,7 @@ def csr2dense(x, out=None):
     return out
 
 
+@annotate_routine('cupy.cusparse.csc2dense')
 def csc2dense(x, out=None):
     """Converts CSC-matrix to a dense matrix.
 
@@ -374,6 +382,7 @@ def csc2dense(x, out=None):
     return out
 
 
+@annotate_routine('cupy.cusparse.csrsort')
 def csrsort(x):
     """Sorts indices of CSR-matrix in place.
 
@@ -388,18 +397,19 @@ def csrsort(x):
     buffer_size = cusparse.xcsrsort_bufferSizeExt(
         handle, m, n, nnz, x.indptr.data.ptr,
         x.indices.data.ptr)
-    buf = cupy.empty(buffer_size, 'b')
+    buf = device.get_cusparse_workspace(buffer_size)
     P = cupy.empty(nnz, 'i')
     cusparse.createIdentityPermutation(handle, nnz, P.data.ptr)
     cusparse.xcsrsort(
         handle, m, n, nnz, x._descr.descriptor, x.indptr.data.ptr,
-        x.indices.data.ptr, P.data.ptr, buf.data.ptr)
+        x.indices.data.ptr, P.data.ptr, buf.ptr)
     _call_cusparse(
         'gthr', x.dtype,
         handle, nnz, x.data.data.ptr, x.data.data.ptr,
         P.data.ptr, cusparse.CUSPARSE_INDEX_BASE_ZERO)
 
 
+@annotate_routine('cupy.cusparse.cscsort')
 def cscsort(x):
     """Sorts indices of CSC-matrix in place.
 
@@ -414,18 +424,19 @@ def cscsort(x):
     buffer_size = cusparse.xcscsort_bufferSizeExt(
         handle, m, n, nnz, x.indptr.data.ptr,
         x.indices.data.ptr)
-    buf = cupy.empty(buffer_size, 'b')
+    buf = device.get_cusparse_workspace(buffer_size)
     P = cupy.empty(nnz, 'i')
     cusparse.createIdentityPermutation(handle, nnz, P.data.ptr)
     cusparse.xcscsort(
         handle, m, n, nnz, x._descr.descriptor, x.indptr.data.ptr,
-        x.indices.data.ptr, P.data.ptr, buf.data.ptr)
+        x.indices.data.ptr, P.data.ptr, buf.ptr)
     _call_cusparse(
         'gthr', x.dtype,
         handle, nnz, x.data.data.ptr, x.data.data.ptr,
         P.data.ptr, cusparse.CUSPARSE_INDEX_BASE_ZERO)
 
 
+@annotate_routine('cupy.cusparse.coosort')
 def coosort(x):
     handle = device.get_cusparse_handle()
     m, n = x.shape
@@ -433,18 +444,19 @@ def coosort(x):
 
     buffer_size = cusparse.xcoosort_bufferSizeExt(
         handle, m, n, nnz, x.row.data.ptr, x.col.data.ptr)
-    buf = cupy.empty(buffer_size, 'b')
+    buf = device.get_cusparse_workspace(buffer_size)
     P = cupy.empty(nnz, 'i')
     cusparse.createIdentityPermutation(handle, nnz, P.data.ptr)
     cusparse.xcoosortByRow(
         handle, m, n, nnz, x.row.data.ptr, x.col.data.ptr,
-        P.data.ptr, buf.data.ptr)
+        P.data.ptr, buf.ptr)
     _call_cusparse(
         'gthr', x.dtype,
         handle, nnz, x.data.data.ptr, x.data.data.ptr,
         P.data.ptr, cusparse.CUSPARSE_INDEX_BASE_ZERO)
 
 
+@annotate_routine('cupy.cusparse.coo2csr')
 def coo2csr(x):
     handle = device.get_cusparse_handle()
     m = x.shape[0]
@@ -456,6 +468,7 @@ def coo2csr(x):
         (x.data, x.col, indptr), shape=x.shape)
 
 
+@annotate_routine('cupy.cusparse.csr2coo')
 def csr2coo(x, data, indices):
     """Converts a CSR-matrix to COO format.
 
@@ -480,6 +493,7 @@ def csr2coo(x, data, indices):
         (data, (row, indices)), shape=x.shape)
 
 
+@annotate_routine('cupy.cusparse.csr2csc')
 def csr2csc(x):
     handle = device.get_cusparse_handle()
     m, n = x.shape
@@ -0,0 +1,25 @@
+# Functions from the following NumPy document
+# https://docs.scipy.org/doc/numpy/reference/routines.fft.html
+
+# "NOQA" to suppress flake8 warning
+from cupy.fft import cache  # NOQA
+from cupy.fft.cache import get_plan_cache  # NOQA
+from cupy.fft.cache import PlanCache  # NOQA
+from cupy.fft.fft import fft  # NOQA
+from cupy.fft.fft import fft2  # NOQA
+from cupy.fft.fft import fftfreq  # NOQA
+from cupy.fft.fft import fftn  # NOQA
+from cupy.fft.fft import fftshift  # NOQA
+from cupy.fft.fft import hfft  # NOQA
+from cupy.fft.fft import ifft  # NOQA
+from cupy.fft.fft import ifft2  # NOQA
+from cupy.fft.fft import ifftn  # NOQA
+from cupy.fft.fft import ifftshift  # NOQA
+from cupy.fft.fft import ihfft  # NOQA
+from cupy.fft.fft import irfft  # NOQA
+from cupy.fft.fft import irfft2  # NOQA
+from cupy.fft.fft import irfftn  # NOQA
+from cupy.fft.fft import rfft  # NOQA
+from cupy.fft.fft import rfft2  # NOQA
+from cupy.fft.fft import rfftfreq  # NOQA
+from cupy.fft.fft import rfftn  # NOQA
@@ -0,0 +1,166 @@
+import collections
+import threading
+
+from cupy.cuda import cufft
+from cupy.cuda import device
+from cupy.cuda import memory
+from cupy.cuda import stream
+
+
+_thread_local = threading.local()
+
+_default_cache_size = 16
+
+
+class Plan(object):
+
+    """cuFFT plan of batched transforms of contiguous arrays.
+
+    The work area of the plan is allocated from the memory pool of CuPy
+    instead of being allocated by cuFFT, and it is released when the plan is
+    destroyed.
+
+    Args:
+        shape (tuple of ints): Shape of each transform.
+        fft_type (int): Type of the transforms such as
+            ``cupy.cuda.cufft.CUFFT_C2C``.
+        batch (int): Number of the transforms.
+
+    Attributes:
+        handle (int): Raw handle of the plan.
+        work_area (cupy.cuda.MemoryPointer): Work area of the plan.
+
+    """
+
+    def __init__(self, shape, fft_type, batch):
+        self.shape = shape
+        self.fft_type = fft_type
+        self.batch = batch
+        self.work_area = None
+        self.handle = cufft.create()
+        try:
+            cufft.setAutoAllocation(self.handle, 0)
+            work_size = cufft.makePlanMany(self.handle, shape, fft_type, batch)
+            self.work_area = memory.alloc(work_size)
+            if work_size > 0:
+                cufft.setWorkArea(self.handle, self.work_area.ptr)
+        except Exception:
+            cufft.destroy(self.handle)
+            self.handle = None
+            raise
+
+    def __del__(self):
+        if self.handle is not None:
+            cufft.destroy(self.handle)
+            self.handle = None
+
+    def execute(self, a, out, direction):
+        """Runs the transforms on the current stream.
+
+        Args:
+            a (cupy.ndarray): C-contiguous input array.
+            out (cupy.ndarray): C-contiguous output array.
+            direction (int): ``cupy.cuda.cufft.CUFFT_FORWARD`` or
+                ``cupy.cuda.cufft.CUFFT_INVERSE``. It is ignored by the real
+                transforms.
+
+        """
+        handle = self.handle
+        cufft.setStream(handle, stream.get_current_stream().ptr)
+        fft_type = self.fft_type
+        if fft_type == cufft.CUFFT_C2C:
+            cufft.execC2C(handle, a.data.ptr, out.data.ptr, direction)
+        elif fft_type == cufft.CUFFT_Z2Z:
+            cufft.execZ2Z(handle, a.data.ptr, out.data.ptr, direction)
+        elif fft_type == cufft.CUFFT_R2C:
+            cufft.execR2C(handle, a.data.ptr, out.data.ptr)
+        elif fft_type == cufft.CUFFT_D2Z:
+            cufft.execD2Z(handle, a.data.ptr, out.data.ptr)
+        elif fft_type == cufft.CUFFT_C2R:
+            cufft.execC2R(handle, a.data.ptr, out.data.ptr)
+        elif fft_type == cufft.CUFFT_Z2D:
+            cufft.execZ2D(handle, a.data.ptr, out.data.ptr)
+        else:
+            raise ValueError('Unknown FFT type: %d' % fft_type)
+
+
+class PlanCache(object):
+
+    """LRU cache of cuFFT plans.
+
+    The plans are keyed on the device, the shape of each transform, the type
+    of the transforms and the batch size. When the number of the plans
+    exceeds the size of the cache, the least recently used plan is dropped
+    and its work area is returned to the memory pool.
+
+    Args:
+        size (int): Maximum number of the plans kept in the cache. If it is
+            ``0``, no plan is kept.
+
+    """
+
+    def __init__(self, size=_default_cache_size):
+        if size < 0:
+            raise ValueError('size must be non-negative')
+        self._size = size
+        self._plans = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._plans)
+
+    @property
+    def size(self):
+        """Maximum number of the plans kept in the cache."""
+        return self._size
+
+    def set_size(self, size):
+        """Changes the size of the cache, dropping the plans over it."""
+        if size < 0:
+            raise ValueError('size must be non-negative')
+        self._size = size
+        self._evict()
+
+    def clear(self):
+        """Drops all the plans."""
+        self._plans.clear()
+
+    def get(self, shape, fft_type, batch):
+        """Returns a plan for the current device, creating it if not cached.
+
+        Args:
+            shape (tuple of ints): Shape of each transform.
+            fft_type (int): Type of the transforms.
+            batch (int): Number of the transforms.
+
+        Returns:
+            Plan: The plan.
+
+        """
+        key = (device.get_device_id(), shape, fft_type, batch)
+        plan = self._plans.pop(key, None)
+        if plan is None:
+            plan = Plan(shape, fft_type, batch)
+        if self._size > 0:
+            self._plans[key] = plan
+            self._evict()
+        return plan
+
+    def _evict(self):
+        while len(self._plans) > self._size:
+            self._plans.popitem(last=False)
+
+
+def get_plan_cache():
+    """Returns the cache of cuFFT plans of the current thread.
+
+    Plans are not shared between threads, since a plan holds a single work
+    area and cannot run on two streams at the same time.
+
+    Returns:
+        PlanCache: The cache.
+
+    """
+    cache = getattr(_thread_local, 'plan_cache', None)
+    if cache is None:
+        cache = _thread_local.plan_cache = PlanCache()
+    return cache
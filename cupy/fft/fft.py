@@ -0,0 +1,492 @@
+import math
+
+import numpy
+import six
+
+import cupy
+from cupy.core import internal
+from cupy.cuda import cufft
+from cupy.fft import cache
+
+
+def _complex_dtype(dtype):
+    if dtype.char in 'efF':
+        return numpy.dtype(numpy.complex64)
+    return numpy.dtype(numpy.complex128)
+
+
+def _real_dtype(dtype):
+    if dtype.char in 'efF':
+        return numpy.dtype(numpy.float32)
+    return numpy.dtype(numpy.float64)
+
+
+def _check_norm(norm):
+    if norm not in (None, 'ortho'):
+        raise ValueError('Invalid norm value %s, should be None or "ortho".'
+                         % norm)
+
+
+def _cook_nd_args(a, s, axes, invreal=False):
+    ndim = a.ndim
+    if s is None:
+        if axes is None:
+            axes = six.moves.range(-ndim, 0)
+        s = [None] * len(axes)
+    s = list(s)
+    if axes is None:
+        axes = six.moves.range(-len(s), 0)
+    axes = list(axes)
+    if len(s) != len(axes):
+        raise ValueError('Shape and axes have different lengths.')
+    for i, ax in enumerate(axes):
+        if not -ndim <= ax < ndim:
+            raise ValueError('Axis out of range')
+        axes[i] = ax % ndim
+    for i, n in enumerate(s):
+        if n is None:
+            n = a.shape[axes[i]]
+            if invreal and i == len(s) - 1:
+                n = (n - 1) * 2
+            s[i] = n
+        if n < 1:
+            raise ValueError(
+                'Invalid number of FFT data points (%d) specified.' % n)
+    return s, axes
+
+
+def _resize(a, s, axes):
+    # Truncates or zero-pads the array along the axes.
+    for n, axis in zip(s, axes):
+        m = a.shape[axis]
+        if m == n:
+            continue
+        index = [slice(None)] * a.ndim
+        if m > n:
+            index[axis] = slice(0, n)
+            a = a[tuple(index)]
+        else:
+            shape = list(a.shape)
+            shape[axis] = n
+            z = cupy.zeros(shape, a.dtype)
+            index[axis] = slice(0, m)
+            z[tuple(index)] = a
+            a = z
+    return a
+
+
+def _exec_fft(a, axes, fft_type, direction, out_size=None):
+    # Runs a batched transform of rank len(axes) <= 3. The transformed axes
+    # are moved to the end so that the transforms of all the other indices
+    # are done by a single plan.
+    batch_axes = [i for i in six.moves.range(a.ndim) if i not in axes]
+    perm = batch_axes + list(axes)
+    a = a.transpose(perm)
+    if fft_type in (cufft.CUFFT_C2R, cufft.CUFFT_Z2D):
+        # The complex-to-real transforms overwrite the input.
+        a = a.copy()
+        n = a.shape[len(batch_axes):-1] + (out_size,)
+        out_shape = a.shape[:-1] + (out_size,)
+        dtype = _real_dtype(a.dtype)
+    elif fft_type in (cufft.CUFFT_R2C, cufft.CUFFT_D2Z):
+        a = cupy.ascontiguousarray(a)
+        n = a.shape[len(batch_axes):]
+        out_shape = a.shape[:-1] + (a.shape[-1] // 2 + 1,)
+        dtype = _complex_dtype(a.dtype)
+    else:
+        a = cupy.ascontiguousarray(a)
+        n = a.shape[len(batch_axes):]
+        out_shape = a.shape
+        dtype = a.dtype
+    out = cupy.empty(out_shape, dtype)
+    batch = internal.prod(a.shape[:len(batch_axes)])
+    if out.size != 0:
+        plan = cache.get_plan_cache().get(tuple(n), fft_type, batch)
+        plan.execute(a, out, direction)
+    return out.transpose(numpy.argsort(perm).tolist())
+
+
+def _fft_c2c(a, axes, direction):
+    # cuFFT supports transforms of at most three dimensions, so the axes are
+    # transformed by groups of up to three distinct axes.
+    fft_type = cufft.CUFFT_C2C
+    if a.dtype == numpy.complex128:
+        fft_type = cufft.CUFFT_Z2Z
+    group = []
+    for axis in reversed(axes):
+        if len(group) == 3 or axis in group:
+            a = _exec_fft(a, group[::-1], fft_type, direction)
+            group = []
+        group.append(axis)
+    if group:
+        a = _exec_fft(a, group[::-1], fft_type, direction)
+    return a
+
+
+def _normalize(a, s, direction, norm):
+    # The result of the transforms is owned by the caller, so it is scaled
+    # in place.
+    if norm is None and direction == cufft.CUFFT_FORWARD:
+        return a
+    size = internal.prod(s)
+    if norm == 'ortho':
+        a *= 1.0 / math.sqrt(size)
+    else:
+        a *= 1.0 / size
+    return a
+
+
+def _fftn(a, s, axes, norm, direction):
+    _check_norm(norm)
+    dtype = _complex_dtype(a.dtype)
+    if a.dtype != dtype:
+        a = a.astype(dtype)
+    s, axes = _cook_nd_args(a, s, axes)
+    if not axes:
+        return a.copy()
+    a = _resize(a, s, axes)
+    a = _fft_c2c(a, axes, direction)
+    return _normalize(a, s, direction, norm)
+
+
+def _rfftn(a, s, axes, norm):
+    _check_norm(norm)
+    if a.dtype.kind == 'c':
+        a = a.real
+    dtype = _real_dtype(a.dtype)
+    if a.dtype != dtype:
+        a = a.astype(dtype)
+    s, axes = _cook_nd_args(a, s, axes)
+    if not axes:
+        raise ValueError('At least one axis is required.')
+    a = _resize(a, s, axes)
+    fft_type = cufft.CUFFT_R2C
+    if dtype == numpy.float64:
+        fft_type = cufft.CUFFT_D2Z
+    a = _exec_fft(a, axes[-1:], fft_type, cufft.CUFFT_FORWARD)
+    a = _fft_c2c(a, axes[:-1], cufft.CUFFT_FORWARD)
+    return _normalize(a, s, cufft.CUFFT_FORWARD, norm)
+
+
+def _irfftn(a, s, axes, norm):
+    _check_norm(norm)
+    dtype = _complex_dtype(a.dtype)
+    if a.dtype != dtype:
+        a = a.astype(dtype)
+    s, axes = _cook_nd_args(a, s, axes, invreal=True)
+    if not axes:
+        raise ValueError('At least one axis is required.')
+    a = _resize(a, s[:-1] + [s[-1] // 2 + 1], axes)
+    a = _fft_c2c(a, axes[:-1], cufft.CUFFT_INVERSE)
+    fft_type = cufft.CUFFT_C2R
+    if dtype == numpy.complex128:
+        fft_type = cufft.CUFFT_Z2D
+    a = _exec_fft(a, axes[-1:], fft_type, cufft.CUFFT_INVERSE, s[-1])
+    return _normalize(a, s, cufft.CUFFT_INVERSE, norm)
+
+
+def fft(a, n=None, axis=-1, norm=None):
+    """Computes the one-dimensional discrete Fourier transform.
+
+    Args:
+        a (cupy.ndarray): Array to be transformed.
+        n (None or int): Length of the transformed axis of the output. If it
+            is larger than the length of the input, the input is padded with
+            zeros, and if it is smaller, the input is truncated.
+        axis (int): Axis over which to compute the transform. The other axes
+            are transformed by a single batched plan.
+        norm (None or ``'ortho'``): Normalization mode.
+
+    Returns:
+        cupy.ndarray: The transformed array. Its dtype is
+        :class:`numpy.complex64` if ``a`` is of single precision, or
+        :class:`numpy.complex128` otherwise.
+
+    .. seealso:: :func:`numpy.fft.fft`
+
+    """
+    return _fftn(a, None if n is None else (n,), (axis,), norm,
+                 cufft.CUFFT_FORWARD)
+
+
+def ifft(a, n=None, axis=-1, norm=None):
+    """Computes the one-dimensional inverse discrete Fourier transform.
+
+    .. seealso::
+       :func:`cupy.fft.fft` for the arguments,
+       :func:`numpy.fft.ifft`
+
+    """
+    return _fftn(a, None if n is None else (n,), (axis,), norm,
+                 cufft.CUFFT_INVERSE)
+
+
+def fft2(a, s=None, axes=(-2, -1), norm=None):
+    """Computes the two-dimensional discrete Fourier transform.
+
+    .. seealso::
+       :func:`cupy.fft.fftn` for the arguments,
+       :func:`numpy.fft.fft2`
+
+    """
+    return _fftn(a, s, axes, norm, cufft.CUFFT_FORWARD)
+
+
+def ifft2(a, s=None, axes=(-2, -1), norm=None):
+    """Computes the two-dimensional inverse discrete Fourier transform.
+
+    .. seealso::
+       :func:`cupy.fft.fftn` for the arguments,
+       :func:`numpy.fft.ifft2`
+
+    """
+    return _fftn(a, s, axes, norm, cufft.CUFFT_INVERSE)
+
+
+def fftn(a, s=None, axes=None, norm=None):
+    """Computes the N-dimensional discrete Fourier transform.
+
+    Args:
+        a (cupy.ndarray): Array to be transformed.
+        s (None or tuple of ints): Shape of the transformed axes of the
+            output. The input is padded with zeros or truncated to it.
+        axes (None or tuple of ints): Axes over which to compute the
+            transform. The last ``len(s)`` axes, or all the axes if ``s`` is
+            also ``None``, are transformed by default.
+        norm (None or ``'ortho'``): Normalization mode.
+
+    Returns:
+        cupy.ndarray: The transformed array.
+
+    .. seealso:: :func:`numpy.fft.fftn`
+
+    """
+    return _fftn(a, s, axes, norm, cufft.CUFFT_FORWARD)
+
+
+def ifftn(a, s=None, axes=None, norm=None):
+    """Computes the N-dimensional inverse discrete Fourier transform.
+
+    .. seealso::
+       :func:`cupy.fft.fftn` for the arguments,
+       :func:`numpy.fft.ifftn`
+
+    """
+    return _fftn(a, s, axes, norm, cufft.CUFFT_INVERSE)
+
+
+def rfft(a, n=None, axis=-1, norm=None):
+    """Computes the one-dimensional discrete Fourier transform of real input.
+
+    Args:
+        a (cupy.ndarray): Array to be transformed. The imaginary part is
+            discarded if it is complex.
+        n (None or int): Number of points of the input along the axis to use.
+        axis (int): Axis over which to compute the transform.
+        norm (None or ``'ortho'``): Normalization mode.
+
+    Returns:
+        cupy.ndarray: The transformed array. The length of the transformed
+        axis is ``n // 2 + 1``.
+
+    .. seealso:: :func:`numpy.fft.rfft`
+
+    """
+    return _rfftn(a, None if n is None else (n,), (axis,), norm)
+
+
+def irfft(a, n=None, axis=-1, norm=None):
+    """Computes the inverse of :func:`cupy.fft.rfft`.
+
+    Args:
+        a (cupy.ndarray): Array to be transformed.
+        n (None or int): Length of the transformed axis of the output. It is
+            ``2 * (m - 1)`` by default, where ``m`` is the length of the
+            input along the axis.
+        axis (int): Axis over which to compute the transform.
+        norm (None or ``'ortho'``): Normalization mode.
+
+    Returns:
+        cupy.ndarray: The real transformed array.
+
+    .. seealso:: :func:`numpy.fft.irfft`
+
+    """
+    return _irfftn(a, None if n is None else (n,), (axis,), norm)
+
+
+def rfft2(a, s=None, axes=(-2, -1), norm=None):
+    """Computes the two-dimensional discrete Fourier transform of real input.
+
+    .. seealso::
+       :func:`cupy.fft.rfftn` for the arguments,
+       :func:`numpy.fft.rfft2`
+
+    """
+    return _rfftn(a, s, axes, norm)
+
+
+def irfft2(a, s=None, axes=(-2, -1), norm=None):
+    """Computes the inverse of :func:`cupy.fft.rfft2`.
+
+    .. seealso::
+       :func:`cupy.fft.irfftn` for the arguments,
+       :func:`numpy.fft.irfft2`
+
+    """
+    return _irfftn(a, s, axes, norm)
+
+
+def rfftn(a, s=None, axes=None, norm=None):
+    """Computes the N-dimensional discrete Fourier transform of real input.
+
+    The last axis is transformed by a real-to-complex transform and the
+    others by complex-to-complex ones.
+
+    Args:
+        a (cupy.ndarray): Array to be transformed.
+        s (None or tuple of ints): Number of points of the input along the
+            axes to use.
+        axes (None or tuple of ints): Axes over which to compute the
+            transform.
+        norm (None or ``'ortho'``): Normalization mode.
+
+    Returns:
+        cupy.ndarray: The transformed array. The length of the last
+        transformed axis is ``s[-1] // 2 + 1``.
+
+    .. seealso:: :func:`numpy.fft.rfftn`
+
+    """
+    return _rfftn(a, s, axes, norm)
+
+
+def irfftn(a, s=None, axes=None, norm=None):
+    """Computes the inverse of :func:`cupy.fft.rfftn`.
+
+    Args:
+        a (cupy.ndarray): Array to be transformed.
+        s (None or tuple of ints): Shape of the transformed axes of the
+            output. The length of the last axis is ``2 * (m - 1)`` by
+            default, where ``m`` is the length of the input along it.
+        axes (None or tuple of ints): Axes over which to compute the
+            transform.
+        norm (None or ``'ortho'``): Normalization mode.
+
+    Returns:
+        cupy.ndarray: The real transformed array.
+
+    .. seealso:: :func:`numpy.fft.irfftn`
+
+    """
+    return _irfftn(a, s, axes, norm)
+
+
+def hfft(a, n=None, axis=-1, norm=None):
+    """Computes the FFT of a signal that has Hermitian symmetry.
+
+    .. seealso::
+       :func:`cupy.fft.irfft` for the arguments,
+       :func:`numpy.fft.hfft`
+
+    """
+    _check_norm(norm)
+    if n is None:
+        n = (a.shape[axis] - 1) * 2
+    out = irfft(a.conj(), n, axis)
+    out *= math.sqrt(n) if norm == 'ortho' else n
+    return out
+
+
+def ihfft(a, n=None, axis=-1, norm=None):
+    """Computes the inverse FFT of a signal that has Hermitian symmetry.
+
+    .. seealso::
+       :func:`cupy.fft.rfft` for the arguments,
+       :func:`numpy.fft.ihfft`
+
+    """
+    _check_norm(norm)
+    if n is None:
+        n = a.shape[axis]
+    out = rfft(a, n, axis).conj()
+    out *= 1.0 / (math.sqrt(n) if norm == 'ortho' else n)
+    return out
+
+
+def fftfreq(n, d=1.0):
+    """Returns the sample frequencies of the discrete Fourier transform.
+
+    Args:
+        n (int): Window length.
+        d (float): Sample spacing.
+
+    Returns:
+        cupy.ndarray: Array of length ``n`` of the sample frequencies.
+
+    .. seealso:: :func:`numpy.fft.fftfreq`
+
+    """
+    freq = cupy.empty(n, numpy.float64)
+    m = (n - 1) // 2 + 1
+    freq[:m] = cupy.arange(0, m, dtype=numpy.float64)
+    freq[m:] = cupy.arange(-(n // 2), 0, dtype=numpy.float64)
+    freq *= 1.0 / (n * d)
+    return freq
+
+
+def rfftfreq(n, d=1.0):
+    """Returns the sample frequencies of :func:`cupy.fft.rfft`.
+
+    Args:
+        n (int): Window length.
+        d (float): Sample spacing.
+
+    Returns:
+        cupy.ndarray: Array of length ``n // 2 + 1`` of the sample
+        frequencies.
+
+    .. seealso:: :func:`numpy.fft.rfftfreq`
+
+    """
+    freq = cupy.arange(0, n // 2 + 1, dtype=numpy.float64)
+    freq *= 1.0 / (n * d)
+    return freq
+
+
+def _shift(x, axes, sign):
+    if axes is None:
+        axes = six.moves.range(x.ndim)
+    elif isinstance(axes, six.integer_types):
+        axes = (axes,)
+    for axis in axes:
+        x = cupy.roll(x, sign * (x.shape[axis] // 2), axis)
+    return x
+
+
+def fftshift(x, axes=None):
+    """Shifts the zero-frequency component to the center of the spectrum.
+
+    Args:
+        x (cupy.ndarray): Input array.
+        axes (None, int or tuple of ints): Axes over which to shift. All the
+            axes are shifted by default.
+
+    Returns:
+        cupy.ndarray: The shifted array.
+
+    .. seealso:: :func:`numpy.fft.fftshift`
+
+    """
+    return _shift(x, axes, 1)
+
+
+def ifftshift(x, axes=None):
+    """Inverse of :func:`cupy.fft.fftshift`.
+
+    .. seealso::
+       :func:`cupy.fft.fftshift` for the arguments,
+       :func:`numpy.fft.ifftshift`
+
+    """
+    return _shift(x, axes, -1)
@@ -4,6 +4,7 @@
 # "NOQA" to suppress flake8 warning
 from cupy.linalg import decomposition  # NOQA
 from cupy.linalg import eigenvalue  # NOQA
+from cupy.linalg import einsum  # NOQA
 from cupy.linalg import norms  # NOQA
 from cupy.linalg.norms import det  # NOQA
 from cupy.linalg.norms import matrix_rank  # NOQA
@@ -11,6 +12,7 @@ from cupy.linalg.norms import norm  # NOQA
 from cupy.linalg.norms import slogdet  # NOQA
 from cupy.linalg import product  # NOQA
 from cupy.linalg import solve  # NOQA
+from cupy.linalg import status  # NOQA
 
 from cupy.linalg.decomposition import cholesky  # NOQA
 from cupy.linalg.decomposition import qr  # NOQA
@@ -19,5 +21,17 @@ from cupy.linalg.decomposition import svd  # NOQA
 from cupy.linalg.eigenvalue import eigh  # NOQA
 from cupy.linalg.eigenvalue import eigvalsh  # NOQA
 
+from cupy.linalg.product import gemm  # NOQA
+
+from cupy.linalg.solve import inv  # NOQA
+from cupy.linalg.solve import lu_factor  # NOQA
+from cupy.linalg.solve import lu_solve  # NOQA
+from cupy.linalg.solve import mixed_precision_solve  # NOQA
 from cupy.linalg.solve import solve  # NOQA
 from cupy.linalg.solve import tensorsolve  # NOQA
+
+from cupy.linalg.status import check_mode  # NOQA
+from cupy.linalg.status import check_status  # NOQA
+from cupy.linalg.status import get_check_mode  # NOQA
+from cupy.linalg.status import get_status  # NOQA
+from cupy.linalg.status import set_check_mode  # NOQA
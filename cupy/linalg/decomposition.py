@@ -1,16 +1,51 @@
 import numpy
 from numpy import linalg
+import six
 
 import cupy
 from cupy import cuda
 from cupy.cuda import cublas
 from cupy.cuda import device
+from cupy.linalg import status
 from cupy.linalg import util
+from cupy.prof.auto_range import annotate_routine
 
 if cuda.cusolver_enabled:
     from cupy.cuda import cusolver
 
 
+_cholesky_small_kernel = cupy.core.ElementwiseKernel(
+    'int32 n', 'raw T a, int32 info',
+    '''
+    T* m = &a[i * n * n];
+    info = 0;
+    for (int j = 0; j < n; ++j) {
+      T d = m[j * n + j];
+      for (int k = 0; k < j; ++k) {
+        d -= m[j * n + k] * m[j * n + k];
+      }
+      if (!(d > 0)) {
+        info = j + 1;
+        break;
+      }
+      d = sqrt(d);
+      m[j * n + j] = d;
+      for (int r = j + 1; r < n; ++r) {
+        T s = m[r * n + j];
+        for (int k = 0; k < j; ++k) {
+          s -= m[r * n + k] * m[j * n + k];
+        }
+        m[r * n + j] = s / d;
+      }
+      for (int c = j + 1; c < n; ++c) {
+        m[j * n + c] = 0;
+      }
+    }
+    ''',
+    'cupy_cholesky_small')
+
+
+@annotate_routine('cupy.linalg.cholesky')
 def cholesky(a):
     '''Cholesky decomposition.
 
@@ -19,17 +54,23 @@ def cholesky(a):
     transpose operator. Note that in the current implementation ``a`` must be
     a real matrix, and only float32 and float64 are supported.
 
+    Stacked matrices are decomposed at once. Small matrices are processed by
+    a single kernel, and larger ones by the batched routine of cuSOLVER if it
+    is available (CUDA 9.1 or later).
+
     Args:
-        a (cupy.ndarray): The input matrix with dimension ``(N, N)``
+        a (cupy.ndarray): The input matrix with dimension ``(..., N, N)``
 
     .. seealso:: :func:`numpy.linalg.cholesky`
     '''
     if not cuda.cusolver_enabled:
         raise RuntimeError('Current cupy only supports cusolver in CUDA 8.0')
 
-    # TODO(Saito): Current implementation only accepts two-dimensional arrays
     util._assert_cupy_array(a)
-    util._assert_rank2(a)
+    if a.ndim < 2:
+        raise linalg.LinAlgError(
+            '{}-dimensional array given. Array must be '
+            'at least two-dimensional'.format(a.ndim))
     util._assert_nd_squareness(a)
 
     # Cast to float32 or float64
@@ -39,35 +80,62 @@ def cholesky(a):
         dtype = numpy.find_common_type((a.dtype.char, 'f'), ()).char
 
     x = a.astype(dtype, order='C', copy=True)
+    if a.ndim > 2:
+        return _cholesky_batched(x)
+
     n = len(a)
     handle = device.get_cusolver_handle()
     dev_info = cupy.empty(1, dtype=numpy.int32)
     if dtype == 'f':
         buffersize = cusolver.spotrf_bufferSize(
             handle, cublas.CUBLAS_FILL_MODE_UPPER, n, x.data.ptr, n)
-        workspace = cupy.empty(buffersize, dtype=numpy.float32)
+        workspace = device.get_cusolver_workspace(buffersize * x.itemsize)
         cusolver.spotrf(
             handle, cublas.CUBLAS_FILL_MODE_UPPER, n, x.data.ptr, n,
-            workspace.data.ptr, buffersize, dev_info.data.ptr)
+            workspace.ptr, buffersize, dev_info.data.ptr)
     else:  # dtype == 'd'
         buffersize = cusolver.dpotrf_bufferSize(
             handle, cublas.CUBLAS_FILL_MODE_UPPER, n, x.data.ptr, n)
-        workspace = cupy.empty(buffersize, dtype=numpy.float64)
+        workspace = device.get_cusolver_workspace(buffersize * x.itemsize)
         cusolver.dpotrf(
             handle, cublas.CUBLAS_FILL_MODE_UPPER, n, x.data.ptr, n,
-            workspace.data.ptr, buffersize, dev_info.data.ptr)
-    status = int(dev_info[0])
-    if status > 0:
-        raise linalg.LinAlgError(
-            'The leading minor of order {} '
-            'is not positive definite'.format(status))
-    elif status < 0:
-        raise linalg.LinAlgError(
-            'Parameter error (maybe caused by a bug in cupy.linalg?)')
+            workspace.ptr, buffersize, dev_info.data.ptr)
+    status._check_info(
+        dev_info, 'The leading minor of order {} is not positive definite')
     util._tril(x, k=0)
     return x
 
 
+def _cholesky_batched(x):
+    n = x.shape[-1]
+    y = x.reshape(-1, n, n)
+    batch = len(y)
+    if batch == 0 or n == 0:
+        return x
+    info = cupy.empty(batch, dtype=numpy.int32)
+    if n <= util._batched_small_size:
+        _cholesky_small_kernel(n, y, info)
+    elif cuda.runtime.runtimeGetVersion() >= 9010:
+        # The lower triangle of the column-major matrix is the upper one of
+        # the C-contiguous matrix.
+        if x.dtype == 'f':
+            potrfBatched = cusolver.spotrfBatched
+        else:  # x.dtype == 'd'
+            potrfBatched = cusolver.dpotrfBatched
+        potrfBatched(
+            device.get_cusolver_handle(), cublas.CUBLAS_FILL_MODE_LOWER, n,
+            util._batched_pointers(y).data.ptr, n, info.data.ptr, batch)
+        util._triu(y, k=0)
+        x = y.swapaxes(1, 2).reshape(x.shape)
+    else:
+        for i in six.moves.range(batch):
+            y[i] = cholesky(y[i])
+        return x
+    status._check_info(info, 'Matrix is not positive definite')
+    return x
+
+
+@annotate_routine('cupy.linalg.qr')
 def qr(a, mode='reduced'):
     '''QR decomposition.
 
@@ -112,22 +180,19 @@ def qr(a, mode='reduced'):
     # compute working space of geqrf and ormqr, and solve R
     if dtype == 'f':
         buffersize = cusolver.sgeqrf_bufferSize(handle, m, n, x.data.ptr, n)
-        workspace = cupy.empty(buffersize, dtype=numpy.float32)
+        workspace = device.get_cusolver_workspace(buffersize * x.itemsize)
         tau = cupy.empty(mn, dtype=numpy.float32)
         cusolver.sgeqrf(
             handle, m, n, x.data.ptr, m,
-            tau.data.ptr, workspace.data.ptr, buffersize, dev_info.data.ptr)
+            tau.data.ptr, workspace.ptr, buffersize, dev_info.data.ptr)
     else:  # dtype == 'd'
         buffersize = cusolver.dgeqrf_bufferSize(handle, n, m, x.data.ptr, n)
-        workspace = cupy.empty(buffersize, dtype=numpy.float64)
+        workspace = device.get_cusolver_workspace(buffersize * x.itemsize)
         tau = cupy.empty(mn, dtype=numpy.float64)
         cusolver.dgeqrf(
             handle, m, n, x.data.ptr, m,
-            tau.data.ptr, workspace.data.ptr, buffersize, dev_info.data.ptr)
-    status = int(dev_info[0])
-    if status < 0:
-        raise linalg.LinAlgError(
-            'Parameter error (maybe caused by a bug in cupy.linalg?)')
+            tau.data.ptr, workspace.ptr, buffersize, dev_info.data.ptr)
+    status._check_info(dev_info)
 
     if mode == 'r':
         r = x[:, :mn].transpose()
@@ -154,23 +219,24 @@ def qr(a, mode='reduced'):
     if dtype == 'f':
         buffersize = cusolver.sorgqr_bufferSize(
             handle, m, mc, mn, q.data.ptr, m, tau.data.ptr)
-        workspace = cupy.empty(buffersize, dtype=numpy.float32)
+        workspace = device.get_cusolver_workspace(buffersize * x.itemsize)
         cusolver.sorgqr(
             handle, m, mc, mn, q.data.ptr, m, tau.data.ptr,
-            workspace.data.ptr, buffersize, dev_info.data.ptr)
+            workspace.ptr, buffersize, dev_info.data.ptr)
     else:
         buffersize = cusolver.dorgqr_bufferSize(
             handle, m, mc, mn, q.data.ptr, m, tau.data.ptr)
-        workspace = cupy.empty(buffersize, dtype=numpy.float64)
+        workspace = device.get_cusolver_workspace(buffersize * x.itemsize)
         cusolver.dorgqr(
             handle, m, mc, mn, q.data.ptr, m, tau.data.ptr,
-            workspace.data.ptr, buffersize, dev_info.data.ptr)
+            workspace.ptr, buffersize, dev_info.data.ptr)
 
     q = q[:mc].transpose()
     r = x[:, :mc].transpose()
     return q, util._triu(r)
 
 
+@annotate_routine('cupy.linalg.svd')
 def svd(a, full_matrices=True, compute_uv=True):
     '''Singular Value Decomposition.
 
@@ -234,26 +300,20 @@ def svd(a, full_matrices=True, compute_uv=True):
         job = ord('N')
     if dtype == 'f':
         buffersize = cusolver.sgesvd_bufferSize(handle, m, n)
-        workspace = cupy.empty(buffersize, dtype=dtype)
+        workspace = device.get_cusolver_workspace(buffersize * x.itemsize)
         cusolver.sgesvd(
             handle, job, job, m, n, x.data.ptr, m,
             s.data.ptr, u_ptr, m, vt_ptr, n,
-            workspace.data.ptr, buffersize, 0, dev_info.data.ptr)
+            workspace.ptr, buffersize, 0, dev_info.data.ptr)
     else:  # dtype == 'd'
         buffersize = cusolver.dgesvd_bufferSize(handle, m, n)
-        workspace = cupy.empty(buffersize, dtype=dtype)
+        workspace = device.get_cusolver_workspace(buffersize * x.itemsize)
         cusolver.dgesvd(
             handle, job, job, m, n, x.data.ptr, m,
             s.data.ptr, u_ptr, m, vt_ptr, n,
-            workspace.data.ptr, buffersize, 0, dev_info.data.ptr)
+            workspace.ptr, buffersize, 0, dev_info.data.ptr)
 
-    status = int(dev_info[0])
-    if status > 0:
-        raise linalg.LinAlgError(
-            'SVD computation does not converge')
-    elif status < 0:
-        raise linalg.LinAlgError(
-            'Parameter error (maybe caused by a bug in cupy.linalg?)')
+    status._check_info(dev_info, 'SVD computation does not converge')
 
     # Note that the returned array may need to be transporsed
     # depending on the structure of an input
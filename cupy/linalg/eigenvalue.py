@@ -1,23 +1,100 @@
+import numpy
+
 import cupy
 from cupy import cuda
 from cupy.cuda import cublas
 from cupy.cuda import device
+from cupy.linalg import status
+from cupy.prof.auto_range import annotate_routine
 
 if cuda.cusolver_enabled:
     from cupy.cuda import cusolver
 
 
-def _syevd(a, UPLO, with_eigen_vector):
-    if UPLO not in ('L', 'U'):
-        raise ValueError("UPLO argument must be 'L' or 'U'")
+# Stacked matrices up to this size are decomposed by the batched Jacobi
+# method, which is limited to small matrices.
+_syevj_batched_max_size = 32
 
+
+def _get_dtypes(a):
     if a.dtype == 'f' or a.dtype == 'e':
-        dtype = 'f'
-        ret_type = a.dtype
+        return 'f', a.dtype
     else:
         # NumPy uses float64 when an input is not floating point number.
-        dtype = 'd'
-        ret_type = 'd'
+        return 'd', 'd'
+
+
+@annotate_routine('cupy.linalg.eigh')
+def _eigh(a, UPLO, with_eigen_vector):
+    if UPLO not in ('L', 'U'):
+        raise ValueError("UPLO argument must be 'L' or 'U'")
+    if a.ndim == 2:
+        return _syevd(a, UPLO, with_eigen_vector)
+
+    ret_type = _get_dtypes(a)[1]
+    n = a.shape[-1]
+    batch_shape = a.shape[:-2]
+    if (0 < n <= _syevj_batched_max_size and a.size != 0 and
+            cuda.runtime.runtimeGetVersion() >= 9000):
+        return _syevj_batched(a, UPLO, with_eigen_vector)
+
+    w = cupy.empty(batch_shape + (n,), ret_type)
+    v = cupy.empty(batch_shape + (n, n), ret_type)
+    for index in numpy.ndindex(*batch_shape):
+        w[index], v[index] = _syevd(a[index], UPLO, with_eigen_vector)
+    return w, v
+
+
+def _syevj_batched(a, UPLO, with_eigen_vector):
+    dtype, ret_type = _get_dtypes(a)
+    n = a.shape[-1]
+    batch_shape = a.shape[:-2]
+
+    # Each matrix is transposed to the column-major order which cuSolver
+    # assumes.
+    v = a.swapaxes(-2, -1).astype(dtype, order='C', copy=True)
+    v = v.reshape(-1, n, n)
+    batch = len(v)
+    w = cupy.empty((batch, n), dtype)
+    dev_info = cupy.empty(batch, 'i')
+    handle = device.get_cusolver_handle()
+
+    if with_eigen_vector:
+        jobz = cusolver.CUSOLVER_EIG_MODE_VECTOR
+    else:
+        jobz = cusolver.CUSOLVER_EIG_MODE_NOVECTOR
+
+    if UPLO == 'L':
+        uplo = cublas.CUBLAS_FILL_MODE_LOWER
+    else:  # UPLO == 'U'
+        uplo = cublas.CUBLAS_FILL_MODE_UPPER
+
+    if dtype == 'f':
+        buffer_size = cusolver.ssyevjBatched_bufferSize
+        syevj = cusolver.ssyevjBatched
+    else:  # dtype == 'd'
+        buffer_size = cusolver.dsyevjBatched_bufferSize
+        syevj = cusolver.dsyevjBatched
+
+    params = cusolver.createSyevjInfo()
+    try:
+        work_size = buffer_size(
+            handle, jobz, uplo, n, v.data.ptr, n, w.data.ptr, params, batch)
+        work = device.get_cusolver_workspace(work_size * v.itemsize)
+        syevj(
+            handle, jobz, uplo, n, v.data.ptr, n, w.data.ptr,
+            work.ptr, work_size, dev_info.data.ptr, params, batch)
+    finally:
+        cusolver.destroySyevjInfo(params)
+    status._check_info(dev_info, 'Eigenvalues did not converge')
+
+    w = w.reshape(batch_shape + (n,))
+    v = v.swapaxes(-2, -1).reshape(batch_shape + (n, n))
+    return w.astype(ret_type, copy=False), v.astype(ret_type, copy=False)
+
+
+def _syevd(a, UPLO, with_eigen_vector):
+    dtype, ret_type = _get_dtypes(a)
 
     # Note that cuSolver assumes fortran array
     v = a.astype(dtype, order='F', copy=True)
@@ -25,7 +102,7 @@ def _syevd(a, UPLO, with_eigen_vector):
     m, lda = a.shape
     w = cupy.empty(m, dtype)
     dev_info = cupy.empty((), 'i')
-    handle = device.Device().cusolver_handle
+    handle = device.get_cusolver_handle()
 
     if with_eigen_vector:
         jobz = cusolver.CUSOLVER_EIG_MODE_VECTOR
@@ -48,10 +125,11 @@ def _syevd(a, UPLO, with_eigen_vector):
 
     work_size = buffer_size(
         handle, jobz, uplo, m, v.data.ptr, lda, w.data.ptr)
-    work = cupy.empty(work_size, dtype)
+    work = device.get_cusolver_workspace(work_size * v.itemsize)
     syevd(
         handle, jobz, uplo, m, v.data.ptr, lda,
-        w.data.ptr, work.data.ptr, work_size, dev_info.data.ptr)
+        w.data.ptr, work.ptr, work_size, dev_info.data.ptr)
+    status._check_info(dev_info, 'Eigenvalues did not converge')
 
     return w.astype(ret_type, copy=False), v.astype(ret_type, copy=False)
 
@@ -67,28 +145,31 @@ def eigh(a, UPLO='L'):
 
     .. note::
 
-       Currenlty only 2-D matrix is supported.
+       Stacked matrices of dimension ``(..., M, M)`` are also supported.
+       Small ones are decomposed at once by the batched Jacobi method if it
+       is available (CUDA 9.0 or later).
 
     .. note::
 
        CUDA >=8.0 is required.
 
     Args:
-        a (cupy.ndarray): A symmetric 2-D square matrix.
+        a (cupy.ndarray): A symmetric 2-D square matrix or stacked
+            matrices with dimension ``(..., M, M)``.
         UPLO (str): Select from ``'L'`` or ``'U'``. It specifies which
             part of ``a`` is used. ``'L'`` uses the lower triangular part of
             ``a``, and ``'U'`` uses the upper triangular part of ``a``.
     Returns:
         tuple of :class:`~cupy.ndarray`:
             Returns a tuple ``(w, v)``. ``w`` contains eigenvalues and
-            ``v`` contains eigenvectors. ``v[:, i]`` is an eigenvector
-            corresponding to an eigenvalue ``w[i]``.
+            ``v`` contains eigenvectors. ``v[..., :, i]`` is an eigenvector
+            corresponding to an eigenvalue ``w[..., i]``.
 
     .. seealso:: :func:`numpy.linalg.eigh`
     """
     if not cuda.cusolver_enabled:
         raise RuntimeError('Current cupy only supports cusolver in CUDA 8.0')
-    return _syevd(a, UPLO, True)
+    return _eigh(a, UPLO, True)
 
 
 # TODO(okuta): Implement eigvals
@@ -103,14 +184,17 @@ def eigvalsh(a, UPLO='L'):
 
     .. note::
 
-       Currenlty only 2-D matrix is supported.
+       Stacked matrices of dimension ``(..., M, M)`` are also supported.
+       Small ones are decomposed at once by the batched Jacobi method if it
+       is available (CUDA 9.0 or later).
 
     .. note::
 
        CUDA >=8.0 is required.
 
     Args:
-        a (cupy.ndarray): A symmetric 2-D square matrix.
+        a (cupy.ndarray): A symmetric 2-D square matrix or stacked
+            matrices with dimension ``(..., M, M)``.
         UPLO (str): Select from ``'L'`` or ``'U'``. It specifies which
             part of ``a`` is used. ``'L'`` uses the lower triangular part of
             ``a``, and ``'U'`` uses the upper triangular part of ``a``.
@@ -122,4 +206,4 @@ def eigvalsh(a, UPLO='L'):
     """
     if not cuda.cusolver_enabled:
         raise RuntimeError('Current cupy only supports cusolver in CUDA 8.0')
-    return _syevd(a, UPLO, False)[0]
+    return _eigh(a, UPLO, False)[0]
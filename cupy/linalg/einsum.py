@@ -0,0 +1,484 @@
+import string
+
+import numpy
+import six
+
+import cupy
+from cupy import core
+from cupy import util
+
+
+# Labels are represented by integers. Letters are represented by their code
+# points, and the broadcast dimensions of an ellipsis by negative integers
+# counted from the last one, so that they are sorted before the letters.
+
+
+def _parse_term(term, ndim, n_ellipsis=None):
+    # Converts a term of subscripts to a list of labels. n_ellipsis is the
+    # number of dimensions of an ellipsis in an output term.
+    for c in term.replace('...', ''):
+        if c not in string.ascii_letters:
+            raise ValueError(
+                'einstein sum subscripts string contains a \'%s\', which '
+                'is not a valid label' % c)
+    if '...' not in term:
+        if ndim is not None and len(term) != ndim:
+            raise ValueError(
+                'einstein sum subscripts string \'%s\' does not match the '
+                'number of dimensions %d of the operand' % (term, ndim))
+        return [ord(c) for c in term]
+
+    head, _, tail = term.partition('...')
+    if '.' in head or '.' in tail:
+        raise ValueError(
+            'einstein sum subscripts string contains a \'.\' that is not '
+            'part of an ellipsis (\'...\')')
+    if n_ellipsis is None:
+        n_ellipsis = ndim - len(head) - len(tail)
+        if n_ellipsis < 0:
+            raise ValueError(
+                'einstein sum subscripts string \'%s\' has more labels than '
+                'the number of dimensions %d of the operand' % (term, ndim))
+    return ([ord(c) for c in head] +
+            list(six.moves.range(-n_ellipsis, 0)) +
+            [ord(c) for c in tail])
+
+
+def _parse_subscripts(subscripts, ndims):
+    """Parses the subscripts of einsum.
+
+    Args:
+        subscripts (str): Subscripts of the einstein summation.
+        ndims (tuple of ints): Numbers of dimensions of the operands.
+
+    Returns:
+        tuple: A list of the label lists of the operands and the label list
+        of the output.
+
+    """
+    subscripts = subscripts.replace(' ', '')
+    if subscripts.count('->') > 1:
+        raise ValueError(
+            'einstein sum subscripts string may include only one \'->\'')
+    if '->' in subscripts:
+        in_subscripts, out_subscripts = subscripts.split('->')
+    else:
+        in_subscripts, out_subscripts = subscripts, None
+    terms = in_subscripts.split(',')
+    if len(terms) != len(ndims):
+        raise ValueError(
+            'The number of operands %d does not match the number of terms '
+            '%d in the subscripts' % (len(ndims), len(terms)))
+
+    inputs = [_parse_term(term, ndim) for term, ndim in zip(terms, ndims)]
+    n_ellipsis = 0
+    for labels in inputs:
+        n_ellipsis = max([n_ellipsis] + [-label for label in labels])
+
+    if out_subscripts is None:
+        # Implicit mode: the broadcast dimensions followed by the labels
+        # appearing only once in alphabetical order.
+        counts = {}
+        for labels in inputs:
+            for label in labels:
+                counts[label] = counts.get(label, 0) + 1
+        output = list(six.moves.range(-n_ellipsis, 0))
+        output += sorted(
+            label for label, c in six.iteritems(counts)
+            if c == 1 and label >= 0)
+    else:
+        output = _parse_term(out_subscripts, None, n_ellipsis)
+        all_labels = set()
+        for labels in inputs:
+            all_labels.update(labels)
+        for label in output:
+            if label >= 0 and label not in all_labels:
+                raise ValueError(
+                    'einstein sum subscripts string included output '
+                    'subscript \'%s\' which never appeared in an input' %
+                    chr(label))
+        if len(set(output)) != len(output):
+            raise ValueError(
+                'einstein sum subscripts string includes output subscript '
+                'multiple times')
+    return inputs, output
+
+
+# Integers in sublists are mapped to letters in the same order as NumPy,
+# which decides the order of the implicit output.
+_sublist_letters = string.ascii_uppercase + string.ascii_lowercase
+
+
+def _subscripts_from_sublists(operands):
+    # Converts the interleaved form einsum(op0, sublist0, op1, sublist1, ...,
+    # [sublistout]) to the subscripts string form.
+    def to_term(sublist):
+        term = []
+        for s in sublist:
+            if s is Ellipsis:
+                term.append('...')
+            elif 0 <= s < len(_sublist_letters):
+                term.append(_sublist_letters[s])
+            else:
+                raise ValueError(
+                    'subscript is not within the valid range [0, 52)')
+        return ''.join(term)
+
+    arrays = list(operands[0::2])
+    terms = [to_term(s) for s in operands[1::2]]
+    if len(operands) % 2 == 1:
+        subscripts = ','.join(terms) + '->' + to_term(arrays.pop())
+    else:
+        subscripts = ','.join(terms)
+    return subscripts, arrays
+
+
+def _get_sizes(inputs, shapes):
+    # Returns the size of each label. Dimensions of size one are broadcast.
+    sizes = {}
+    for labels, shape in zip(inputs, shapes):
+        for label, dim in zip(labels, shape):
+            prev = sizes.get(label, 1)
+            if prev != dim and prev != 1 and dim != 1:
+                if label < 0:
+                    raise ValueError(
+                        'operands could not be broadcast together with '
+                        'remapped shapes')
+                raise ValueError(
+                    'dimensions in operand for collapsing index \'%s\' '
+                    'don\'t match (%d != %d)' % (chr(label), prev, dim))
+            if prev == 1:
+                sizes[label] = dim
+    return sizes
+
+
+def _product(labels, sizes):
+    ret = 1
+    for label in labels:
+        ret *= sizes[label]
+    return ret
+
+
+def _contraction(inputs, i, j, output, sizes):
+    # Returns the labels kept by contracting the i-th and j-th label sets,
+    # and the number of multiply-adds of the contraction.
+    needed = set(output)
+    for k, labels in enumerate(inputs):
+        if k != i and k != j:
+            needed.update(labels)
+    involved = inputs[i] | inputs[j]
+    return involved & needed, _product(involved, sizes)
+
+
+def _greedy_path(inputs, output, sizes):
+    """Finds a contraction path by the greedy algorithm.
+
+    At each step, the pair whose contraction reduces the total size of the
+    intermediate arrays the most is contracted. Ties are broken by the cost
+    of the contraction.
+
+    Args:
+        inputs (list of sets): Label sets of the operands.
+        output (set): Label set of the output.
+        sizes (dict): Size of each label.
+
+    Returns:
+        list of tuples: Pairs of the positions of the operands contracted at
+        each step. The result of each contraction is appended to the list of
+        the operands after the pair is removed.
+
+    """
+    inputs = list(inputs)
+    path = []
+    while len(inputs) > 1:
+        best = None
+        for i in six.moves.range(len(inputs)):
+            for j in six.moves.range(i + 1, len(inputs)):
+                kept, cost = _contraction(inputs, i, j, output, sizes)
+                removed = (_product(kept, sizes) -
+                           _product(inputs[i], sizes) -
+                           _product(inputs[j], sizes))
+                key = (removed, cost)
+                if best is None or key < best[0]:
+                    best = key, (i, j), kept
+        _, (i, j), kept = best
+        path.append((i, j))
+        inputs = [s for k, s in enumerate(inputs) if k != i and k != j]
+        inputs.append(kept)
+    return path
+
+
+def _optimal_path(inputs, output, sizes):
+    """Finds the contraction path of the minimum cost.
+
+    All contraction orders are searched with pruning by the cost of the best
+    path found so far. The search time grows exponentially with the number
+    of operands.
+
+    Args:
+        inputs (list of sets): Label sets of the operands.
+        output (set): Label set of the output.
+        sizes (dict): Size of each label.
+
+    Returns:
+        list of tuples: Pairs of the positions of the operands contracted at
+        each step, in the same format as :func:`_greedy_path`.
+
+    """
+    # The greedy path gives the initial bound.
+    best_path = _greedy_path(inputs, output, sizes)
+    best = [_path_cost(inputs, output, sizes, best_path), best_path]
+
+    def search(inputs, path, cost):
+        if len(inputs) == 1:
+            if cost < best[0]:
+                best[0] = cost
+                best[1] = path
+            return
+        for i in six.moves.range(len(inputs)):
+            for j in six.moves.range(i + 1, len(inputs)):
+                kept, c = _contraction(inputs, i, j, output, sizes)
+                if cost + c >= best[0]:
+                    continue
+                rest = [s for k, s in enumerate(inputs) if k != i and k != j]
+                search(rest + [kept], path + [(i, j)], cost + c)
+
+    search(list(inputs), [], 0)
+    return best[1]
+
+
+def _path_cost(inputs, output, sizes, path):
+    inputs = list(inputs)
+    total = 0
+    for i, j in path:
+        kept, cost = _contraction(inputs, i, j, output, sizes)
+        total += cost
+        inputs = [s for k, s in enumerate(inputs) if k != i and k != j]
+        inputs.append(kept)
+    return total
+
+
+def _check_path(path, n):
+    # Validates an explicit path of the form ['einsum_path', (0, 1), ...].
+    if not path or path[0] != 'einsum_path':
+        raise TypeError(
+            'optimize must be a bool, \'greedy\', \'optimal\' or a list '
+            'starting with \'einsum_path\'')
+    ret = []
+    for pair in path[1:]:
+        pair = tuple(pair)
+        if len(pair) != 2 or not (0 <= pair[0] < n and 0 <= pair[1] < n and
+                                  pair[0] != pair[1]):
+            raise ValueError('Invalid contraction %s in the path' % (pair,))
+        ret.append(pair)
+        n -= 1
+    if n > 1:
+        raise ValueError('The path does not contract all operands')
+    return ret
+
+
+@util.memoize()
+def _plan(subscripts, shapes, optimize):
+    """Makes the plan of an einstein summation.
+
+    The plan is memoized for each combination of the subscripts, the shapes
+    of the operands and the optimization strategy.
+
+    Returns:
+        tuple: The label lists of the operands with the broadcast dimensions
+        removed, the shapes of the operands without them, the label list of
+        the output, the size of each label and the contraction path.
+
+    """
+    inputs, output = _parse_subscripts(
+        subscripts, [len(shape) for shape in shapes])
+    sizes = _get_sizes(inputs, shapes)
+
+    # Dimensions of size one broadcast against others are removed since the
+    # operands do not depend on them.
+    in_shapes = []
+    for k, (labels, shape) in enumerate(zip(inputs, shapes)):
+        keep = [dim == sizes[label] for label, dim in zip(labels, shape)]
+        inputs[k] = [label for label, b in zip(labels, keep) if b]
+        in_shapes.append(tuple(dim for dim, b in zip(shape, keep) if b))
+
+    # Labels that appear only in one operand are summed up before the
+    # contractions, and are not considered by the planner.
+    label_sets = []
+    for k, labels in enumerate(inputs):
+        needed = set(output)
+        for m, other in enumerate(inputs):
+            if m != k:
+                needed.update(other)
+        label_sets.append(set(labels) & needed)
+
+    n = len(inputs)
+    if n <= 2:
+        path = [(0, 1)] if n == 2 else []
+    elif optimize is False:
+        path = [(0, 1)] + [(0, k) for k in six.moves.range(n - 2, 0, -1)]
+    elif optimize is True or optimize == 'greedy':
+        path = _greedy_path(label_sets, set(output), sizes)
+    elif optimize == 'optimal':
+        path = _optimal_path(label_sets, set(output), sizes)
+    elif isinstance(optimize, tuple):
+        path = _check_path(optimize, n)
+    else:
+        raise TypeError(
+            'optimize must be a bool, \'greedy\', \'optimal\' or a list '
+            'starting with \'einsum_path\'')
+    return inputs, in_shapes, output, sizes, path
+
+
+def _reduce_term(a, labels, keep, dtype):
+    # Takes the diagonals of repeated labels and sums up the labels not in
+    # keep. Diagonals are views, and the sum is done by a reduction kernel.
+    labels = list(labels)
+    while len(set(labels)) != len(labels):
+        for i, label in enumerate(labels):
+            if label in labels[i + 1:]:
+                j = labels.index(label, i + 1)
+                break
+        a = a.diagonal(0, i, j)
+        labels = [x for k, x in enumerate(labels) if k != i and k != j]
+        labels.append(label)
+    axes = tuple(i for i, label in enumerate(labels) if label not in keep)
+    if axes:
+        a = a.sum(axis=axes, dtype=dtype)
+        labels = [label for label in labels if label in keep]
+    return a, labels
+
+
+def _contract_pair(a, a_labels, b, b_labels, keep, sizes, dtype):
+    # Contracts two operands without repeated labels. The labels of both
+    # operands not in keep must be shared by them.
+    batch = [x for x in a_labels if x in b_labels and x in keep]
+    summed = [x for x in a_labels if x in b_labels and x not in keep]
+    a_free = [x for x in a_labels if x not in b_labels]
+    b_free = [x for x in b_labels if x not in a_labels]
+
+    if not batch:
+        a = a.transpose([a_labels.index(x) for x in summed + a_free])
+        b = b.transpose([b_labels.index(x) for x in summed + b_free])
+        if a.ndim == 0 or b.ndim == 0:
+            ret = cupy.multiply(a, b)
+        else:
+            ret_shape = [sizes[x] for x in a_free + b_free]
+            ret = core.tensordot_core(
+                a, b, None, _product(a_free, sizes), _product(b_free, sizes),
+                _product(summed, sizes), ret_shape)
+        return ret.astype(dtype, copy=False), a_free + b_free
+
+    if not summed:
+        # Broadcast product. A matrix product with k = 1 is wasteful.
+        a = a.transpose([a_labels.index(x) for x in batch + a_free])
+        b = b.transpose([b_labels.index(x) for x in batch + b_free])
+        a = a[(Ellipsis,) + (None,) * len(b_free)]
+        b = b[(slice(None),) * len(batch) + (None,) * len(a_free)]
+        ret = cupy.multiply(a, b)
+        return ret.astype(dtype, copy=False), batch + a_free + b_free
+
+    # Batched matrix product
+    nbatch = _product(batch, sizes)
+    n = _product(a_free, sizes)
+    m = _product(b_free, sizes)
+    k = _product(summed, sizes)
+    a = a.transpose([a_labels.index(x) for x in batch + a_free + summed])
+    b = b.transpose([b_labels.index(x) for x in batch + summed + b_free])
+    ret = core.matmul(a.reshape(nbatch, n, k), b.reshape(nbatch, k, m))
+    ret = ret.reshape([sizes[x] for x in batch + a_free + b_free])
+    return ret.astype(dtype, copy=False), batch + a_free + b_free
+
+
+def einsum(*operands, **kwargs):
+    """einsum(subscripts, *operands, dtype=None, optimize=True)
+
+    Evaluates the Einstein summation convention on the operands.
+
+    The operands are contracted pairwise in the order chosen by the path
+    optimizer. Each pairwise contraction is computed by a matrix product,
+    batched over the labels kept by both operands. Diagonals of repeated
+    labels are taken as views, and labels appearing only in one operand are
+    summed up by reductions. The path is cached for each combination of the
+    subscripts and the shapes of the operands.
+
+    Args:
+        subscripts (str): Specifies the subscripts for summation. The
+            interleaved form ``einsum(op0, sublist0, op1, sublist1, ...,
+            [sublistout])`` is also supported.
+        operands (sequence of cupy.ndarray): Arrays for the operation.
+        dtype: Data type of the computation and the result. The type of the
+            result of the operands is used by default.
+        optimize: Strategy to find the order of the contractions. ``True``
+            or ``'greedy'`` uses the greedy algorithm, ``'optimal'`` searches
+            all orders for the one of the minimum cost, and ``False``
+            contracts the operands from left to right. A path of the form
+            ``['einsum_path', (0, 1), ...]`` may also be given.
+
+    Returns:
+        cupy.ndarray: The result of the Einstein summation. It may be a view
+        of the operand if no computation is required.
+
+    .. note::
+       Unlike :func:`numpy.einsum`, the contraction order is optimized by
+       default since the path is cached and costs nothing after the first
+       call.
+
+    .. seealso:: :func:`numpy.einsum`
+
+    """
+    dtype = kwargs.pop('dtype', None)
+    optimize = kwargs.pop('optimize', True)
+    if kwargs:
+        raise TypeError('Wrong arguments %s' % ', '.join(kwargs))
+    if not operands:
+        raise ValueError('must specify the einstein sum subscripts string '
+                         'and at least one operand')
+
+    if isinstance(operands[0], six.string_types):
+        subscripts = operands[0]
+        arrays = list(operands[1:])
+    else:
+        subscripts, arrays = _subscripts_from_sublists(operands)
+    if not arrays:
+        raise ValueError('No input operands')
+    arrays = [cupy.asarray(a) for a in arrays]
+    if dtype is None:
+        dtype = numpy.result_type(*[a.dtype for a in arrays])
+    else:
+        dtype = numpy.dtype(dtype)
+    if isinstance(optimize, list):
+        optimize = tuple(optimize)
+
+    inputs, in_shapes, output, sizes, path = _plan(
+        subscripts, tuple(a.shape for a in arrays), optimize)
+    out_shape = tuple(sizes[label] for label in output)
+    if any(a.size == 0 for a in arrays):
+        return cupy.zeros(out_shape, dtype=dtype)
+
+    terms = []
+    for k, a in enumerate(arrays):
+        a = a.astype(dtype, copy=False)
+        if a.shape != in_shapes[k]:
+            a = a.reshape(in_shapes[k])
+        needed = set(output)
+        for m, labels in enumerate(inputs):
+            if m != k:
+                needed.update(labels)
+        terms.append(_reduce_term(a, inputs[k], needed, dtype))
+
+    for i, j in path:
+        a, a_labels = terms[i]
+        b, b_labels = terms[j]
+        terms = [t for k, t in enumerate(terms) if k != i and k != j]
+        needed = set(output)
+        for _, labels in terms:
+            needed.update(labels)
+        a, a_labels = _reduce_term(a, a_labels, needed | set(b_labels), dtype)
+        b, b_labels = _reduce_term(b, b_labels, needed | set(a_labels), dtype)
+        terms.append(_contract_pair(
+            a, a_labels, b, b_labels, needed, sizes, dtype))
+
+    ret, labels = terms[0]
+    ret, labels = _reduce_term(ret, labels, set(output), dtype)
+    return ret.transpose([labels.index(label) for label in output])
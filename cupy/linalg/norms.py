@@ -3,15 +3,10 @@ from numpy import linalg
 
 import cupy
 from cupy import cuda
-from cupy.cuda import device
 from cupy.linalg import decomposition
 from cupy.linalg import util
 
 
-if cuda.cusolver_enabled:
-    from cupy.cuda import cusolver
-
-
 def norm(x, ord=None, axis=None, keepdims=False):
     """Returns one of matrix norms specified by ``ord`` parameter.
 
@@ -195,58 +190,39 @@ def slogdet(a):
         msg = ('%d-dimensional array given. '
                'Array must be at least two-dimensional' % a.ndim)
         raise linalg.LinAlgError(msg)
+    util._assert_nd_squareness(a)
 
     dtype = numpy.find_common_type((a.dtype.char, 'f'), ())
     shape = a.shape[:-2]
-    sign = cupy.empty(shape, dtype)
-    logdet = cupy.empty(shape, dtype)
-
-    a = a.astype(dtype)
-    for index in numpy.ndindex(*shape):
-        s, l = _slogdet_one(a[index])
-        sign[index] = s
-        logdet[index] = l
-    return sign, logdet
-
-
-def _slogdet_one(a):
-    util._assert_rank2(a)
-    util._assert_nd_squareness(a)
-    dtype = a.dtype
-
-    handle = device.get_cusolver_handle()
-    m = len(a)
-    ipiv = cupy.empty(m, 'i')
-    info = cupy.empty((), 'i')
-
-    # Need to make a copy because getrf works inplace
-    a_copy = a.copy(order='F')
-
-    if dtype == 'f':
-        getrf_bufferSize = cusolver.sgetrf_bufferSize
-        getrf = cusolver.sgetrf
-    else:
-        getrf_bufferSize = cusolver.dgetrf_bufferSize
-        getrf = cusolver.dgetrf
-
-    buffersize = getrf_bufferSize(handle, m, m, a_copy.data.ptr, m)
-    workspace = cupy.empty(buffersize, dtype=dtype)
-    getrf(handle, m, m, a_copy.data.ptr, m, workspace.data.ptr,
-          ipiv.data.ptr, info.data.ptr)
-
-    if info[()] == 0:
-        diag = cupy.diag(a_copy)
-        # ipiv is 1-origin
-        non_zero = (cupy.count_nonzero(ipiv != cupy.arange(1, m + 1)) +
-                    cupy.count_nonzero(diag < 0))
-        # Note: sign == -1 ** (non_zero % 2)
-        sign = (non_zero % 2) * -2 + 1
-        logdet = cupy.log(abs(diag)).sum()
-    else:
-        sign = cupy.array(0.0, dtype=dtype)
-        logdet = cupy.array(float('-inf'), dtype)
-
-    return sign, logdet
+    n = a.shape[-1]
+    if a.size == 0:
+        sign = cupy.ones(shape, dtype)
+        logdet = cupy.zeros(shape, dtype)
+        return sign, logdet
+
+    # Need to make a copy because the LU decomposition works inplace
+    x = a.astype(dtype, order='C', copy=True).reshape(-1, n, n)
+    info, swaps = util._lu_batched(x)
+    diag = x.diagonal(0, 1, 2)
+    negative = swaps + (diag < 0).sum(axis=1)
+    logabs = cupy.log(abs(diag)).sum(axis=1)
+    sign, logdet = _slogdet_kernel(info, negative, logabs)
+    return sign.reshape(shape), logdet.reshape(shape)
+
+
+_slogdet_kernel = cupy.core.ElementwiseKernel(
+    'int32 info, int64 negative, T logabs', 'T sign, T logdet',
+    '''
+    if (info == 0) {
+      // Note: sign == -1 ** (negative % 2)
+      sign = negative % 2 ? -1 : 1;
+      logdet = logabs;
+    } else {
+      sign = 0;
+      logdet = -INFINITY;
+    }
+    ''',
+    'cupy_slogdet')
 
 
 def trace(a, offset=0, axis1=0, axis2=1, dtype=None, out=None):
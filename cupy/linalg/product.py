@@ -1,10 +1,14 @@
 import collections
+import weakref
 
 import numpy
 import six
 
 import cupy
 from cupy import core
+from cupy.core import fusion
+from cupy.cuda import cublas
+from cupy.cuda import device
 from cupy import internal
 
 
@@ -53,7 +57,23 @@ def vdot(a, b):
     if a.size != b.size:
         raise ValueError('Axis dimension mismatch')
 
-    return core.tensordot_core(a, b, None, 1, 1, a.size, ())
+    dtype = numpy.find_common_type((a.dtype, b.dtype), ())
+    if dtype.kind != 'c' or a.size == 0:
+        return core.tensordot_core(a, b, None, 1, 1, a.size, ())
+
+    # The first argument is conjugated by dotc.
+    a = cupy.ascontiguousarray(a.ravel(), dtype)
+    b = cupy.ascontiguousarray(b.ravel(), dtype)
+    ret = cupy.empty((), dtype)
+    dotc = cublas.cdotc if dtype.char == 'F' else cublas.zdotc
+    handle = device.get_cublas_handle()
+    mode = cublas.getPointerMode(handle)
+    cublas.setPointerMode(handle, cublas.CUBLAS_POINTER_MODE_DEVICE)
+    try:
+        dotc(handle, a.size, a.data.ptr, 1, b.data.ptr, 1, ret.data.ptr)
+    finally:
+        cublas.setPointerMode(handle, mode)
+    return ret
 
 
 def inner(a, b):
@@ -193,7 +213,74 @@ def tensordot(a, b, axes=2):
     return core.tensordot_core(a, b, None, n, m, k, ret_shape)
 
 
-# TODO(okuta): Implement einsum
+_fused_epilogues = weakref.WeakKeyDictionary()
+
+
+def _get_fused_epilogue(epilogue):
+    if isinstance(epilogue, fusion.Fusion):
+        return epilogue
+    f = _fused_epilogues.get(epilogue)
+    if f is None:
+        f = fusion.Fusion(epilogue, None, None, lambda x: x)
+        _fused_epilogues[epilogue] = f
+    return f
+
+
+def gemm(a, b, epilogue=None, args=(), alpha=1, beta=0, out=None):
+    """Computes a matrix product followed by a fused elementwise epilogue.
+
+    It computes ``epilogue(alpha * a.dot(b) + beta * out, *args)``. The
+    scaling by ``alpha`` and the accumulation to ``out`` are done by cuBLAS
+    within the GEMM call. The epilogue, e.g. the bias addition and the
+    activation of a dense layer, runs as a single fused kernel over the
+    product, so that each step does not read and write the whole output.
+
+    >>> @cupy.fuse()
+    ... def bias_relu(y, bias):
+    ...     return cupy.maximum(y + bias, 0)
+    >>> y = cupy.linalg.gemm(x, w, bias_relu, (bias,))
+
+    Args:
+        a (cupy.ndarray): The left matrix.
+        b (cupy.ndarray): The right matrix.
+        epilogue (function): Elementwise function applied to the product.
+            It takes the product as the first argument followed by ``args``.
+            A function decorated with :func:`cupy.fuse` is used as is, and
+            any other function is fused on the first call.
+        args (tuple of cupy.ndarray): Additional arguments of
+            ``epilogue``. They are broadcast to the shape of the product.
+        alpha: Scaling factor of the product.
+        beta: Scaling factor of ``out`` accumulated to the product. If it
+            is nonzero, ``out`` is required.
+        out (cupy.ndarray): C-contiguous output array. The result of
+            ``epilogue`` is written to it in place. It may overlap ``a`` or
+            ``b``, in which case the operand is copied before the GEMM.
+
+    Returns:
+        cupy.ndarray: The result.
+
+    .. seealso:: :func:`cupy.dot`
+
+    """
+    if a.ndim != 2 or b.ndim != 2:
+        raise ValueError('gemm only supports 2-D matrices')
+    n, k = a.shape
+    if b.shape[0] != k:
+        raise ValueError('Axis dimension mismatch')
+    m = b.shape[1]
+    if out is not None:
+        if out.shape != (n, m):
+            raise ValueError('Output array has an invalid shape')
+        if not out.flags.c_contiguous:
+            raise ValueError('Output array must be C-contiguous')
+    elif beta != 0:
+        raise ValueError('Output array is required if beta is nonzero')
+
+    y = core.tensordot_core(a.T, b, out, n, m, k, (n, m), alpha, beta)
+    if epilogue is None:
+        return y
+    epilogue = _get_fused_epilogue(epilogue)
+    return epilogue(y, *args, out=out)
 
 
 # TODO(okuta): Implement matrix_power
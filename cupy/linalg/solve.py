@@ -5,34 +5,218 @@ import six
 import cupy
 from cupy import cuda
 from cupy.cuda import cublas
-from cupy.cuda import device
+from cupy.linalg import status
 from cupy.linalg import util
-
-if cuda.cusolver_enabled:
-    from cupy.cuda import cusolver
+from cupy.prof.auto_range import annotate_routine
 
 
+@annotate_routine('cupy.linalg.solve')
 def solve(a, b):
     '''Solves a linear matrix equation.
 
     It computes the exact solution of ``x`` in ``ax = b``,
     where ``a`` is a square and full rank matrix.
 
+    A matrix is solved with the LU decomposition of cuSOLVER. It is computed
+    in the order of ``a``, so that both C-contiguous and F-contiguous
+    matrices are copied without transposition. Stacked matrices are solved
+    at once. Small matrices are processed by a single kernel, and larger
+    ones by the batched LU decomposition of cuBLAS.
+
+    Args:
+        a (cupy.ndarray): The matrix with dimension ``(..., M, M)``
+        b (cupy.ndarray): The vector with ``(..., M)`` elements, or
+            the matrix with dimension ``(..., M, K)``
+
+    Returns:
+        cupy.ndarray:
+            The solution with the shape of ``b`` broadcast with the leading
+            dimensions of ``a``.
+
+    .. seealso:: :func:`numpy.linalg.solve`
+    '''
+    if not cuda.cusolver_enabled:
+        raise RuntimeError('Current cupy only supports cusolver in CUDA 8.0')
+
+    util._assert_cupy_array(a, b)
+    _assert_rank_at_least2(a)
+    util._assert_nd_squareness(a)
+    dtype = _get_dtype(a)
+
+    if a.ndim > 2 or b.ndim > 2:
+        return _solve_batched(a, b, dtype)
+
+    if len(a) != len(b):
+        raise linalg.LinAlgError(
+            'The number of rows of array a must be '
+            'the same as that of array b')
+    return _solve_lu(a, b, dtype)
+
+
+def _get_dtype(a):
+    # Cast to float32 or float64
+    if a.dtype.char == 'f' or a.dtype.char == 'd':
+        return a.dtype.char
+    else:
+        return numpy.find_common_type((a.dtype.char, 'f'), ()).char
+
+
+def _solve_lu(a, b, dtype):
+    x = b.astype(dtype, order='F', copy=True)
+    if a.size == 0:
+        return x
+    # The factors of a C-contiguous matrix are those of its transpose in the
+    # column-major order, which solve the transposed systems.
+    if a.flags.f_contiguous:
+        lu = a.astype(dtype, order='F', copy=True)
+        trans = cublas.CUBLAS_OP_N
+    else:
+        lu = a.astype(dtype, order='C', copy=True)
+        trans = cublas.CUBLAS_OP_T
+    ipiv = cupy.empty(len(a), dtype=numpy.int32)
+    dev_info = cupy.empty(1, dtype=numpy.int32)
+    util._getrf(lu, ipiv, dev_info)
+    status._check_info(dev_info, 'Singular matrix')
+    util._getrs(lu, ipiv, trans, x)
+    return x
+
+
+@annotate_routine('cupy.linalg.lu_factor')
+def lu_factor(a, overwrite_a=False):
+    '''LU decomposition of a matrix with partial pivoting.
+
+    The factors are meant to be reused by :func:`cupy.linalg.lu_solve` to
+    solve the linear systems of the same matrix for many right-hand sides.
+    A singular matrix is not reported here, and results in infinities or
+    NaNs in the solutions.
+
+    Args:
+        a (cupy.ndarray): The square matrix with dimension ``(M, M)``
+        overwrite_a (bool): If ``True``, an F-contiguous ``a`` of float32 or
+            float64 is overwritten by the factors without copy.
+
+    Returns:
+        tuple of :class:`~cupy.ndarray`:
+            A tuple ``(lu, piv)``. ``lu`` is an F-contiguous matrix whose
+            upper triangle is ``U`` and whose strictly lower triangle is
+            ``L`` with the unit diagonal omitted. ``piv`` holds the
+            zero-based pivot indices; row ``i`` was interchanged with row
+            ``piv[i]``.
+
+    .. seealso:: :func:`scipy.linalg.lu_factor`
+    '''
+    if not cuda.cusolver_enabled:
+        raise RuntimeError('Current cupy only supports cusolver in CUDA 8.0')
+
+    util._assert_cupy_array(a)
+    util._assert_rank2(a)
+    util._assert_nd_squareness(a)
+
+    lu = a.astype(_get_dtype(a), order='F', copy=not overwrite_a)
+    piv = cupy.empty(len(a), dtype=numpy.int32)
+    if a.size != 0:
+        dev_info = cupy.empty(1, dtype=numpy.int32)
+        util._getrf(lu, piv, dev_info)
+        status._check_info(dev_info)
+        # ipiv is 1-origin
+        piv -= 1
+    return lu, piv
+
+
+@annotate_routine('cupy.linalg.lu_solve')
+def lu_solve(lu_and_piv, b, trans=0, overwrite_b=False):
+    '''Solves linear systems with the LU decomposition of the matrix.
+
+    Args:
+        lu_and_piv (tuple): The factors and the pivot indices computed by
+            :func:`cupy.linalg.lu_factor`.
+        b (cupy.ndarray): The vector with ``M`` elements, or the matrix
+            with dimension ``(M, K)``
+        trans (int): ``0`` to solve ``ax = b``, and ``1`` or ``2`` to solve
+            ``a^T x = b``.
+        overwrite_b (bool): If ``True``, an F-contiguous ``b`` of the dtype
+            of the factors is overwritten by the solution without copy.
+
+    Returns:
+        cupy.ndarray: The solution with the shape of ``b``.
+
+    .. seealso:: :func:`scipy.linalg.lu_solve`
+    '''
+    if not cuda.cusolver_enabled:
+        raise RuntimeError('Current cupy only supports cusolver in CUDA 8.0')
+
+    lu, piv = lu_and_piv
+    util._assert_cupy_array(lu, piv, b)
+    util._assert_rank2(lu)
+    util._assert_nd_squareness(lu)
+    if 2 < b.ndim:
+        raise linalg.LinAlgError(
+            '{}-dimensional array given. Array must be '
+            'one or two-dimensional'.format(b.ndim))
+    if len(lu) != len(b):
+        raise linalg.LinAlgError(
+            'The number of rows of array a must be '
+            'the same as that of array b')
+    if trans == 0:
+        trans = cublas.CUBLAS_OP_N
+    elif trans in (1, 2):
+        trans = cublas.CUBLAS_OP_T
+    else:
+        raise ValueError('trans must be 0, 1 or 2')
+
+    dtype = _get_dtype(lu)
+    lu = lu.astype(dtype, order='F', copy=False)
+    x = b.astype(dtype, order='F', copy=not overwrite_b)
+    if x.size != 0:
+        # ipiv is 1-origin
+        ipiv = piv.astype(numpy.int32) + 1
+        util._getrs(lu, ipiv, trans, x)
+    return x
+
+
+@annotate_routine('cupy.linalg.mixed_precision_solve')
+def mixed_precision_solve(a, b, max_iter=30, return_iter=False):
+    '''Solves a linear matrix equation with mixed precision.
+
+    The matrix is factorized in float32, and the float32 solution is refined
+    iteratively with the residuals computed in float64 by :func:`cupy.dot`
+    until it is as accurate as a float64 solution. It is much faster than
+    :func:`cupy.linalg.solve` on GPUs with low float64 throughput, since
+    only the matrix products are computed in float64.
+
+    The iteration stops when the residual of every column satisfies
+    ``||r||_inf <= ||x||_inf * ||a||_inf * eps * sqrt(M)``, where ``eps`` is
+    the machine epsilon of float64, as LAPACK ``dsgesv`` does. If the
+    refinement does not converge, or the matrix cannot be factorized in
+    float32, the system is solved in float64 instead.
+
     Args:
         a (cupy.ndarray): The matrix with dimension ``(M, M)``
         b (cupy.ndarray): The vector with ``M`` elements, or
             the matrix with dimension ``(M, K)``
+        max_iter (int): The maximum number of the refinement steps.
+        return_iter (bool): If ``True``, the number of the refinement steps
+            is also returned.
 
-    .. seealso:: :func:`numpy.linalg.solve`
+    Returns:
+        cupy.ndarray or tuple:
+            The float64 solution ``x``. If ``return_iter`` is ``True``, a
+            tuple ``(x, iter)`` is returned. A nonnegative ``iter`` is the
+            number of the refinement steps. A negative one means that the
+            system was solved in float64 because the norm of ``a`` exceeded
+            the range of float32 (``-2``), the float32 factorization was
+            singular (``-3``) or the refinement did not converge
+            (``-(max_iter + 1)``).
+
+    .. note::
+       If ``a`` and ``b`` are both float32, the system is just solved in
+       float32 and ``iter`` is ``0``.
+
+    .. seealso:: :func:`cupy.linalg.solve`
     '''
-    # NOTE: Since cusolver in CUDA 8.0 does not support gesv,
-    #       we manually solve a linear system with QR decomposition.
-    #       For details, please see the following:
-    #       http://docs.nvidia.com/cuda/cusolver/index.html#qr_examples
     if not cuda.cusolver_enabled:
         raise RuntimeError('Current cupy only supports cusolver in CUDA 8.0')
 
-    # TODO(Saito): Current implementation only accepts two-dimensional arrays
     util._assert_cupy_array(a, b)
     util._assert_rank2(a)
     util._assert_nd_squareness(a)
@@ -45,57 +229,100 @@ def solve(a, b):
             'The number of rows of array a must be '
             'the same as that of array b')
 
-    # Cast to float32 or float64
-    if a.dtype.char == 'f' or a.dtype.char == 'd':
-        dtype = a.dtype.char
-    else:
-        dtype = numpy.find_common_type((a.dtype.char, 'f'), ()).char
+    dtype = numpy.find_common_type((a.dtype.char, b.dtype.char, 'f'), ())
+    if dtype == numpy.float32:
+        x = _solve_lu(a, b, 'f')
+        return (x, 0) if return_iter else x
+
+    x, iteration = _refine(a, b, max_iter)
+    if iteration < 0:
+        x = _solve_lu(a, b, 'd')
+    return (x, iteration) if return_iter else x
+
 
-    m, k = (b.size, 1) if b.ndim == 1 else b.shape
-    a = a.transpose().astype(dtype, order='C', copy=True)
-    b = b.transpose().astype(dtype, order='C', copy=True)
-    cusolver_handle = device.get_cusolver_handle()
-    cublas_handle = device.get_cublas_handle()
+def _refine(a, b, max_iter):
+    a64 = a.astype(numpy.float64, copy=False)
+    b64 = b.astype(numpy.float64, copy=False)
+    if a.size == 0:
+        return b64.copy(), 0
+
+    n = len(a)
+    anrm = float(abs(a64).sum(axis=1).max())
+    if not anrm <= numpy.finfo(numpy.float32).max:
+        return None, -2
+
+    # The factors are computed in the order of a as _solve_lu does.
+    if a.flags.f_contiguous:
+        lu = a.astype(numpy.float32, order='F', copy=True)
+        trans = cublas.CUBLAS_OP_N
+    else:
+        lu = a.astype(numpy.float32, order='C', copy=True)
+        trans = cublas.CUBLAS_OP_T
+    ipiv = cupy.empty(n, dtype=numpy.int32)
     dev_info = cupy.empty(1, dtype=numpy.int32)
+    util._getrf(lu, ipiv, dev_info)
+    if int(dev_info[0]) != 0:
+        return None, -3
+
+    d = b.astype(numpy.float32, order='F', copy=True)
+    util._getrs(lu, ipiv, trans, d)
+    x = d.astype(numpy.float64)
+    cte = anrm * numpy.finfo(numpy.float64).eps * numpy.sqrt(n)
+    for iteration in six.moves.range(max_iter + 1):
+        r = b64 - cupy.dot(a64, x)
+        if (abs(r).max(axis=0) <= abs(x).max(axis=0) * cte).all():
+            return x, iteration
+        if iteration == max_iter:
+            break
+        d = r.astype(numpy.float32, order='F')
+        util._getrs(lu, ipiv, trans, d)
+        x += d
+    return None, -(max_iter + 1)
+
+
+def _assert_rank_at_least2(a):
+    if a.ndim < 2:
+        raise linalg.LinAlgError(
+            '{}-dimensional array given. Array must be '
+            'at least two-dimensional'.format(a.ndim))
+
 
-    if dtype == 'f':
-        geqrf = cusolver.sgeqrf
-        geqrf_bufferSize = cusolver.sgeqrf_bufferSize
-        ormqr = cusolver.sormqr
-        trsm = cublas.strsm
-    else:  # dtype == 'd'
-        geqrf = cusolver.dgeqrf
-        geqrf_bufferSize = cusolver.dgeqrf_bufferSize
-        ormqr = cusolver.dormqr
-        trsm = cublas.dtrsm
-
-    # 1. QR decomposition (A = Q * R)
-    buffersize = geqrf_bufferSize(cusolver_handle, m, m, a.data.ptr, m)
-    workspace = cupy.empty(buffersize, dtype=dtype)
-    tau = cupy.empty(m, dtype=dtype)
-    geqrf(
-        cusolver_handle, m, m, a.data.ptr, m,
-        tau.data.ptr, workspace.data.ptr, buffersize, dev_info.data.ptr)
-    _check_status(dev_info)
-    # 2. ormqr (Q^T * B)
-    ormqr(
-        cusolver_handle, cublas.CUBLAS_SIDE_LEFT, cublas.CUBLAS_OP_T,
-        m, k, m, a.data.ptr, m, tau.data.ptr, b.data.ptr, m,
-        workspace.data.ptr, buffersize, dev_info.data.ptr)
-    _check_status(dev_info)
-    # 3. trsm (X = R^{-1} * (Q^T * B))
-    trsm(
-        cublas_handle, cublas.CUBLAS_SIDE_LEFT, cublas.CUBLAS_FILL_MODE_UPPER,
-        cublas.CUBLAS_OP_N, cublas.CUBLAS_DIAG_NON_UNIT,
-        m, k, 1, a.data.ptr, m, b.data.ptr, m)
-    return b.transpose()
-
-
-def _check_status(dev_info):
-    status = int(dev_info)
-    if status < 0:
+def _solve_batched(a, b, dtype, is_vector=None):
+    # b is regarded as a stack of vectors if is_vector is True. It is
+    # inferred from the numbers of dimensions as NumPy does if it is None.
+    n = a.shape[-1]
+    if is_vector is None:
+        is_vector = b.ndim == a.ndim - 1
+    if is_vector:
+        b = b[..., None]
+    if b.ndim < 2 or b.shape[-2] != n:
+        raise linalg.LinAlgError(
+            'The number of rows of array a must be '
+            'the same as that of array b')
+    k = b.shape[-1]
+    try:
+        # Zero-size arrays are used to broadcast the shapes without
+        # allocation.
+        batch_shape = numpy.broadcast(
+            numpy.empty(a.shape[:-2] + (0,)),
+            numpy.empty(b.shape[:-2] + (0,))).shape[:-1]
+    except ValueError:
         raise linalg.LinAlgError(
-            'Parameter error (maybe caused by a bug in cupy.linalg?)')
+            'The leading dimensions of arrays a and b are not broadcastable')
+
+    # Each right-hand side is stored in a row so that they form the
+    # column-major matrix which the library routines expect.
+    x = cupy.empty(batch_shape + (n, n), dtype=dtype)
+    x[...] = a
+    y = cupy.empty(batch_shape + (k, n), dtype=dtype)
+    y[...] = b.swapaxes(-1, -2)
+    if x.size != 0 and y.size != 0:
+        info, _ = util._lu_batched(x.reshape(-1, n, n), y.reshape(-1, k, n))
+        status._check_info(info, 'Singular matrix')
+    y = y.swapaxes(-1, -2)
+    if is_vector:
+        y = y[..., 0]
+    return y
 
 
 def tensorsolve(a, b, axes=None):
@@ -131,7 +358,35 @@ def tensorsolve(a, b, axes=None):
 # TODO(okuta): Implement lstsq
 
 
-# TODO(okuta): Implement inv
+@annotate_routine('cupy.linalg.inv')
+def inv(a):
+    '''Computes the inverse of a matrix.
+
+    This function computes matrix ``a_inv`` from n-dimensional regular matrix
+    ``a`` such that ``dot(a, a_inv) == eye(n)``. Stacked matrices are
+    inverted at once.
+
+    Args:
+        a (cupy.ndarray): The regular matrix with dimension ``(..., M, M)``
+
+    Returns:
+        cupy.ndarray:
+            The inverse of ``a`` with dimension ``(..., M, M)``.
+
+    .. seealso:: :func:`numpy.linalg.inv`
+    '''
+    if not cuda.cusolver_enabled:
+        raise RuntimeError('Current cupy only supports cusolver in CUDA 8.0')
+
+    util._assert_cupy_array(a)
+    _assert_rank_at_least2(a)
+    util._assert_nd_squareness(a)
+
+    dtype = _get_dtype(a)
+    b = cupy.eye(a.shape[-1], dtype=dtype)
+    if a.ndim == 2:
+        return _solve_lu(a, b, dtype)
+    return _solve_batched(a, b, dtype, False)
 
 
 # TODO(okuta): Implement pinv
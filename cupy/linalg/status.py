@@ -0,0 +1,180 @@
+import contextlib
+import threading
+
+import numpy
+from numpy import linalg
+
+import cupy
+from cupy import cuda
+
+
+_thread_local = threading.local()
+
+_check_modes = ('strict', 'deferred')
+
+# Messages of the errors recorded in the deferred mode. The status array
+# holds the one-based index of the message.
+_messages = ['Parameter error (maybe caused by a bug in cupy.linalg?)']
+_message_codes = {_messages[0]: 1}
+_messages_lock = threading.Lock()
+
+
+def set_check_mode(mode):
+    """Sets how the info codes of the linear algebra routines are checked.
+
+    In the ``'strict'`` mode, which is the default, each routine reads the
+    info codes returned by cuSOLVER and cuBLAS back to the host as soon as it
+    calls them, and raises :class:`numpy.linalg.LinAlgError` on failure. It
+    synchronizes the device at every call.
+
+    In the ``'deferred'`` mode, the failures are accumulated in a status
+    array on the device without synchronization, and the results of failed
+    computations are left undefined. The errors are raised by
+    :func:`cupy.linalg.check_status` at the point the user chooses, or can
+    be inspected through :func:`cupy.linalg.get_status`.
+
+    The mode is set for the current thread.
+
+    Args:
+        mode (str): ``'strict'`` or ``'deferred'``.
+
+    Returns:
+        str: The previous mode.
+
+    .. seealso:: :func:`cupy.linalg.check_mode`
+
+    """
+    if mode not in _check_modes:
+        raise ValueError('mode must be \'strict\' or \'deferred\'')
+    old = get_check_mode()
+    _thread_local.check_mode = mode
+    return old
+
+
+def get_check_mode():
+    """Returns the check mode of the current thread.
+
+    .. seealso:: :func:`cupy.linalg.set_check_mode`
+
+    """
+    return getattr(_thread_local, 'check_mode', 'strict')
+
+
+@contextlib.contextmanager
+def check_mode(mode):
+    """A context manager to set the check mode in the enclosed block
+
+    >>> with cupy.linalg.check_mode('deferred'):
+    ...     x = cupy.linalg.solve(a, b)
+    ...     y = cupy.linalg.cholesky(c)
+    >>> cupy.linalg.check_status()
+
+    Args:
+        mode (str): ``'strict'`` or ``'deferred'``.
+
+    .. seealso:: :func:`cupy.linalg.set_check_mode`
+
+    """
+    old = set_check_mode(mode)
+    try:
+        yield
+    finally:
+        set_check_mode(old)
+
+
+def _get_status_array():
+    statuses = getattr(_thread_local, 'statuses', None)
+    if statuses is None:
+        statuses = _thread_local.statuses = {}
+    dev = cuda.get_device_id()
+    status = statuses.get(dev)
+    if status is None:
+        # The code of the first error and the info value of it.
+        status = cupy.zeros(2, dtype=numpy.int32)
+        statuses[dev] = status
+    return status
+
+
+def get_status():
+    """Returns the status of the routines called in the deferred mode.
+
+    The status is not read back to the host, so that the device is not
+    synchronized.
+
+    Returns:
+        cupy.ndarray: A zero-dimensional int32 array on the current device.
+        It is nonzero if a routine has failed since the last call of
+        :func:`cupy.linalg.check_status` in the current thread.
+
+    """
+    return _get_status_array()[0]
+
+
+def check_status():
+    """Raises the first error of the routines called in the deferred mode.
+
+    It synchronizes the device to read the status of the current device and
+    thread back, and clears it.
+
+    .. seealso:: :func:`cupy.linalg.set_check_mode`
+
+    """
+    status = _get_status_array()
+    code, value = status.get()
+    if code == 0:
+        return
+    status.fill(0)
+    raise linalg.LinAlgError(_messages[code - 1].format(value))
+
+
+def _get_message_code(message):
+    code = _message_codes.get(message)
+    if code is None:
+        with _messages_lock:
+            code = _message_codes.get(message)
+            if code is None:
+                _messages.append(message)
+                code = len(_messages)
+                _message_codes[message] = code
+    return code
+
+
+_update_status_kernel = cupy.core.ElementwiseKernel(
+    'int32 info_min, int32 info_max, int32 code', 'raw int32 status',
+    '''
+    if (status[0] == 0) {
+      if (info_min < 0) {
+        status[0] = 1;
+        status[1] = info_min;
+      } else if (info_max > 0 && code != 0) {
+        status[0] = code;
+        status[1] = info_max;
+      }
+    }
+    ''',
+    'cupy_linalg_update_status')
+
+
+def _check_info(info, message=None):
+    """Checks the info codes returned by a library routine.
+
+    Negative codes are reported as parameter errors. Positive codes are
+    reported with ``message`` formatted with the code, or ignored if it is
+    ``None``.
+
+    Args:
+        info (cupy.ndarray): int32 array of the info codes.
+        message (str): Message of the error on positive codes.
+
+    """
+    if info.size == 0:
+        return
+    if get_check_mode() == 'strict':
+        info = cupy.asnumpy(info)
+        if (info < 0).any():
+            raise linalg.LinAlgError(_messages[0])
+        if message is not None and (info > 0).any():
+            raise linalg.LinAlgError(message.format(info.max()))
+        return
+    code = 0 if message is None else _get_message_code(message)
+    _update_status_kernel(info.min(), info.max(), code, _get_status_array())
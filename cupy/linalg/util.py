@@ -1,6 +1,13 @@
+import numpy
 from numpy import linalg
 
 import cupy
+from cupy import cuda
+from cupy.cuda import cublas
+from cupy.cuda import device
+
+if cuda.cusolver_enabled:
+    from cupy.cuda import cusolver
 
 
 def _assert_cupy_array(*arrays):
@@ -26,7 +33,7 @@ def _assert_nd_squareness(*arrays):
 
 
 def _tril(x, k=0):
-    m, n = x.shape
+    m, n = x.shape[-2:]
     u = cupy.arange(m).reshape(m, 1)
     v = cupy.arange(n).reshape(1, n)
     mask = v - u <= k
@@ -35,9 +42,216 @@ def _tril(x, k=0):
 
 
 def _triu(x, k=0):
-    m, n = x.shape
+    m, n = x.shape[-2:]
     u = cupy.arange(m).reshape(m, 1)
     v = cupy.arange(n).reshape(1, n)
     mask = v - u >= k
     x *= mask
     return x
+
+
+# Stacked matrices up to this size are factorized by a single kernel which
+# processes each matrix in a thread, since the batched library routines have
+# a large overhead per matrix for tiny sizes.
+_batched_small_size = 16
+
+
+def _batched_pointers(x):
+    """Returns the device array of the addresses of the stacked matrices.
+
+    Args:
+        x (cupy.ndarray): C-contiguous array of shape ``(batch, m, n)``.
+
+    """
+    ptr = x.data.ptr
+    stride = x.strides[0]
+    return cupy.arange(
+        ptr, ptr + stride * x.shape[0], stride, dtype=numpy.uintp)
+
+
+_lu_small_kernel = cupy.core.ElementwiseKernel(
+    'int32 n, int32 nrhs', 'raw T a, raw T b, int32 info, int32 swaps',
+    '''
+    T* m = &a[i * n * n];
+    T* r = nrhs > 0 ? &b[i * n * nrhs] : NULL;
+    info = 0;
+    swaps = 0;
+    for (int k = 0; k < n; ++k) {
+      int p = k;
+      T pmax = fabs(m[k * n + k]);
+      for (int j = k + 1; j < n; ++j) {
+        T v = fabs(m[j * n + k]);
+        if (v > pmax) {
+          p = j;
+          pmax = v;
+        }
+      }
+      if (pmax == 0) {
+        if (info == 0) {
+          info = k + 1;
+        }
+        continue;
+      }
+      if (p != k) {
+        ++swaps;
+        for (int c = 0; c < n; ++c) {
+          T t = m[k * n + c];
+          m[k * n + c] = m[p * n + c];
+          m[p * n + c] = t;
+        }
+        for (int c = 0; c < nrhs; ++c) {
+          T t = r[c * n + k];
+          r[c * n + k] = r[c * n + p];
+          r[c * n + p] = t;
+        }
+      }
+      T d = m[k * n + k];
+      for (int j = k + 1; j < n; ++j) {
+        T f = m[j * n + k] / d;
+        m[j * n + k] = f;
+        for (int c = k + 1; c < n; ++c) {
+          m[j * n + c] -= f * m[k * n + c];
+        }
+        for (int c = 0; c < nrhs; ++c) {
+          r[c * n + j] -= f * r[c * n + k];
+        }
+      }
+    }
+    if (info == 0) {
+      for (int c = 0; c < nrhs; ++c) {
+        for (int k = n - 1; k >= 0; --k) {
+          T s = r[c * n + k];
+          for (int j = k + 1; j < n; ++j) {
+            s -= m[k * n + j] * r[c * n + j];
+          }
+          r[c * n + k] = s / m[k * n + k];
+        }
+      }
+    }
+    ''',
+    'cupy_lu_small')
+
+
+def _lu_batched(x, b=None):
+    """LU decomposition of stacked matrices with partial pivoting.
+
+    The matrices are factorized in place. When ``b`` is given, the linear
+    systems are also solved in place.
+
+    Args:
+        x (cupy.ndarray): C-contiguous array of shape ``(batch, n, n)``
+            whose dtype is float32 or float64.
+        b (cupy.ndarray): C-contiguous array of shape ``(batch, k, n)`` of
+            the same dtype. ``b[i, j]`` is the ``j``-th right-hand side of
+            the ``i``-th system.
+
+    Returns:
+        tuple of :class:`~cupy.ndarray`: A tuple ``(info, swaps)`` of int32
+        arrays of shape ``(batch,)``. ``info`` is the one-based index of the
+        first zero pivot or zero, and ``swaps`` is the number of row
+        exchanges. The diagonal of ``x`` is that of the upper triangular
+        factor.
+
+    """
+    batch, n = x.shape[:2]
+    info = cupy.empty(batch, numpy.int32)
+    if n <= _batched_small_size:
+        swaps = cupy.empty(batch, numpy.int32)
+        if b is None:
+            b = cupy.empty((batch, 0, n), x.dtype)
+        _lu_small_kernel(n, b.shape[1], x, b, info, swaps)
+        return info, swaps
+
+    # The library routines see the transposed matrices since they assume
+    # the column-major order. Its LU decomposition is used to solve the
+    # original systems.
+    ipiv = cupy.empty((batch, n), numpy.int32)
+    if batch == 1:
+        # The blocked routine of cuSOLVER is faster for a single matrix.
+        _getrf(x[0], ipiv[0], info)
+        if b is not None:
+            _getrs(x[0], ipiv[0], cublas.CUBLAS_OP_T, b[0].T)
+    else:
+        handle = device.get_cublas_handle()
+        if x.dtype == 'f':
+            getrf = cublas.sgetrfBatched
+            getrs = cublas.sgetrsBatched
+        else:  # x.dtype == 'd'
+            getrf = cublas.dgetrfBatched
+            getrs = cublas.dgetrsBatched
+        x_array = _batched_pointers(x)
+        getrf(handle, n, x_array.data.ptr, n, ipiv.data.ptr, info.data.ptr,
+              batch)
+        if b is not None:
+            b_array = _batched_pointers(b)
+            status = getrs(
+                handle, cublas.CUBLAS_OP_T, n, b.shape[1], x_array.data.ptr,
+                n, ipiv.data.ptr, b_array.data.ptr, n, batch)
+            if status < 0:
+                raise linalg.LinAlgError(
+                    'Parameter error (maybe caused by a bug in cupy.linalg?)')
+    # ipiv is 1-origin
+    swaps = (ipiv != cupy.arange(1, n + 1, dtype=numpy.int32)).sum(
+        axis=1, dtype=numpy.int32)
+    return info, swaps
+
+
+# Sizes of the workspace of getrf keyed by the device, the dtype and the
+# size of the matrix, so that repeated factorizations of the same shape skip
+# the query.
+_getrf_workspace_sizes = {}
+
+
+def _getrf(x, ipiv, info):
+    """LU decomposition of a matrix by cuSOLVER.
+
+    Args:
+        x (cupy.ndarray): The square matrix of float32 or float64, which is
+            overwritten by the factors. It must be F-contiguous, or
+            C-contiguous to factorize its transpose.
+        ipiv (cupy.ndarray): int32 array of length ``n`` to store the
+            one-based pivot indices.
+        info (cupy.ndarray): int32 array to store the info code.
+
+    """
+    n = len(x)
+    handle = device.get_cusolver_handle()
+    if x.dtype == 'f':
+        getrf_bufferSize = cusolver.sgetrf_bufferSize
+        getrf = cusolver.sgetrf
+    else:  # x.dtype == 'd'
+        getrf_bufferSize = cusolver.dgetrf_bufferSize
+        getrf = cusolver.dgetrf
+    key = (device.get_device_id(), x.dtype.char, n)
+    buffersize = _getrf_workspace_sizes.get(key)
+    if buffersize is None:
+        buffersize = getrf_bufferSize(handle, n, n, x.data.ptr, max(n, 1))
+        _getrf_workspace_sizes[key] = buffersize
+    workspace = device.get_cusolver_workspace(buffersize * x.itemsize)
+    getrf(handle, n, n, x.data.ptr, max(n, 1), workspace.ptr,
+          ipiv.data.ptr, info.data.ptr)
+
+
+def _getrs(x, ipiv, trans, b):
+    """Solves linear systems with the LU decomposition by cuSOLVER.
+
+    Args:
+        x (cupy.ndarray): The factors computed by :func:`_getrf`.
+        ipiv (cupy.ndarray): The pivot indices computed by :func:`_getrf`.
+        trans (int): ``CUBLAS_OP_N`` to solve the systems of the factorized
+            matrix in the column-major order, or ``CUBLAS_OP_T`` to solve
+            those of its transpose.
+        b (cupy.ndarray): F-contiguous vector or matrix of the right-hand
+            sides, which is overwritten by the solution.
+
+    """
+    n = len(x)
+    nrhs = 1 if b.ndim == 1 else b.shape[1]
+    handle = device.get_cusolver_handle()
+    dev_info = cupy.empty(1, dtype=numpy.int32)
+    if x.dtype == 'f':
+        getrs = cusolver.sgetrs
+    else:  # x.dtype == 'd'
+        getrs = cusolver.dgetrs
+    getrs(handle, trans, n, nrhs, x.data.ptr, max(n, 1), ipiv.data.ptr,
+          b.data.ptr, max(n, 1), dev_info.data.ptr)
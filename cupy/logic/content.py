@@ -3,8 +3,8 @@ from cupy import core
 
 def _create_float_test_ufunc(name, doc):
     return core.create_ufunc(
-        'cupy_' + name, ('e->?', 'f->?', 'd->?'), 'out0 = %s(in0)' % name,
-        doc=doc)
+        'cupy_' + name, ('e->?', 'f->?', 'd->?', 'F->?', 'D->?'),
+        'out0 = %s(in0)' % name, doc=doc)
 
 
 isfinite = _create_float_test_ufunc(
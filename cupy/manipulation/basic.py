@@ -2,6 +2,7 @@ import numpy
 import six
 
 from cupy import core
+from cupy.cuda import stream
 
 
 def copyto(dst, src, casting='same_kind', where=None):
@@ -45,7 +46,8 @@ def copyto(dst, src, casting='same_kind', where=None):
 
     if where is None:
         if _can_memcpy(dst, src):
-            dst.data.copy_from(src.data, src.nbytes)
+            dst.data.copy_from_async(src.data, src.nbytes,
+                                     stream.get_current_stream())
         else:
             device = dst.device
             with device:
@@ -12,7 +12,8 @@ def flip(a, axis):
         axis (int): Axis in array, which entries are reversed.
 
     Returns:
-        ~cupy.ndarray: Output array.
+        ~cupy.ndarray: Output array. It is a view of ``a`` with a negative
+        stride, so no data is copied.
 
     .. seealso:: :func:`numpy.flip`
 
@@ -38,14 +39,15 @@ def fliplr(a):
         a (~cupy.ndarray): Input array.
 
     Returns:
-        ~cupy.ndarray: Output array.
+        ~cupy.ndarray: Output array. It is a view of ``a`` with a negative
+        stride, so no data is copied.
 
     .. seealso:: :func:`numpy.fliplr`
 
     """
     if a.ndim < 2:
         raise ValueError('Input must be >= 2-d')
-    return cupy.take(a, cupy.arange(a.shape[1] - 1, -1, -1), axis=1)
+    return _flip(a, 1)
 
 
 def flipud(a):
@@ -58,14 +60,15 @@ def flipud(a):
         a (~cupy.ndarray): Input array.
 
     Returns:
-        ~cupy.ndarray: Output array.
+        ~cupy.ndarray: Output array. It is a view of ``a`` with a negative
+        stride, so no data is copied.
 
     .. seealso:: :func:`numpy.flipud`
 
     """
     if a.ndim < 1:
         raise ValueError('Input must be >= 1-d')
-    return cupy.take(a, cupy.arange(a.shape[0] - 1, -1, -1), axis=0)
+    return _flip(a, 0)
 
 
 def roll(a, shift, axis=None):
@@ -132,7 +135,7 @@ def rot90(a, k=1, axes=(0, 1)):
             the axes. Axes must be different.
 
     Returns:
-        ~cupy.ndarray: Output array.
+        ~cupy.ndarray: Output array. It is a view of ``a``.
 
     .. seealso:: :func:`numpy.rot90`
 
@@ -1,4 +1,19 @@
 import cupy
+from cupy import core
+
+
+_tile_kernel = core.ElementwiseKernel(
+    'raw T x', 'T y',
+    '''
+    const char* ptr = reinterpret_cast<const char*>(&x[0]);
+    for (int j = 0; j < _ind.ndim; ++j) {
+      ptr += x.strides()[j] * (_ind.get()[j] % x.shape()[j]);
+    }
+    y = *reinterpret_cast<const T*>(ptr);
+    ''',
+    'cupy_tile',
+    reduce_dims=False
+)
 
 
 def tile(A, reps):
@@ -30,26 +45,10 @@ def tile(A, reps):
     if d < c.ndim:
         tup = (1,) * (c.ndim - d) + tup
     shape_out = tuple(s * t for s, t in zip(c.shape, tup))
-    if c.size == 0:
-        return cupy.empty(shape_out, dtype=c.dtype)
-    c_shape = []
-    ret_shape = []
-    for dim_in, nrep in zip(c.shape, tup):
-        if nrep == 1:
-            c_shape.append(dim_in)
-            ret_shape.append(dim_in)
-        elif dim_in == 1:
-            c_shape.append(dim_in)
-            ret_shape.append(nrep)
-        else:
-            c_shape.append(1)
-            c_shape.append(dim_in)
-            ret_shape.append(nrep)
-            ret_shape.append(dim_in)
-    ret = cupy.empty(ret_shape, dtype=c.dtype)
+    ret = cupy.empty(shape_out, dtype=c.dtype)
     if ret.size:
-        ret[...] = c.reshape(c_shape)
-    return ret.reshape(shape_out)
+        _tile_kernel(c, ret)
+    return ret
 
 
 def repeat(a, repeats, axis=None):
@@ -57,7 +56,7 @@ def repeat(a, repeats, axis=None):
 
     Args:
         a (cupy.ndarray): Array to transform.
-        repeats (int, list or tuple): The number of repeats.
+        repeats (int, list, tuple or cupy.ndarray): The number of repeats.
         axis (int): The axis to repeat.
 
     Returns:
@@ -8,7 +8,7 @@ exp = ufunc.create_math_ufunc(
 
     .. seealso:: :data:`numpy.exp`
 
-    ''')
+    ''', support_complex=True)
 
 
 expm1 = ufunc.create_math_ufunc(
@@ -37,7 +37,7 @@ log = ufunc.create_math_ufunc(
 
     .. seealso:: :data:`numpy.log`
 
-    ''')
+    ''', support_complex=True)
 
 
 log10 = ufunc.create_math_ufunc(
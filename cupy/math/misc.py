@@ -34,7 +34,7 @@ sqrt = sqrt_fixed = core.sqrt
 square = core.create_ufunc(
     'cupy_square',
     ('b->b', 'B->B', 'h->h', 'H->H', 'i->i', 'I->I', 'l->l', 'L->L', 'q->q',
-     'Q->Q', 'e->e', 'f->f', 'd->d'),
+     'Q->Q', 'e->e', 'f->f', 'd->d', 'F->F', 'D->D'),
     'out0 = in0 * in0',
     doc='''Elementwise square function.
 
@@ -132,6 +132,41 @@ fmin = core.create_ufunc(
     ''')
 
 
+def real(val):
+    """Returns the real part of the elements of the array.
+
+    Args:
+        val (cupy.ndarray): Input array.
+
+    Returns:
+        cupy.ndarray: A view of the real parts if ``val`` is complex.
+        Otherwise, ``val`` itself.
+
+    .. seealso:: :func:`numpy.real`
+
+    """
+    return val.real
+
+
+def imag(val):
+    """Returns the imaginary part of the elements of the array.
+
+    Args:
+        val (cupy.ndarray): Input array.
+
+    Returns:
+        cupy.ndarray: A view of the imaginary parts if ``val`` is complex.
+        Otherwise, a new array filled with zeros.
+
+    .. seealso:: :func:`numpy.imag`
+
+    """
+    return val.imag
+
+
+conj = conjugate = core.conj
+
+
 # TODO(okuta): Implement nan_to_num
 
 
@@ -1,5 +1,4 @@
 import numpy
-import six
 
 from cupy import core
 
@@ -49,45 +48,24 @@ def prod(a, axis=None, dtype=None, out=None, keepdims=False):
 # TODO(okuta): Implement nansum
 
 
-def _axis_to_first(x, axis):
-    if axis < 0:
-        axis = x.ndim + axis
-    trans = [axis] + [a for a in six.moves.range(x.ndim) if a != axis]
-    pre = list(six.moves.range(1, axis + 1))
-    succ = list(six.moves.range(axis + 1, x.ndim))
-    revert = pre + [0] + succ
-    return trans, revert
-
-
-def _proc_as_batch(proc, x, axis):
-    trans, revert = _axis_to_first(x, axis)
-    t = x.transpose(trans)
-    s = t.shape
-    r = t.reshape(x.shape[axis], -1).T
-    result = proc(r)
-    return result.T.reshape(s).transpose(revert)
-
-
-def _cumsum_batch(out):
-    kern = core.ElementwiseKernel(
-        'int32 pos, int32 batch', 'raw T x',
-        '''
-        int b = i % batch;
-        int j = i / batch;
-        if (j & pos) {
-          const int dst_index[] = {b, j};
-          const int src_index[] = {b, j ^ pos | (pos - 1)};
-          x[dst_index] += x[src_index];
-        }
-        ''',
-        'cumsum_batch_kernel'
-    )
-
-    pos = 1
-    while pos < out.size:
-        kern(pos, out.shape[0], out, size=out.size)
-        pos <<= 1
-    return out
+def _cum_core(a, axis, dtype, out, op):
+    if dtype is None:
+        kind = a.dtype.kind
+        if kind == 'b':
+            dtype = numpy.dtype('l')
+        elif kind == 'i' and a.dtype.itemsize < numpy.dtype('l').itemsize:
+            dtype = numpy.dtype('l')
+        elif kind == 'u' and a.dtype.itemsize < numpy.dtype('L').itemsize:
+            dtype = numpy.dtype('L')
+        else:
+            dtype = a.dtype
+
+    if axis is None:
+        a = a.ravel()
+        axis = 0
+    elif not (-a.ndim <= axis < a.ndim):
+        raise ValueError('axis(={}) out of bounds'.format(axis))
+    return op.accumulate(a, axis, dtype, out)
 
 
 def cumsum(a, axis=None, dtype=None, out=None):
@@ -106,66 +84,7 @@ def cumsum(a, axis=None, dtype=None, out=None):
     .. seealso:: :func:`numpy.cumsum`
 
     """
-    if out is None:
-        if dtype is None:
-            kind = a.dtype.kind
-            if kind == 'b':
-                dtype = numpy.dtype('l')
-            elif kind == 'i' and a.dtype.itemsize < numpy.dtype('l').itemsize:
-                dtype = numpy.dtype('l')
-            elif kind == 'u' and a.dtype.itemsize < numpy.dtype('L').itemsize:
-                dtype = numpy.dtype('L')
-            else:
-                dtype = a.dtype
-
-        out = a.astype(dtype)
-    else:
-        out[...] = a
-
-    if axis is None:
-        out = out.ravel()
-    elif not (-a.ndim <= axis < a.ndim):
-        raise ValueError('axis(={}) out of bounds'.format(axis))
-    else:
-        return _proc_as_batch(_cumsum_batch, out, axis=axis)
-
-    kern = core.ElementwiseKernel(
-        'int32 pos', 'raw T x',
-        '''
-        if (i & pos) {
-          x[i] += x[i ^ pos | (pos - 1)];
-        }
-        ''',
-        'cumsum_kernel'
-    )
-
-    pos = 1
-    while pos < out.size:
-        kern(pos, out, size=out.size)
-        pos <<= 1
-    return out
-
-
-def _cumprod_batch(out):
-    kern = core.ElementwiseKernel(
-        'int64 pos, int64 batch', 'raw T x',
-        '''
-        int b = i % batch;
-        int j = i / batch;
-        if (j & pos) {
-          const int dst_index[] = {b, j};
-          const int src_index[] = {b, j ^ pos | (pos - 1)};
-          x[dst_index] *= x[src_index];
-        }
-        ''',
-        'cumprod_batch_kernel'
-    )
-
-    pos = 1
-    while pos < out.size:
-        kern(pos, out.shape[0], out, size=out.size)
-        pos <<= 1
-    return out
+    return _cum_core(a, axis, dtype, out, core.add)
 
 
 def cumprod(a, axis=None, dtype=None, out=None):
@@ -184,44 +103,7 @@ def cumprod(a, axis=None, dtype=None, out=None):
     .. seealso:: :func:`numpy.cumprod`
 
     """
-    if out is None:
-        if dtype is None:
-            kind = a.dtype.kind
-            if kind == 'b':
-                dtype = numpy.dtype('l')
-            elif kind == 'i' and a.dtype.itemsize < numpy.dtype('l').itemsize:
-                dtype = numpy.dtype('l')
-            elif kind == 'u' and a.dtype.itemsize < numpy.dtype('L').itemsize:
-                dtype = numpy.dtype('L')
-            else:
-                dtype = a.dtype
-
-        out = a.astype(dtype)
-    else:
-        out[...] = a
-
-    if axis is None:
-        out = out.ravel()
-    elif not (-a.ndim <= axis < a.ndim):
-        raise ValueError('axis(={}) out of bounds'.format(axis))
-    else:
-        return _proc_as_batch(_cumprod_batch, out, axis=axis)
-
-    kern = core.ElementwiseKernel(
-        'int64 pos', 'raw T x',
-        '''
-        if (i & pos) {
-          x[i] *= x[i ^ pos | (pos - 1)];
-        }
-        ''',
-        'cumprod_kernel'
-    )
-
-    pos = 1
-    while pos < out.size:
-        kern(pos, out, size=out.size)
-        pos <<= 1
-    return out
+    return _cum_core(a, axis, dtype, out, core.multiply)
 
 
 # TODO(okuta): Implement diff
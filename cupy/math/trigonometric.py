@@ -8,7 +8,7 @@ sin = ufunc.create_math_ufunc(
 
     .. seealso:: :data:`numpy.sin`
 
-    ''')
+    ''', support_complex=True)
 
 
 cos = ufunc.create_math_ufunc(
@@ -17,7 +17,7 @@ cos = ufunc.create_math_ufunc(
 
     .. seealso:: :data:`numpy.cos`
 
-    ''')
+    ''', support_complex=True)
 
 
 tan = ufunc.create_math_ufunc(
@@ -1,13 +1,17 @@
 from cupy import core
 
 
-def create_math_ufunc(math_name, nargs, name, doc):
+def create_math_ufunc(math_name, nargs, name, doc, support_complex=False):
     assert 1 <= nargs <= 2
     if nargs == 1:
+        types = ('e->e', 'f->f', 'd->d')
+        if support_complex:
+            types += ('F->F', 'D->D')
         return core.create_ufunc(
-            name, ('e->e', 'f->f', 'd->d'),
-            'out0 = %s(in0)' % math_name, doc=doc)
+            name, types, 'out0 = %s(in0)' % math_name, doc=doc)
     else:
+        types = ('ee->e', 'ff->f', 'dd->d')
+        if support_complex:
+            types += ('FF->F', 'DD->D')
         return core.create_ufunc(
-            name, ('ee->e', 'ff->f', 'dd->d'),
-            'out0 = %s(in0, in1)' % math_name, doc=doc)
+            name, types, 'out0 = %s(in0, in1)' % math_name, doc=doc)
@@ -2,25 +2,8 @@ import numpy
 import six
 
 import cupy
-
-
-def _prepend_const(narray, pad_amount, value, axis=-1):
-    if pad_amount == 0:
-        return narray
-    padshape = tuple(x if i != axis else pad_amount
-                     for i, x in enumerate(narray.shape))
-    return cupy.concatenate((cupy.full(padshape, value, narray.dtype),
-                             narray), axis=axis)
-
-
-def _append_const(narray, pad_amount, value, axis=-1):
-    if pad_amount == 0:
-        return narray
-    padshape = tuple(x if i != axis else pad_amount
-                     for i, x in enumerate(narray.shape))
-    return cupy.concatenate((narray,
-                             cupy.full(padshape, value, narray.dtype)),
-                            axis=axis)
+from cupy import core
+from cupy import util
 
 
 def _normalize_shape(ndarray, shape, cast_to_int=True):
@@ -51,10 +34,81 @@ def _validate_lengths(narray, number_elements):
     return shape
 
 
-def pad(array, pad_width, mode, **keywords):
+_index_exprs = {
+    'edge': '''
+        if (j < 0) j = 0;
+        if (j >= n) j = n - 1;''',
+    'wrap': '''
+        j %= n;
+        if (j < 0) j += n;''',
+    'reflect': '''
+        if (n == 1) {
+          j = 0;
+        } else {
+          ptrdiff_t period = 2 * (n - 1);
+          j %= period;
+          if (j < 0) j += period;
+          if (j >= n) j = period - j;
+        }''',
+    'symmetric': '''
+        ptrdiff_t period = 2 * n;
+        j %= period;
+        if (j < 0) j += period;
+        if (j >= n) j = period - 1 - j;''',
+}
+
+
+@util.memoize()
+def _get_pad_kernel(mode, ndim):
+    in_params = ['raw T x'] + ['int64 b%d' % i for i in range(ndim)]
+    if mode == 'constant':
+        in_params += ['T c%d_%d' % (i, j) for i in range(ndim)
+                      for j in range(2)]
+    ops = []
+    if ndim == 0:
+        ops.append('y = x[0];')
+    elif mode == 'constant':
+        # Constants of the last axis are used at the corners as NumPy does.
+        ops.append('bool fill = false;')
+        ops.append('T value;')
+        for i in range(ndim):
+            ops.append('''
+            ptrdiff_t j{0} = _ind.get()[{0}] - b{0};
+            if (j{0} < 0) {{
+              fill = true;
+              value = c{0}_0;
+            }} else if (j{0} >= x.shape()[{0}]) {{
+              fill = true;
+              value = c{0}_1;
+            }}'''.format(i))
+        ops.append('if (fill) {')
+        ops.append('  y = value;')
+        ops.append('} else {')
+        ops.append('  const ptrdiff_t index[] = {%s};' % ', '.join(
+            'j%d' % i for i in range(ndim)))
+        ops.append('  y = x[index];')
+        ops.append('}')
+    else:
+        ops.append('ptrdiff_t index[%d];' % ndim)
+        for i in range(ndim):
+            ops.append('''
+            {{
+              ptrdiff_t n = x.shape()[{0}];
+              ptrdiff_t j = _ind.get()[{0}] - b{0};
+              {1}
+              index[{0}] = j;
+            }}'''.format(i, _index_exprs[mode]))
+        ops.append('y = x[index];')
+    return core.ElementwiseKernel(
+        ', '.join(in_params), 'T y', '\n'.join(ops),
+        'cupy_pad_' + mode, reduce_dims=False)
+
+
+def pad(array, pad_width, mode='constant', out=None, **keywords):
     """Returns padded array. You can specify the padded widths and values.
 
-    This function currently supports only ``mode=constant`` .
+    The padded array is written by a single kernel, which computes the
+    index of the source element or the constant for each output element.
 
     Args:
         array (array-like): Input array of rank N.
@@ -69,6 +123,20 @@ def pad(array, pad_width, mode, **keywords):
         mode (str):
             'constant'
                 Pads with a constant values.
+            'edge'
+                Pads with the edge values of array.
+            'reflect'
+                Pads with the reflection of the vector mirrored on the first
+                and last values of the vector along each axis.
+            'symmetric'
+                Pads with the reflection of the vector mirrored along the edge
+                of the array.
+            'wrap'
+                Pads with the wrap of the vector along the axis. The first
+                values are used to pad the end and the end values are used to
+                pad the beginning.
+        out (cupy.ndarray): Output array of the padded shape and the same
+            dtype as ``array``. A new array is allocated by default.
         constant_values (int or array-like): Used in
             ``constant``.
             The values are padded for each axis.
@@ -79,6 +147,8 @@ def pad(array, pad_width, mode, **keywords):
             (constant,) or int is a shortcut for before = after = constant for
             all axes.
             Default is 0. You cannot specify ``cupy.ndarray`` .
+        reflect_type (str): Used in ``reflect`` and ``symmetric``. Only
+            ``'even'``, the default, is supported.
 
     Returns:
         cupy.ndarray:
@@ -90,15 +160,20 @@ def pad(array, pad_width, mode, **keywords):
     """
     if not numpy.asarray(pad_width).dtype.kind == 'i':
         raise TypeError('pad_width must be of integral type.')
-    narray = cupy.array(array)
+    narray = cupy.array(array, copy=False)
     pad_width = _validate_lengths(narray, pad_width)
     allowed_keywords = {
         'constant': ['constant_values'],
+        'edge': [],
+        'wrap': [],
+        'reflect': ['reflect_type'],
+        'symmetric': ['reflect_type'],
     }
     keyword_defaults = {
         'constant_values': 0,
+        'reflect_type': 'even',
     }
-    if mode != 'constant':
+    if mode not in allowed_keywords:
         raise NotImplementedError
     for key in keywords:
         if key not in allowed_keywords[mode]:
@@ -106,14 +181,31 @@ def pad(array, pad_width, mode, **keywords):
                              (key, allowed_keywords[mode]))
     for allowed_keyword in allowed_keywords[mode]:
         keywords.setdefault(allowed_keyword, keyword_defaults[allowed_keyword])
-    for key in keywords:
-        if key == 'constant_values':
-            keywords[key] = _normalize_shape(narray, keywords[key],
-                                             cast_to_int=False)
-    newmatrix = narray.copy()
-    for axis, ((pad_before, pad_after), (before_value, after_value)) \
-            in enumerate(six.moves.zip(pad_width,
-                                       keywords['constant_values'])):
-        newmatrix = _prepend_const(newmatrix, pad_before, before_value, axis)
-        newmatrix = _append_const(newmatrix, pad_after, after_value, axis)
-    return newmatrix
+    if keywords.get('reflect_type', 'even') != 'even':
+        raise NotImplementedError
+
+    shape = tuple(n + before + after
+                  for n, (before, after) in zip(narray.shape, pad_width))
+    if mode != 'constant':
+        for axis, (n, (before, after)) in enumerate(
+                six.moves.zip(narray.shape, pad_width)):
+            if n == 0 and (before or after):
+                raise ValueError(
+                    "can't extend empty axis %d using modes other than "
+                    "'constant'" % axis)
+
+    if out is None:
+        out = cupy.empty(shape, dtype=narray.dtype)
+    elif out.shape != shape:
+        raise ValueError('out must have the shape %s' % (shape,))
+    if out.size == 0:
+        return out
+
+    args = [narray] + [before for before, _ in pad_width]
+    if mode == 'constant':
+        constant_values = _normalize_shape(
+            narray, keywords['constant_values'], cast_to_int=False)
+        for values in constant_values:
+            args.extend(values)
+    _get_pad_kernel(mode, narray.ndim)(*(args + [out]))
+    return out
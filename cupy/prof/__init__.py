@@ -1,2 +1,5 @@
+from cupy.prof.auto_range import auto_range  # NOQA
+from cupy.prof.auto_range import is_auto_range_enabled  # NOQA
+from cupy.prof.auto_range import set_auto_range  # NOQA
 from cupy.prof.time_range import time_range  # NOQA
 from cupy.prof.time_range import TimeRangeDecorator  # NOQA
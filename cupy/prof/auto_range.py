@@ -0,0 +1,90 @@
+import contextlib
+import functools
+
+from cupy import cuda
+from cupy.core import core
+
+
+def set_auto_range(enabled):
+    """Enables or disables automatic NVTX ranges.
+
+    While enabled, every kernel launch and every library routine called by
+    CuPy is marked as a range in NVIDIA profiler timeline. Ranges are named
+    after the ufunc, the kernel or the routine, followed by the dtype and the
+    shape of the operation. They nest under ranges made by
+    :func:`cupy.prof.time_range`.
+
+    Automatic ranges can also be enabled by setting the
+    ``CUPY_NVTX_AUTO_RANGE`` environment variable to ``1``.
+
+    Args:
+        enabled (bool): If ``True``, automatic ranges are enabled.
+
+    .. seealso:: :func:`cupy.prof.auto_range`
+
+    """
+    core.set_auto_range(enabled)
+
+
+def is_auto_range_enabled():
+    """Returns ``True`` if automatic NVTX ranges are enabled."""
+    return core.is_auto_range_enabled()
+
+
+@contextlib.contextmanager
+def auto_range(enabled=True):
+    """A context manager to enable automatic NVTX ranges in the enclosed block
+
+    >>> from cupy import prof
+    >>> with cupy.prof.auto_range():
+    ...    # every kernel launched here is marked as a range
+    ...    pass
+
+    Args:
+        enabled (bool): If ``True``, automatic ranges are enabled in the
+            block. Otherwise they are disabled in the block.
+
+    .. seealso:: :func:`cupy.prof.set_auto_range`
+    """
+    old = core.is_auto_range_enabled()
+    core.set_auto_range(enabled)
+    try:
+        yield
+    finally:
+        core.set_auto_range(old)
+
+
+def _find_operand(args):
+    for a in args:
+        if hasattr(a, 'dtype') and hasattr(a, 'shape'):
+            return a
+    return None
+
+
+def annotate_routine(name):
+    """Decorator to mark calls of a library routine with an automatic range.
+
+    The range is pushed only when automatic ranges are enabled. The dtype and
+    the shape of the first array-like argument are added to the name.
+
+    Args:
+        name (str): Name of the range, e.g. ``'cusolver.potrf'``.
+
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def inner(*args, **kwargs):
+            if not core.is_auto_range_enabled():
+                return func(*args, **kwargs)
+            a = _find_operand(args)
+            if a is None:
+                message = name
+            else:
+                message = '%s (%s, %s)' % (name, a.dtype, a.shape)
+            cuda.nvtx.RangePush(message)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                cuda.nvtx.RangePop()
+        return inner
+    return decorator
@@ -238,6 +238,11 @@ class RandomState(object):
     def choice(self, a, size=None, replace=True, p=None):
         """Returns an array of random values from a given 1-D array.
 
+        Weighted sampling with replacement is done by binary searches on the
+        cumulative sum of ``p``. Sampling without replacement is done by
+        sorting random keys, which are exponentially distributed with rates
+        ``p`` if ``p`` is given.
+
         .. seealso::
             :func:`cupy.random.choice` for full document,
             :meth:`numpy.random.choice`
@@ -260,37 +265,45 @@ class RandomState(object):
                 if a_size == 0:
                     raise ValueError('a must be non-empty')
 
+        if size is None:
+            raise NotImplementedError
+        shape = size
+        size = six.moves.reduce(operator.mul, core.get_size(shape), 1)
+        if not replace and size > a_size:
+            raise ValueError('Cannot take a larger sample than population '
+                             'when \'replace=False\'')
+
         if p is not None:
-            p = cupy.array(p)
+            if not isinstance(p, cupy.ndarray):
+                p = numpy.asarray(p, dtype=numpy.float64)
             if p.ndim != 1:
                 raise ValueError('p must be 1-dimensional')
             if len(p) != a_size:
                 raise ValueError('a and p must have same size')
-            if not (p >= 0).all():
+            p, cdf, p_min, p_sum, p_nonzero = _get_probabilities(p)
+            if p_min < 0:
                 raise ValueError('probabilities are not non-negative')
-            p_sum = cupy.sum(p).get()
             if not numpy.allclose(p_sum, 1):
                 raise ValueError('probabilities do not sum to 1')
+            if not replace and p_nonzero < size:
+                raise ValueError('Fewer non-zero entries in p than size')
 
-        if not replace:
-            raise NotImplementedError
-
-        if size is None:
-            raise NotImplementedError
-        shape = size
-        size = numpy.prod(shape)
-
-        if p is not None:
-            p = cupy.broadcast_to(p, (size, a_size))
-            index = cupy.argmax(cupy.log(p) +
-                                cupy.random.gumbel(size=(size, a_size)),
-                                axis=1)
-            if not isinstance(shape, six.integer_types):
-                index = cupy.reshape(index, shape)
+        if replace:
+            if p is not None:
+                r = self.random_sample(size=shape, dtype=numpy.float64)
+                index = _choice_search_kernel(r, cdf, a_size)
+            else:
+                index = cupy.random.randint(0, a_size, size=shape)
+                # Align the dtype with NumPy
+                index = index.astype(cupy.int64, copy=False)
         else:
-            index = cupy.random.randint(0, a_size, size=shape)
-            # Align the dtype with NumPy
+            keys = self.random_sample(size=a_size, dtype=numpy.float64)
+            if p is not None:
+                keys = _exponential_key_kernel(keys, p)
+            index = cupy.argsort(keys)[:size]
             index = index.astype(cupy.int64, copy=False)
+            if not isinstance(shape, six.integer_types):
+                index = cupy.reshape(index, shape)
 
         if isinstance(a, six.integer_types):
             return index
@@ -301,6 +314,59 @@ class RandomState(object):
         return a[index]
 
 
+def _get_probabilities(p):
+    """Returns the probabilities on the device with their statistics.
+
+    The cumulative sum is also returned. Probabilities given on the host are
+    checked on the host, so that the device is not synchronized. Otherwise,
+    the statistics are transferred at once.
+
+    """
+    if isinstance(p, numpy.ndarray):
+        cdf = cupy.array(numpy.cumsum(p))
+        return (cupy.array(p), cdf, p.min(), p.sum(),
+                numpy.count_nonzero(p))
+    p = p.astype(numpy.float64, copy=False)
+    cdf = cupy.cumsum(p)
+    stats = cupy.concatenate((
+        p.min(keepdims=True), cdf[-1:],
+        cupy.count_nonzero(p).astype(numpy.float64).reshape(1))).get()
+    return p, cdf, stats[0], stats[1], stats[2]
+
+
+# Searches the first index whose cumulative probability exceeds r times the
+# total. Indices of zero probability are skipped even if r * total is rounded
+# up to the total.
+_choice_search_kernel = core.ElementwiseKernel(
+    'float64 r, raw float64 cdf, int64 n', 'int64 index',
+    '''
+    double x = r * cdf[n - 1];
+    ptrdiff_t lo = 0, hi = n - 1;
+    while (lo < hi) {
+        ptrdiff_t mid = lo + (hi - lo) / 2;
+        if (cdf[mid] > x) {
+            hi = mid;
+        } else {
+            lo = mid + 1;
+        }
+    }
+    while (lo > 0 && cdf[lo - 1] == cdf[lo]) {
+        --lo;
+    }
+    index = lo;
+    ''',
+    'cupy_random_choice_search')
+
+
+# The indices with the smallest keys are a sample without replacement
+# weighted by p.
+_exponential_key_kernel = core.ElementwiseKernel(
+    'float64 r, float64 p', 'float64 key',
+    'key = p > 0 ? -log1p(-r) / p '
+    '    : __longlong_as_double(0x7ff0000000000000LL)',
+    'cupy_random_exponential_key')
+
+
 def seed(seed=None):
     """Resets the state of the random number generator with a seed.
 
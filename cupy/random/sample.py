@@ -144,7 +144,9 @@ def choice(a, size=None, replace=True, p=None):
     """Returns an array of random values from a given 1-D array.
 
     Each element of the returned array is independently sampled
-    from ``a`` according to ``p`` or uniformly.
+    from ``a`` according to ``p`` or uniformly. If ``replace`` is ``False``,
+    the elements are sampled without replacement, i.e. they are distinct
+    entries of ``a``.
 
     Args:
         a (1-D array-like or int):
@@ -1,4 +1,8 @@
+import numpy
+
+import cupy
 from cupy import core
+from cupy import util
 
 
 def argmax(a, axis=None, dtype=None, out=None, keepdims=False):
@@ -131,7 +135,117 @@ _where_ufunc = core.create_ufunc(
     'out0 = in0 ? in1 : in2')
 
 
-# TODO(okuta): Implement searchsorted
+# Haystacks of at most this length are staged in shared memory.
+_searchsorted_shared_size = 2048
+
+_searchsorted_preamble = '''
+template <typename T>
+__device__ bool _searchsorted_less(T a, T b) {
+  // NaNs are regarded as larger than any number as in sorting.
+  return a < b || (b != b && a == a);
+}
+
+// Clips an index given by the sorter, which is not validated on the host.
+__device__ long long _searchsorted_clip(long long j, long long n) {
+  return j < 0 ? 0 : j >= n ? n - 1 : j;
+}
+'''
+
+_searchsorted_code = '''
+  T _v = x;
+  long long _lo = 0, _hi = n_bins;
+  bool _rev = detect_order && n_bins > 1 &&
+      _searchsorted_less(_BIN(n_bins - 1), _BIN(0));
+  while (_lo < _hi) {
+    long long _mid = _lo + (_hi - _lo) / 2;
+    T _b = _BIN(_rev ? n_bins - 1 - _mid : _mid);
+    if (right ? !_searchsorted_less(_v, _b) : _searchsorted_less(_b, _v)) {
+      _lo = _mid + 1;
+    } else {
+      _hi = _mid;
+    }
+  }
+  y = _rev ? n_bins - _lo : _lo;
+'''
+
+
+@util.memoize()
+def _get_searchsorted_kernel(use_sorter, use_shared):
+    in_params = 'S x, raw T bins, '
+    if use_sorter:
+        in_params += 'raw U sorter, '
+        load = 'bins[_searchsorted_clip(sorter[j], n_bins)]'
+    else:
+        load = 'bins[j]'
+    in_params += 'int64 n_bins, bool right, bool detect_order'
+    if use_shared:
+        loop_prep = '''
+        __shared__ T _sbins[%d];
+        for (long long j = threadIdx.x; j < n_bins; j += blockDim.x) {
+          _sbins[j] = %s;
+        }
+        __syncthreads();
+        ''' % (_searchsorted_shared_size, load)
+        bin_expr = '_sbins[j]'
+    else:
+        loop_prep = ''
+        bin_expr = load
+    return core.ElementwiseKernel(
+        in_params, 'int64 y', _searchsorted_code, 'cupy_searchsorted',
+        preamble=_searchsorted_preamble + '#define _BIN(j) (%s)\n' % bin_expr,
+        loop_prep=loop_prep)
+
+
+def _searchsorted(a, v, right, sorter, detect_order):
+    if a.ndim != 1:
+        raise ValueError('object too deep for desired array')
+    if not isinstance(v, cupy.ndarray):
+        v = cupy.asarray(v)
+    dtype = numpy.promote_types(a.dtype, v.dtype)
+    if a.dtype != dtype:
+        a = a.astype(dtype)
+    use_shared = a.size <= _searchsorted_shared_size
+    if sorter is None:
+        kern = _get_searchsorted_kernel(False, use_shared)
+        return kern(v, a, a.size, right, detect_order)
+    if sorter.shape != a.shape:
+        raise ValueError('sorter.size must equal a.size')
+    if sorter.dtype.kind not in 'iu':
+        raise TypeError('sorter must only contain integers')
+    kern = _get_searchsorted_kernel(True, use_shared)
+    return kern(v, a, sorter, a.size, right, detect_order)
+
+
+def searchsorted(a, v, side='left', sorter=None):
+    """Finds indices where elements should be inserted to maintain order.
+
+    Each element of ``v`` is looked up by a binary search in parallel. If
+    ``a`` is short, it is first staged in the shared memory of each block.
+    The result stays on the device, so no synchronization is needed.
+
+    Args:
+        a (cupy.ndarray): Input 1-D array sorted in ascending order. NaNs are
+            expected at the end as :func:`cupy.sort` places them.
+        v (cupy.ndarray or scalar): Values to insert into ``a``.
+        side ({'left', 'right'}): If ``'left'``, the index of the first
+            suitable location is given. If ``'right'``, the last such index
+            is given.
+        sorter (cupy.ndarray): Optional array of integer indices that sort
+            ``a`` into ascending order, e.g. the result of
+            :func:`cupy.argsort`. The indices must be in the range
+            ``[0, len(a))``. They are not checked, so that the device is not
+            synchronized, and indices out of the range are clipped to it.
+
+    Returns:
+        cupy.ndarray: Array of insertion points with the same shape as
+        ``v``.
+
+    .. seealso:: :func:`numpy.searchsorted`
+
+    """
+    if side not in ('left', 'right'):
+        raise ValueError('side must be \'left\' or \'right\'')
+    return _searchsorted(a, v, side == 'right', sorter, False)
 
 
 # TODO(okuta): Implement extract
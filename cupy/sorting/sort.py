@@ -1,4 +1,5 @@
 import cupy
+from cupy import core
 import numpy
 
 if cupy.cuda.thrust_enabled:
@@ -127,7 +128,124 @@ def msort(a):
 # TODO(okuta): Implement sort_complex
 
 
-# TODO(okuta): Implement partition
+def partition(a, kth, axis=-1):
+    """Returns a partially sorted copy of an array.
 
+    Creates a copy of the array whose elements are rearranged such that the
+    value of the element in k-th position would occur in that position in a
+    sorted array. All of the elements before the new k-th element are less
+    than or equal to the elements after the new k-th element.
 
-# TODO(okuta): Implement argpartition
+    Args:
+        a (cupy.ndarray): Array to be sorted.
+        kth (int or sequence of ints): Element index to partition by. If
+            supplied with a sequence of k-th it will partition all elements
+            indexed by k-th of them into their sorted position at once.
+        axis (int or None): Axis along which to sort. Default is -1, which
+            means sort along the last axis. If None is supplied, the array is
+            flattened before sorting.
+
+    Returns:
+        cupy.ndarray: Array of the same type and shape as ``a``.
+
+    .. note::
+       For its implementation reason, ``cupy.partition`` does not support
+       ``kind`` and ``order`` parameters.
+
+    .. seealso:: :func:`numpy.partition`
+
+    """
+    if axis is None:
+        ret = a.flatten()
+        axis = -1
+    else:
+        ret = a.copy()
+    ret.partition(kth, axis=axis)
+    return ret
+
+
+def argpartition(a, kth, axis=-1):
+    """Returns the indices that would partially sort an array.
+
+    Args:
+        a (cupy.ndarray): Array to be sorted.
+        kth (int or sequence of ints): Element index to partition by. If
+            supplied with a sequence of k-th it will partition all elements
+            indexed by k-th of them into their sorted position at once.
+        axis (int or None): Axis along which to sort. Default is -1, which
+            means sort along the last axis. If None is supplied, the array is
+            flattened before sorting.
+
+    Returns:
+        cupy.ndarray: Array of indices that partition ``a``.
+
+    .. note::
+       For its implementation reason, ``cupy.argpartition`` does not support
+       ``kind`` and ``order`` parameters.
+
+    .. seealso:: :func:`numpy.argpartition`
+
+    """
+    return a.argpartition(kth, axis=axis)
+
+
+_take_rows_kernel = core.ElementwiseKernel(
+    'raw T a, S idx, int64 n, int64 k', 'T out',
+    'out = a[(i / k) * n + idx]',
+    'cupy_take_rows')
+
+
+def _take_rows(a, idx):
+    # Takes idx[..., j]-th elements of the last axis of a.
+    return _take_rows_kernel(a, idx, a.shape[-1], idx.shape[-1])
+
+
+def topk(a, k, axis=-1, largest=True):
+    """Returns the k largest or smallest elements along an axis.
+
+    The elements are selected by :func:`cupy.argpartition`, whose cost grows
+    linearly with the length of the axis, and only the selected ones are
+    sorted. Each row along the axis is processed independently, so batches
+    of rows are handled at once.
+
+    Args:
+        a (cupy.ndarray): Input array.
+        k (int): Number of elements to return.
+        axis (int): Axis along which to select. Default is -1, which means
+            the last axis.
+        largest (bool): If ``True``, the largest elements are returned in
+            descending order. Otherwise, the smallest elements are returned in
+            ascending order. NaNs are regarded as larger than any number.
+
+    Returns:
+        tuple of cupy.ndarray: The selected values and their indices along
+        the axis. Both have the same shape as ``a`` except that the length of
+        the axis is ``k``.
+
+    """
+    ndim = a.ndim
+    if ndim == 0:
+        raise ValueError('topk requires an array with the rank of one or '
+                         'more')
+    if not -ndim <= axis < ndim:
+        raise ValueError('Axis out of range')
+    axis %= ndim
+    n = a.shape[axis]
+    if not 0 <= k <= n:
+        raise ValueError('k(=%d) out of bounds (%d)' % (k, n))
+
+    a = cupy.rollaxis(a, axis, ndim)
+    if k == 0 or a.size == 0:
+        idx = cupy.empty(a.shape[:-1] + (k,), dtype=numpy.intp)
+    elif largest:
+        idx = a.argpartition(n - k)[..., n - k:]
+    else:
+        idx = a.argpartition(k - 1)[..., :k]
+    values = _take_rows(a, idx)
+
+    order = values.argsort()
+    if largest:
+        order = order[..., ::-1]
+    values = _take_rows(values, order)
+    idx = _take_rows(idx, order)
+    return (cupy.rollaxis(values, -1, axis), cupy.rollaxis(idx, -1, axis))
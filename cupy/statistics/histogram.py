@@ -1,9 +1,239 @@
 import numpy
+import six
 
 import cupy
+from cupy import core
+from cupy.sorting import search
+from cupy import util
 
 
-# TODO(okuta): Implement histogram
+# Histograms of at most this many bins are privatized in shared memory. Each
+# block counts its elements in its own copy of the bins, and the copies are
+# merged into the output at the end of the block.
+_histogram_shared_size = 4096
+
+_histogram_preamble = '''
+__device__ void _hist_add(unsigned int* p, unsigned int v) {
+  atomicAdd(p, v);
+}
+
+__device__ void _hist_add(long long* p, unsigned long long v) {
+  atomicAdd(reinterpret_cast<unsigned long long*>(p), v);
+}
+
+__device__ void _hist_add(double* p, double v) {
+#if __CUDA_ARCH__ >= 600
+  atomicAdd(p, v);
+#else
+  unsigned long long* a = reinterpret_cast<unsigned long long*>(p);
+  unsigned long long old = *a, assumed;
+  do {
+    assumed = old;
+    old = atomicCAS(
+        a, assumed, __double_as_longlong(v + __longlong_as_double(assumed)));
+  } while (assumed != old);
+#endif
+}
+'''
+
+
+@util.memoize()
+def _get_histogram_kernel(in_params, index_code, weighted, name):
+    """Returns a kernel adding each element to the bin it belongs to.
+
+    ``index_code`` sets ``_k`` to the bin of the element. Elements whose
+    ``_k`` is out of ``[0, n_bins)`` are ignored. If ``weighted`` is true,
+    ``w`` is added to the bins of type ``float64``. Otherwise, the bins of
+    type ``int64`` are incremented. If ``n_bins`` is small enough, the
+    kernel must be launched with ``shared`` set to ``True`` to privatize the
+    bins in shared memory.
+
+    """
+    if weighted:
+        acc_type, value, out_params = 'double', '(double)w', 'raw float64 hist'
+    else:
+        acc_type, value, out_params = 'unsigned int', '1U', 'raw int64 hist'
+    global_value = '(double)w' if weighted else '1ULL'
+    merged_value = '_sbins[j]' if weighted else (
+        '(unsigned long long)_sbins[j]')
+    loop_prep = '''
+      __shared__ %(acc_type)s _sbins[%(size)d];
+      if (shared) {
+        for (int j = threadIdx.x; j < n_bins; j += blockDim.x) {
+          _sbins[j] = 0;
+        }
+        __syncthreads();
+      }
+    ''' % {'acc_type': acc_type, 'size': _histogram_shared_size}
+    operation = '''
+      long long _k;
+      %(index_code)s;
+      if (0 <= _k && _k < n_bins) {
+        if (shared) {
+          _hist_add(&_sbins[_k], %(value)s);
+        } else {
+          _hist_add(&hist[_k], %(global_value)s);
+        }
+      }
+    ''' % {'index_code': index_code, 'value': value,
+           'global_value': global_value}
+    after_loop = '''
+      if (shared) {
+        __syncthreads();
+        for (int j = threadIdx.x; j < n_bins; j += blockDim.x) {
+          if (_sbins[j] != 0) {
+            _hist_add(&hist[j], %s);
+          }
+        }
+      }
+    ''' % merged_value
+    return core.ElementwiseKernel(
+        in_params + ', int64 n_bins, bool shared', out_params, operation,
+        name, preamble=_histogram_preamble, loop_prep=loop_prep,
+        after_loop=after_loop)
+
+
+def _histogram(kernel_args, n_bins, in_params, index_code, weights, name):
+    # Counts the elements into n_bins bins by the kernel and returns the bins.
+    if weights is None:
+        hist = cupy.zeros((n_bins,), dtype=numpy.intp)
+    else:
+        hist = cupy.zeros((n_bins,), dtype=numpy.float64)
+        kernel_args = kernel_args + (weights,)
+        in_params += ', T w'
+    kern = _get_histogram_kernel(
+        in_params, index_code, weights is not None, name)
+    kern(*(kernel_args + (n_bins, n_bins <= _histogram_shared_size, hist)))
+    return hist
+
+
+# The largest value of the input of bincount. It is the largest int64 value
+# if the input has negative values, so that the input is validated in the
+# same pass.
+_bincount_max = core.ReductionKernel(
+    'S x', 'int64 y',
+    'x < 0 ? 0x7fffffffffffffffLL : (long long)x',
+    'max(a, b)', 'y = a', '-1', 'cupy_bincount_max')
+
+
+def histogram(a, bins=10, range=None, weights=None, density=False):
+    """Computes the histogram of a set of data.
+
+    If ``bins`` is an integer, the bins have the same width and each element
+    is assigned to its bin arithmetically. Otherwise, the bins are looked up
+    by :func:`cupy.searchsorted`. The counts of each block are accumulated
+    in shared memory before they are merged.
+
+    Args:
+        a (cupy.ndarray): Input data. The histogram is computed over the
+            flattened array.
+        bins (int or cupy.ndarray or sequence): If an integer, the number of
+            equal-width bins. Otherwise, the monotonically increasing bin
+            edges including the rightmost edge. The monotonicity of edges
+            given as a :class:`cupy.ndarray` is not checked.
+        range (tuple of floats): The lower and upper range of the bins. The
+            minimum and the maximum of ``a`` are used by default.
+        weights (cupy.ndarray): Weights of the elements of ``a``, which has
+            the same shape as ``a``.
+        density (bool): If ``True``, the value of the probability density
+            function at each bin is returned instead of the counts.
+
+    Returns:
+        tuple: The histogram of type ``int64``, or of the type of
+        ``weights`` or ``float64`` if ``weights`` or ``density`` is given,
+        and the bin edges of length ``len(hist) + 1``.
+
+    .. seealso:: :func:`numpy.histogram`
+
+    """
+    if a.dtype.kind == 'c':
+        raise NotImplementedError('complex data is not supported')
+    if weights is not None:
+        if weights.shape != a.shape:
+            raise ValueError('weights should have the same shape as a.')
+        weights = weights.ravel()
+    a = a.ravel()
+
+    if range is not None:
+        first_edge, last_edge = range
+        if first_edge > last_edge:
+            raise ValueError(
+                'max must be larger than min in range parameter.')
+        if not (numpy.isfinite(first_edge) and numpy.isfinite(last_edge)):
+            raise ValueError(
+                'supplied range of [{}, {}] is not finite'.format(
+                    first_edge, last_edge))
+    elif a.size == 0:
+        first_edge, last_edge = 0, 1
+    else:
+        first_edge, last_edge = core.concatenate_method(
+            (a.min().reshape(1), a.max().reshape(1)), 0).get()
+        if not (numpy.isfinite(first_edge) and numpy.isfinite(last_edge)):
+            raise ValueError(
+                'autodetected range of [{}, {}] is not finite'.format(
+                    first_edge, last_edge))
+    if first_edge == last_edge:
+        first_edge = first_edge - 0.5
+        last_edge = last_edge + 0.5
+
+    if isinstance(bins, six.integer_types + (numpy.integer,)):
+        n_bins = int(bins)
+        if n_bins < 1:
+            raise ValueError('`bins` must be positive, when an integer')
+        bin_type = numpy.result_type(first_edge, last_edge, a.dtype)
+        if bin_type.kind in 'iub':
+            bin_type = numpy.result_type(bin_type, float)
+        # The edges are made on the host in the same way as NumPy.
+        bin_edges = cupy.array(numpy.linspace(
+            first_edge, last_edge, n_bins + 1, endpoint=True, dtype=bin_type))
+        norm = n_bins / (float(last_edge) - float(first_edge))
+        hist = _histogram(
+            (a, bin_edges, float(first_edge), norm), n_bins,
+            'S x, raw E edges, float64 first, float64 norm',
+            '''
+            E _x = x;
+            if (_x >= edges[0] && _x <= edges[n_bins]) {
+              // The index is corrected by the edges as NumPy does.
+              _k = (long long)(((double)_x - first) * norm);
+              if (_k >= n_bins) {
+                _k = n_bins - 1;
+              }
+              if (_x < edges[_k]) {
+                --_k;
+              } else if (_k != n_bins - 1 && _x >= edges[_k + 1]) {
+                ++_k;
+              }
+            } else {
+              _k = -1;
+            }
+            ''', weights, 'cupy_histogram_uniform')
+    else:
+        if isinstance(bins, cupy.ndarray):
+            bin_edges = bins
+        else:
+            bin_edges = numpy.asarray(bins)
+            if (bin_edges[:-1] > bin_edges[1:]).any():
+                raise ValueError(
+                    '`bins` must increase monotonically, when an array')
+            bin_edges = cupy.array(bin_edges)
+        if bin_edges.ndim != 1 or bin_edges.size < 1:
+            raise ValueError('`bins` must be 1d, when an array')
+        n_bins = bin_edges.size - 1
+        index = search.searchsorted(bin_edges, a, side='right')
+        hist = _histogram(
+            (a, index, bin_edges), n_bins,
+            'S x, int64 index, raw E edges',
+            '''
+            // The rightmost edge is included in the last bin.
+            _k = x == edges[n_bins] ? n_bins - 1 : index - 1;
+            ''', weights, 'cupy_histogram')
+
+    if weights is not None and hist.dtype != weights.dtype:
+        hist = hist.astype(weights.dtype)
+    if density:
+        db = (bin_edges[1:] - bin_edges[:-1]).astype(numpy.float64)
+        return hist / db / hist.sum(), bin_edges
+    return hist, bin_edges
 
 
 # TODO(okuta): Implement histogram2d
@@ -32,10 +262,8 @@ def bincount(x, weights=None, minlength=None):
         raise ValueError('object too deep for desired array')
     if x.ndim < 1:
         raise ValueError('object of too small depth for desired array')
-    if x.dtype.kind == 'f':
+    if x.dtype.kind in 'fc':
         raise TypeError('x must be int array')
-    if (x < 0).any():
-        raise ValueError('The first argument of bincount must be non-negative')
     if weights is not None and x.shape != weights.shape:
         raise ValueError('The weights and list don\'t have the same length.')
     if minlength is not None:
@@ -43,30 +271,38 @@ def bincount(x, weights=None, minlength=None):
         if minlength <= 0:
             raise ValueError('minlength must be positive')
 
-    size = int(cupy.max(x)) + 1
+    # Only one synchronization is needed for the validation and the size.
+    x_max = int(_bincount_max(x))
+    if x_max == numpy.iinfo(numpy.int64).max:
+        raise ValueError('The first argument of bincount must be non-negative')
+    size = x_max + 1
     if minlength is not None:
         size = max(size, minlength)
 
-    if weights is None:
-        # atomicAdd for int64 is not provided
-        b = cupy.zeros((size,), dtype=cupy.int32)
-        cupy.ElementwiseKernel(
-            'S x', 'raw U bin',
-            'atomicAdd(&bin[x], 1)',
-            'bincount_kernel'
-        )(x, b)
-        b = b.astype(numpy.intp)
-    else:
-        # atomicAdd for float64 is not provided
-        b = cupy.zeros((size,), dtype=cupy.float32)
-        cupy.ElementwiseKernel(
-            'S x, T w', 'raw U bin',
-            'atomicAdd(&bin[x], w)',
-            'bincount_with_weight_kernel'
-        )(x, weights, b)
-        b = b.astype(cupy.float64)
+    return _histogram(
+        (x,), size, 'S x', '_k = x', weights, 'cupy_bincount')
+
+
+def digitize(x, bins, right=False):
+    """Finds the indices of the bins to which each value belongs.
 
-    return b
+    The bins are looked up by :func:`cupy.searchsorted`. Whether ``bins`` is
+    increasing or decreasing is determined on the device, so no
+    synchronization is needed.
 
+    Args:
+        x (cupy.ndarray): Input array to be binned.
+        bins (cupy.ndarray): 1-D array of bins, which must be monotonically
+            increasing or decreasing. The monotonicity is not checked.
+        right (bool): If ``True``, the intervals include the right edges
+            instead of the left ones.
+
+    Returns:
+        cupy.ndarray: Array of indices with the same shape as ``x``.
 
-# TODO(okuta): Implement digitize
+    .. seealso:: :func:`numpy.digitize`
+
+    """
+    if x.dtype.kind == 'c':
+        raise TypeError('x may not be complex')
+    return search._searchsorted(bins, x, not right, None, True)
@@ -1,4 +1,48 @@
-# TODO(okuta): Implement median
+import numpy
+
+from cupy.statistics import order
+
+
+def median(a, axis=None, out=None, overwrite_input=False, keepdims=False):
+    """Computes the median along the specified axis.
+
+    The median is found by selecting the middle items instead of sorting the
+    data, except that short rows are sorted by blocks.
+
+    Args:
+        a (cupy.ndarray): Array for which to compute the median.
+        axis (int or tuple of ints): Along which axis or axes to compute the
+            median. The flattened array is used by default.
+        out (cupy.ndarray): Output array.
+        overwrite_input (bool): If ``True``, the input array may be
+            modified. Short rows along the axis are sorted in place instead
+            of in a working copy if they are contiguous.
+        keepdims (bool): If ``True``, the axis is remained as an axis of
+            size one.
+
+    Returns:
+        cupy.ndarray: The median of ``a``, along the axis if specified.
+
+    .. seealso:: :func:`numpy.median`
+
+    """
+    return order._quantile(a, numpy.array(0.5), axis, out, 'midpoint',
+                           keepdims, False, overwrite_input)
+
+
+def nanmedian(a, axis=None, out=None, overwrite_input=False, keepdims=False):
+    """Computes the median along the specified axis ignoring NaN.
+
+    When there is a slice whose elements are all NaN, a :class:`RuntimeWarning`
+    is raised and NaN is returned.
+
+    .. seealso::
+       :func:`cupy.median` for the arguments,
+       :func:`numpy.nanmedian`
+
+    """
+    return order._quantile(a, numpy.array(0.5), axis, out, 'midpoint',
+                           keepdims, True, overwrite_input)
 
 
 # TODO(okuta): Implement average
@@ -1,5 +1,9 @@
 import warnings
 
+import numpy
+import six
+
+import cupy
 from cupy import core
 from cupy.logic import content
 
@@ -113,4 +117,253 @@ def nanmax(a, axis=None, out=None, keepdims=False):
 # TODO(okuta): Implement ptp
 
 
-# TODO(okuta): Implement percentile
+_quantile_interpolations = {
+    'linear': 0,
+    'lower': 1,
+    'higher': 2,
+    'midpoint': 3,
+    'nearest': 4,
+}
+
+_quantile_index_kernel = core.ElementwiseKernel(
+    'float64 q, int64 count, int32 mode',
+    'int64 lower, int64 upper, float64 frac',
+    '''
+    double v = q * (count > 0 ? count - 1 : 0);
+    lower = (long long)floor(v);
+    upper = (long long)ceil(v);
+    frac = v - lower;
+    if (mode == 1) {
+      upper = lower;
+    } else if (mode == 2) {
+      lower = upper;
+    } else if (mode == 3) {
+      frac = lower == upper ? 0.0 : 0.5;
+    } else if (mode == 4) {
+      lower = upper = (long long)rint(v);
+    }
+    if (mode != 0 && mode != 3) {
+      frac = 0.0;
+    }
+    ''',
+    'cupy_quantile_index')
+
+_quantile_interpolate_kernel = core.ElementwiseKernel(
+    'S lower, S upper, float64 frac, bool invalid', 'T out',
+    '''
+    if (invalid) {
+      out = NAN;
+    } else if (frac == 0) {
+      out = lower;
+    } else {
+      double l = lower;
+      out = l + ((double)upper - l) * frac;
+    }
+    ''',
+    'cupy_quantile_interpolate')
+
+_count_nan = core.ReductionKernel(
+    'T x', 'int64 y', 'x != x', 'a + b', 'y = a', '0', 'cupy_count_nan')
+
+
+def _quantile(a, q, axis, out, interpolation, keepdims, ignore_nan,
+              overwrite_input):
+    # Computes the quantiles by selecting the items next to them instead of
+    # sorting the whole array. q is a NumPy array of quantiles in [0, 1].
+    if interpolation not in _quantile_interpolations:
+        raise ValueError(
+            'interpolation can only be \'linear\', \'lower\', \'higher\', '
+            '\'midpoint\', or \'nearest\'')
+    if a.dtype.kind == 'f':
+        dtype = a.dtype
+        if dtype.char == 'e':
+            # Selection of float16 is not supported.
+            a = a.astype(numpy.float32)
+        res_dtype = a.dtype
+    elif a.dtype.kind in 'iu':
+        dtype = res_dtype = numpy.dtype(numpy.float64)
+    else:
+        raise TypeError('Unsupported type %s' % a.dtype)
+
+    ndim = a.ndim
+    if axis is None:
+        axes = tuple(six.moves.range(ndim))
+    else:
+        if not isinstance(axis, tuple):
+            axis = (axis,)
+        axes = []
+        for ax in axis:
+            if not (-ndim <= ax < ndim):
+                raise ValueError('Axis out of range')
+            ax %= ndim
+            if ax in axes:
+                raise ValueError('Duplicate value in \'axis\'')
+            axes.append(ax)
+        axes = tuple(axes)
+    keep = [i for i in six.moves.range(ndim) if i not in axes]
+    reduced_shape = [a.shape[i] for i in keep]
+    n = 1
+    for ax in axes:
+        n *= a.shape[ax]
+    if len(axes) == 1:
+        # The items are selected from the rows in place.
+        x = a
+        x_axis = axes[0]
+    else:
+        x = a.transpose(keep + list(axes)).reshape(reduced_shape + [n])
+        x_axis = len(keep)
+    rows = 1
+    for dim in reduced_shape:
+        rows *= dim
+
+    q_shape = q.shape
+    q = q.ravel()
+    nq = q.size
+    if rows == 0 or n == 0:
+        res = cupy.empty((rows, nq), dtype=res_dtype)
+        res.fill(float('nan'))
+    else:
+        if a.dtype.kind == 'f':
+            nnan = _count_nan(x, axis=x_axis).reshape(rows, 1)
+        else:
+            nnan = cupy.zeros((rows, 1), dtype=numpy.int64)
+        if ignore_nan:
+            # NaNs are placed after all numbers by the selection.
+            count = n - nnan
+            invalid = count == 0
+            if invalid.any():
+                warnings.warn('All-NaN slice encountered', RuntimeWarning)
+        else:
+            count = cupy.full((rows, 1), n, dtype=numpy.int64)
+            invalid = nnan != 0
+        lower, upper, frac = _quantile_index_kernel(
+            cupy.asarray(q), count, _quantile_interpolations[interpolation])
+        # Both neighbors of all quantiles are selected in a single pass.
+        rank = core.concatenate_method((lower, upper), 1)
+        selected = core.core._select(
+            x, x_axis, rank, overwrite_input).reshape(rows, 2 * nq)
+        res = _quantile_interpolate_kernel(
+            selected[:, :nq], selected[:, nq:], frac, invalid,
+            cupy.empty((rows, nq), dtype=res_dtype))
+
+    if keepdims:
+        reduced_shape = [1 if i in axes else a.shape[i]
+                         for i in six.moves.range(ndim)]
+    res = res.T.reshape(q_shape + tuple(reduced_shape))
+    if res.dtype != dtype:
+        res = res.astype(dtype)
+    if out is None:
+        return res
+    if out.shape != res.shape:
+        raise ValueError('Output array has a wrong shape')
+    core.elementwise_copy(res, out)
+    return out
+
+
+def _as_quantiles(q, scale, name):
+    q = numpy.asarray(cupy.asnumpy(q), dtype=numpy.float64) / scale
+    if ((q < 0) | (q > 1)).any():
+        raise ValueError('%s must be in the range [0, %d]' % (name, scale))
+    return q
+
+
+def percentile(a, q, axis=None, out=None, overwrite_input=False,
+               interpolation='linear', keepdims=False):
+    """Computes the q-th percentile of the data along the specified axis.
+
+    The percentiles are found by selecting the items next to them along the
+    axis instead of sorting the data, except that short rows are sorted by
+    blocks. All of them are computed at once.
+
+    Args:
+        a (cupy.ndarray): Array for which to compute percentiles.
+        q (float, tuple of floats or cupy.ndarray): Percentiles to compute
+            in the range between 0 and 100 inclusive.
+        axis (int or tuple of ints): Along which axis or axes to compute the
+            percentiles. The flattened array is used by default.
+        out (cupy.ndarray): Output array.
+        overwrite_input (bool): If ``True``, the input array may be
+            modified. Short rows along the axis are sorted in place instead
+            of in a working copy if they are contiguous.
+        interpolation (str): Interpolation method when a percentile lies
+            between two data points. ``'linear'``, ``'lower'``,
+            ``'higher'``, ``'midpoint'`` and ``'nearest'`` are supported.
+        keepdims (bool): If ``True``, the axis is remained as an axis of
+            size one.
+
+    Returns:
+        cupy.ndarray: The percentiles of ``a``, along the axis if specified.
+        The shape of ``q`` is prepended to its shape.
+
+    .. seealso:: :func:`numpy.percentile`
+
+    """
+    q = _as_quantiles(q, 100, 'Percentiles')
+    return _quantile(a, q, axis, out, interpolation, keepdims, False,
+                     overwrite_input)
+
+
+def quantile(a, q, axis=None, out=None, overwrite_input=False,
+             interpolation='linear', keepdims=False):
+    """Computes the q-th quantile of the data along the specified axis.
+
+    Args:
+        a (cupy.ndarray): Array for which to compute quantiles.
+        q (float, tuple of floats or cupy.ndarray): Quantiles to compute in
+            the range between 0 and 1 inclusive.
+        axis (int or tuple of ints): Along which axis or axes to compute the
+            quantiles. The flattened array is used by default.
+        out (cupy.ndarray): Output array.
+        overwrite_input (bool): If ``True``, the input array may be
+            modified. Short rows along the axis are sorted in place instead
+            of in a working copy if they are contiguous.
+        interpolation (str): Interpolation method when a quantile lies
+            between two data points. ``'linear'``, ``'lower'``,
+            ``'higher'``, ``'midpoint'`` and ``'nearest'`` are supported.
+        keepdims (bool): If ``True``, the axis is remained as an axis of
+            size one.
+
+    Returns:
+        cupy.ndarray: The quantiles of ``a``, along the axis if specified.
+        The shape of ``q`` is prepended to its shape.
+
+    .. seealso:: :func:`numpy.quantile`
+
+    """
+    q = _as_quantiles(q, 1, 'Quantiles')
+    return _quantile(a, q, axis, out, interpolation, keepdims, False,
+                     overwrite_input)
+
+
+def nanpercentile(a, q, axis=None, out=None, overwrite_input=False,
+                  interpolation='linear', keepdims=False):
+    """Computes the q-th percentile of the data along an axis ignoring NaN.
+
+    When there is a slice whose elements are all NaN, a :class:`RuntimeWarning`
+    is raised and NaN is returned.
+
+    .. seealso::
+       :func:`cupy.percentile` for the arguments,
+       :func:`numpy.nanpercentile`
+
+    """
+    q = _as_quantiles(q, 100, 'Percentiles')
+    return _quantile(a, q, axis, out, interpolation, keepdims, True,
+                     overwrite_input)
+
+
+def nanquantile(a, q, axis=None, out=None, overwrite_input=False,
+                interpolation='linear', keepdims=False):
+    """Computes the q-th quantile of the data along an axis ignoring NaN.
+
+    When there is a slice whose elements are all NaN, a :class:`RuntimeWarning`
+    is raised and NaN is returned.
+
+    .. seealso::
+       :func:`cupy.quantile` for the arguments,
+       :func:`numpy.nanquantile`
+
+    """
+    q = _as_quantiles(q, 1, 'Quantiles')
+    return _quantile(a, q, axis, out, interpolation, keepdims, True,
+                     overwrite_input)
@@ -492,6 +492,7 @@ def for_dtypes(dtypes, name='dtype'):
 
 _regular_float_dtypes = (numpy.float64, numpy.float32)
 _float_dtypes = _regular_float_dtypes + (numpy.float16,)
+_complex_dtypes = (numpy.complex64, numpy.complex128)
 _signed_dtypes = tuple(numpy.dtype(i).type for i in 'bhilq')
 _unsigned_dtypes = tuple(numpy.dtype(i).type for i in 'BHILQ')
 _int_dtypes = _signed_dtypes + _unsigned_dtypes
@@ -587,6 +588,20 @@ def for_float_dtypes(name='dtype', no_float16=False):
         return for_dtypes(_float_dtypes, name=name)
 
 
+def for_complex_dtypes(name='dtype'):
+    """Decorator that checks the fixture with complex dtypes.
+
+    Args:
+         name(str): Argument name to which specified dtypes are passed.
+
+    dtypes to be tested are ``numpy.complex64`` and ``numpy.complex128``.
+
+    .. seealso:: :func:`cupy.testing.for_dtypes`,
+        :func:`cupy.testing.for_all_dtypes`
+    """
+    return for_dtypes(_complex_dtypes, name=name)
+
+
 def for_signed_dtypes(name='dtype'):
     """Decorator that checks the fixture with signed dtypes.
 
@@ -26,6 +26,7 @@ MODULES = [
             'cupy.core.flags',
             'cupy.core.internal',
             'cupy.cuda.cublas',
+            'cupy.cuda.cufft',
             'cupy.cuda.curand',
             'cupy.cuda.cusparse',
             'cupy.cuda.device',
@@ -44,6 +45,7 @@ MODULES = [
             'cuda.h',
             'cuda_profiler_api.h',
             'cuda_runtime.h',
+            'cufft.h',
             'curand.h',
             'cusparse.h',
             'nvrtc.h',
@@ -53,6 +55,7 @@ MODULES = [
             'cublas',
             'cuda',
             'cudart',
+            'cufft',
             'curand',
             'cusparse',
             'nvrtc',
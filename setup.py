@@ -38,11 +38,13 @@ setup(
     url='https://docs-cupy.chainer.org/',
     license='MIT License',
     packages=['cupy',
+              'cupy.benchmarks',
               'cupy.binary',
               'cupy.core',
               'cupy.creation',
               'cupy.cuda',
               'cupy.ext',
+              'cupy.fft',
               'cupy.indexing',
               'cupy.io',
               'cupy.linalg',
@@ -0,0 +1,77 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import six
+
+from cupy import benchmarks
+from cupy.benchmarks import harness
+
+
+class TestHarness(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = harness._benchmarks
+        harness._benchmarks = []
+
+        @benchmarks.benchmark(
+            'test.add', [{'size': 4}, {'size': 1024}],
+            nbytes=lambda size: 3 * size)
+        def add(xp, size):
+            a = xp.ones(size)
+            return lambda: a + a
+
+        @benchmarks.benchmark(
+            'test.dot', [{'size': 8}], flops=lambda size: 2 * size ** 3)
+        def dot(xp, size):
+            a = xp.ones((size, size))
+            return lambda: a.dot(a)
+
+    def tearDown(self):
+        harness._benchmarks = self.registry
+
+    def test_get_benchmarks(self):
+        names = [b.name for b in benchmarks.get_benchmarks()]
+        self.assertEqual(names, ['test.add', 'test.dot'])
+        names = [b.name for b in benchmarks.get_benchmarks('*.dot')]
+        self.assertEqual(names, ['test.dot'])
+
+    def test_dry_run_params(self):
+        b = benchmarks.get_benchmarks('test.add')[0]
+        self.assertEqual(b.dry_run_params(), [{'size': 4}, {'size': 64}])
+
+    def test_dry_run(self):
+        results = benchmarks.run(dry_run=True)
+        self.assertEqual(len(results), 3)
+        for r in results:
+            self.assertEqual(r['backend'], 'numpy')
+            self.assertGreaterEqual(r['time'], 0)
+        self.assertIsNone(results[0]['flops'])
+        self.assertIsNone(results[2]['bandwidth'])
+
+    def test_write_json(self):
+        results = benchmarks.run(dry_run=True)
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'results.json')
+            benchmarks.write_json(results, path)
+            with open(path) as f:
+                data = json.load(f)
+        finally:
+            shutil.rmtree(tmpdir)
+        self.assertIn('environment', data)
+        self.assertEqual(len(data['results']), 3)
+
+    def test_print_results(self):
+        f = six.StringIO()
+        benchmarks.print_results(benchmarks.run(dry_run=True), f)
+        self.assertEqual(len(f.getvalue().splitlines()), 4)
+
+
+class TestRoutines(unittest.TestCase):
+
+    def test_dry_run(self):
+        results = benchmarks.run(dry_run=True)
+        self.assertGreater(len(results), 0)
@@ -1231,3 +1231,46 @@ class TestFusionDecorator(unittest.TestCase):
 
         a = xp.array([1])
         return func_w_paren(a)
+
+
+@testing.gpu
+class TestFusionOut(unittest.TestCase):
+
+    @testing.for_all_dtypes(no_bool=True)
+    @testing.numpy_cupy_array_equal()
+    def test_elementwise_out(self, xp, dtype):
+        @cupy.fuse()
+        def g(x, y):
+            return x + y
+
+        a = testing.shaped_arange((3, 4), xp, dtype)
+        b = testing.shaped_arange((4,), xp, dtype)
+        out = xp.zeros((3, 4), dtype)
+        ret = g(a, b, out=out)
+        self.assertIs(ret, out)
+        return out
+
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_array_equal()
+    def test_elementwise_inplace(self, xp, dtype):
+        @cupy.fuse()
+        def g(x, y):
+            return x * y - y
+
+        a = testing.shaped_arange((3, 4), xp, dtype)
+        b = testing.shaped_arange((4,), xp, dtype)
+        g(a, b, out=a)
+        return a
+
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_reduction_out(self, xp, dtype):
+        @cupy.fuse(reduce=cupy.sum)
+        def g(x):
+            return x * x
+
+        a = testing.shaped_arange((3, 4), xp, dtype)
+        out = xp.zeros((4,), dtype)
+        ret = g(a, axis=0, out=out)
+        self.assertIs(ret, out)
+        return out
@@ -0,0 +1,130 @@
+import unittest
+
+import numpy
+
+import cupy
+from cupy import core
+
+
+class TestUfuncGetCode(unittest.TestCase):
+
+    def test_name_and_types(self):
+        a = numpy.empty((2, 3), dtype=numpy.float32)
+        code = cupy.add.get_code(a, a)
+        self.assertIsInstance(code, core.KernelCode)
+        self.assertEqual(code.name, 'cupy_add')
+        self.assertIn('typedef float in0_type;', code.source)
+        self.assertIn('typedef float out0_type;', code.source)
+        self.assertIn('extern "C" __global__ void cupy_add(', code.source)
+        self.assertEqual(code.options, ())
+
+    def test_contiguous_dims_are_reduced(self):
+        a = numpy.empty((2, 3, 4), dtype=numpy.float32)
+        code = cupy.add.get_code(a, a)
+        self.assertIn('CArray<float, 1> _raw_in0', code.source)
+        self.assertIn('CIndexer<1> _ind', code.source)
+
+    def test_non_contiguous_dims_are_kept(self):
+        a = numpy.empty((4, 6), dtype=numpy.float32)[:, ::2]
+        b = numpy.empty((4, 3), dtype=numpy.float32)
+        code = cupy.add.get_code(a, b)
+        self.assertIn('CArray<float, 2> _raw_in0', code.source)
+        self.assertIn('CIndexer<2> _ind', code.source)
+
+    def test_scalar(self):
+        a = numpy.empty((3,), dtype=numpy.float32)
+        code = cupy.add.get_code(a, 1.0)
+        self.assertIn('float in1', code.source)
+        self.assertIn('typedef float in1_type;', code.source)
+
+    def test_dtype(self):
+        a = numpy.empty((3,), dtype=numpy.float32)
+        code = cupy.add.get_code(a, a, dtype=numpy.float64)
+        self.assertIn('typedef double out0_type;', code.source)
+
+    def test_wrong_number_of_arguments(self):
+        a = numpy.empty((3,), dtype=numpy.float32)
+        with self.assertRaises(TypeError):
+            cupy.add.get_code(a)
+
+    def test_same_code_for_same_signature(self):
+        a = numpy.empty((3,), dtype=numpy.float32)
+        b = numpy.empty((5, 7), dtype=numpy.float32)
+        self.assertEqual(cupy.exp.get_code(a).source,
+                         cupy.exp.get_code(b).source)
+
+
+class TestElementwiseKernelGetCode(unittest.TestCase):
+
+    def test_get_code(self):
+        kernel = core.ElementwiseKernel(
+            'T x, T y', 'T z', 'z = x * y', 'my_mul')
+        a = numpy.empty((2, 3), dtype=numpy.float64)
+        code = kernel.get_code(a, a)
+        self.assertEqual(code.name, 'my_mul')
+        self.assertIn('typedef double T;', code.source)
+        self.assertIn('z = x * y', code.source)
+        self.assertIn('CArray<double, 1> _raw_z', code.source)
+
+    def test_options(self):
+        kernel = core.ElementwiseKernel(
+            'T x', 'T y', 'y = x', 'my_copy', options=('-DFOO',))
+        a = numpy.empty((2,), dtype=numpy.int32)
+        code = kernel.get_code(a)
+        self.assertEqual(code.options, ('-DFOO',))
+
+    def test_raw(self):
+        kernel = core.ElementwiseKernel(
+            'raw T x', 'T y', 'y = x[i]', 'my_raw')
+        a = numpy.empty((2, 3), dtype=numpy.float32)
+        b = numpy.empty((6,), dtype=numpy.float32)
+        code = kernel.get_code(a, b)
+        self.assertIn('CArray<float, 2> x', code.source)
+
+
+class TestReductionGetCode(unittest.TestCase):
+
+    def test_simple_reduction(self):
+        a = numpy.empty((2, 3), dtype=numpy.float32)
+        code = core.core._sum.get_code(a, axis=1)
+        self.assertEqual(code.name, 'cupy_sum')
+        self.assertIn('typedef float type_in0_raw;', code.source)
+        self.assertIn('CIndexer<2> _in_ind', code.source)
+        self.assertIn('CIndexer<1> _out_ind', code.source)
+
+    def test_simple_reduction_dtype(self):
+        a = numpy.empty((2, 3), dtype=numpy.int8)
+        code = core.core._sum.get_code(a, dtype=numpy.int64)
+        self.assertIn('typedef long long type_out0_raw;', code.source)
+
+    def test_reduction_kernel(self):
+        kernel = core.ReductionKernel(
+            'T x', 'T y', 'x * x', 'a + b', 'y = a', '0', 'my_sqnorm')
+        a = numpy.empty((4, 5), dtype=numpy.float64)
+        code = kernel.get_code(a, axis=0)
+        self.assertEqual(code.name, 'my_sqnorm')
+        self.assertIn('typedef double T;', code.source)
+        self.assertIn('#define REDUCE(a, b) (a + b)', code.source)
+
+
+class TestFusionGetCode(unittest.TestCase):
+
+    def test_elementwise(self):
+        @cupy.fuse()
+        def f(x, y):
+            return x * y + x
+
+        a = numpy.empty((3,), dtype=numpy.float32)
+        code = f.get_code(a, a)
+        self.assertIsInstance(code, core.KernelCode)
+        self.assertIn('CArray<float, 1>', code.source)
+
+    def test_reduction(self):
+        @cupy.fuse(reduce=cupy.sum)
+        def f(x):
+            return x * x
+
+        a = numpy.empty((3, 4), dtype=numpy.float64)
+        code = f.get_code(a, axis=1)
+        self.assertIn('_pre_map', code.source)
+        self.assertIn('CIndexer<2> _in_ind', code.source)
@@ -3,6 +3,8 @@ import unittest
 import numpy
 
 import cupy
+from cupy import cuda
+from cupy.cuda import memory
 from cupy import testing
 
 
@@ -136,3 +138,65 @@ class TestArrayCopyAndView(unittest.TestCase):
     def test_diagonal2(self, xp, dtype):
         a = testing.shaped_arange((3, 4, 5), xp, dtype)
         return a.diagonal(-1, 2, 0)
+
+
+class _RecordingPointer(memory.MemoryPointer):
+
+    def copy_from_device_async(self, src, size, stream):
+        self.calls.append(('copy_from_device_async', stream))
+        memory.MemoryPointer.copy_from_device_async(self, src, size, stream)
+
+    def copy_from_host_async(self, mem, size, stream):
+        self.calls.append(('copy_from_host_async', stream))
+        memory.MemoryPointer.copy_from_host_async(self, mem, size, stream)
+
+    def copy_to_host_async(self, mem, size, stream):
+        self.calls.append(('copy_to_host_async', stream))
+        memory.MemoryPointer.copy_to_host_async(self, mem, size, stream)
+
+    def memset_async(self, value, size, stream):
+        self.calls.append(('memset_async', stream))
+        memory.MemoryPointer.memset_async(self, value, size, stream)
+
+
+@testing.gpu
+class TestCopyOnCurrentStream(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.old_allocator = memory.get_allocator()
+        memory.set_allocator(self._alloc)
+        self.stream = cuda.Stream()
+
+    def tearDown(self):
+        memory.set_allocator(self.old_allocator)
+
+    def _alloc(self, size):
+        ptr = _RecordingPointer(memory.Memory(size), 0)
+        ptr.calls = self.calls
+        return ptr
+
+    def test_fill_zero(self):
+        a = cupy.ndarray((4,), dtype=numpy.float32)
+        with self.stream:
+            a.fill(0)
+        self.assertEqual(self.calls, [('memset_async', self.stream)])
+
+    def test_copyto(self):
+        a = cupy.ndarray((4,), dtype=numpy.float32)
+        b = cupy.ndarray((4,), dtype=numpy.float32)
+        with self.stream:
+            cupy.copyto(a, b)
+        self.assertEqual(self.calls, [('copy_from_device_async', self.stream)])
+
+    def test_set(self):
+        a = cupy.ndarray((4,), dtype=numpy.float32)
+        with self.stream:
+            a.set(numpy.arange(4, dtype=numpy.float32))
+        self.assertEqual(self.calls, [('copy_from_host_async', self.stream)])
+
+    def test_get(self):
+        a = cupy.ndarray((4,), dtype=numpy.float32)
+        with self.stream:
+            a.get()
+        self.assertEqual(self.calls, [('copy_to_host_async', self.stream)])
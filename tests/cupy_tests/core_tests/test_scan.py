@@ -2,7 +2,10 @@
 
 import unittest
 
+import numpy
+
 import cupy
+from cupy import core
 from cupy import cuda
 from cupy import testing
 
@@ -23,6 +26,19 @@ class TestScan(unittest.TestCase):
 
         testing.assert_array_equal(prefix_sum, expect)
 
+    @testing.for_dtypes('ilfd')
+    @testing.numpy_cupy_allclose()
+    def test_cumsum_multi_tile_rows(self, xp, dtype):
+        # Each row spans several tiles, whose totals are carried over.
+        a = testing.shaped_random((5, 3000), xp, dtype, scale=3)
+        return xp.cumsum(a, axis=1)
+
+    @testing.for_dtypes('ilfd')
+    @testing.numpy_cupy_allclose()
+    def test_cumsum_multi_tile_columns(self, xp, dtype):
+        a = testing.shaped_random((3000, 5), xp, dtype, scale=3)
+        return xp.cumsum(a, axis=0)
+
     def test_check_1d_array(self):
         with self.assertRaises(TypeError):
             a = cupy.zeros((2, 2))
@@ -53,3 +69,104 @@ class TestScan(unittest.TestCase):
 
         cupy.core.core.scan(a, a)
         testing.assert_array_equal(a, expect)
+
+
+@testing.parameterize(*testing.product({
+    'shape': [(10,), (3, 1000), (2000, 3), (4, 5, 6)],
+    'axis': [0, -1],
+}))
+@testing.gpu
+class TestAccumulate(unittest.TestCase):
+
+    @testing.for_all_dtypes(no_bool=True, no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_add(self, xp, dtype):
+        a = testing.shaped_random(self.shape, xp, dtype, scale=3)
+        return xp.add.accumulate(a, axis=self.axis)
+
+    @testing.for_all_dtypes(no_bool=True)
+    @testing.numpy_cupy_allclose()
+    def test_maximum(self, xp, dtype):
+        a = testing.shaped_random(self.shape, xp, dtype)
+        return xp.maximum.accumulate(a, axis=self.axis)
+
+    @testing.for_all_dtypes(no_bool=True)
+    @testing.numpy_cupy_allclose()
+    def test_minimum(self, xp, dtype):
+        a = testing.shaped_random(self.shape, xp, dtype)
+        return xp.minimum.accumulate(a, axis=self.axis)
+
+    @testing.numpy_cupy_array_equal()
+    def test_logical_and(self, xp):
+        a = testing.shaped_random(self.shape, xp, numpy.bool_)
+        return xp.logical_and.accumulate(a, axis=self.axis)
+
+    @testing.numpy_cupy_array_equal()
+    def test_logical_or(self, xp):
+        a = testing.shaped_random(self.shape, xp, numpy.bool_)
+        return xp.logical_or.accumulate(a, axis=self.axis)
+
+    @testing.numpy_cupy_allclose()
+    def test_dtype(self, xp):
+        a = testing.shaped_random(self.shape, xp, numpy.int8)
+        return xp.add.accumulate(a, axis=self.axis, dtype=numpy.float64)
+
+    @testing.numpy_cupy_allclose()
+    def test_non_contiguous(self, xp):
+        a = testing.shaped_random(self.shape, xp, numpy.float32)[::-2]
+        return xp.multiply.accumulate(a, axis=self.axis)
+
+    @testing.numpy_cupy_allclose()
+    def test_out(self, xp):
+        a = testing.shaped_random(self.shape, xp, numpy.float32)
+        out = xp.zeros(self.shape, numpy.float64)
+        xp.add.accumulate(a, axis=self.axis, out=out)
+        return out
+
+    @testing.numpy_cupy_allclose()
+    def test_in_place(self, xp):
+        a = testing.shaped_random(self.shape, xp, numpy.float64)
+        xp.add.accumulate(a, axis=self.axis, out=a)
+        return a
+
+
+@testing.gpu
+class TestAccumulateInvalid(unittest.TestCase):
+
+    def test_unary(self):
+        with self.assertRaises(ValueError):
+            cupy.exp.accumulate(cupy.ones((3,)))
+
+    def test_not_associative(self):
+        with self.assertRaises(NotImplementedError):
+            cupy.subtract.accumulate(cupy.ones((3,)))
+
+    def test_scalar(self):
+        with self.assertRaises(TypeError):
+            cupy.add.accumulate(cupy.array(1))
+
+    def test_invalid_axis(self):
+        with self.assertRaises(ValueError):
+            cupy.add.accumulate(cupy.ones((3, 4)), axis=2)
+
+
+class TestScanKernelCode(unittest.TestCase):
+
+    def test_inclusive(self):
+        code = core.core._get_scan_kernel_code(
+            'my_scan', numpy.int8, numpy.int64, numpy.float32, 3, 2,
+            'out0 = in0 + in1', '', None, 128)
+        self.assertEqual(code.name, 'my_scan')
+        self.assertIn('typedef signed char type_in;', code.source)
+        self.assertIn('typedef long long type_scan;', code.source)
+        self.assertIn('typedef float type_out;', code.source)
+        self.assertIn('const CArray<type_in, 3> _x', code.source)
+        self.assertIn('CArray<type_out, 2> _y', code.source)
+        self.assertIn('#define _EXCLUSIVE 0', code.source)
+
+    def test_exclusive(self):
+        code = core.core._get_scan_kernel_code(
+            'my_scan', numpy.float32, numpy.float32, numpy.float32, 1, 1,
+            'out0 = max(in0, in1)', '', '-INFINITY', 256)
+        self.assertIn('#define _EXCLUSIVE 1', code.source)
+        self.assertIn('type_scan(-INFINITY)', code.source)
@@ -1,5 +1,9 @@
+import os
+import shutil
+import tempfile
 import unittest
 
+import mock
 import six
 
 from cupy.cuda import compiler
@@ -13,3 +17,71 @@ class TestNvrtcStderr(unittest.TestCase):
         # An error message contains the file name `kern.cu`
         with six.assertRaisesRegex(self, compiler.CompileException, 'kern.cu'):
             compiler.compile_using_nvrtc('a')
+
+
+class TestDumpSource(unittest.TestCase):
+
+    def setUp(self):
+        self.dump_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dump_dir)
+
+    def test_dump(self):
+        with mock.patch('cupy.cuda.compiler.compile_using_nvrtc',
+                        return_value=b'// ptx') as m:
+            compiler._dump_source(
+                self.dump_dir, 'key', 'source', ('-ftz=true',), 'compute_30')
+        m.assert_called_once_with('source', ('-ftz=true',), 'compute_30')
+
+        with open(os.path.join(self.dump_dir, 'key.cu')) as f:
+            cu = f.read()
+        self.assertIn('-ftz=true', cu)
+        self.assertIn('compute_30', cu)
+        self.assertTrue(cu.endswith('source'))
+        with open(os.path.join(self.dump_dir, 'key.ptx')) as f:
+            self.assertEqual(f.read(), '// ptx')
+
+    def test_dump_once(self):
+        with mock.patch('cupy.cuda.compiler.compile_using_nvrtc',
+                        return_value=b'// ptx') as m:
+            for _ in range(2):
+                compiler._dump_source(
+                    self.dump_dir, 'key', 'source', (), 'compute_30')
+        self.assertEqual(m.call_count, 1)
+
+
+class TestGetCacheKey(unittest.TestCase):
+
+    def setUp(self):
+        self.patches = [
+            mock.patch('cupy.cuda.compiler._get_nvrtc_version',
+                       return_value=(8, 0)),
+            mock.patch('cupy.cuda.compiler.preprocess', return_value=''),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+
+    def test_same_source(self):
+        self.assertEqual(
+            compiler.get_cache_key('a', arch='compute_30'),
+            compiler.get_cache_key('a', arch='compute_30'))
+
+    def test_different_source(self):
+        self.assertNotEqual(
+            compiler.get_cache_key('a', arch='compute_30'),
+            compiler.get_cache_key('b', arch='compute_30'))
+
+    def test_different_options(self):
+        self.assertNotEqual(
+            compiler.get_cache_key('a', ('-DA',), arch='compute_30'),
+            compiler.get_cache_key('a', arch='compute_30'))
+
+    def test_different_arch(self):
+        self.assertNotEqual(
+            compiler.get_cache_key('a', arch='compute_30'),
+            compiler.get_cache_key('a', arch='compute_35'))
@@ -0,0 +1,124 @@
+import gc
+import threading
+import unittest
+
+from cupy import cuda
+from cupy.cuda import device
+from cupy import testing
+
+
+class FakeLibrary(object):
+
+    def __init__(self):
+        self.handles = []
+        self.destroyed = []
+        self.streams = {}
+
+    def create(self):
+        handle = len(self.handles) + 1
+        self.handles.append(handle)
+        return handle
+
+    def destroy(self, handle):
+        self.destroyed.append(handle)
+
+    def setStream(self, handle, stream):
+        self.streams[handle] = stream
+
+
+@testing.gpu
+class TestHandlePool(unittest.TestCase):
+
+    def setUp(self):
+        self.library = FakeLibrary()
+        self.pool = device._HandlePool(self.library)
+        self.dev_id = cuda.Device().id
+
+    def tearDown(self):
+        self.pool.clear()
+
+    def test_reuse_handle(self):
+        h1 = self.pool.get_handle(self.dev_id)
+        h2 = self.pool.get_handle(self.dev_id)
+        self.assertEqual(h1, h2)
+        self.assertEqual(self.library.handles, [h1])
+
+    def test_null_stream(self):
+        h = self.pool.get_handle(self.dev_id)
+        self.assertNotIn(h, self.library.streams)
+
+    def test_handle_per_stream(self):
+        h1 = self.pool.get_handle(self.dev_id)
+        stream = cuda.Stream()
+        with stream:
+            h2 = self.pool.get_handle(self.dev_id)
+            self.assertEqual(self.pool.get_handle(self.dev_id), h2)
+        self.assertNotEqual(h1, h2)
+        self.assertEqual(self.library.streams, {h2: stream.ptr})
+        self.assertEqual(self.pool.get_handle(self.dev_id), h1)
+
+    def test_release_on_stream_deletion(self):
+        stream = cuda.Stream()
+        with stream:
+            h = self.pool.get_handle(self.dev_id)
+        self.assertEqual(self.library.destroyed, [])
+        del stream
+        gc.collect()
+        self.assertEqual(self.library.destroyed, [h])
+
+    def test_workspace_grows(self):
+        w1 = self.pool.get_workspace(self.dev_id, 100)
+        w2 = self.pool.get_workspace(self.dev_id, 50)
+        self.assertIs(w1, w2)
+        w3 = self.pool.get_workspace(self.dev_id, 200)
+        self.assertIsNot(w1, w3)
+        self.assertGreaterEqual(w3.mem.size, 200)
+        self.assertIs(self.pool.get_workspace(self.dev_id, 100), w3)
+
+    def test_workspace_per_stream(self):
+        w1 = self.pool.get_workspace(self.dev_id, 100)
+        with cuda.Stream():
+            w2 = self.pool.get_workspace(self.dev_id, 100)
+        self.assertIsNot(w1, w2)
+
+    def test_clear(self):
+        h1 = self.pool.get_handle(self.dev_id)
+        with cuda.Stream():
+            h2 = self.pool.get_handle(self.dev_id)
+        self.pool.clear()
+        self.assertEqual(sorted(self.library.destroyed), sorted([h1, h2]))
+        h3 = self.pool.get_handle(self.dev_id)
+        self.assertNotIn(h3, (h1, h2))
+
+
+@testing.gpu
+class TestGetHandle(unittest.TestCase):
+
+    def test_cublas_handle(self):
+        h = device.get_cublas_handle()
+        self.assertEqual(device.get_cublas_handle(), h)
+        self.assertEqual(cuda.Device().cublas_handle, h)
+
+    def test_cublas_handle_per_stream(self):
+        h1 = device.get_cublas_handle()
+        with cuda.Stream():
+            h2 = device.get_cublas_handle()
+        self.assertNotEqual(h1, h2)
+
+    def test_cusparse_handle(self):
+        h = device.get_cusparse_handle()
+        self.assertEqual(device.get_cusparse_handle(), h)
+        self.assertEqual(cuda.Device().cusparse_handle, h)
+
+    def test_cublas_handle_per_thread(self):
+        handles = []
+
+        def get_handle():
+            handles.append(device.get_cublas_handle())
+
+        h = device.get_cublas_handle()
+        t = threading.Thread(target=get_handle)
+        t.start()
+        t.join()
+        self.assertEqual(len(handles), 1)
+        self.assertNotEqual(handles[0], h)
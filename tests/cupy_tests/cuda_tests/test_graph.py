@@ -0,0 +1,204 @@
+import unittest
+
+import mock
+
+import cupy
+from cupy.cuda import graph
+from cupy.cuda import memory
+
+
+class GraphTestBase(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = mock.MagicMock()
+        self.runtime.streamEndCapture.return_value = 10
+        self.runtime.graphInstantiate.return_value = 20
+        self.prepare_library_handles = mock.MagicMock()
+        self.patches = [
+            mock.patch('cupy.cuda.graph.runtime', self.runtime),
+            mock.patch('cupy.cuda.graph._prepare_library_handles',
+                       self.prepare_library_handles),
+        ]
+        for p in self.patches:
+            p.start()
+
+        self.allocated = []
+        self.old_allocator = memory.get_allocator()
+        memory.set_allocator(self._alloc)
+        self.stream = mock.MagicMock(ptr=5)
+        self.stream.__exit__.return_value = False
+
+    def tearDown(self):
+        memory.set_allocator(self.old_allocator)
+        for p in self.patches:
+            p.stop()
+
+    def _alloc(self, size):
+        mem = memory.MemoryPointer(memory.Memory(0), 0)
+        self.allocated.append(mem)
+        return mem
+
+
+class TestCapture(GraphTestBase):
+
+    def test_capture(self):
+        with graph.capture(self.stream) as g:
+            self.assertFalse(g.captured)
+            self.assertTrue(graph.is_capturing())
+        self.assertFalse(graph.is_capturing())
+        self.runtime.streamBeginCapture.assert_called_once_with(5)
+        self.runtime.streamEndCapture.assert_called_once_with(5)
+        self.runtime.graphInstantiate.assert_called_once_with(10)
+        self.assertTrue(g.captured)
+        self.assertEqual(g.ptr, 20)
+        self.assertIs(g.stream, self.stream)
+
+    def test_launch(self):
+        with graph.capture(self.stream) as g:
+            pass
+        g.launch()
+        self.runtime.graphLaunch.assert_called_once_with(20, 5)
+
+    def test_launch_on_another_stream(self):
+        with graph.capture(self.stream) as g:
+            pass
+        g.launch(mock.MagicMock(ptr=7))
+        self.runtime.graphLaunch.assert_called_once_with(20, 7)
+
+    def test_launch_before_capture(self):
+        g = graph.Graph()
+        with self.assertRaises(RuntimeError):
+            g.launch()
+
+    def test_destroy(self):
+        with graph.capture(self.stream) as g:
+            pass
+        del g
+        self.runtime.graphExecDestroy.assert_called_once_with(20)
+        self.runtime.graphDestroy.assert_called_once_with(10)
+
+    def test_null_stream(self):
+        with self.assertRaises(ValueError):
+            with graph.capture(mock.MagicMock(ptr=0)):
+                pass
+        self.assertFalse(self.runtime.streamBeginCapture.called)
+
+    def test_nested(self):
+        with graph.capture(self.stream):
+            with self.assertRaises(RuntimeError):
+                with graph.capture(mock.MagicMock(ptr=6)):
+                    pass
+
+    def test_memory_is_kept(self):
+        with graph.capture(self.stream) as g:
+            memory.alloc(16)
+            memory.alloc(32)
+        self.assertEqual(g._memory, self.allocated)
+        self.assertEqual(len(g._memory), 2)
+        self.assertEqual(memory.get_allocator(), self._alloc)
+
+    def test_library_handles(self):
+        def check():
+            # The handles are prepared in the stream before the capture.
+            self.stream.__enter__.assert_called_once_with()
+            self.assertFalse(self.runtime.streamBeginCapture.called)
+
+        self.prepare_library_handles.side_effect = check
+        with graph.capture(self.stream):
+            pass
+        self.prepare_library_handles.assert_called_once_with()
+
+    def test_current_stream(self):
+        with graph.capture(self.stream):
+            self.stream.__enter__.assert_called_once_with()
+        self.stream.__exit__.assert_called_once_with(None, None, None)
+
+    def test_error(self):
+        with self.assertRaises(ZeroDivisionError):
+            with graph.capture(self.stream):
+                memory.alloc(16)
+                1 / 0
+        self.runtime.streamEndCapture.assert_called_once_with(5)
+        self.assertFalse(self.runtime.graphInstantiate.called)
+        self.assertFalse(graph.is_capturing())
+        self.assertEqual(memory.get_allocator(), self._alloc)
+        self.stream.__exit__.assert_called_once_with(
+            ZeroDivisionError, mock.ANY, mock.ANY)
+
+
+def _array(shape):
+    return cupy.ndarray(shape, memptr=memory.MemoryPointer(
+        memory.Memory(0), 0))
+
+
+class TestPrepareLibraryHandles(unittest.TestCase):
+
+    @mock.patch('cupy.cuda.graph.device')
+    def test_prepare_library_handles(self, device):
+        device.cusolver_enabled = True
+        graph._prepare_library_handles()
+        device.get_cublas_handle.assert_called_once_with()
+        device.get_cusparse_handle.assert_called_once_with()
+        device.get_cusolver_handle.assert_called_once_with()
+
+    @mock.patch('cupy.cuda.graph.device')
+    def test_without_cusolver(self, device):
+        device.cusolver_enabled = False
+        graph._prepare_library_handles()
+        self.assertFalse(device.get_cusolver_handle.called)
+
+
+class TestGraphed(GraphTestBase):
+
+    def setUp(self):
+        super(TestGraphed, self).setUp()
+        self.calls = []
+
+        def f(x, alpha):
+            self.calls.append((x, alpha))
+            return 'result'
+
+        self.f = graph.graphed(f, stream=self.stream)
+
+    def tearDown(self):
+        # Destroys the graph while the runtime is mocked.
+        del self.f
+        super(TestGraphed, self).tearDown()
+
+    def test_first_call(self):
+        x = _array((2, 3))
+        self.assertEqual(self.f(x, 2.0), 'result')
+        # Once to warm up, and once to capture.
+        self.assertEqual(len(self.calls), 2)
+        self.stream.synchronize.assert_called_once_with()
+        self.runtime.streamBeginCapture.assert_called_once_with(5)
+        self.runtime.graphLaunch.assert_called_once_with(20, 5)
+
+    def test_replay(self):
+        x = _array((2, 3))
+        self.f(x, 2.0)
+        self.assertEqual(self.f(x, 2.0), 'result')
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(self.runtime.streamBeginCapture.call_count, 1)
+        self.assertEqual(self.runtime.graphLaunch.call_count, 2)
+
+    def test_shape_changed(self):
+        self.f(_array((2, 3)), 2.0)
+        with self.assertRaises(ValueError):
+            self.f(_array((3, 2)), 2.0)
+        self.assertEqual(self.runtime.graphLaunch.call_count, 1)
+
+    def test_scalar_changed(self):
+        x = _array((2, 3))
+        self.f(x, 2.0)
+        with self.assertRaises(ValueError):
+            self.f(x, 3.0)
+
+    def test_decorator_with_arguments(self):
+        @graph.graphed(stream=self.stream)
+        def g(x):
+            return x
+
+        x = _array((2,))
+        self.assertIs(g(x), x)
+        self.assertEqual(g.__name__, 'g')
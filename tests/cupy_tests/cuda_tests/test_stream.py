@@ -22,3 +22,27 @@ class TestStream(unittest.TestCase):
 
         stream.synchronize()
         self.assertEqual(out, list(range(N)))
+
+    def test_current_stream(self):
+        self.assertIs(cuda.get_current_stream(), cuda.Stream.null)
+
+    @attr.gpu
+    def test_use(self):
+        stream = cuda.Stream()
+        try:
+            self.assertIs(stream.use(), stream)
+            self.assertIs(cuda.get_current_stream(), stream)
+        finally:
+            cuda.Stream.null.use()
+        self.assertIs(cuda.get_current_stream(), cuda.Stream.null)
+
+    @attr.gpu
+    def test_with(self):
+        stream1 = cuda.Stream()
+        stream2 = cuda.Stream()
+        with stream1:
+            self.assertIs(cuda.get_current_stream(), stream1)
+            with stream2:
+                self.assertIs(cuda.get_current_stream(), stream2)
+            self.assertIs(cuda.get_current_stream(), stream1)
+        self.assertIs(cuda.get_current_stream(), cuda.Stream.null)
@@ -0,0 +1,236 @@
+import unittest
+
+import mock
+import numpy
+
+import cupy
+from cupy.cuda import cufft
+from cupy import fft
+from cupy import testing
+
+
+class FakeCufft(object):
+
+    CUFFT_FORWARD = cufft.CUFFT_FORWARD
+    CUFFT_INVERSE = cufft.CUFFT_INVERSE
+    CUFFT_R2C = cufft.CUFFT_R2C
+    CUFFT_C2R = cufft.CUFFT_C2R
+    CUFFT_C2C = cufft.CUFFT_C2C
+    CUFFT_D2Z = cufft.CUFFT_D2Z
+    CUFFT_Z2D = cufft.CUFFT_Z2D
+    CUFFT_Z2Z = cufft.CUFFT_Z2Z
+
+    def __init__(self, work_size=256):
+        self.work_size = work_size
+        self.next_handle = 1
+        self.alive = set()
+        self.plans = {}
+        self.work_areas = {}
+        self.streams = {}
+        self.executed = []
+
+    def create(self):
+        handle = self.next_handle
+        self.next_handle += 1
+        self.alive.add(handle)
+        return handle
+
+    def destroy(self, handle):
+        self.alive.remove(handle)
+
+    def setAutoAllocation(self, handle, auto_allocate):
+        assert auto_allocate == 0
+
+    def makePlanMany(self, handle, n, fft_type, batch):
+        self.plans[handle] = (tuple(n), fft_type, batch)
+        return self.work_size
+
+    def setWorkArea(self, handle, ptr):
+        self.work_areas[handle] = ptr
+
+    def setStream(self, handle, stream):
+        self.streams[handle] = stream
+
+    def _exec(self, name):
+        def f(handle, idata, odata, *args):
+            self.executed.append((name, handle, idata, odata) + args)
+        return f
+
+    def __getattr__(self, name):
+        if name.startswith('exec'):
+            return self._exec(name)
+        raise AttributeError(name)
+
+
+class PlanCacheTestBase(unittest.TestCase):
+
+    def setUp(self):
+        self.cufft = FakeCufft()
+        self.memory = mock.MagicMock()
+        self.patches = [
+            mock.patch('cupy.fft.cache.cufft', self.cufft),
+            mock.patch('cupy.fft.cache.memory', self.memory),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+
+
+class TestPlanCache(PlanCacheTestBase):
+
+    def setUp(self):
+        super(TestPlanCache, self).setUp()
+        self.device = mock.MagicMock()
+        self.device.get_device_id.return_value = 0
+        self.patches.append(mock.patch('cupy.fft.cache.device', self.device))
+        self.patches[-1].start()
+
+    def test_plan(self):
+        plan = fft.cache.Plan((4, 5), cufft.CUFFT_C2C, 3)
+        self.assertEqual(self.cufft.plans[plan.handle],
+                         ((4, 5), cufft.CUFFT_C2C, 3))
+        self.memory.alloc.assert_called_once_with(256)
+        self.assertEqual(self.cufft.work_areas[plan.handle],
+                         self.memory.alloc.return_value.ptr)
+        handle = plan.handle
+        del plan
+        self.assertNotIn(handle, self.cufft.alive)
+
+    def test_plan_without_work_area(self):
+        self.cufft.work_size = 0
+        plan = fft.cache.Plan((4,), cufft.CUFFT_R2C, 1)
+        self.assertNotIn(plan.handle, self.cufft.work_areas)
+
+    def test_plan_error(self):
+        self.cufft.makePlanMany = mock.Mock(side_effect=RuntimeError)
+        with self.assertRaises(RuntimeError):
+            fft.cache.Plan((4,), cufft.CUFFT_C2C, 1)
+        self.assertEqual(len(self.cufft.alive), 0)
+
+    def test_reuse(self):
+        cache = fft.PlanCache(2)
+        plan = cache.get((4,), cufft.CUFFT_C2C, 1)
+        self.assertIs(cache.get((4,), cufft.CUFFT_C2C, 1), plan)
+        self.assertEqual(len(cache), 1)
+
+    def test_key(self):
+        cache = fft.PlanCache(4)
+        plan = cache.get((4,), cufft.CUFFT_C2C, 1)
+        self.assertIsNot(cache.get((4,), cufft.CUFFT_C2C, 2), plan)
+        self.assertIsNot(cache.get((4,), cufft.CUFFT_Z2Z, 1), plan)
+        self.assertIsNot(cache.get((2, 2), cufft.CUFFT_C2C, 1), plan)
+        self.device.get_device_id.return_value = 1
+        self.assertIsNot(cache.get((4,), cufft.CUFFT_C2C, 1), plan)
+        self.assertEqual(len(cache), 4)
+
+    def test_lru(self):
+        cache = fft.PlanCache(2)
+        plan1 = cache.get((1,), cufft.CUFFT_C2C, 1)
+        plan2 = cache.get((2,), cufft.CUFFT_C2C, 1)
+        self.assertIs(cache.get((1,), cufft.CUFFT_C2C, 1), plan1)
+        handle2 = plan2.handle
+        del plan2
+        cache.get((3,), cufft.CUFFT_C2C, 1)
+        self.assertEqual(len(cache), 2)
+        # The least recently used plan is dropped and destroyed.
+        self.assertNotIn(handle2, self.cufft.alive)
+        self.assertIs(cache.get((1,), cufft.CUFFT_C2C, 1), plan1)
+
+    def test_set_size(self):
+        cache = fft.PlanCache(3)
+        for n in range(3):
+            cache.get((n + 1,), cufft.CUFFT_C2C, 1)
+        cache.set_size(1)
+        self.assertEqual(cache.size, 1)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(len(self.cufft.alive), 1)
+
+    def test_no_cache(self):
+        cache = fft.PlanCache(0)
+        plan = cache.get((4,), cufft.CUFFT_C2C, 1)
+        self.assertIsNot(cache.get((4,), cufft.CUFFT_C2C, 1), plan)
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        cache = fft.PlanCache()
+        cache.get((4,), cufft.CUFFT_C2C, 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(len(self.cufft.alive), 0)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            fft.PlanCache(-1)
+
+    def test_thread_local(self):
+        self.assertIs(fft.get_plan_cache(), fft.get_plan_cache())
+
+
+@testing.gpu
+class TestFftPlan(PlanCacheTestBase):
+
+    def setUp(self):
+        super(TestFftPlan, self).setUp()
+        fft.get_plan_cache().clear()
+
+    def tearDown(self):
+        fft.get_plan_cache().clear()
+        super(TestFftPlan, self).tearDown()
+
+    def _executed_plan(self):
+        name, handle = self.cufft.executed[-1][:2]
+        return (name,) + self.cufft.plans[handle]
+
+    def test_batched_axis(self):
+        a = cupy.ones((2, 3, 4), dtype=numpy.complex64)
+        out = fft.fft(a, axis=1)
+        self.assertEqual(out.shape, (2, 3, 4))
+        self.assertEqual(out.dtype, numpy.complex64)
+        self.assertEqual(self._executed_plan(),
+                         ('execC2C', (3,), cufft.CUFFT_C2C, 8))
+        self.assertEqual(self.cufft.executed[-1][-1], cufft.CUFFT_FORWARD)
+
+    def test_stream(self):
+        a = cupy.ones(4, dtype=numpy.complex128)
+        stream = cupy.cuda.Stream()
+        with stream:
+            fft.ifft(a)
+        handle = self.cufft.executed[-1][1]
+        self.assertEqual(self.cufft.streams[handle], stream.ptr)
+        self.assertEqual(self.cufft.executed[-1][-1], cufft.CUFFT_INVERSE)
+
+    def test_plan_reused(self):
+        a = cupy.ones((3, 4), dtype=numpy.complex64)
+        fft.fft(a)
+        fft.fft(a + 1)
+        self.assertEqual(len(self.cufft.plans), 1)
+        self.assertEqual(len(self.cufft.executed), 2)
+
+    def test_fftn_groups_axes(self):
+        a = cupy.ones((2, 3, 4, 5), dtype=numpy.complex128)
+        fft.fftn(a)
+        plans = [self.cufft.plans[e[1]] for e in self.cufft.executed]
+        self.assertEqual(plans, [((3, 4, 5), cufft.CUFFT_Z2Z, 2),
+                                 ((2,), cufft.CUFFT_Z2Z, 60)])
+
+    def test_rfftn(self):
+        a = cupy.ones((2, 3, 4), dtype=numpy.float32)
+        out = fft.rfftn(a)
+        self.assertEqual(out.shape, (2, 3, 3))
+        self.assertEqual(out.dtype, numpy.complex64)
+        plans = [(e[0],) + self.cufft.plans[e[1]]
+                 for e in self.cufft.executed]
+        self.assertEqual(plans, [('execR2C', (4,), cufft.CUFFT_R2C, 6),
+                                 ('execC2C', (2, 3), cufft.CUFFT_C2C, 3)])
+
+    def test_irfft_does_not_overwrite_input(self):
+        a = cupy.ones((3, 5), dtype=numpy.complex128)
+        out = fft.irfft(a)
+        self.assertEqual(out.shape, (3, 8))
+        self.assertEqual(out.dtype, numpy.float64)
+        self.assertEqual(self._executed_plan(),
+                         ('execZ2D', (8,), cufft.CUFFT_Z2D, 3))
+        self.assertNotEqual(self.cufft.executed[-1][2], a.data.ptr)
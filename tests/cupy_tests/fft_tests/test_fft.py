@@ -0,0 +1,231 @@
+import unittest
+
+import numpy
+
+import cupy
+from cupy import testing
+
+
+_fft_dtypes = (numpy.float32, numpy.float64, numpy.complex64,
+               numpy.complex128)
+
+
+def _random(shape, xp, dtype):
+    a = testing.shaped_random(shape, numpy, dtype)
+    if a.dtype.kind == 'c':
+        a = a + 1j * testing.shaped_random(shape, numpy, dtype, seed=1)
+        a = a.astype(dtype)
+    return xp.asarray(a)
+
+
+@testing.parameterize(*testing.product({
+    'n': [None, 5, 10, 15],
+    'shape': [(10,), (10, 10)],
+    'norm': [None, 'ortho'],
+}))
+@testing.gpu
+class TestFft(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.for_dtypes(_fft_dtypes)
+    @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-4, type_check=False)
+    def test_fft(self, xp, dtype):
+        a = _random(self.shape, xp, dtype)
+        return xp.fft.fft(a, n=self.n, norm=self.norm)
+
+    @testing.for_dtypes(_fft_dtypes)
+    @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-4, type_check=False)
+    def test_ifft(self, xp, dtype):
+        a = _random(self.shape, xp, dtype)
+        return xp.fft.ifft(a, n=self.n, norm=self.norm)
+
+    @testing.for_dtypes((numpy.float32, numpy.float64))
+    @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-4, type_check=False)
+    def test_rfft(self, xp, dtype):
+        a = _random(self.shape, xp, dtype)
+        return xp.fft.rfft(a, n=self.n, norm=self.norm)
+
+    @testing.for_dtypes(_fft_dtypes)
+    @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-4, type_check=False)
+    def test_irfft(self, xp, dtype):
+        a = _random(self.shape, xp, dtype)
+        return xp.fft.irfft(a, n=self.n, norm=self.norm)
+
+    @testing.for_dtypes(_fft_dtypes)
+    @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-4, type_check=False)
+    def test_hfft(self, xp, dtype):
+        a = _random(self.shape, xp, dtype)
+        return xp.fft.hfft(a, n=self.n, norm=self.norm)
+
+    @testing.for_dtypes((numpy.float32, numpy.float64))
+    @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-4, type_check=False)
+    def test_ihfft(self, xp, dtype):
+        a = _random(self.shape, xp, dtype)
+        return xp.fft.ihfft(a, n=self.n, norm=self.norm)
+
+
+@testing.parameterize(*testing.product({
+    'axis': [0, 1, -1],
+}))
+@testing.gpu
+class TestFftAxis(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.for_dtypes(_fft_dtypes)
+    @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-4, type_check=False)
+    def test_fft(self, xp, dtype):
+        a = _random((3, 4, 5), xp, dtype)
+        return xp.fft.fft(a, axis=self.axis)
+
+    @testing.for_dtypes((numpy.float32, numpy.float64))
+    @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-4, type_check=False)
+    def test_rfft(self, xp, dtype):
+        a = _random((3, 4, 5), xp, dtype)
+        return xp.fft.rfft(a, axis=self.axis)
+
+    @testing.for_dtypes((numpy.complex64, numpy.complex128))
+    @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-4, type_check=False)
+    def test_irfft(self, xp, dtype):
+        a = _random((3, 4, 5), xp, dtype)
+        return xp.fft.irfft(a, axis=self.axis)
+
+
+@testing.parameterize(
+    {'shape': (3, 4), 's': None, 'axes': None},
+    {'shape': (3, 4), 's': (1, 5), 'axes': None},
+    {'shape': (3, 4), 's': None, 'axes': (-2, -1)},
+    {'shape': (3, 4), 's': None, 'axes': (-1, -2)},
+    {'shape': (3, 4), 's': None, 'axes': (0,)},
+    {'shape': (2, 3, 4), 's': None, 'axes': None},
+    {'shape': (2, 3, 4), 's': (1, 4, 10), 'axes': None},
+    {'shape': (2, 3, 4), 's': (2, 3), 'axes': (0, 2)},
+    {'shape': (2, 3, 4, 5), 's': None, 'axes': None},
+    {'shape': (2, 3, 4, 5), 's': None, 'axes': (0, 1, 3)},
+)
+@testing.gpu
+class TestFftn(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.for_dtypes(_fft_dtypes)
+    @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-4, type_check=False)
+    def test_fftn(self, xp, dtype):
+        a = _random(self.shape, xp, dtype)
+        return xp.fft.fftn(a, s=self.s, axes=self.axes)
+
+    @testing.for_dtypes(_fft_dtypes)
+    @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-4, type_check=False)
+    def test_ifftn(self, xp, dtype):
+        a = _random(self.shape, xp, dtype)
+        return xp.fft.ifftn(a, s=self.s, axes=self.axes, norm='ortho')
+
+    @testing.for_dtypes((numpy.float32, numpy.float64))
+    @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-4, type_check=False)
+    def test_rfftn(self, xp, dtype):
+        a = _random(self.shape, xp, dtype)
+        return xp.fft.rfftn(a, s=self.s, axes=self.axes)
+
+    @testing.for_dtypes((numpy.complex64, numpy.complex128))
+    @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-4, type_check=False)
+    def test_irfftn(self, xp, dtype):
+        a = _random(self.shape, xp, dtype)
+        return xp.fft.irfftn(a, s=self.s, axes=self.axes)
+
+
+@testing.gpu
+class TestFft2(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.for_dtypes(_fft_dtypes)
+    @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-4, type_check=False)
+    def test_fft2(self, xp, dtype):
+        a = _random((2, 3, 4), xp, dtype)
+        return xp.fft.fft2(a)
+
+    @testing.for_dtypes(_fft_dtypes)
+    @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-4, type_check=False)
+    def test_ifft2(self, xp, dtype):
+        a = _random((2, 3, 4), xp, dtype)
+        return xp.fft.ifft2(a, s=(4, 2))
+
+    @testing.for_dtypes((numpy.float32, numpy.float64))
+    @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-4, type_check=False)
+    def test_rfft2(self, xp, dtype):
+        a = _random((2, 3, 4), xp, dtype)
+        return xp.fft.rfft2(a)
+
+    @testing.for_dtypes((numpy.complex64, numpy.complex128))
+    @testing.numpy_cupy_allclose(rtol=1e-4, atol=1e-4, type_check=False)
+    def test_irfft2(self, xp, dtype):
+        a = _random((2, 3, 4), xp, dtype)
+        return xp.fft.irfft2(a, axes=(0, 2))
+
+
+@testing.gpu
+class TestFftInvalid(unittest.TestCase):
+
+    def test_invalid_norm(self):
+        a = cupy.ones(4, dtype=numpy.complex64)
+        with self.assertRaises(ValueError):
+            cupy.fft.fft(a, norm='forward')
+
+    def test_invalid_n(self):
+        a = cupy.ones(4, dtype=numpy.complex64)
+        with self.assertRaises(ValueError):
+            cupy.fft.fft(a, n=0)
+
+    def test_axis_out_of_range(self):
+        a = cupy.ones((2, 3), dtype=numpy.complex64)
+        with self.assertRaises(ValueError):
+            cupy.fft.fft(a, axis=2)
+
+    def test_shape_axes_mismatch(self):
+        a = cupy.ones((2, 3), dtype=numpy.complex64)
+        with self.assertRaises(ValueError):
+            cupy.fft.fftn(a, s=(2, 3), axes=(0,))
+
+
+@testing.parameterize(*testing.product({
+    'n': [1, 10, 15],
+    'd': [1, 0.5],
+}))
+@testing.gpu
+class TestFftfreq(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.numpy_cupy_allclose()
+    def test_fftfreq(self, xp):
+        return xp.fft.fftfreq(self.n, self.d)
+
+    @testing.numpy_cupy_allclose()
+    def test_rfftfreq(self, xp):
+        return xp.fft.rfftfreq(self.n, self.d)
+
+
+@testing.parameterize(
+    {'shape': (10,), 'axes': None},
+    {'shape': (5, 10), 'axes': None},
+    {'shape': (5, 10), 'axes': 0},
+    {'shape': (5, 10), 'axes': (1,)},
+    {'shape': (5, 10), 'axes': (0, 1)},
+)
+@testing.gpu
+class TestFftshift(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.for_all_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_fftshift(self, xp, dtype):
+        x = testing.shaped_arange(self.shape, xp, dtype)
+        return xp.fft.fftshift(x, self.axes)
+
+    @testing.for_all_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_ifftshift(self, xp, dtype):
+        x = testing.shaped_arange(self.shape, xp, dtype)
+        return xp.fft.ifftshift(x, self.axes)
@@ -32,6 +32,18 @@ class TestCholeskyDecomposition(unittest.TestCase):
         # np.linalg.cholesky only uses a lower triangle of an array
         self.check_L(numpy.array([[1, 2], [1, 9]]))
 
+    def test_batched_decomposition(self):
+        for n in (3, 16, 20):
+            A = numpy.random.randint(0, 100, size=(2, 3, n, n))
+            A = numpy.matmul(A, A.swapaxes(-1, -2)) + numpy.eye(n)
+            self.check_L(A)
+
+    def test_not_positive_definite(self):
+        for n in (3, 20):
+            a = cupy.stack([cupy.eye(n), -cupy.eye(n)])
+            with self.assertRaises(numpy.linalg.LinAlgError):
+                cupy.linalg.cholesky(a)
+
 
 @testing.parameterize(*testing.product({
     'mode': ['r', 'raw', 'complete', 'reduced'],
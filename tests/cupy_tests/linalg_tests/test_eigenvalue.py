@@ -47,6 +47,27 @@ class TestEigenvalue(unittest.TestCase):
         testing.assert_allclose(w, nw, rtol=1e-3, atol=1e-4)
         testing.assert_allclose(v, nv, rtol=1e-3, atol=1e-4)
 
+    @testing.for_float_dtypes(no_float16=True)
+    def test_eigh_batched(self, dtype):
+        for n in (4, 40):
+            a = testing.shaped_random((2, 3, n, n), numpy, dtype)
+            a = a + a.swapaxes(-1, -2)
+            w, v = cupy.linalg.eigh(cupy.asarray(a), UPLO=self.UPLO)
+            nw = numpy.linalg.eigh(a, UPLO=self.UPLO)[0]
+            testing.assert_allclose(w, nw, rtol=1e-3, atol=1e-3)
+            # Eigenvectors are compared through the reconstruction since
+            # their signs are not defined.
+            av = numpy.matmul(a, v.get())
+            testing.assert_allclose(
+                av, v.get() * w.get()[..., None, :], rtol=1e-3, atol=1e-3)
+
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose(rtol=1e-3, atol=1e-3)
+    def test_eigvalsh_batched(self, xp, dtype):
+        a = testing.shaped_random((3, 5, 5), xp, dtype)
+        a = a + a.swapaxes(-1, -2)
+        return xp.linalg.eigvalsh(a, UPLO=self.UPLO)
+
     @testing.for_all_dtypes(no_float16=True)
     @testing.numpy_cupy_allclose(rtol=1e-3, atol=1e-4)
     def test_eigvalsh(self, xp, dtype):
@@ -0,0 +1,175 @@
+import unittest
+
+import numpy
+
+import cupy
+from cupy.linalg import einsum
+from cupy import testing
+
+
+@testing.parameterize(*testing.product({
+    'subscripts_shapes': [
+        ('ij,jk->ik', ((2, 3), (3, 4))),
+        ('ij,jk', ((2, 3), (3, 4))),
+        ('ii', ((3, 3),)),
+        ('ii->i', ((3, 3),)),
+        ('iij->j', ((3, 3, 2),)),
+        ('ij->ji', ((2, 3),)),
+        ('ij->', ((2, 3),)),
+        ('i,i', ((4,), (4,))),
+        ('i,j', ((2,), (3,))),
+        ('ij,ij->', ((2, 3), (2, 3))),
+        ('bij,bjk->bik', ((2, 3, 4), (2, 4, 5))),
+        ('ij,kj->ikj', ((2, 3), (4, 3))),
+        ('ij,ij->ij', ((2, 3), (2, 3))),
+        ('ij,ik->ijk', ((2, 3), (2, 4))),
+        ('...i,...j->...ij', ((2, 1, 3), (4, 2))),
+        ('...ij,...jk', ((2, 3, 4), (4, 5))),
+        ('...i,...i->...', ((2, 1, 4), (3, 4))),
+        ('ij,jk', ((1, 4), (4, 5))),
+        (',i->i', ((), (3,))),
+        ('ijk,jl,kl->il', ((3, 4, 5), (4, 6), (5, 6))),
+        ('abc,cd,de,ea->b', ((3, 4, 5), (5, 6), (6, 2), (2, 3))),
+        ('ij,jk', ((0, 3), (3, 4))),
+    ],
+    'optimize': [False, True, 'optimal'],
+}))
+@testing.gpu
+class TestEinsum(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_einsum(self, xp, dtype):
+        subscripts, shapes = self.subscripts_shapes
+        operands = [testing.shaped_random(shape, xp, dtype, seed=i)
+                    for i, shape in enumerate(shapes)]
+        if xp is numpy:
+            return xp.einsum(subscripts, *operands)
+        return xp.einsum(subscripts, *operands, optimize=self.optimize)
+
+
+@testing.gpu
+class TestEinsumMisc(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.for_all_dtypes(no_bool=True, no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_einsum_dtypes(self, xp, dtype):
+        a = testing.shaped_arange((2, 3), xp, dtype)
+        b = testing.shaped_arange((3, 2), xp, dtype)
+        return xp.einsum('ij,jk,kl->il', a, b, a)
+
+    @testing.numpy_cupy_allclose()
+    def test_einsum_sublist(self, xp):
+        a = testing.shaped_arange((2, 3), xp, numpy.float32)
+        b = testing.shaped_arange((3, 4), xp, numpy.float32)
+        return xp.einsum(a, [0, 1], b, [1, 2], [0, 2])
+
+    @testing.numpy_cupy_allclose()
+    def test_einsum_sublist_implicit_output(self, xp):
+        # The implicit output is ordered by the letters the integers are
+        # mapped to, where 0 precedes 26.
+        a = testing.shaped_arange((2, 3), xp, numpy.float32)
+        b = testing.shaped_arange((3, 4), xp, numpy.float32)
+        return xp.einsum(a, [26, 1], b, [1, 0])
+
+    @testing.numpy_cupy_allclose()
+    def test_einsum_dtype_argument(self, xp):
+        a = testing.shaped_arange((2, 3), xp, numpy.int32)
+        return xp.einsum('ij->j', a, dtype=numpy.float64)
+
+    def test_einsum_explicit_path(self):
+        a = testing.shaped_arange((2, 3), cupy, numpy.float32)
+        b = testing.shaped_arange((3, 4), cupy, numpy.float32)
+        c = testing.shaped_arange((4, 5), cupy, numpy.float32)
+        ret = cupy.einsum('ij,jk,kl', a, b, c,
+                          optimize=['einsum_path', (1, 2), (0, 1)])
+        testing.assert_allclose(ret, a.dot(b).dot(c))
+
+    def test_einsum_diagonal_view(self):
+        a = testing.shaped_arange((3, 3), cupy, numpy.float32)
+        ret = cupy.einsum('ii->i', a)
+        self.assertIs(ret.base, a)
+
+    @testing.numpy_cupy_raises()
+    def test_invalid_label(self, xp):
+        a = testing.shaped_arange((2, 3), xp, numpy.float32)
+        xp.einsum('i1', a)
+
+    @testing.numpy_cupy_raises()
+    def test_wrong_ndim(self, xp):
+        a = testing.shaped_arange((2, 3), xp, numpy.float32)
+        xp.einsum('ijk', a)
+
+    @testing.numpy_cupy_raises()
+    def test_size_mismatch(self, xp):
+        a = testing.shaped_arange((2, 3), xp, numpy.float32)
+        b = testing.shaped_arange((4, 2), xp, numpy.float32)
+        xp.einsum('ij,jk', a, b)
+
+    @testing.numpy_cupy_raises()
+    def test_unknown_output_label(self, xp):
+        a = testing.shaped_arange((2, 3), xp, numpy.float32)
+        xp.einsum('ij->k', a)
+
+
+class TestEinsumPlanner(unittest.TestCase):
+
+    def test_parse_implicit(self):
+        inputs, output = einsum._parse_subscripts('ij,jk', (2, 2))
+        self.assertEqual(inputs, [[ord('i'), ord('j')], [ord('j'), ord('k')]])
+        self.assertEqual(output, [ord('i'), ord('k')])
+
+    def test_parse_ellipsis(self):
+        inputs, output = einsum._parse_subscripts('...i,i...->...', (3, 2))
+        self.assertEqual(inputs, [[-2, -1, ord('i')], [ord('i'), -1]])
+        self.assertEqual(output, [-2, -1])
+
+    def test_parse_invalid(self):
+        with self.assertRaises(ValueError):
+            einsum._parse_subscripts('ij->i->j', (2,))
+        with self.assertRaises(ValueError):
+            einsum._parse_subscripts('ij->ii', (2,))
+        with self.assertRaises(ValueError):
+            einsum._parse_subscripts('i.j', (2,))
+
+    def test_greedy_path(self):
+        sizes = {'a': 1000, 'b': 2, 'c': 1000, 'd': 2}
+        inputs = [{'a', 'b'}, {'b', 'c'}, {'c', 'd'}]
+        path = einsum._greedy_path(inputs, {'a', 'd'}, sizes)
+        self.assertEqual(path, [(1, 2), (0, 1)])
+
+    def test_optimal_path(self):
+        sizes = {'a': 10, 'b': 10, 'c': 100, 'd': 1}
+        inputs = [{'a', 'b'}, {'b', 'c'}, {'c', 'd'}]
+        path = einsum._optimal_path(inputs, {'a', 'd'}, sizes)
+        cost = einsum._path_cost(inputs, {'a', 'd'}, sizes, path)
+        for other in ([(0, 1), (0, 1)], [(0, 2), (0, 1)],
+                      [(1, 2), (0, 1)]):
+            self.assertLessEqual(
+                cost, einsum._path_cost(inputs, {'a', 'd'}, sizes, other))
+
+    def test_plan_is_cached(self):
+        plan1 = einsum._plan('ij,jk,kl', ((2, 3), (3, 4), (4, 5)), True)
+        plan2 = einsum._plan('ij,jk,kl', ((2, 3), (3, 4), (4, 5)), True)
+        self.assertIs(plan1, plan2)
+
+    def test_plan_broadcast(self):
+        inputs, shapes, output, sizes, path = einsum._plan(
+            '...i,...i', ((2, 1, 4), (3, 4)), True)
+        self.assertEqual(inputs, [[-2, ord('i')], [-1, ord('i')]])
+        self.assertEqual(shapes, [(2, 4), (3, 4)])
+        self.assertEqual(sizes[-1], 3)
+        self.assertEqual(path, [(0, 1)])
+
+    def test_check_path(self):
+        self.assertEqual(
+            einsum._check_path(('einsum_path', (1, 2), (0, 1)), 3),
+            [(1, 2), (0, 1)])
+        with self.assertRaises(ValueError):
+            einsum._check_path(('einsum_path', (0, 1)), 3)
+        with self.assertRaises(TypeError):
+            einsum._check_path(((0, 1), (0, 1)), 3)
@@ -171,6 +171,24 @@ class TestSlogdet(unittest.TestCase):
         sign, logdet = xp.linalg.slogdet(a)
         return xp.array([sign, logdet], dtype)
 
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose(rtol=1e-3, atol=1e-4)
+    def test_slogdet_batched(self, xp, dtype):
+        results = []
+        for n in (5, 20):
+            a = testing.shaped_random((2, 3, n, n), xp, dtype, scale=2) - 1
+            a[0, 1] = 0
+            sign, logdet = xp.linalg.slogdet(a)
+            results += [sign, logdet]
+        return xp.stack(results).astype(dtype)
+
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose(rtol=1e-3, atol=1e-4)
+    def test_slogdet_large(self, xp, dtype):
+        a = testing.shaped_random((30, 30), xp, dtype, scale=2) - 1
+        sign, logdet = xp.linalg.slogdet(a)
+        return xp.array([sign, logdet], dtype)
+
     @testing.for_float_dtypes(no_float16=True)
     @testing.numpy_cupy_raises(accept_error=numpy.linalg.LinAlgError)
     def test_slogdet_one_dim(self, xp, dtype):
@@ -2,6 +2,7 @@ import unittest
 
 import numpy
 
+import cupy
 from cupy import testing
 
 
@@ -195,6 +196,41 @@ class TestProduct(unittest.TestCase):
             (2, 2, 2, 3), xp, dtype).transpose(1, 3, 0, 2)
         return xp.vdot(a, b)
 
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_allclose(rtol=1e-5)
+    def test_complex_dot(self, xp, dtype):
+        a = testing.shaped_arange((2, 3, 4), xp, dtype) * (1 - 2j)
+        b = testing.shaped_arange((4, 2), xp, dtype) * (2 + 1j)
+        return xp.dot(a, b)
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_allclose(rtol=1e-5)
+    def test_complex_dot_vec(self, xp, dtype):
+        a = testing.shaped_arange((5,), xp, dtype) * (1 - 2j)
+        b = testing.shaped_reverse_arange((5,), xp, dtype) * (2 + 1j)
+        return xp.dot(a, b)
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_allclose(rtol=1e-5)
+    def test_complex_dot_vec_strided(self, xp, dtype):
+        a = testing.shaped_arange((10,), xp, dtype)[::2] * (1 - 2j)
+        b = testing.shaped_reverse_arange((5,), xp, dtype) * (2 + 1j)
+        return xp.dot(a, b)
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_allclose(rtol=1e-5)
+    def test_complex_vdot(self, xp, dtype):
+        a = testing.shaped_arange((2, 3, 4), xp, dtype) * (1 - 2j)
+        b = testing.shaped_reverse_arange((2, 3, 4), xp, dtype) * (2 + 1j)
+        return xp.vdot(a.transpose(2, 0, 1), b)
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_allclose(rtol=1e-5)
+    def test_complex_and_real_vdot(self, xp, dtype):
+        a = testing.shaped_arange((5,), xp, numpy.float32)
+        b = testing.shaped_reverse_arange((5,), xp, dtype) * (1 - 2j)
+        return xp.vdot(a, b)
+
     @testing.for_all_dtypes()
     @testing.numpy_cupy_allclose()
     def test_inner(self, xp, dtype):
@@ -351,3 +387,121 @@ class TestProduct(unittest.TestCase):
         a = xp.array(2, dtype=dtype)
         b = testing.shaped_arange((4, 5), xp, dtype)
         return xp.kron(a, b)
+
+
+@cupy.fuse()
+def _shifted_relu(y, shift):
+    return cupy.maximum(y - shift, 0)
+
+
+def _scale(y, s):
+    return y * s
+
+
+@testing.gpu
+class TestGemm(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.for_float_dtypes(no_float16=True)
+    def test_gemm(self, dtype):
+        a = testing.shaped_arange((3, 4), numpy, dtype)
+        b = testing.shaped_arange((4, 5), numpy, dtype)
+        y = cupy.linalg.gemm(cupy.asarray(a), cupy.asarray(b))
+        testing.assert_allclose(y, a.dot(b))
+
+    @testing.for_float_dtypes(no_float16=True)
+    def test_gemm_transposed(self, dtype):
+        a = testing.shaped_arange((4, 3), numpy, dtype).T
+        b = testing.shaped_arange((5, 4), numpy, dtype).T
+        y = cupy.linalg.gemm(cupy.asarray(a), cupy.asarray(b))
+        testing.assert_allclose(y, a.dot(b))
+
+    @testing.for_dtypes('fdFD')
+    def test_alpha_beta(self, dtype):
+        a = testing.shaped_arange((3, 4), numpy, dtype)
+        b = testing.shaped_arange((4, 5), numpy, dtype)
+        c = testing.shaped_reverse_arange((3, 5), numpy, dtype)
+        out = cupy.asarray(c)
+        y = cupy.linalg.gemm(cupy.asarray(a), cupy.asarray(b), alpha=2,
+                             beta=-1, out=out)
+        self.assertIs(y, out)
+        testing.assert_allclose(y, 2 * a.dot(b) - c)
+
+    @testing.for_float_dtypes(no_float16=True)
+    def test_out_overlapping_operand(self, dtype):
+        a = testing.shaped_arange((4, 4), numpy, dtype)
+        b = testing.shaped_reverse_arange((4, 4), numpy, dtype)
+        x = cupy.asarray(a)
+        y = cupy.linalg.gemm(x, cupy.asarray(b), beta=1, out=x)
+        self.assertIs(y, x)
+        testing.assert_allclose(y, a.dot(b) + a)
+        x = cupy.asarray(b)
+        y = cupy.linalg.gemm(cupy.asarray(a), x, beta=1, out=x)
+        testing.assert_allclose(y, a.dot(b) + b)
+
+    @testing.for_float_dtypes(no_float16=True)
+    def test_epilogue(self, dtype):
+        a = testing.shaped_arange((3, 4), numpy, dtype)
+        b = testing.shaped_arange((4, 5), numpy, dtype)
+        shift = testing.shaped_arange((5,), numpy, dtype) * 40
+        y = cupy.linalg.gemm(cupy.asarray(a), cupy.asarray(b),
+                             _shifted_relu, (cupy.asarray(shift),))
+        testing.assert_allclose(y, numpy.maximum(a.dot(b) - shift, 0))
+
+    @testing.for_float_dtypes(no_float16=True)
+    def test_epilogue_out(self, dtype):
+        a = testing.shaped_arange((3, 4), numpy, dtype)
+        b = testing.shaped_arange((4, 5), numpy, dtype)
+        c = testing.shaped_arange((3, 5), numpy, dtype)
+        shift = testing.shaped_arange((3, 1), numpy, dtype) * 40
+        out = cupy.asarray(c)
+        y = cupy.linalg.gemm(cupy.asarray(a), cupy.asarray(b),
+                             _shifted_relu, (cupy.asarray(shift),),
+                             alpha=0.5, beta=1, out=out)
+        self.assertIs(y, out)
+        expected = numpy.maximum(0.5 * a.dot(b) + c - shift, 0)
+        testing.assert_allclose(y, expected)
+
+    def test_unfused_epilogue(self):
+        a = testing.shaped_arange((3, 4), cupy, numpy.float32)
+        b = testing.shaped_arange((4, 5), cupy, numpy.float32)
+        s = numpy.float32(0.5)
+        y1 = cupy.linalg.gemm(a, b, _scale, (s,))
+        y2 = cupy.linalg.gemm(a, b, _scale, (s,))
+        testing.assert_allclose(y1, a.dot(b) * 0.5)
+        testing.assert_array_equal(y1, y2)
+        self.assertIn(_scale, cupy.linalg.product._fused_epilogues)
+
+    def test_zero_size(self):
+        a = cupy.ones((3, 0), dtype=numpy.float32)
+        b = cupy.ones((0, 5), dtype=numpy.float32)
+        out = cupy.ones((3, 5), dtype=numpy.float32)
+        y = cupy.linalg.gemm(a, b, alpha=2, beta=3, out=out)
+        testing.assert_array_equal(y, numpy.full((3, 5), 3, numpy.float32))
+
+    def test_invalid_ndim(self):
+        a = cupy.ones((2, 3, 4), dtype=numpy.float32)
+        b = cupy.ones((4, 5), dtype=numpy.float32)
+        with self.assertRaises(ValueError):
+            cupy.linalg.gemm(a, b)
+
+    def test_dimension_mismatch(self):
+        a = cupy.ones((3, 4), dtype=numpy.float32)
+        b = cupy.ones((3, 5), dtype=numpy.float32)
+        with self.assertRaises(ValueError):
+            cupy.linalg.gemm(a, b)
+
+    def test_beta_without_out(self):
+        a = cupy.ones((3, 4), dtype=numpy.float32)
+        b = cupy.ones((4, 5), dtype=numpy.float32)
+        with self.assertRaises(ValueError):
+            cupy.linalg.gemm(a, b, beta=1)
+
+    def test_invalid_out(self):
+        a = cupy.ones((3, 4), dtype=numpy.float32)
+        b = cupy.ones((4, 5), dtype=numpy.float32)
+        with self.assertRaises(ValueError):
+            cupy.linalg.gemm(a, b, out=cupy.ones((5, 3), numpy.float32))
+        with self.assertRaises(ValueError):
+            cupy.linalg.gemm(a, b, out=cupy.ones((5, 3), numpy.float32).T)
@@ -43,6 +43,263 @@ class TestSolve(unittest.TestCase):
         self.check_shape((3, 3, 4), (3,))
 
 
+@testing.parameterize(*testing.product({
+    'order': ['C', 'F'],
+    'b_shape': [(5,), (5, 3)],
+}))
+@unittest.skipUnless(
+    cuda.cusolver_enabled, 'Only cusolver in CUDA 8.0 is supported')
+@testing.gpu
+class TestSolveOrder(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.for_dtypes([
+        numpy.int32, numpy.int64, numpy.float32, numpy.float64])
+    @testing.numpy_cupy_allclose(rtol=1e-3, atol=1e-3)
+    def test_solve(self, xp, dtype):
+        a = testing.shaped_random((5, 5), xp, dtype, scale=3)
+        a += 10 * xp.eye(5, dtype=dtype)
+        if self.order == 'F':
+            a = xp.asfortranarray(a)
+        b = testing.shaped_random(self.b_shape, xp, dtype)
+        return xp.linalg.solve(a, b)
+
+    def test_singular(self):
+        a = cupy.zeros((5, 5), order=self.order)
+        with self.assertRaises(numpy.linalg.LinAlgError):
+            cupy.linalg.solve(a, cupy.ones(self.b_shape))
+
+
+@testing.parameterize(*testing.product({
+    'n': [1, 4, 30],
+    'b_shape': [(), (3,)],
+    'trans': [0, 1],
+}))
+@unittest.skipUnless(
+    cuda.cusolver_enabled, 'Only cusolver in CUDA 8.0 is supported')
+@testing.gpu
+class TestLUSolve(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.for_float_dtypes(no_float16=True)
+    def test_lu_solve(self, dtype):
+        a = testing.shaped_random((self.n, self.n), numpy, dtype, scale=1)
+        a += self.n * numpy.eye(self.n, dtype=dtype)
+        b = testing.shaped_random((self.n,) + self.b_shape, numpy, dtype)
+        lu_and_piv = cupy.linalg.lu_factor(cupy.asarray(a))
+        # The factors are reused.
+        for i in range(2):
+            x = cupy.linalg.lu_solve(
+                lu_and_piv, cupy.asarray(b + i), trans=self.trans)
+            expected = numpy.linalg.solve(a.T if self.trans else a, b + i)
+            self.assertEqual(x.dtype, dtype)
+            testing.assert_allclose(x, expected, rtol=1e-3, atol=1e-3)
+
+    @testing.with_requires('scipy')
+    @testing.for_float_dtypes(no_float16=True)
+    def test_lu_factor(self, dtype):
+        import scipy.linalg
+        a = testing.shaped_random((self.n, self.n), numpy, dtype)
+        lu, piv = cupy.linalg.lu_factor(cupy.asarray(a))
+        expected_lu, expected_piv = scipy.linalg.lu_factor(a)
+        self.assertTrue(lu.flags.f_contiguous)
+        testing.assert_array_equal(piv, expected_piv)
+        testing.assert_allclose(lu, expected_lu, rtol=1e-3, atol=1e-3)
+
+
+@unittest.skipUnless(
+    cuda.cusolver_enabled, 'Only cusolver in CUDA 8.0 is supported')
+@testing.gpu
+class TestLUSolveMisc(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    def test_overwrite(self):
+        a = cupy.asfortranarray(
+            testing.shaped_random((4, 4), cupy, numpy.float64))
+        lu, piv = cupy.linalg.lu_factor(a, overwrite_a=True)
+        self.assertIs(lu, a)
+        b = cupy.asfortranarray(
+            testing.shaped_random((4, 2), cupy, numpy.float64))
+        x = cupy.linalg.lu_solve((lu, piv), b, overwrite_b=True)
+        self.assertIs(x, b)
+
+    def test_no_overwrite(self):
+        a = testing.shaped_random((4, 4), cupy, numpy.float64)
+        a_copy = a.copy()
+        cupy.linalg.lu_factor(a)
+        testing.assert_array_equal(a, a_copy)
+
+    def test_invalid_shape(self):
+        lu_and_piv = cupy.linalg.lu_factor(cupy.eye(3))
+        with self.assertRaises(numpy.linalg.LinAlgError):
+            cupy.linalg.lu_solve(lu_and_piv, cupy.ones(4))
+        with self.assertRaises(numpy.linalg.LinAlgError):
+            cupy.linalg.lu_factor(cupy.ones((2, 3)))
+
+    def test_invalid_trans(self):
+        lu_and_piv = cupy.linalg.lu_factor(cupy.eye(3))
+        with self.assertRaises(ValueError):
+            cupy.linalg.lu_solve(lu_and_piv, cupy.ones(3), trans=3)
+
+
+@testing.parameterize(*testing.product({
+    'n': [3, 50],
+    'b_shape': [(), (4,)],
+    'order': ['C', 'F'],
+}))
+@unittest.skipUnless(
+    cuda.cusolver_enabled, 'Only cusolver in CUDA 8.0 is supported')
+@testing.gpu
+class TestMixedPrecisionSolve(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    def test_solve(self):
+        a = testing.shaped_random((self.n, self.n), numpy, numpy.float64)
+        a += self.n * numpy.eye(self.n)
+        b = testing.shaped_random((self.n,) + self.b_shape, numpy,
+                                  numpy.float64)
+        a_gpu = cupy.asarray(a)
+        if self.order == 'F':
+            a_gpu = cupy.asfortranarray(a_gpu)
+        x, iteration = cupy.linalg.mixed_precision_solve(
+            a_gpu, cupy.asarray(b), return_iter=True)
+        self.assertEqual(x.dtype, numpy.float64)
+        self.assertGreaterEqual(iteration, 0)
+        testing.assert_allclose(x, numpy.linalg.solve(a, b), rtol=1e-12)
+
+
+@unittest.skipUnless(
+    cuda.cusolver_enabled, 'Only cusolver in CUDA 8.0 is supported')
+@testing.gpu
+class TestMixedPrecisionSolveMisc(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    def test_singular_in_float32(self):
+        # The matrix is regular only in float64.
+        a = numpy.array([[1, 1], [1, 1 + 1e-10]])
+        b = numpy.array([2, 3], dtype=numpy.float64)
+        x, iteration = cupy.linalg.mixed_precision_solve(
+            cupy.asarray(a), cupy.asarray(b), return_iter=True)
+        self.assertEqual(iteration, -3)
+        testing.assert_allclose(x, numpy.linalg.solve(a, b), rtol=1e-5)
+
+    def test_not_converged(self):
+        a = testing.shaped_random((10, 10), numpy, numpy.float64)
+        a += 10 * numpy.eye(10)
+        b = testing.shaped_random((10,), numpy, numpy.float64)
+        x, iteration = cupy.linalg.mixed_precision_solve(
+            cupy.asarray(a), cupy.asarray(b), max_iter=0, return_iter=True)
+        self.assertEqual(iteration, -1)
+        testing.assert_allclose(x, numpy.linalg.solve(a, b), rtol=1e-12)
+
+    def test_overflow(self):
+        a = cupy.eye(3) * 1e300
+        b = cupy.ones(3)
+        x, iteration = cupy.linalg.mixed_precision_solve(
+            a, b, return_iter=True)
+        self.assertEqual(iteration, -2)
+        testing.assert_allclose(x, cupy.full(3, 1e-300), rtol=1e-12)
+
+    def test_float32(self):
+        a = cupy.eye(3, dtype=numpy.float32) * 2
+        b = cupy.ones(3, dtype=numpy.float32)
+        x, iteration = cupy.linalg.mixed_precision_solve(
+            a, b, return_iter=True)
+        self.assertEqual(x.dtype, numpy.float32)
+        self.assertEqual(iteration, 0)
+        testing.assert_allclose(x, cupy.full(3, 0.5, numpy.float32))
+
+    def test_singular(self):
+        with self.assertRaises(numpy.linalg.LinAlgError):
+            cupy.linalg.mixed_precision_solve(cupy.zeros((3, 3)),
+                                              cupy.ones(3))
+
+
+@testing.parameterize(*testing.product({
+    'shapes': [
+        ((3, 4, 4), (3, 4)),
+        ((2, 3, 5, 5), (2, 3, 5, 2)),
+        ((2, 1, 3, 3), (4, 3, 1)),
+        ((3, 3), (2, 3, 2)),
+        ((2, 20, 20), (2, 20)),
+        ((1, 24, 24), (1, 24, 3)),
+        ((3, 0, 0), (3, 0)),
+    ],
+}))
+@unittest.skipUnless(
+    cuda.cusolver_enabled, 'Only cusolver in CUDA 8.0 is supported')
+@testing.gpu
+class TestBatchedSolve(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose(rtol=1e-3, atol=1e-3)
+    def test_solve(self, xp, dtype):
+        a_shape, b_shape = self.shapes
+        n = a_shape[-1]
+        # Diagonally dominant matrices are well-conditioned.
+        a = testing.shaped_random(a_shape, xp, dtype, scale=1)
+        a += n * xp.eye(n, dtype=dtype)
+        b = testing.shaped_random(b_shape, xp, dtype)
+        return xp.linalg.solve(a, b)
+
+
+@unittest.skipUnless(
+    cuda.cusolver_enabled, 'Only cusolver in CUDA 8.0 is supported')
+@testing.gpu
+class TestBatchedSolveMisc(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    def test_singular(self):
+        for n in (3, 20):
+            a = cupy.stack([cupy.eye(n), cupy.zeros((n, n))])
+            b = cupy.ones((2, n))
+            with self.assertRaises(numpy.linalg.LinAlgError):
+                cupy.linalg.solve(a, b)
+
+    def test_invalid_shape(self):
+        with self.assertRaises(numpy.linalg.LinAlgError):
+            cupy.linalg.solve(cupy.ones((2, 3, 3)), cupy.ones((2, 4)))
+        with self.assertRaises(numpy.linalg.LinAlgError):
+            cupy.linalg.solve(cupy.ones((2, 3, 3)), cupy.ones((3, 3, 1)))
+        with self.assertRaises(numpy.linalg.LinAlgError):
+            cupy.linalg.solve(cupy.ones((3,)), cupy.ones((3,)))
+
+
+@testing.parameterize(*testing.product({
+    'shape': [(1, 1), (4, 4), (3, 5, 5), (5, 5, 5), (1, 4, 4),
+              (2, 2, 16, 16), (3, 20, 20), (40, 40), (0, 3, 3)],
+}))
+@unittest.skipUnless(
+    cuda.cusolver_enabled, 'Only cusolver in CUDA 8.0 is supported')
+@testing.gpu
+class TestInv(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose(rtol=1e-3, atol=1e-3)
+    def test_inv(self, xp, dtype):
+        n = self.shape[-1]
+        a = testing.shaped_random(self.shape, xp, dtype, scale=1)
+        a += n * xp.eye(n, dtype=dtype)
+        return xp.linalg.inv(a)
+
+    def test_singular(self):
+        a = cupy.zeros(self.shape)
+        if a.size == 0:
+            return
+        with self.assertRaises(numpy.linalg.LinAlgError):
+            cupy.linalg.inv(a)
+
+
 @unittest.skipUnless(
     cuda.cusolver_enabled, 'Only cusolver in CUDA 8.0 is supported')
 @testing.gpu
@@ -0,0 +1,77 @@
+import unittest
+
+import numpy
+
+import cupy
+from cupy import cuda
+from cupy import testing
+
+
+class TestCheckMode(unittest.TestCase):
+
+    def test_default(self):
+        self.assertEqual(cupy.linalg.get_check_mode(), 'strict')
+
+    def test_set_check_mode(self):
+        old = cupy.linalg.set_check_mode('deferred')
+        try:
+            self.assertEqual(old, 'strict')
+            self.assertEqual(cupy.linalg.get_check_mode(), 'deferred')
+        finally:
+            cupy.linalg.set_check_mode(old)
+        self.assertEqual(cupy.linalg.get_check_mode(), 'strict')
+
+    def test_check_mode(self):
+        with cupy.linalg.check_mode('deferred'):
+            self.assertEqual(cupy.linalg.get_check_mode(), 'deferred')
+        self.assertEqual(cupy.linalg.get_check_mode(), 'strict')
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            cupy.linalg.set_check_mode('ignore')
+
+
+@unittest.skipUnless(
+    cuda.cusolver_enabled, 'Only cusolver in CUDA 8.0 is supported')
+@testing.gpu
+class TestDeferredCheck(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    def tearDown(self):
+        cupy.linalg.status._get_status_array().fill(0)
+
+    def test_strict(self):
+        a = -cupy.eye(3, dtype=numpy.float32)
+        with self.assertRaises(numpy.linalg.LinAlgError):
+            cupy.linalg.cholesky(a)
+
+    def test_deferred(self):
+        a = -cupy.eye(3, dtype=numpy.float32)
+        with cupy.linalg.check_mode('deferred'):
+            cupy.linalg.cholesky(a)
+            self.assertNotEqual(int(cupy.linalg.get_status()), 0)
+        with self.assertRaises(numpy.linalg.LinAlgError) as cm:
+            cupy.linalg.check_status()
+        self.assertIn('positive definite', str(cm.exception))
+        # The status is cleared.
+        self.assertEqual(int(cupy.linalg.get_status()), 0)
+        cupy.linalg.check_status()
+
+    def test_deferred_first_error(self):
+        a = cupy.zeros((2, 4, 4), dtype=numpy.float64)
+        b = cupy.ones((2, 4), dtype=numpy.float64)
+        with cupy.linalg.check_mode('deferred'):
+            cupy.linalg.solve(a, b)
+            cupy.linalg.cholesky(-cupy.eye(3))
+        with self.assertRaises(numpy.linalg.LinAlgError) as cm:
+            cupy.linalg.check_status()
+        self.assertEqual(str(cm.exception), 'Singular matrix')
+
+    def test_deferred_success(self):
+        a = testing.shaped_random((3, 4, 4), cupy, numpy.float32, scale=1)
+        a += 4 * cupy.eye(4, dtype=numpy.float32)
+        with cupy.linalg.check_mode('deferred'):
+            cupy.linalg.inv(a)
+        self.assertEqual(int(cupy.linalg.get_status()), 0)
+        cupy.linalg.check_status()
@@ -1,5 +1,6 @@
 import unittest
 
+import cupy
 from cupy import testing
 
 
@@ -241,3 +242,78 @@ class TestRot90(unittest.TestCase):
     def test_rot90_invalid_negative_axes(self, xp, dtype):
         x = testing.shaped_arange((3, 4, 2), xp, dtype)
         return xp.rot90(x, 1, axes=(1, -2))
+
+
+@testing.gpu
+class TestFlipView(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    def check_view(self, a, b):
+        self.assertIs(b.data.mem, a.data.mem)
+        self.assertFalse(b.flags.owndata)
+
+    def test_flip_is_view(self):
+        a = testing.shaped_arange((3, 4), cupy)
+        b = cupy.flip(a, 1)
+        self.check_view(a, b)
+        self.assertEqual(b.strides, (a.strides[0], -a.strides[1]))
+
+    def test_fliplr_is_view(self):
+        a = testing.shaped_arange((3, 4), cupy)
+        self.check_view(a, cupy.fliplr(a))
+
+    def test_flipud_is_view(self):
+        a = testing.shaped_arange((3, 4), cupy)
+        self.check_view(a, cupy.flipud(a))
+
+    def test_rot90_is_view(self):
+        a = testing.shaped_arange((3, 4), cupy)
+        self.check_view(a, cupy.rot90(a))
+        self.check_view(a, cupy.rot90(a, 2))
+        self.check_view(a, cupy.rot90(a, 3))
+
+    @testing.for_all_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_flip_twice(self, xp, dtype):
+        x = testing.shaped_arange((2, 3, 4), xp, dtype)
+        return xp.flip(xp.flipud(x), 0)
+
+    @testing.for_all_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_elementwise_on_flipped(self, xp, dtype):
+        x = testing.shaped_arange((3, 4), xp, dtype)
+        return xp.fliplr(x) + xp.flipud(x)
+
+    @testing.for_all_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_copy_flipped(self, xp, dtype):
+        x = testing.shaped_arange((3, 4), xp, dtype)
+        return xp.rot90(x).copy()
+
+    @testing.for_all_dtypes()
+    @testing.numpy_cupy_allclose()
+    def test_sum_flipped(self, xp, dtype):
+        x = testing.shaped_arange((3, 4, 5), xp, dtype)
+        return xp.flip(x, 1).sum(axis=1)
+
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_dot_flipped(self, xp, dtype):
+        a = testing.shaped_arange((3, 4), xp, dtype)
+        b = testing.shaped_arange((4, 5), xp, dtype)
+        return xp.fliplr(a).dot(xp.flipud(b))
+
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_dot_flipped_single_row(self, xp, dtype):
+        a = testing.shaped_arange((1, 4), xp, dtype)
+        b = testing.shaped_arange((4, 1), xp, dtype)
+        return xp.flipud(a).dot(xp.fliplr(b))
+
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_dot_flipped_vector(self, xp, dtype):
+        a = testing.shaped_arange((4,), xp, dtype)
+        b = testing.shaped_arange((3, 4), xp, dtype)
+        return b.dot(xp.flipud(a))
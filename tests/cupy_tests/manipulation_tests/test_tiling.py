@@ -1,5 +1,8 @@
 import unittest
 
+import numpy
+
+import cupy
 from cupy import testing
 
 
@@ -22,6 +25,48 @@ class TestRepeat(unittest.TestCase):
         x = testing.shaped_arange((2, 3, 4), xp)
         return xp.repeat(x, self.repeats, self.axis)
 
+    @testing.numpy_cupy_array_equal()
+    def test_array_repeat_non_contiguous(self, xp):
+        x = testing.shaped_arange((4, 3, 4), xp)[::2, :, ::-1]
+        return xp.repeat(x, self.repeats, self.axis)
+
+
+@testing.parameterize(
+    {'repeats': 2, 'axis': 0},
+    {'repeats': 2, 'axis': -1},
+    {'repeats': [2], 'axis': 0},
+)
+@testing.gpu
+class TestRepeatZeroDim(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.numpy_cupy_array_equal()
+    def test_array_repeat_zero_dim(self, xp):
+        x = xp.array(3.0)
+        return xp.repeat(x, self.repeats, self.axis)
+
+
+@testing.parameterize(
+    {'repeats': [0, 0, 0], 'axis': 1},
+    {'repeats': [1, 2, 3], 'axis': 1},
+    {'repeats': [3, 0, 2], 'axis': -2},
+)
+@testing.gpu
+class TestRepeatDeviceRepeats(unittest.TestCase):
+
+    def test_array_repeat(self):
+        x = testing.shaped_arange((2, 3, 4), numpy)
+        expected = numpy.repeat(x, self.repeats, self.axis)
+        actual = cupy.repeat(cupy.array(x), cupy.array(self.repeats),
+                             self.axis)
+        testing.assert_array_equal(actual, expected)
+
+    def test_negative(self):
+        x = testing.shaped_arange((2, 3, 4), cupy)
+        with self.assertRaises(ValueError):
+            cupy.repeat(x, cupy.array([1, -1, 1]), 1)
+
 
 @testing.parameterize(
     {'repeats': -3, 'axis': None},
@@ -40,6 +85,23 @@ class TestRepeatFailure(unittest.TestCase):
         xp.repeat(x, -3)
 
 
+@testing.parameterize(
+    {'shape': (2, 3), 'repeats': 2, 'axis': 2},
+    {'shape': (2, 3), 'repeats': 2, 'axis': -3},
+    {'shape': (2, 3), 'repeats': [1, 2], 'axis': 2},
+    {'shape': (), 'repeats': 2, 'axis': 1},
+)
+@testing.gpu
+class TestRepeatAxisOutOfBounds(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.numpy_cupy_raises()
+    def test_repeat_axis_out_of_bounds(self, xp):
+        x = testing.shaped_arange(self.shape, xp)
+        xp.repeat(x, self.repeats, self.axis)
+
+
 @testing.parameterize(
     {'reps': 0},
     {'reps': 1},
@@ -58,6 +120,11 @@ class TestTile(unittest.TestCase):
         x = testing.shaped_arange((2, 3, 4), xp)
         return xp.tile(x, self.reps)
 
+    @testing.numpy_cupy_array_equal()
+    def test_array_tile_non_contiguous(self, xp):
+        x = testing.shaped_arange((2, 3, 8), xp)[:, ::-1, ::2]
+        return xp.tile(x, self.reps)
+
 
 @testing.parameterize(
     {'reps': -1},
@@ -107,3 +107,139 @@ class TestMatmulLarge(unittest.TestCase):
         x1 = testing.shaped_arange(self.shape_pair[0], xp, dtype1)
         x2 = testing.shaped_arange(self.shape_pair[1], xp, dtype2)
         return xp.matmul(x1, x2)
+
+
+@testing.parameterize(
+    *testing.product({
+        'trans_pair': [(False, False), (True, False), (False, True),
+                       (True, True)],
+        'shape_pair': [
+            ((5, 3, 2), (5, 2, 4)),
+            ((5, 3, 2), (1, 2, 4)),
+            ((3, 2), (4, 5, 2, 4)),
+            ((4, 1, 3, 2), (5, 2, 4)),
+        ],
+    }))
+@testing.gpu
+class TestMatmulLayout(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    def _make(self, xp, shape, dtype, trans):
+        if trans:
+            shape = shape[:-2] + (shape[-1], shape[-2])
+            return xp.swapaxes(testing.shaped_arange(shape, xp, dtype),
+                               -1, -2)
+        return testing.shaped_arange(shape, xp, dtype)
+
+    @testing.with_requires('numpy>=1.10')
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_matmul(self, xp, dtype):
+        x1 = self._make(xp, self.shape_pair[0], dtype, self.trans_pair[0])
+        x2 = self._make(xp, self.shape_pair[1], dtype, self.trans_pair[1])
+        return xp.matmul(x1, x2)
+
+
+@testing.gpu
+class TestMatmulMisc(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.with_requires('numpy>=1.10')
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_matmul_strided(self, xp, dtype):
+        x1 = testing.shaped_arange((5, 3, 4), xp, dtype)[:, :, ::2]
+        x2 = testing.shaped_arange((10, 2, 4), xp, dtype)[::2]
+        return xp.matmul(x1, x2)
+
+    @testing.with_requires('numpy>=1.10')
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_matmul_negative_batch_stride(self, xp, dtype):
+        x1 = testing.shaped_arange((5, 3, 2), xp, dtype)[::-1]
+        x2 = testing.shaped_arange((5, 2, 4), xp, dtype)
+        return xp.matmul(x1, x2)
+
+    @testing.with_requires('numpy>=1.10')
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_matmul_zero_k(self, xp, dtype):
+        x1 = testing.shaped_arange((2, 3, 0), xp, dtype)
+        x2 = testing.shaped_arange((2, 0, 4), xp, dtype)
+        return xp.matmul(x1, x2)
+
+    @testing.with_requires('numpy>=1.10')
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_allclose(rtol=1e-5)
+    def test_matmul_complex(self, xp, dtype):
+        x1 = testing.shaped_arange((5, 3, 2), xp, dtype) * (1 - 2j)
+        x2 = testing.shaped_arange((5, 2, 4), xp, dtype) * (2 + 1j)
+        return xp.matmul(x1, x2)
+
+    @testing.with_requires('numpy>=1.10')
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_allclose(rtol=1e-5)
+    def test_matmul_complex_irregular_batch(self, xp, dtype):
+        x1 = testing.shaped_arange((4, 6, 3, 2), xp, dtype)[:, ::2] * 1j
+        x2 = testing.shaped_arange((2, 4), xp, dtype) * (2 + 1j)
+        return xp.matmul(x1, x2)
+
+    @testing.with_requires('numpy>=1.10')
+    @testing.for_complex_dtypes(name='dtype1')
+    @testing.for_float_dtypes(name='dtype2')
+    @testing.numpy_cupy_allclose(rtol=1e-3, atol=1e-3)
+    def test_matmul_complex_and_real(self, xp, dtype1, dtype2):
+        x1 = testing.shaped_arange((5, 3, 2), xp, dtype1) * (1 - 2j)
+        x2 = testing.shaped_arange((5, 2, 4), xp, dtype2)
+        return xp.matmul(x1, x2)
+
+    @testing.with_requires('numpy>=1.10')
+    @testing.for_all_dtypes(name='dtype1', no_bool=True)
+    @testing.for_float_dtypes(name='dtype2')
+    @testing.numpy_cupy_allclose(rtol=1e-3, atol=1e-3)
+    def test_matmul_out(self, xp, dtype1, dtype2):
+        x1 = testing.shaped_arange((5, 3, 2), xp, dtype1)
+        x2 = testing.shaped_arange((5, 2, 4), xp, dtype1)
+        out = xp.zeros((5, 3, 4), dtype=dtype2)
+        ret = xp.matmul(x1, x2, out=out)
+        self.assertIs(ret, out)
+        return out
+
+    @testing.with_requires('numpy>=1.10')
+    @testing.numpy_cupy_allclose()
+    def test_matmul_out_non_contiguous(self, xp):
+        x1 = testing.shaped_arange((5, 3, 2), xp, numpy.float32)
+        x2 = testing.shaped_arange((5, 2, 4), xp, numpy.float32)
+        out = xp.zeros((5, 4, 3), dtype=numpy.float32)
+        xp.matmul(x1, x2, out=out.swapaxes(1, 2))
+        return out
+
+    @testing.with_requires('numpy>=1.10')
+    @testing.numpy_cupy_raises()
+    def test_matmul_out_wrong_shape(self, xp):
+        x1 = testing.shaped_arange((5, 3, 2), xp, numpy.float32)
+        x2 = testing.shaped_arange((5, 2, 4), xp, numpy.float32)
+        xp.matmul(x1, x2, out=xp.zeros((5, 4, 3), dtype=numpy.float32))
+
+    @testing.with_requires('numpy>=1.10')
+    @testing.numpy_cupy_raises()
+    def test_matmul_mismatch(self, xp):
+        x1 = testing.shaped_arange((3, 2), xp, numpy.float32)
+        x2 = testing.shaped_arange((3, 4), xp, numpy.float32)
+        xp.matmul(x1, x2)
+
+    @testing.with_requires('numpy>=1.10')
+    @testing.numpy_cupy_raises()
+    def test_matmul_broadcast_mismatch(self, xp):
+        x1 = testing.shaped_arange((2, 3, 2), xp, numpy.float32)
+        x2 = testing.shaped_arange((3, 2, 4), xp, numpy.float32)
+        xp.matmul(x1, x2)
+
+    @testing.with_requires('numpy>=1.10')
+    @testing.numpy_cupy_raises()
+    def test_matmul_scalar(self, xp):
+        x1 = testing.shaped_arange((), xp, numpy.float32)
+        x2 = testing.shaped_arange((3, 4), xp, numpy.float32)
+        xp.matmul(x1, x2)
@@ -2,6 +2,7 @@ import unittest
 
 import numpy
 
+import cupy
 from cupy import testing
 
 
@@ -107,3 +108,180 @@ class TestMisc(unittest.TestCase):
 
     def test_fmin_nan(self):
         self.check_binary_nan('fmin')
+
+
+@testing.gpu
+class TestComplex(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    def _make(self, xp, dtype, shape=(2, 3)):
+        return testing.shaped_arange(shape, xp, dtype) * (1 - 2j)
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_real(self, xp, dtype):
+        return xp.real(self._make(xp, dtype))
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_imag(self, xp, dtype):
+        return xp.imag(self._make(xp, dtype))
+
+    @testing.for_float_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_real_of_real(self, xp, dtype):
+        return xp.real(testing.shaped_arange((2, 3), xp, dtype))
+
+    @testing.for_float_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_imag_of_real(self, xp, dtype):
+        return xp.imag(testing.shaped_arange((2, 3), xp, dtype))
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_real_setter(self, xp, dtype):
+        a = self._make(xp, dtype)
+        a.real = testing.shaped_reverse_arange((2, 3), xp, numpy.float32)
+        return a
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_imag_setter(self, xp, dtype):
+        a = self._make(xp, dtype)
+        a.imag = 3
+        return a
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_conj(self, xp, dtype):
+        return xp.conj(self._make(xp, dtype))
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_conj_method(self, xp, dtype):
+        return self._make(xp, dtype).conj()
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_allclose(rtol=1e-5)
+    def test_absolute(self, xp, dtype):
+        return xp.absolute(self._make(xp, dtype))
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_allclose(rtol=1e-5)
+    def test_sqrt(self, xp, dtype):
+        return xp.sqrt(self._make(xp, dtype))
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_allclose(rtol=1e-5)
+    def test_square(self, xp, dtype):
+        return xp.square(self._make(xp, dtype))
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_allclose(rtol=1e-5)
+    def check_binary(self, name, xp, dtype):
+        a = self._make(xp, dtype)
+        b = testing.shaped_reverse_arange((2, 3), xp, dtype) * (2 + 1j)
+        return getattr(xp, name)(a, b)
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_allclose(rtol=1e-5)
+    def check_binary_scalar(self, name, xp, dtype):
+        return getattr(xp, name)(self._make(xp, dtype), 1 + 2j)
+
+    def test_add(self):
+        self.check_binary('add')
+        self.check_binary_scalar('add')
+
+    def test_subtract(self):
+        self.check_binary('subtract')
+        self.check_binary_scalar('subtract')
+
+    def test_multiply(self):
+        self.check_binary('multiply')
+        self.check_binary_scalar('multiply')
+
+    def test_true_divide(self):
+        self.check_binary('true_divide')
+        self.check_binary_scalar('true_divide')
+
+    @testing.for_all_dtypes(name='real_dtype')
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_allclose(rtol=1e-3)
+    def test_add_real(self, xp, real_dtype, dtype):
+        a = testing.shaped_arange((2, 3), xp, real_dtype)
+        return xp.add(a, self._make(xp, dtype))
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_allclose(rtol=1e-3)
+    def test_multiply_float16(self, xp, dtype):
+        a = testing.shaped_arange((2, 3), xp, numpy.float16)
+        return xp.multiply(self._make(xp, dtype), a)
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_negative(self, xp, dtype):
+        return -self._make(xp, dtype)
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_equal(self, xp, dtype):
+        a = self._make(xp, dtype)
+        b = a.copy()
+        b[0] = 0
+        return a == b
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_less(self, xp, dtype):
+        a = self._make(xp, dtype)
+        b = a.conj()
+        b[1] = 0
+        return a < b
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_allclose(rtol=1e-5)
+    def test_exp(self, xp, dtype):
+        return xp.exp(self._make(xp, dtype) / 4)
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_allclose(rtol=1e-5)
+    def test_log(self, xp, dtype):
+        return xp.log(self._make(xp, dtype))
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_allclose(rtol=1e-5)
+    def test_sum(self, xp, dtype):
+        return self._make(xp, dtype, (2, 3, 4)).sum(axis=1)
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_allclose(rtol=1e-5)
+    def test_prod(self, xp, dtype):
+        a = self._make(xp, dtype, (2, 3)) / 4
+        return a.prod(axis=1)
+
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_allclose(rtol=1e-5)
+    def test_mean(self, xp, dtype):
+        return self._make(xp, dtype, (2, 3, 4)).mean(axis=2)
+
+    @testing.for_complex_dtypes()
+    @testing.for_all_dtypes(name='dst_dtype')
+    @testing.numpy_cupy_array_equal()
+    def test_astype(self, xp, dtype, dst_dtype):
+        return self._make(xp, dtype).astype(dst_dtype)
+
+    @testing.for_all_dtypes(name='src_dtype')
+    @testing.for_complex_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_astype_from_real(self, xp, src_dtype, dtype):
+        return testing.shaped_arange((2, 3), xp, src_dtype).astype(dtype)
+
+    @testing.for_complex_dtypes()
+    def test_get_and_set(self, dtype):
+        a_cpu = self._make(numpy, dtype)
+        a = cupy.array(a_cpu)
+        testing.assert_array_equal(a.get(), a_cpu)
+        b_cpu = a_cpu * 1j
+        a.set(b_cpu)
+        testing.assert_array_equal(a.get(), b_cpu)
@@ -187,6 +187,37 @@ class TestCumsum(unittest.TestCase):
         a = testing.shaped_arange(tuple(six.moves.range(4, 4 + n)), xp, dtype)
         return xp.cumsum(a, axis=self.axis)
 
+    @testing.for_all_dtypes()
+    @testing.numpy_cupy_allclose()
+    def test_cumsum_axis_non_contiguous(self, xp, dtype):
+        a = testing.shaped_arange((8, 5, 6), xp, dtype)[::2, :, 1::2]
+        return xp.cumsum(a, axis=self.axis)
+
+    @testing.for_all_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_cumsum_axis_many_rows(self, xp, dtype):
+        a = xp.ones((3, 40, 50), dtype)
+        return xp.cumsum(a, axis=self.axis)
+
+    @testing.for_all_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_cumsum_long(self, xp, dtype):
+        a = xp.ones((3000,), dtype)
+        return xp.cumsum(a)
+
+    @testing.numpy_cupy_allclose()
+    def test_cumsum_long_axis(self, xp):
+        a = testing.shaped_arange((2, 5000, 3), xp, numpy.float64)
+        return xp.cumsum(a, axis=1)
+
+    @testing.for_all_dtypes()
+    @testing.numpy_cupy_allclose()
+    def test_cumsum_out(self, xp, dtype):
+        a = testing.shaped_arange((4, 5), xp, dtype)
+        out = xp.zeros((4, 5), numpy.float64)
+        xp.cumsum(a, axis=1, out=out)
+        return out
+
     @testing.for_all_dtypes()
     @testing.numpy_cupy_raises()
     def test_invalid_axis_lower(self, xp, dtype):
@@ -223,6 +254,12 @@ class TestCumprod(unittest.TestCase):
         a = testing.shaped_arange((4, 5), xp, dtype)
         return xp.cumprod(a, axis=1)
 
+    @testing.for_all_dtypes()
+    @testing.numpy_cupy_allclose()
+    def test_cumprod_2dim_with_first_axis(self, xp, dtype):
+        a = testing.shaped_arange((4, 5), xp, dtype)
+        return xp.cumprod(a, axis=0)
+
     @testing.slow
     @testing.numpy_cupy_allclose()
     def test_cumprod_huge_array(self, xp):
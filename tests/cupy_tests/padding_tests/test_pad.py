@@ -2,6 +2,7 @@ import unittest
 
 import numpy
 
+import cupy
 from cupy import testing
 
 
@@ -69,6 +70,54 @@ class TestPadNumpybug(unittest.TestCase):
         return a
 
 
+@testing.parameterize(*testing.product({
+    'mode': ['edge', 'reflect', 'symmetric', 'wrap'],
+    'pad_width': [1, [1, 2], [[1, 2], [3, 4]], [[0, 7], [5, 0]]],
+}))
+@testing.gpu
+class TestPadModes(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.for_all_dtypes(no_bool=True)
+    @testing.numpy_cupy_array_equal()
+    def test_pad(self, xp, dtype):
+        array = testing.shaped_arange((3, 4), xp, dtype)
+        return xp.pad(array, self.pad_width, mode=self.mode)
+
+    @testing.numpy_cupy_array_equal()
+    def test_pad_non_contiguous(self, xp):
+        array = testing.shaped_arange((6, 4), xp)[::2, ::-1]
+        return xp.pad(array, self.pad_width, mode=self.mode)
+
+    @testing.numpy_cupy_array_equal()
+    def test_pad_1dim(self, xp):
+        array = testing.shaped_arange((1,), xp)
+        return xp.pad(array, 3, mode=self.mode)
+
+
+@testing.gpu
+class TestPadOut(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    def test_pad_out(self):
+        array = testing.shaped_arange((2, 3))
+        out = cupy.empty((5, 6), dtype=array.dtype)
+        ret = cupy.pad(array, [[1, 2], [2, 1]], mode='constant',
+                       constant_values=3, out=out)
+        self.assertIs(ret, out)
+        testing.assert_array_equal(
+            out, numpy.pad(array.get(), [[1, 2], [2, 1]], mode='constant',
+                           constant_values=3))
+
+    def test_pad_out_wrong_shape(self):
+        array = testing.shaped_arange((2, 3))
+        out = cupy.empty((4, 5), dtype=array.dtype)
+        with self.assertRaises(ValueError):
+            cupy.pad(array, 1, mode='edge', out=out)
+
+
 @testing.parameterize(
     {'array': [], 'pad_width': 1, 'mode': 'constant', 'constant_values': 3},
     {'array': 1, 'pad_width': 1, 'mode': 'constant', 'constant_values': 3},
@@ -0,0 +1,98 @@
+import os
+import unittest
+
+import mock
+
+import cupy
+from cupy import cuda
+from cupy import prof
+from cupy.prof.auto_range import annotate_routine
+from cupy import testing
+
+
+@unittest.skipUnless(cuda.nvtx_enabled, 'nvtx is required for auto_range')
+class TestAutoRange(unittest.TestCase):
+
+    def setUp(self):
+        # The state does not depend on the environment of the process.
+        self.old_auto_range = prof.is_auto_range_enabled()
+        prof.set_auto_range(False)
+
+    def tearDown(self):
+        prof.set_auto_range(self.old_auto_range)
+
+    def test_disabled_by_default(self):
+        with mock.patch.dict(os.environ):
+            os.environ.pop('CUPY_NVTX_AUTO_RANGE', None)
+            self.assertFalse(cupy.core.core._get_auto_range_default())
+
+    def test_enabled_by_environment(self):
+        with mock.patch.dict(os.environ, {'CUPY_NVTX_AUTO_RANGE': '1'}):
+            self.assertTrue(cupy.core.core._get_auto_range_default())
+
+    def test_auto_range_context(self):
+        with prof.auto_range():
+            self.assertTrue(prof.is_auto_range_enabled())
+            with prof.auto_range(False):
+                self.assertFalse(prof.is_auto_range_enabled())
+            self.assertTrue(prof.is_auto_range_enabled())
+        self.assertFalse(prof.is_auto_range_enabled())
+
+    def test_annotate_routine(self):
+        push_patch = mock.patch('cupy.cuda.nvtx.RangePush')
+        pop_patch = mock.patch('cupy.cuda.nvtx.RangePop')
+
+        @annotate_routine('test:routine')
+        def f(x):
+            return x
+
+        with push_patch as push, pop_patch as pop:
+            f(None)
+            self.assertFalse(push.called)
+            with prof.auto_range():
+                f(None)
+            push.assert_called_once_with('test:routine')
+            pop.assert_called_once_with()
+
+    @testing.gpu
+    def test_ufunc(self):
+        a = cupy.arange(6, dtype=cupy.float32).reshape(2, 3)
+        push_patch = mock.patch('cupy.cuda.nvtx.RangePush')
+        pop_patch = mock.patch('cupy.cuda.nvtx.RangePop')
+        with push_patch as push, pop_patch as pop:
+            with prof.auto_range():
+                cupy.add(a, a)
+            push.assert_called_once_with('cupy_add (float32, (2, 3))')
+            pop.assert_called_once_with()
+
+    @testing.gpu
+    def test_elementwise_kernel(self):
+        a = cupy.arange(6, dtype=cupy.float32)
+        kern = cupy.ElementwiseKernel('T x', 'T y', 'y = x', 'test_kernel')
+        push_patch = mock.patch('cupy.cuda.nvtx.RangePush')
+        pop_patch = mock.patch('cupy.cuda.nvtx.RangePop')
+        with push_patch as push, pop_patch as pop:
+            with prof.auto_range():
+                kern(a)
+            push.assert_called_once_with('test_kernel (float32, (6,))')
+            pop.assert_called_once_with()
+
+    @testing.gpu
+    def test_reduction(self):
+        a = cupy.arange(6, dtype=cupy.float32)
+        push_patch = mock.patch('cupy.cuda.nvtx.RangePush')
+        pop_patch = mock.patch('cupy.cuda.nvtx.RangePop')
+        with push_patch as push, pop_patch as pop:
+            with prof.auto_range():
+                a.sum()
+            push.assert_called_once_with('cupy_sum (float32, (6,))')
+            pop.assert_called_once_with()
+
+    @testing.gpu
+    def test_disabled(self):
+        a = cupy.arange(6, dtype=cupy.float32)
+        push_patch = mock.patch('cupy.cuda.nvtx.RangePush')
+        with push_patch as push:
+            cupy.add(a, a)
+            a.sum()
+            self.assertFalse(push.called)
@@ -335,6 +335,69 @@ class TestChoiceMultinomial(unittest.TestCase):
         return y
 
 
+@testing.parameterize(
+    {'a': 5, 'size': 3, 'p': None},
+    {'a': 5, 'size': (2, 2), 'p': None},
+    {'a': 5, 'size': 5, 'p': [0.1, 0.2, 0.3, 0.2, 0.2]},
+    {'a': 5, 'size': 2, 'p': [0.5, 0.0, 0.5, 0.0, 0.0]},
+    {'a': [4, 5, 6, 7, 8], 'size': 4, 'p': None},
+)
+@testing.fix_random()
+@testing.gpu
+class TestChoiceWithoutReplacement(unittest.TestCase):
+
+    def setUp(self):
+        self.rs = cupy.random.get_random_state()
+        self.rs.seed(testing.generate_seed())
+
+    def test_dtype_shape(self):
+        v = self.rs.choice(self.a, self.size, False, self.p)
+        if isinstance(self.size, six.integer_types):
+            expected_shape = (self.size,)
+        else:
+            expected_shape = self.size
+        self.assertEqual(v.dtype, 'int')
+        self.assertEqual(v.shape, expected_shape)
+
+    @condition.repeat(3, 10)
+    def test_unique(self):
+        for _ in range(10):
+            v = self.rs.choice(self.a, self.size, False, self.p).get()
+            self.assertEqual(len(numpy.unique(v)), v.size)
+
+    def test_zero_probabilities(self):
+        if self.p is None or self.size < numpy.count_nonzero(self.p):
+            return
+        v = self.rs.choice(self.a, self.size, False, self.p).get()
+        self.assertEqual(sorted(v), list(numpy.nonzero(self.p)[0]))
+
+
+@testing.fix_random()
+@testing.gpu
+class TestChoiceZeroProbability(unittest.TestCase):
+
+    def setUp(self):
+        self.rs = cupy.random.get_random_state()
+        self.rs.seed(testing.generate_seed())
+
+    def test_zero_probability_is_not_chosen(self):
+        p = numpy.zeros(1000)
+        p[::100] = 0.1
+        v = self.rs.choice(1000, 10000, True, p).get()
+        self.assertTrue(numpy.all(v % 100 == 0))
+
+    def test_device_probabilities(self):
+        p = cupy.array([0.0, 0.5, 0.0, 0.5])
+        v = self.rs.choice(4, 1000, True, p).get()
+        self.assertTrue(numpy.all(v % 2 == 1))
+
+    def test_invalid_device_probabilities(self):
+        with self.assertRaises(ValueError):
+            self.rs.choice(3, 1, True, cupy.array([-0.1, 0.3, 0.8]))
+        with self.assertRaises(ValueError):
+            self.rs.choice(3, 1, True, cupy.array([0.1, 0.1, 0.7]))
+
+
 @testing.parameterize(
     {'a': 3.1, 'size': 1, 'p': [0.1, 0.1, 0.8]},
     {'a': None, 'size': 1, 'p': [0.1, 0.1, 0.8]},
@@ -345,6 +408,8 @@ class TestChoiceMultinomial(unittest.TestCase):
     {'a': 2, 'size': 1, 'p': [0.1, 0.1, 0.8]},
     {'a': 3, 'size': 1, 'p': [-0.1, 0.3, 0.8]},
     {'a': 3, 'size': 1, 'p': [0.1, 0.1, 0.7]},
+    {'a': 3, 'size': 4, 'p': None, 'replace': False},
+    {'a': 3, 'size': 3, 'p': [0.5, 0.5, 0.0], 'replace': False},
 )
 @testing.fix_random()
 @testing.gpu
@@ -354,8 +419,10 @@ class TestChoiceFailure(unittest.TestCase):
         self.rs = generator.RandomState(seed=testing.generate_seed())
 
     def test_choice_invalid_value(self):
+        replace = getattr(self, 'replace', True)
         with self.assertRaises(ValueError):
-            self.rs.choice(a=self.a, size=self.size, p=self.p)
+            self.rs.choice(a=self.a, size=self.size, replace=replace,
+                           p=self.p)
 
 
 class TestResetStates(unittest.TestCase):
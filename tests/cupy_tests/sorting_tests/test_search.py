@@ -2,6 +2,7 @@ import unittest
 
 import numpy
 
+import cupy
 from cupy import testing
 
 
@@ -186,3 +187,76 @@ class TestFlatNonzero(unittest.TestCase):
     def test_flatnonzero(self, xp, dtype):
         array = xp.array(self.array, dtype=dtype)
         return xp.flatnonzero(array)
+
+
+@testing.parameterize(*testing.product({
+    'size': [0, 1, 10, 3000],
+    'side': ['left', 'right'],
+}))
+@testing.gpu
+class TestSearchsorted(unittest.TestCase):
+
+    @testing.for_all_dtypes(no_float16=True, no_bool=True)
+    @testing.numpy_cupy_array_equal()
+    def test_searchsorted(self, xp, dtype):
+        a = xp.sort(testing.shaped_random((self.size,), xp, dtype))
+        v = testing.shaped_random((4, 5), xp, dtype)
+        return xp.searchsorted(a, v, side=self.side)
+
+    @testing.numpy_cupy_array_equal()
+    def test_searchsorted_duplicates(self, xp):
+        a = xp.sort(testing.shaped_random((self.size,), xp, xp.int32, 3))
+        v = xp.arange(-1, 5, dtype=xp.int32)
+        return xp.searchsorted(a, v, side=self.side)
+
+    @testing.numpy_cupy_array_equal()
+    def test_searchsorted_nan(self, xp):
+        a = xp.sort(testing.shaped_random((self.size,), xp))
+        a[self.size // 2:] = float('nan')
+        v = xp.array([-1, 0, 5, 11, float('nan')], 'f')
+        return xp.searchsorted(a, v, side=self.side)
+
+    @testing.numpy_cupy_array_equal()
+    def test_searchsorted_sorter(self, xp):
+        a = testing.shaped_random((self.size,), xp, xp.float64)
+        v = testing.shaped_random((7,), xp, xp.float64)
+        return xp.searchsorted(a, v, side=self.side, sorter=xp.argsort(a))
+
+    def test_searchsorted_sorter_out_of_range(self):
+        a = cupy.array([1, 2, 3, 4])
+        v = cupy.arange(6)
+        # The indices are clipped to [0, 4).
+        sorter = cupy.array([-3, 1, 2, 10])
+        testing.assert_array_equal(
+            cupy.searchsorted(a, v, side=self.side, sorter=sorter),
+            cupy.searchsorted(a, v, side=self.side))
+
+    @testing.numpy_cupy_array_equal()
+    def test_searchsorted_mixed_dtypes(self, xp):
+        a = xp.sort(testing.shaped_random((self.size,), xp, xp.int64))
+        v = testing.shaped_random((7,), xp, xp.float32)
+        return xp.searchsorted(a, v, side=self.side)
+
+    @testing.numpy_cupy_array_equal()
+    def test_searchsorted_scalar(self, xp):
+        a = xp.sort(testing.shaped_random((self.size,), xp))
+        return xp.array(xp.searchsorted(a, 3.5, side=self.side))
+
+
+@testing.gpu
+class TestSearchsortedInvalid(unittest.TestCase):
+
+    @testing.numpy_cupy_raises()
+    def test_invalid_side(self, xp):
+        a = xp.arange(4)
+        xp.searchsorted(a, a, side='middle')
+
+    @testing.numpy_cupy_raises()
+    def test_two_dim(self, xp):
+        a = xp.arange(4).reshape(2, 2)
+        xp.searchsorted(a, a)
+
+    @testing.numpy_cupy_raises()
+    def test_wrong_sorter_size(self, xp):
+        a = xp.arange(4)
+        xp.searchsorted(a, a, sorter=xp.arange(3))
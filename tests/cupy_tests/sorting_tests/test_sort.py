@@ -69,10 +69,11 @@ class TestSort(unittest.TestCase):
         a.sort()
         return a
 
-    def test_sort_non_contiguous(self):
-        a = testing.shaped_random((10,), cupy)[::2]  # Non contiguous view
-        with self.assertRaises(NotImplementedError):
-            a.sort()
+    @testing.numpy_cupy_allclose()
+    def test_sort_non_contiguous(self, xp):
+        a = testing.shaped_random((10,), xp)
+        a[::2].sort()  # Non contiguous view
+        return a
 
     @testing.numpy_cupy_allclose()
     def test_external_sort_contiguous(self, xp):
@@ -113,6 +114,18 @@ class TestSort(unittest.TestCase):
         a = testing.shaped_random((2, 3, 3), xp)
         return xp.sort(a, axis=None)
 
+    @testing.numpy_cupy_array_equal()
+    def test_sort_axis_non_contiguous(self, xp):
+        a = testing.shaped_random((4, 3, 6), xp)
+        a[:, :, ::2].sort(axis=0)
+        return a
+
+    @testing.numpy_cupy_array_equal()
+    def test_sort_reversed_view(self, xp):
+        a = testing.shaped_random((3, 10), xp)
+        a[:, ::-1].sort()
+        return a
+
     @testing.numpy_cupy_raises()
     def test_sort_invalid_axis(self, xp):
         a = testing.shaped_random((2, 3, 3), xp)
@@ -298,3 +311,296 @@ class TestMsort(unittest.TestCase):
         a = testing.shaped_random((10,), cupy, dtype)
         with self.assertRaises(NotImplementedError):
             return cupy.msort(a)
+
+
+def _permutation(xp, shape):
+    size = numpy.prod(shape, dtype=int)
+    a = numpy.random.RandomState(0).permutation(size).reshape(shape)
+    return xp.asarray(a)
+
+
+@testing.parameterize(*testing.product({
+    'shape': [(2100,), (3, 2100), (2100, 3), (5, 1, 2051)],
+    'axis': [0, -1],
+    'step': [1, -1, 2],
+}))
+@testing.gpu
+class TestSortLongRows(unittest.TestCase):
+
+    @testing.numpy_cupy_array_equal()
+    def test_sort(self, xp):
+        a = testing.shaped_random(self.shape, xp, scale=100)
+        a[..., ::self.step].sort(axis=self.axis)
+        return a
+
+    @testing.numpy_cupy_array_equal()
+    def test_argsort(self, xp):
+        a = _permutation(xp, self.shape)
+        return a[..., ::self.step].argsort(axis=self.axis)
+
+
+@testing.gpu
+class TestSortBatched(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.for_all_dtypes(no_float16=True, no_bool=True)
+    @testing.numpy_cupy_array_equal()
+    def test_sort_many_rows(self, xp, dtype):
+        a = testing.shaped_random((300, 7), xp, dtype)
+        a.sort(axis=0)
+        return a
+
+    @testing.for_all_dtypes(no_float16=True, no_bool=True)
+    def test_argsort_stable(self, dtype):
+        a = testing.shaped_random((4, 1000), numpy, dtype, scale=3)
+        expected = numpy.argsort(a, axis=1, kind='mergesort')
+        testing.assert_array_equal(
+            cupy.asarray(a).argsort(axis=1), expected)
+
+    @testing.numpy_cupy_array_equal()
+    def test_argsort_transposed(self, xp):
+        a = testing.shaped_random((5, 6, 7), xp).transpose(2, 0, 1)
+        return a.argsort(axis=1)
+
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_array_equal()
+    def test_sort_nan(self, xp, dtype):
+        a = xp.array([[3, float('nan'), 1, -2, float('nan'), 0]], dtype)
+        a.sort()
+        return a
+
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_array_equal()
+    def test_argsort_nan(self, xp, dtype):
+        a = xp.array([3, float('nan'), 1, -2, float('nan'), 0], dtype)
+        return a.argsort()
+
+    @testing.numpy_cupy_array_equal()
+    def test_argsort_length_one(self, xp):
+        return testing.shaped_random((3, 1), xp).argsort(axis=1)
+
+    @testing.numpy_cupy_array_equal()
+    def test_sort_empty(self, xp):
+        a = xp.empty((0, 3))
+        a.sort(axis=0)
+        return a
+
+
+class TestSortKernelCode(unittest.TestCase):
+
+    def test_sort(self):
+        code = cupy.core.core._get_sort_kernel_code(
+            'my_sort', numpy.float32, 2, 1, 64, False)
+        self.assertEqual(code.name, 'my_sort')
+        self.assertIn('typedef float T;', code.source)
+        self.assertIn('#define _SIZE 64', code.source)
+        self.assertIn('#define _ARGSORT 0', code.source)
+        self.assertIn('CArray<T, 2> _x', code.source)
+
+    def test_argsort(self):
+        code = cupy.core.core._get_sort_kernel_code(
+            'my_argsort', numpy.int64, 1, 3, 1024, True)
+        self.assertIn('typedef long long T;', code.source)
+        self.assertIn('#define _ARGSORT 1', code.source)
+        self.assertIn('CArray<long long, 3> _idx', code.source)
+
+    def test_select(self):
+        code = cupy.core.core._get_select_kernel_code(
+            'my_select', numpy.float64, 2, 1, 2, False, True)
+        self.assertEqual(code.name, 'my_select')
+        self.assertIn('typedef double T;', code.source)
+        self.assertIn('typedef unsigned long long K;', code.source)
+        self.assertIn('#define _VALUES 0', code.source)
+        self.assertIn('#define _INDICES 1', code.source)
+
+    def test_select_unsigned(self):
+        code = cupy.core.core._get_select_kernel_code(
+            'my_select', numpy.uint16, 1, 1, 1, True, False)
+        self.assertIn('typedef unsigned short K;', code.source)
+        self.assertIn('return (K)v;', code.source)
+        self.assertIn('return (T)k;', code.source)
+
+    def test_select_value_float(self):
+        code = cupy.core.core._get_select_kernel_code(
+            'my_select', numpy.float32, 1, 2, 1, True, False)
+        self.assertIn('typedef unsigned int K;', code.source)
+        self.assertIn('__uint_as_float', code.source)
+
+
+@testing.parameterize(*testing.product({
+    'external': [False, True],
+    'length': [10, 3000],
+}))
+@testing.gpu
+class TestPartition(unittest.TestCase):
+
+    def partition(self, a, kth, axis=-1):
+        if self.external:
+            xp = cupy.get_array_module(a)
+            return xp.partition(a, kth, axis=axis)
+        else:
+            a.partition(kth, axis=axis)
+            return a
+
+    def check_partitioned(self, a, kth, axis=-1):
+        a = cupy.rollaxis(a, axis, a.ndim)
+        pivot = a[..., kth:kth + 1]
+        self.assertTrue(bool((a[..., :kth] <= pivot).all()))
+        self.assertTrue(bool((a[..., kth + 1:] >= pivot).all()))
+
+    @testing.for_all_dtypes(no_float16=True, no_bool=True)
+    def test_partition_one_dim(self, dtype):
+        a = testing.shaped_random((self.length,), numpy, dtype)
+        kth = self.length // 3
+        b = self.partition(cupy.array(a), kth)
+        testing.assert_array_equal(b[kth], numpy.partition(a, kth)[kth])
+        testing.assert_array_equal(cupy.sort(b), numpy.sort(a))
+        self.check_partitioned(b, kth)
+
+    @testing.for_all_dtypes(no_float16=True, no_bool=True)
+    def test_partition_multi_dim(self, dtype):
+        a = testing.shaped_random((3, 4, self.length), numpy, dtype)
+        kth = 2
+        b = self.partition(cupy.array(a), kth)
+        testing.assert_array_equal(
+            b[..., kth], numpy.partition(a, kth)[..., kth])
+        self.check_partitioned(b, kth)
+
+    def test_partition_axis(self):
+        a = testing.shaped_random((self.length, 3, 4), numpy)
+        kth = self.length - 1
+        b = self.partition(cupy.array(a), kth, axis=0)
+        testing.assert_array_equal(
+            b[kth], numpy.partition(a, kth, axis=0)[kth])
+        self.check_partitioned(b, kth, axis=0)
+
+    def test_partition_negative_kth(self):
+        a = testing.shaped_random((self.length,), numpy)
+        b = self.partition(cupy.array(a), -2)
+        testing.assert_array_equal(b[-2], numpy.partition(a, -2)[-2])
+
+    def test_partition_sequence_kth(self):
+        a = testing.shaped_random((self.length,), numpy)
+        kth = [1, self.length // 2]
+        b = self.partition(cupy.array(a), kth)
+        expected = numpy.partition(a, kth)
+        for k in kth:
+            testing.assert_array_equal(b[k], expected[k])
+            self.check_partitioned(b, k)
+
+    def test_partition_nan(self):
+        a = testing.shaped_random((self.length,), numpy)
+        a[::3] = numpy.nan
+        kth = self.length // 2
+        b = self.partition(cupy.array(a), kth)
+        testing.assert_array_equal(b[kth], numpy.partition(a, kth)[kth])
+
+    def test_partition_non_contiguous(self):
+        a = testing.shaped_random((2, self.length), numpy)
+        kth = 3
+        b = cupy.array(a)[:, ::-1]
+        b = self.partition(b, kth)
+        testing.assert_array_equal(
+            b[:, kth], numpy.partition(a[:, ::-1], kth)[:, kth])
+        self.check_partitioned(b, kth)
+
+    @testing.numpy_cupy_raises()
+    def test_partition_invalid_kth(self, xp):
+        a = testing.shaped_random((self.length,), xp)
+        return self.partition(a, self.length)
+
+    @testing.numpy_cupy_raises()
+    def test_partition_zero_dim(self, xp):
+        a = testing.shaped_random((), xp)
+        return self.partition(a, 0)
+
+
+@testing.parameterize(*testing.product({
+    'external': [False, True],
+    'length': [10, 3000],
+}))
+@testing.gpu
+class TestArgpartition(unittest.TestCase):
+
+    def argpartition(self, a, kth, axis=-1):
+        if self.external:
+            xp = cupy.get_array_module(a)
+            return xp.argpartition(a, kth, axis=axis)
+        else:
+            return a.argpartition(kth, axis=axis)
+
+    @testing.for_all_dtypes(no_float16=True, no_bool=True)
+    def test_argpartition_multi_dim(self, dtype):
+        a = testing.shaped_random((3, self.length), numpy, dtype)
+        kth = self.length // 2
+        idx = self.argpartition(cupy.array(a), kth).get()
+        b = a[numpy.arange(3)[:, None], idx]
+        expected = numpy.partition(a, kth)
+        testing.assert_array_equal(b[:, kth], expected[:, kth])
+        self.assertTrue(bool((b[:, :kth] <= b[:, kth:kth + 1]).all()))
+        self.assertTrue(bool((b[:, kth + 1:] >= b[:, kth:kth + 1]).all()))
+        testing.assert_array_equal(
+            numpy.sort(idx), numpy.tile(numpy.arange(self.length), (3, 1)))
+
+    def test_argpartition_axis(self):
+        a = _permutation(numpy, (self.length, 3))
+        idx = self.argpartition(cupy.array(a), 0, axis=0)
+        testing.assert_array_equal(
+            idx[0], numpy.argpartition(a, 0, axis=0)[0])
+
+    def test_argpartition_none_axis(self):
+        a = _permutation(numpy, (2, self.length))
+        kth = self.length
+        idx = self.argpartition(cupy.array(a), kth, axis=None)
+        testing.assert_array_equal(
+            idx[kth], numpy.argpartition(a, kth, axis=None)[kth])
+
+    def test_argpartition_original_array_not_modified(self):
+        a = testing.shaped_random((self.length,), cupy)
+        b = cupy.array(a)
+        self.argpartition(a, 3)
+        testing.assert_array_equal(a, b)
+
+
+@testing.parameterize(*testing.product({
+    'shape': [(10,), (6, 3000), (3000, 6)],
+    'axis': [0, -1],
+    'k': [0, 1, 5],
+    'largest': [True, False],
+}))
+@testing.gpu
+class TestTopk(unittest.TestCase):
+
+    def test_topk(self):
+        a = _permutation(numpy, self.shape).astype(numpy.float32)
+        values, idx = cupy.topk(cupy.array(a), self.k, axis=self.axis,
+                                largest=self.largest)
+        order = numpy.argsort(a, axis=self.axis)
+        if self.largest:
+            order = numpy.flip(order, self.axis)
+        order = numpy.rollaxis(order, self.axis, a.ndim)[..., :self.k]
+        testing.assert_array_equal(idx, numpy.rollaxis(order, -1, self.axis))
+
+        expected = numpy.sort(a, axis=self.axis)
+        if self.largest:
+            expected = numpy.flip(expected, self.axis)
+        expected = numpy.rollaxis(expected, self.axis, a.ndim)[..., :self.k]
+        testing.assert_array_equal(
+            values, numpy.rollaxis(expected, -1, self.axis))
+
+
+@testing.gpu
+class TestTopkInvalid(unittest.TestCase):
+
+    def test_k_too_large(self):
+        with self.assertRaises(ValueError):
+            cupy.topk(cupy.arange(3), 4)
+
+    def test_invalid_axis(self):
+        with self.assertRaises(ValueError):
+            cupy.topk(cupy.arange(3), 1, axis=1)
+
+    def test_zero_dim(self):
+        with self.assertRaises(ValueError):
+            cupy.topk(cupy.array(3), 1)
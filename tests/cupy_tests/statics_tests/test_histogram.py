@@ -3,6 +3,7 @@ import unittest
 
 import numpy
 
+import cupy
 from cupy import testing
 
 
@@ -95,3 +96,135 @@ class TestHistogram(unittest.TestCase):
     def test_bincount_zero_minlength(self, xp, dtype):
         x = testing.shaped_arange((3,), xp, dtype)
         return xp.bincount(x, minlength=0)
+
+    @testing.numpy_cupy_array_equal()
+    def test_bincount_empty(self, xp):
+        x = xp.array([], dtype=numpy.int32)
+        return xp.bincount(x, minlength=3)
+
+    @testing.for_dtypes((numpy.int32, numpy.int64))
+    @testing.numpy_cupy_array_equal()
+    def test_bincount_many_bins(self, xp, dtype):
+        x = testing.shaped_random((10000,), xp, dtype, scale=6000)
+        return xp.bincount(x)
+
+    @testing.numpy_cupy_allclose()
+    def test_bincount_many_bins_with_weight(self, xp):
+        x = testing.shaped_random((10000,), xp, numpy.int32, scale=6000)
+        w = testing.shaped_random((10000,), xp, numpy.float64)
+        return xp.bincount(x, weights=w)
+
+    @testing.numpy_cupy_array_equal()
+    def test_bincount_large_input(self, xp):
+        x = testing.shaped_random((100000,), xp, numpy.int32, scale=50)
+        return xp.bincount(x)
+
+
+@testing.gpu
+class TestHistogramFunc(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.for_all_dtypes(no_bool=True, no_float16=True)
+    @testing.numpy_cupy_array_list_equal()
+    def test_histogram(self, xp, dtype):
+        x = testing.shaped_random((100,), xp, dtype)
+        return xp.histogram(x)
+
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_array_list_equal()
+    def test_histogram_bins(self, xp, dtype):
+        x = testing.shaped_random((10, 100), xp, dtype)
+        return xp.histogram(x, bins=37)
+
+    @testing.numpy_cupy_array_list_equal()
+    def test_histogram_range(self, xp):
+        x = testing.shaped_random((1000,), xp, numpy.float64)
+        return xp.histogram(x, bins=5, range=(2, 7.5))
+
+    @testing.numpy_cupy_array_list_equal()
+    def test_histogram_range_float32(self, xp):
+        x = xp.array([0.1, 0.5, 1.1, 1.2], dtype=numpy.float32)
+        return xp.histogram(x, bins=4, range=(0.1, 1.1))
+
+    @testing.numpy_cupy_array_list_equal()
+    def test_histogram_same_values(self, xp):
+        x = xp.full((10,), 3, dtype=numpy.int32)
+        return xp.histogram(x)
+
+    @testing.numpy_cupy_array_list_equal()
+    def test_histogram_empty(self, xp):
+        x = xp.array([], dtype=numpy.float64)
+        return xp.histogram(x, bins=3)
+
+    @testing.numpy_cupy_array_list_equal()
+    def test_histogram_many_bins(self, xp):
+        x = testing.shaped_random((10000,), xp, numpy.float64)
+        return xp.histogram(x, bins=5000)
+
+    @testing.numpy_cupy_allclose()
+    def test_histogram_weights(self, xp):
+        x = testing.shaped_random((1000,), xp, numpy.float64)
+        w = testing.shaped_random((1000,), xp, numpy.float32)
+        return xp.histogram(x, bins=8, weights=w)[0]
+
+    @testing.numpy_cupy_allclose()
+    def test_histogram_density(self, xp):
+        x = testing.shaped_random((1000,), xp, numpy.float64)
+        return xp.histogram(x, bins=[0, 1, 3, 7, 10], density=True)[0]
+
+    @testing.numpy_cupy_array_list_equal()
+    def test_histogram_edges(self, xp):
+        x = testing.shaped_random((1000,), xp, numpy.float64)
+        return xp.histogram(x, bins=[-1, 0.5, 2, 2, 7.5, 9])
+
+    def test_histogram_device_edges(self):
+        x = testing.shaped_random((1000,), numpy, numpy.float32)
+        bins = numpy.array([0, 2.5, 3, 9.5], dtype=numpy.float32)
+        hist, edges = cupy.histogram(cupy.array(x), bins=cupy.array(bins))
+        expected_hist, expected_edges = numpy.histogram(x, bins=bins)
+        testing.assert_array_equal(hist, expected_hist)
+        testing.assert_array_equal(edges, expected_edges)
+
+    @testing.numpy_cupy_raises()
+    def test_histogram_invalid_range(self, xp):
+        x = testing.shaped_random((10,), xp)
+        xp.histogram(x, range=(3, 1))
+
+    @testing.numpy_cupy_raises()
+    def test_histogram_zero_bins(self, xp):
+        x = testing.shaped_random((10,), xp)
+        xp.histogram(x, bins=0)
+
+    @testing.numpy_cupy_raises()
+    def test_histogram_decreasing_edges(self, xp):
+        x = testing.shaped_random((10,), xp)
+        xp.histogram(x, bins=[2, 1])
+
+    @testing.numpy_cupy_raises()
+    def test_histogram_weights_mismatch(self, xp):
+        x = testing.shaped_random((10,), xp)
+        w = testing.shaped_random((9,), xp)
+        xp.histogram(x, weights=w)
+
+
+@testing.parameterize(*testing.product({
+    'bins': [[], [1.5], [0, 1, 2.5, 4, 10], [10, 4, 2.5, 1, 0],
+             list(range(0, 3000, 3))],
+    'right': [False, True],
+}))
+@testing.gpu
+class TestDigitize(unittest.TestCase):
+
+    @testing.for_all_dtypes(no_float16=True, no_bool=True)
+    @testing.numpy_cupy_array_equal()
+    def test_digitize(self, xp, dtype):
+        x = testing.shaped_arange((3, 40), xp, dtype)
+        bins = xp.array(self.bins, dtype=numpy.float64)
+        return xp.digitize(x, bins, right=self.right)
+
+    @testing.numpy_cupy_array_equal()
+    def test_digitize_nan(self, xp):
+        x = xp.array([0, 1.5, float('nan'), 20], dtype=numpy.float32)
+        bins = xp.array(self.bins, dtype=numpy.float32)
+        return xp.digitize(x, bins, right=self.right)
@@ -1,5 +1,9 @@
 import unittest
+import warnings
 
+import numpy
+
+import cupy
 from cupy import testing
 
 
@@ -79,3 +83,69 @@ class TestMeanVar(unittest.TestCase):
     def test_external_std_axis(self, xp, dtype):
         a = testing.shaped_arange((2, 3, 4), xp, dtype)
         return xp.std(a, axis=1)
+
+
+@testing.parameterize(*testing.product({
+    'shape': [(7,), (4, 6), (3, 4000)],
+    'axis': [None, 0, -1],
+    'keepdims': [False, True],
+}))
+@testing.gpu
+class TestMedian(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.for_all_dtypes(no_bool=True)
+    @testing.numpy_cupy_allclose(rtol=1e-3)
+    def test_median(self, xp, dtype):
+        a = testing.shaped_random(self.shape, xp, dtype)
+        return xp.median(a, axis=self.axis, keepdims=self.keepdims)
+
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_nanmedian(self, xp, dtype):
+        a = testing.shaped_random(self.shape, xp, dtype)
+        a[..., 1] = float('nan')
+        return xp.nanmedian(a, axis=self.axis, keepdims=self.keepdims)
+
+
+@testing.gpu
+class TestMedianMisc(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.for_all_dtypes(no_bool=True, no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_median_tuple_axis(self, xp, dtype):
+        a = testing.shaped_random((3, 4, 5), xp, dtype)
+        return xp.median(a, axis=(1, 2))
+
+    @testing.numpy_cupy_allclose()
+    def test_median_overwrite_input(self, xp):
+        a = testing.shaped_random((4, 6), xp, xp.float32)
+        return xp.median(a, axis=1, overwrite_input=True)
+
+    @testing.numpy_cupy_allclose()
+    def test_median_overwrite_input_non_contiguous(self, xp):
+        a = testing.shaped_random((4, 6), xp, xp.float32)
+        return xp.median(a, axis=0, overwrite_input=True)
+
+    def test_median_overwrite_input_in_place(self):
+        a = testing.shaped_random((4, 6), cupy, numpy.float32)
+        expected = cupy.sort(a, axis=1)
+        cupy.median(a, axis=1, overwrite_input=True)
+        testing.assert_array_equal(a, expected)
+
+    def test_median_keep_input(self):
+        a = testing.shaped_random((4, 6), cupy, numpy.float32)
+        expected = a.copy()
+        cupy.median(a, axis=1)
+        testing.assert_array_equal(a, expected)
+
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_median_empty_axis(self, xp, dtype):
+        a = xp.empty((3, 0), dtype=dtype)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return xp.median(a, axis=1)
@@ -104,3 +104,121 @@ class TestOrder(unittest.TestCase):
         self.assertEqual(len(w), 1)
         self.assertIs(w[0].category, RuntimeWarning)
         return m
+
+
+@testing.parameterize(*testing.product({
+    'shape': [(7,), (4, 6), (3, 5000)],
+    'axis': [None, 0, -1],
+    'keepdims': [False, True],
+}))
+@testing.gpu
+class TestPercentile(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.for_all_dtypes(no_bool=True)
+    @testing.numpy_cupy_allclose(rtol=1e-3)
+    def test_percentile(self, xp, dtype):
+        a = testing.shaped_random(self.shape, xp, dtype)
+        return xp.percentile(a, 30, axis=self.axis, keepdims=self.keepdims)
+
+    @testing.for_all_dtypes(no_bool=True, no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_percentile_multiple(self, xp, dtype):
+        a = testing.shaped_random(self.shape, xp, dtype)
+        return xp.percentile(a, [0, 12.5, 50, 99, 100], axis=self.axis,
+                             keepdims=self.keepdims)
+
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_quantile(self, xp, dtype):
+        a = testing.shaped_random(self.shape, xp, dtype)
+        return xp.quantile(a, xp.array([[0.25, 0.5], [0.75, 0.9]]),
+                           axis=self.axis, keepdims=self.keepdims)
+
+
+@testing.parameterize(*testing.product({
+    'interpolation': ['linear', 'lower', 'higher', 'midpoint', 'nearest'],
+}))
+@testing.gpu
+class TestPercentileInterpolation(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.for_all_dtypes(no_bool=True, no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_percentile(self, xp, dtype):
+        a = testing.shaped_random((5, 10), xp, dtype)
+        return xp.percentile(a, [10, 25, 50, 62.5], axis=1,
+                             interpolation=self.interpolation)
+
+
+@testing.gpu
+class TestPercentileMisc(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_percentile_nan(self, xp, dtype):
+        a = testing.shaped_random((3, 8), xp, dtype)
+        a[1, 2] = float('nan')
+        return xp.percentile(a, [20, 80], axis=1)
+
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_nanpercentile(self, xp, dtype):
+        a = testing.shaped_random((3, 8), xp, dtype)
+        a[1, 2] = float('nan')
+        a[2, ::2] = float('nan')
+        return xp.nanpercentile(a, [20, 80], axis=1)
+
+    @testing.for_float_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_nanquantile_all_nan(self, xp, dtype):
+        a = testing.shaped_random((3, 8), xp, dtype)
+        a[1] = float('nan')
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            m = xp.nanquantile(a, 0.5, axis=1)
+        self.assertTrue(any(x.category is RuntimeWarning for x in w))
+        return m
+
+    @testing.for_all_dtypes(no_bool=True, no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_percentile_tuple_axis(self, xp, dtype):
+        a = testing.shaped_random((3, 4, 5), xp, dtype)
+        return xp.percentile(a, 40, axis=(0, 2))
+
+    @testing.for_all_dtypes(no_bool=True, no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_percentile_non_contiguous(self, xp, dtype):
+        a = testing.shaped_random((6, 8), xp, dtype)[::2, ::-1]
+        return xp.percentile(a, 70, axis=0)
+
+    @testing.numpy_cupy_allclose()
+    def test_percentile_out(self, xp):
+        a = testing.shaped_random((4, 6), xp, xp.float32)
+        out = xp.empty((2, 4), dtype=xp.float32)
+        xp.percentile(a, [30, 60], axis=1, out=out)
+        return out
+
+    @testing.numpy_cupy_allclose()
+    def test_percentile_infinity(self, xp):
+        a = xp.array([-float('inf'), 1, 2, float('inf')])
+        return xp.percentile(a, [0, 50, 100])
+
+    @testing.numpy_cupy_raises()
+    def test_percentile_out_of_range(self, xp):
+        a = testing.shaped_random((4, 6), xp, xp.float32)
+        xp.percentile(a, 101)
+
+    @testing.numpy_cupy_raises()
+    def test_quantile_out_of_range(self, xp):
+        a = testing.shaped_random((4, 6), xp, xp.float32)
+        xp.quantile(a, [0.5, -0.1])
+
+    @testing.numpy_cupy_raises()
+    def test_percentile_invalid_interpolation(self, xp):
+        a = testing.shaped_random((4, 6), xp, xp.float32)
+        xp.percentile(a, 50, interpolation='cubic')